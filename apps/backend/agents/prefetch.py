@@ -0,0 +1,326 @@
+"""
+Speculative Subtask Prefetch
+============================
+
+Builds the next subtask's prompt while the current coder session runs.
+
+Between sessions the coder loop used to serially pick the next subtask,
+generate its prompt, read its pattern/target files and query Graphiti
+memory. The prefetcher predicts the next subtask (the one that follows if
+the current subtask completes), builds its prompt and file context in a
+worker thread during the session, and starts the Graphiti lookup as soon
+as post-session processing has saved the new memories.
+
+A prefetched bundle is only used if the prediction turned out right and
+nothing it was built from changed:
+- the plan hash (plan structure, ignoring progress fields) is unchanged
+- the subtask and its attempt count are the same
+- none of the files read for the context were modified by the session
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from core.progress import find_next_subtask
+from debug import debug, is_debug_enabled
+from prompt_generator import (
+    build_subtask_prompt_blocks,
+    format_context_for_prompt,
+    load_subtask_context,
+)
+from prompts_pkg.prompt_builder import PromptBuilder
+from recovery import RecoveryManager
+
+from .memory_manager import get_graphiti_context
+from .utils import find_phase_for_subtask, load_implementation_plan
+
+logger = logging.getLogger(__name__)
+
+# Set AUTO_CLAUDE_PREFETCH=false to build every prompt on demand
+PREFETCH_ENABLED_ENV = "AUTO_CLAUDE_PREFETCH"
+
+# Fields that record progress rather than what the plan asks for. Agents and
+# post-session processing update these constantly; they don't affect prompts.
+_PLAN_PROGRESS_KEYS = {
+    "updated_at",
+    "status",
+    "planStatus",
+    "recoveryNote",
+    "qa_signoff",
+}
+_SUBTASK_PROGRESS_KEYS = {
+    "status",
+    "actual_output",
+    "started_at",
+    "completed_at",
+    "session_id",
+    "critique_result",
+    "notes",
+}
+
+
+def is_prefetch_enabled() -> bool:
+    """Check whether speculative prefetch is enabled (default: on)."""
+    return os.environ.get(PREFETCH_ENABLED_ENV, "true").lower() not in (
+        "0",
+        "false",
+        "no",
+    )
+
+
+def compute_plan_hash(plan: dict) -> str:
+    """
+    Hash the structure of an implementation plan.
+
+    Progress fields (statuses, timestamps, QA sign-off) are ignored, so
+    marking a subtask completed doesn't change the hash, but adding,
+    removing or editing subtasks and phases does.
+    """
+    normalized = {k: v for k, v in plan.items() if k not in _PLAN_PROGRESS_KEYS}
+    normalized["phases"] = [
+        {
+            **{k: v for k, v in phase.items() if k != "subtasks"},
+            "subtasks": [
+                {k: v for k, v in s.items() if k not in _SUBTASK_PROGRESS_KEYS}
+                for s in phase.get("subtasks", [])
+            ],
+        }
+        for phase in plan.get("phases", [])
+    ]
+    encoded = json.dumps(normalized, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _stat_files(project_dir: Path, subtask: dict) -> dict[str, tuple[int, int] | None]:
+    """(mtime_ns, size) of every file load_subtask_context reads."""
+    stats: dict[str, tuple[int, int] | None] = {}
+    for rel in [*subtask.get("patterns_from", []), *subtask.get("files_to_modify", [])]:
+        try:
+            st = (project_dir / rel).stat()
+            stats[rel] = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            stats[rel] = None
+    return stats
+
+
+def build_subtask_prompt(
+    spec_dir: Path,
+    project_dir: Path,
+    subtask: dict,
+    phase: dict,
+    attempt_count: int = 0,
+    recovery_hints: list[str] | None = None,
+) -> PromptBuilder:
+    """
+    Build the coder prompt for a subtask (without Graphiti memory).
+
+    Args:
+        spec_dir: Spec directory
+        project_dir: Project root directory
+        subtask: The subtask to implement
+        phase: The phase containing the subtask
+        attempt_count: Number of previous attempts
+        recovery_hints: Hints from previous failed attempts
+
+    Returns:
+        PromptBuilder with the subtask instructions and relevant file context
+    """
+    builder = build_subtask_prompt_blocks(
+        spec_dir=spec_dir,
+        project_dir=project_dir,
+        subtask=subtask,
+        phase=phase,
+        attempt_count=attempt_count,
+        recovery_hints=recovery_hints,
+    )
+
+    # Load and append relevant file context
+    context = load_subtask_context(spec_dir, project_dir, subtask)
+    if context.get("patterns") or context.get("files_to_modify"):
+        builder.add_volatile(
+            "file_context", "\n\n" + format_context_for_prompt(context)
+        )
+    return builder
+
+
+@dataclass
+class PrefetchedSubtask:
+    """Prompt material built ahead of time for a predicted subtask."""
+
+    subtask: dict
+    plan_hash: str
+    attempt_count: int
+    builder: PromptBuilder
+    file_stats: dict[str, tuple[int, int] | None]
+    graphiti_task: asyncio.Task | None = field(default=None, repr=False)
+
+    @property
+    def subtask_id(self) -> str | None:
+        return self.subtask.get("id")
+
+    @property
+    def prompt(self) -> str:
+        return self.builder.build()
+
+
+class SubtaskPrefetcher:
+    """
+    Prefetches the next subtask's prompt while the current session runs.
+
+    Usage in the coder loop:
+        prefetcher.schedule(current_subtask_id)   # before the session
+        prefetcher.prefetch_memory()              # after post-processing
+        bundle = await prefetcher.take(next_subtask, attempt_count)
+    """
+
+    def __init__(
+        self,
+        spec_dir: Path,
+        project_dir: Path,
+        recovery_manager: RecoveryManager,
+    ):
+        self.spec_dir = spec_dir
+        self.project_dir = project_dir
+        self.recovery_manager = recovery_manager
+        self._task: asyncio.Task | None = None
+        self.stats = {"hits": 0, "misses": 0}
+
+    def schedule(self, current_subtask_id: str | None) -> None:
+        """Start building the subtask predicted to follow the current one."""
+        self.cancel()
+        if not current_subtask_id or not is_prefetch_enabled():
+            return
+        self._task = asyncio.create_task(
+            asyncio.to_thread(self._build_bundle, current_subtask_id)
+        )
+
+    def _build_bundle(self, current_subtask_id: str) -> PrefetchedSubtask | None:
+        plan = load_implementation_plan(self.spec_dir)
+        if not plan:
+            return None
+
+        subtask = find_next_subtask(plan, assume_completed=[current_subtask_id])
+        if not subtask:
+            return None
+
+        subtask_id = subtask.get("id")
+        attempt_count = self.recovery_manager.get_attempt_count(subtask_id)
+        recovery_hints = (
+            self.recovery_manager.get_recovery_hints(subtask_id)
+            if attempt_count > 0
+            else None
+        )
+
+        # Stat before reading so a concurrent edit can only make us discard
+        file_stats = _stat_files(self.project_dir, subtask)
+        builder = build_subtask_prompt(
+            self.spec_dir,
+            self.project_dir,
+            subtask,
+            find_phase_for_subtask(plan, subtask_id) or {},
+            attempt_count,
+            recovery_hints,
+        )
+
+        if is_debug_enabled():
+            debug("prefetch", "Prefetched next subtask", subtask_id=subtask_id)
+
+        return PrefetchedSubtask(
+            subtask=subtask,
+            plan_hash=compute_plan_hash(plan),
+            attempt_count=attempt_count,
+            builder=builder,
+            file_stats=file_stats,
+        )
+
+    def prefetch_memory(self) -> None:
+        """
+        Start the Graphiti lookup for the predicted subtask.
+
+        Called after post-session processing so the lookup sees the memories
+        saved by the session that just finished.
+        """
+        if self._task is None:
+            return
+        self._task = asyncio.create_task(self._attach_memory(self._task))
+
+    async def _attach_memory(self, build: asyncio.Task) -> PrefetchedSubtask | None:
+        bundle = await build
+        if bundle is not None:
+            bundle.graphiti_task = asyncio.create_task(
+                get_graphiti_context(self.spec_dir, self.project_dir, bundle.subtask)
+            )
+        return bundle
+
+    async def take(self, subtask: dict, attempt_count: int) -> PrefetchedSubtask | None:
+        """
+        Return the prefetched bundle if it is still valid for this subtask.
+
+        Args:
+            subtask: The subtask the loop is about to work on
+            attempt_count: Its current attempt count
+
+        Returns:
+            The bundle, or None if nothing usable was prefetched
+        """
+        task, self._task = self._task, None
+        if task is None:
+            return None
+
+        try:
+            bundle = await task
+        except Exception as e:
+            logger.debug(f"Subtask prefetch failed: {e}")
+            bundle = None
+
+        if bundle is not None and self._is_valid(bundle, subtask, attempt_count):
+            self.stats["hits"] += 1
+            return bundle
+
+        if bundle is not None and bundle.graphiti_task is not None:
+            bundle.graphiti_task.cancel()
+        self.stats["misses"] += 1
+        return None
+
+    def _is_valid(
+        self, bundle: PrefetchedSubtask, subtask: dict, attempt_count: int
+    ) -> bool:
+        if bundle.subtask_id != subtask.get("id"):
+            reason = "different subtask"
+        elif bundle.attempt_count != attempt_count:
+            reason = "attempt count changed"
+        elif bundle.file_stats != _stat_files(self.project_dir, subtask):
+            reason = "context files changed"
+        else:
+            plan = load_implementation_plan(self.spec_dir)
+            if plan is None or compute_plan_hash(plan) != bundle.plan_hash:
+                reason = "plan changed"
+            else:
+                return True
+
+        if is_debug_enabled():
+            debug(
+                "prefetch",
+                "Discarding prefetched subtask",
+                subtask_id=bundle.subtask_id,
+                reason=reason,
+            )
+        return False
+
+    def cancel(self) -> None:
+        """Drop any in-flight prefetch."""
+        task, self._task = self._task, None
+        if task is None:
+            return
+        if not task.done():
+            task.cancel()
+        elif not task.cancelled():
+            if task.exception() is None and task.result() is not None:
+                graphiti_task = task.result().graphiti_task
+                if graphiti_task is not None:
+                    graphiti_task.cancel()
@@ -23,7 +23,6 @@ from progress import (
 from recovery import RecoveryManager
 from security.tool_input_validator import get_safe_tool_input
 from task_logger import (
-    LogEntryType,
     LogPhase,
     get_task_logger,
 )
@@ -35,6 +34,7 @@ from ui import (
 )
 
 from .memory_manager import save_session_memory
+from .session_pipeline import SessionEventPipeline
 from .utils import (
     find_subtask_in_plan,
     get_commit_count,
@@ -347,6 +347,9 @@ async def run_agent_session(
 
     # Get task logger for this spec
     task_logger = get_task_logger(spec_dir)
+    # Buffers response text and text log entries; holds the debug flag
+    pipeline = SessionEventPipeline(task_logger, phase)
+    debug_on = pipeline.debug_enabled
     current_tool = None
     message_count = 0
     tool_count = 0
@@ -358,16 +361,16 @@ async def run_agent_session(
         debug_success("session", "Query sent successfully")
 
         # Collect response text and show tool use
-        response_text = ""
         debug("session", "Starting to receive response stream...")
         async for msg in client.receive_response():
             msg_type = type(msg).__name__
             message_count += 1
-            debug_detailed(
-                "session",
-                f"Received message #{message_count}",
-                msg_type=msg_type,
-            )
+            if debug_on:
+                debug_detailed(
+                    "session",
+                    f"Received message #{message_count}",
+                    msg_type=msg_type,
+                )
 
             # Handle AssistantMessage (text and tool use)
             if msg_type == "AssistantMessage" and hasattr(msg, "content"):
@@ -375,17 +378,12 @@ async def run_agent_session(
                     block_type = type(block).__name__
 
                     if block_type == "TextBlock" and hasattr(block, "text"):
-                        response_text += block.text
                         print(block.text, end="", flush=True)
-                        # Log text to task logger (persist without double-printing)
-                        if task_logger and block.text.strip():
-                            task_logger.log(
-                                block.text,
-                                LogEntryType.TEXT,
-                                phase,
-                                print_to_console=False,
-                            )
+                        # Log text to task logger (coalesced, without double-printing)
+                        pipeline.add_text(block.text)
                     elif block_type == "ToolUseBlock" and hasattr(block, "name"):
+                        # Keep the log in stream order: text before the tool
+                        pipeline.flush()
                         tool_name = block.name
                         tool_input_display = None
                         tool_count += 1
@@ -410,12 +408,13 @@ async def run_agent_session(
                             elif "path" in inp:
                                 tool_input_display = inp["path"]
 
-                        debug(
-                            "session",
-                            f"Tool call #{tool_count}: {tool_name}",
-                            tool_input=tool_input_display,
-                            full_input=str(inp)[:500] if inp else None,
-                        )
+                        if debug_on:
+                            debug(
+                                "session",
+                                f"Tool call #{tool_count}: {tool_name}",
+                                tool_input=tool_input_display,
+                                full_input=str(inp)[:500] if inp else None,
+                            )
 
                         # Log tool start (handles printing too)
                         if task_logger:
@@ -438,6 +437,7 @@ async def run_agent_session(
 
             # Handle UserMessage (tool results)
             elif msg_type == "UserMessage" and hasattr(msg, "content"):
+                pipeline.flush()
                 for block in msg.content:
                     block_type = type(block).__name__
 
@@ -481,11 +481,12 @@ async def run_agent_session(
                                 )
                         else:
                             # Tool succeeded
-                            debug_detailed(
-                                "session",
-                                f"Tool success: {current_tool}",
-                                result_length=len(str(result_content)),
-                            )
+                            if debug_on:
+                                debug_detailed(
+                                    "session",
+                                    f"Tool success: {current_tool}",
+                                    result_length=len(str(result_content)),
+                                )
                             if verbose:
                                 result_str = str(result_content)[:200]
                                 print(f"   [Done] {result_str}", flush=True)
@@ -517,6 +518,8 @@ async def run_agent_session(
 
                         current_tool = None
 
+        pipeline.close()
+        response_text = pipeline.response_text
         print("\n" + "-" * 70 + "\n")
 
         # Check if build is complete
@@ -540,6 +543,8 @@ async def run_agent_session(
         return "continue", response_text
 
     except Exception as e:
+        # Keep the text received before the failure in the log
+        pipeline.close()
         debug_error(
             "session",
             f"Session error: {e}",
@@ -0,0 +1,114 @@
+"""
+Session Event Pipeline
+======================
+
+Buffers the hot path of an agent session's response stream.
+
+A long session streams thousands of small TextBlocks. Handling each one
+directly meant:
+- ``response_text += text``, which copies the whole response every time
+- one task log entry per block, and every entry rewrites task_logs.json
+- debug() formatting per message, even with DEBUG off
+
+The pipeline instead collects response text in a list, coalesces
+consecutive text blocks into one log entry per time window (flushed early
+by any tool event and at the end of the stream), and snapshots the debug
+flag once per session so disabled debug hooks cost a single boolean check.
+
+The window is AUTO_CLAUDE_LOG_COALESCE_MS (default 500ms; 0 logs every
+block as before).
+"""
+
+import os
+import time
+from collections.abc import Callable
+
+from debug import is_debug_enabled
+from task_logger import LogEntryType, LogPhase, TaskLogger
+
+LOG_COALESCE_ENV = "AUTO_CLAUDE_LOG_COALESCE_MS"
+DEFAULT_LOG_COALESCE_MS = 500
+
+
+def get_log_coalesce_window() -> float:
+    """Text coalescing window in seconds (from AUTO_CLAUDE_LOG_COALESCE_MS)."""
+    try:
+        ms = int(os.environ.get(LOG_COALESCE_ENV, DEFAULT_LOG_COALESCE_MS))
+    except ValueError:
+        ms = DEFAULT_LOG_COALESCE_MS
+    return max(0, ms) / 1000
+
+
+class SessionEventPipeline:
+    """
+    Accumulates response text and batches text log entries for a session.
+
+    Usage:
+        pipeline = SessionEventPipeline(task_logger, phase)
+        pipeline.add_text(block.text)      # per TextBlock
+        pipeline.flush()                   # before logging a tool event
+        pipeline.close()                   # at end of stream
+        response_text = pipeline.response_text
+    """
+
+    def __init__(
+        self,
+        task_logger: TaskLogger | None,
+        phase: LogPhase,
+        coalesce_window: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.task_logger = task_logger
+        self.phase = phase
+        self.coalesce_window = (
+            get_log_coalesce_window() if coalesce_window is None else coalesce_window
+        )
+        self._clock = clock
+        # Snapshot once: debug hooks in the stream loop check this flag only
+        self.debug_enabled = is_debug_enabled()
+
+        self._parts: list[str] = []
+        self._pending: list[str] = []
+        self._pending_since: float | None = None
+        self.log_entries = 0
+
+    @property
+    def response_text(self) -> str:
+        """All text received so far."""
+        if len(self._parts) > 1:
+            self._parts = ["".join(self._parts)]
+        return self._parts[0] if self._parts else ""
+
+    def add_text(self, text: str) -> None:
+        """Record a text block from the response stream."""
+        self._parts.append(text)
+
+        if self.task_logger is None:
+            return
+        self._pending.append(text)
+        now = self._clock()
+        if self._pending_since is None:
+            self._pending_since = now
+        if now - self._pending_since >= self.coalesce_window:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered text as a single log entry."""
+        pending, self._pending = self._pending, []
+        self._pending_since = None
+        if self.task_logger is None or not pending:
+            return
+        content = "".join(pending)
+        # Blank blocks were never logged; keep it that way for merged ones
+        if content.strip():
+            self.task_logger.log(
+                content,
+                LogEntryType.TEXT,
+                self.phase,
+                print_to_console=False,
+            )
+            self.log_entries += 1
+
+    def close(self) -> None:
+        """Flush remaining text at the end of the stream."""
+        self.flush()
@@ -50,6 +50,13 @@ def analyze_project(project_dir: Path, output_file: Path | None = None) -> dict:
             json.dump(results, f, indent=2)
         print(f"Project index saved to: {output_file}")
 
+        # Remember which manifests this index reflects for freshness checks
+        from prompts_pkg.index_freshness import record_index_manifests
+
+        from .base import SKIP_DIRS
+
+        record_index_manifests(project_dir, output_file, SKIP_DIRS)
+
     return results
 
 
@@ -209,6 +209,12 @@ def handle_build_command(
         if localized_spec_dir:
             spec_dir = localized_spec_dir
 
+    # Analyze the security profile for the working dir in the background,
+    # so the first Bash hook doesn't block on project analysis
+    from security import warm_profile_cache
+
+    warm_profile_cache([working_dir], block=False)
+
     # Run the autonomous agent
     debug_section("run.py", "Starting Build Execution")
     debug(
@@ -16,19 +16,9 @@ if str(_PARENT_DIR) not in sys.path:
     sys.path.insert(0, str(_PARENT_DIR))
 
 
-from .batch_commands import (
-    handle_batch_cleanup_command,
-    handle_batch_create_command,
-    handle_batch_status_command,
-)
-from .build_commands import handle_build_command
-from .followup_commands import handle_followup_command
-from .qa_commands import (
-    handle_qa_command,
-    handle_qa_status_command,
-    handle_review_status_command,
-)
-from .spec_commands import print_specs_list
+# Command handlers are imported where they are dispatched, so that quick
+# commands the UI polls (--list, status checks, merge preview) do not load
+# the agent SDK, QA loop, merge system or memory integrations.
 from .utils import (
     DEFAULT_MODEL,
     find_spec,
@@ -36,13 +26,6 @@ from .utils import (
     print_banner,
     setup_environment,
 )
-from .workspace_commands import (
-    handle_cleanup_worktrees_command,
-    handle_discard_command,
-    handle_list_worktrees_command,
-    handle_merge_command,
-    handle_review_command,
-)
 
 
 def parse_args() -> argparse.Namespace:
@@ -71,6 +54,7 @@ Examples:
   # Status checks
   python auto-claude/run.py --spec 001 --review-status  # Check human review status
   python auto-claude/run.py --spec 001 --qa-status      # Check QA validation status
+  python auto-claude/run.py --spec 001 --prompt-cache-report  # Prompt cache reuse per phase
 
 Prerequisites:
   1. Create a spec first: claude /spec
@@ -165,6 +149,12 @@ Environment Variables:
         action="store_true",
         help="Preview merge conflicts without actually merging (returns JSON)",
     )
+    parser.add_argument(
+        "--merge-preflight",
+        nargs="*",
+        metavar="SPEC",
+        help="Check git conflicts for many spec branches at once (returns JSON; default: all)",
+    )
 
     # QA options
     parser.add_argument(
@@ -196,6 +186,11 @@ Environment Variables:
         action="store_true",
         help="Show human review/approval status for a spec",
     )
+    parser.add_argument(
+        "--prompt-cache-report",
+        action="store_true",
+        help="Show the estimated prompt cache-hit ratio per phase for a spec",
+    )
 
     # Non-interactive mode (for UI/automation)
     parser.add_argument(
@@ -282,30 +277,54 @@ def main() -> None:
 
     # Handle --list command
     if args.list:
+        from .spec_commands import print_specs_list
+
         print_banner()
         print_specs_list(project_dir)
         return
 
     # Handle --list-worktrees command
     if args.list_worktrees:
+        from .workspace_commands import handle_list_worktrees_command
+
         handle_list_worktrees_command(project_dir)
         return
 
     # Handle --cleanup-worktrees command
     if args.cleanup_worktrees:
+        from .workspace_commands import handle_cleanup_worktrees_command
+
         handle_cleanup_worktrees_command(project_dir)
         return
 
+    # Handle --merge-preflight command (bulk git conflict check for the UI)
+    if args.merge_preflight is not None:
+        from .workspace_commands import handle_merge_preflight_command
+
+        result = handle_merge_preflight_command(
+            project_dir, spec_names=args.merge_preflight or None
+        )
+        import json
+
+        print(json.dumps(result))
+        return
+
     # Handle batch commands
     if args.batch_create:
+        from .batch_commands import handle_batch_create_command
+
         handle_batch_create_command(args.batch_create, str(project_dir))
         return
 
     if args.batch_status:
+        from .batch_commands import handle_batch_status_command
+
         handle_batch_status_command(str(project_dir))
         return
 
     if args.batch_cleanup:
+        from .batch_commands import handle_batch_cleanup_command
+
         handle_batch_cleanup_command(str(project_dir), dry_run=not args.no_dry_run)
         return
 
@@ -328,6 +347,8 @@ def main() -> None:
         print_banner()
         print(f"\nError: Spec '{args.spec}' not found")
         print("\nAvailable specs:")
+        from .spec_commands import print_specs_list
+
         print_specs_list(project_dir)
         sys.exit(1)
 
@@ -335,7 +356,7 @@ def main() -> None:
 
     # Handle build management commands
     if args.merge_preview:
-        from cli.workspace_commands import handle_merge_preview_command
+        from .workspace_commands import handle_merge_preview_command
 
         result = handle_merge_preview_command(
             project_dir, spec_dir.name, base_branch=args.base_branch
@@ -347,6 +368,8 @@ def main() -> None:
         return
 
     if args.merge:
+        from .workspace_commands import handle_merge_command
+
         success = handle_merge_command(
             project_dir,
             spec_dir.name,
@@ -358,23 +381,39 @@ def main() -> None:
         return
 
     if args.review:
+        from .workspace_commands import handle_review_command
+
         handle_review_command(project_dir, spec_dir.name)
         return
 
     if args.discard:
+        from .workspace_commands import handle_discard_command
+
         handle_discard_command(project_dir, spec_dir.name)
         return
 
     # Handle QA commands
     if args.qa_status:
+        from .qa_commands import handle_qa_status_command
+
         handle_qa_status_command(spec_dir)
         return
 
     if args.review_status:
+        from .qa_commands import handle_review_status_command
+
         handle_review_status_command(spec_dir)
         return
 
+    if args.prompt_cache_report:
+        from .qa_commands import handle_prompt_cache_report_command
+
+        handle_prompt_cache_report_command(spec_dir)
+        return
+
     if args.qa:
+        from .qa_commands import handle_qa_command
+
         handle_qa_command(
             project_dir=project_dir,
             spec_dir=spec_dir,
@@ -385,6 +424,8 @@ def main() -> None:
 
     # Handle --followup command
     if args.followup:
+        from .followup_commands import handle_followup_command
+
         handle_followup_command(
             project_dir=project_dir,
             spec_dir=spec_dir,
@@ -394,6 +435,8 @@ def main() -> None:
         return
 
     # Normal build flow
+    from .build_commands import handle_build_command
+
     handle_build_command(
         project_dir=project_dir,
         spec_dir=spec_dir,
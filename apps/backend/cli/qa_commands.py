@@ -5,7 +5,6 @@ QA Commands
 CLI commands for QA validation (run QA, check status)
 """
 
-import asyncio
 import sys
 from pathlib import Path
 
@@ -15,12 +14,7 @@ if str(_PARENT_DIR) not in sys.path:
     sys.path.insert(0, str(_PARENT_DIR))
 
 from progress import count_subtasks
-from qa_loop import (
-    is_qa_approved,
-    print_qa_status,
-    run_qa_validation_loop,
-    should_run_qa,
-)
+from qa.criteria import is_qa_approved, print_qa_status, should_run_qa
 from review import ReviewState, display_review_status
 from ui import (
     Icons,
@@ -71,6 +65,21 @@ def handle_review_status_command(spec_dir: Path) -> None:
     print()
 
 
+def handle_prompt_cache_report_command(spec_dir: Path) -> None:
+    """
+    Handle the --prompt-cache-report command.
+
+    Args:
+        spec_dir: Spec directory path
+    """
+    print_banner()
+    print(f"\nSpec: {spec_dir.name}\n")
+    from prompts_pkg import format_prompt_cache_report, get_prompt_cache_report
+
+    print(format_prompt_cache_report(get_prompt_cache_report(spec_dir)))
+    print()
+
+
 def handle_qa_command(
     project_dir: Path,
     spec_dir: Path,
@@ -108,6 +117,10 @@ def handle_qa_command(
     if has_human_feedback:
         print("\n📝 Human feedback detected - processing fix request...")
 
+    import asyncio
+
+    from qa import run_qa_validation_loop
+
     try:
         approved = asyncio.run(
             run_qa_validation_loop(
@@ -14,12 +14,7 @@ _PARENT_DIR = Path(__file__).parent.parent
 if str(_PARENT_DIR) not in sys.path:
     sys.path.insert(0, str(_PARENT_DIR))
 
-from core.auth import get_auth_token, get_auth_token_source
-from dotenv import load_dotenv
-from graphiti_config import get_graphiti_status
-from linear_integration import LinearManager
-from linear_updater import is_linear_enabled
-from spec.pipeline import get_specs_dir
+from spec.pipeline.models import get_specs_dir
 from ui import (
     Icons,
     bold,
@@ -46,10 +41,12 @@ def setup_environment() -> Path:
     # Load .env file - check both auto-claude/ and dev/auto-claude/ locations
     env_file = script_dir / ".env"
     dev_env_file = script_dir.parent / "dev" / "auto-claude" / ".env"
-    if env_file.exists():
-        load_dotenv(env_file)
-    elif dev_env_file.exists():
-        load_dotenv(dev_env_file)
+    for candidate in (env_file, dev_env_file):
+        if candidate.exists():
+            from dotenv import load_dotenv
+
+            load_dotenv(candidate)
+            break
 
     return script_dir
 
@@ -115,6 +112,11 @@ def validate_environment(spec_dir: Path) -> bool:
     Returns:
         True if valid, False otherwise (with error messages printed)
     """
+    from core.auth import get_auth_token, get_auth_token_source
+    from graphiti_config import get_graphiti_status
+    from linear_integration import LinearManager
+    from linear_updater import is_linear_enabled
+
     valid = True
 
     # Check for OAuth token (API keys are not supported)
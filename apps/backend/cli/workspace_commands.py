@@ -15,13 +15,16 @@ if str(_PARENT_DIR) not in sys.path:
     sys.path.insert(0, str(_PARENT_DIR))
 
 from core.workspace.git_utils import (
-    _is_auto_claude_file,
     apply_path_mapping,
     detect_file_renames,
     get_file_content_from_ref,
     get_merge_base,
     is_lock_file,
 )
+from core.workspace.preflight import (
+    check_git_conflicts,
+    check_git_conflicts_batch,
+)
 from debug import debug_warning
 from ui import (
     Icons,
@@ -34,6 +37,7 @@ from workspace import (
     merge_existing_build,
     review_existing_build,
 )
+from worktree import WorktreeManager
 
 from .utils import print_banner
 
@@ -338,6 +342,15 @@ def handle_list_worktrees_command(project_dir: Path) -> None:
         print(
             "  To cleanup all worktrees: python auto-claude/run.py --cleanup-worktrees"
         )
+
+    pool = WorktreeManager(project_dir).get_pool_stats()
+    if pool.size:
+        print()
+        print(
+            f"  Worktree pool: {pool.idle}/{pool.size} ready, "
+            f"hit rate {pool.hit_rate:.0%} ({pool.hits} hits, {pool.misses} misses), "
+            f"reclaim policy: {pool.reclaim_policy}"
+        )
     print()
 
 
@@ -356,8 +369,9 @@ def _check_git_merge_conflicts(project_dir: Path, spec_name: str) -> dict:
     """
     Check for git-level merge conflicts WITHOUT modifying the working directory.
 
-    Uses git merge-tree and git diff to detect conflicts in-memory,
-    which avoids triggering Vite HMR or other file watchers.
+    Uses git merge-tree to detect conflicts in-memory, which avoids triggering
+    Vite HMR or other file watchers. Delegates to the batched merge preflight,
+    so an unchanged (base, spec) pair is answered from cache.
 
     Args:
         project_dir: Project root directory
@@ -371,154 +385,73 @@ def _check_git_merge_conflicts(project_dir: Path, spec_name: str) -> dict:
         - base_branch: str
         - spec_branch: str
     """
-    import subprocess
-
     debug(MODULE, "Checking for git-level merge conflicts (non-destructive)...")
 
-    spec_branch = f"auto-claude/{spec_name}"
-    result = {
-        "has_conflicts": False,
-        "conflicting_files": [],
-        "needs_rebase": False,
-        "base_branch": "main",
-        "spec_branch": spec_branch,
-        "commits_behind": 0,
-    }
-
     try:
-        # Get the current branch (base branch)
-        base_result = subprocess.run(
-            ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-            cwd=project_dir,
-            capture_output=True,
-            text=True,
-        )
-        if base_result.returncode == 0:
-            result["base_branch"] = base_result.stdout.strip()
-
-        # Get the merge base commit
-        merge_base_result = subprocess.run(
-            ["git", "merge-base", result["base_branch"], spec_branch],
-            cwd=project_dir,
-            capture_output=True,
-            text=True,
-        )
-        if merge_base_result.returncode != 0:
-            debug_warning(MODULE, "Could not find merge base")
-            return result
+        result = check_git_conflicts(project_dir, spec_name)
+    except Exception as e:
+        debug_error(MODULE, f"Error checking git conflicts: {e}")
+        import traceback
 
-        merge_base = merge_base_result.stdout.strip()
+        debug_verbose(MODULE, "Exception traceback", traceback=traceback.format_exc())
+        return {
+            "has_conflicts": False,
+            "conflicting_files": [],
+            "needs_rebase": False,
+            "base_branch": "main",
+            "spec_branch": f"auto-claude/{spec_name}",
+            "commits_behind": 0,
+        }
 
-        # Count commits main is ahead
-        ahead_result = subprocess.run(
-            ["git", "rev-list", "--count", f"{merge_base}..{result['base_branch']}"],
-            cwd=project_dir,
-            capture_output=True,
-            text=True,
-        )
-        if ahead_result.returncode == 0:
-            commits_behind = int(ahead_result.stdout.strip())
-            result["commits_behind"] = commits_behind
-            if commits_behind > 0:
-                result["needs_rebase"] = True
-                debug(
-                    MODULE, f"Main is {commits_behind} commits ahead of worktree base"
-                )
+    if result["has_conflicts"]:
+        debug(MODULE, f"Conflicting files: {result['conflicting_files']}")
+    else:
+        debug_success(MODULE, "Git merge-tree: no conflicts detected")
+    return result
 
-        # Use git merge-tree to check for conflicts WITHOUT touching working directory
-        # This is a plumbing command that does a 3-way merge in memory
-        # Note: --write-tree mode only accepts 2 branches (it auto-finds the merge base)
-        merge_tree_result = subprocess.run(
-            [
-                "git",
-                "merge-tree",
-                "--write-tree",
-                "--no-messages",
-                result["base_branch"],  # Use branch names, not commit hashes
-                spec_branch,
-            ],
-            cwd=project_dir,
-            capture_output=True,
-            text=True,
-        )
 
-        # merge-tree returns exit code 1 if there are conflicts
-        if merge_tree_result.returncode != 0:
-            result["has_conflicts"] = True
-            debug(MODULE, "Git merge-tree detected conflicts")
-
-            # Parse the output for conflicting files
-            # merge-tree --write-tree outputs conflict info to stderr
-            output = merge_tree_result.stdout + merge_tree_result.stderr
-            for line in output.split("\n"):
-                # Look for lines indicating conflicts
-                if "CONFLICT" in line:
-                    # Extract file path from conflict message
-                    import re
-
-                    match = re.search(
-                        r"(?:Merge conflict in|CONFLICT.*?:)\s*(.+?)(?:\s*$|\s+\()",
-                        line,
-                    )
-                    if match:
-                        file_path = match.group(1).strip()
-                        # Skip .auto-claude files - they should never be merged
-                        if (
-                            file_path
-                            and file_path not in result["conflicting_files"]
-                            and not _is_auto_claude_file(file_path)
-                        ):
-                            result["conflicting_files"].append(file_path)
-
-            # Fallback: if we didn't parse conflicts, use diff to find files changed in both branches
-            if not result["conflicting_files"]:
-                # Files changed in main since merge-base
-                main_files_result = subprocess.run(
-                    ["git", "diff", "--name-only", merge_base, result["base_branch"]],
-                    cwd=project_dir,
-                    capture_output=True,
-                    text=True,
-                )
-                main_files = (
-                    set(main_files_result.stdout.strip().split("\n"))
-                    if main_files_result.stdout.strip()
-                    else set()
-                )
+def handle_merge_preflight_command(
+    project_dir: Path,
+    spec_names: list[str] | None = None,
+) -> dict:
+    """
+    Handle the --merge-preflight command.
 
-                # Files changed in spec branch since merge-base
-                spec_files_result = subprocess.run(
-                    ["git", "diff", "--name-only", merge_base, spec_branch],
-                    cwd=project_dir,
-                    capture_output=True,
-                    text=True,
-                )
-                spec_files = (
-                    set(spec_files_result.stdout.strip().split("\n"))
-                    if spec_files_result.stdout.strip()
-                    else set()
-                )
+    Bulk variant of the git half of --merge-preview: checks every requested
+    spec branch (default: all auto-claude/* branches) against the current
+    branch in a single pass. Used by the UI to badge the whole queue.
 
-                # Files modified in both = potential conflicts
-                # Filter out .auto-claude files - they should never be merged
-                conflicting = main_files & spec_files
-                result["conflicting_files"] = [
-                    f for f in conflicting if not _is_auto_claude_file(f)
-                ]
-                debug(
-                    MODULE, f"Found {len(conflicting)} files modified in both branches"
-                )
+    Args:
+        project_dir: Project root directory
+        spec_names: Specs to check, or None for every spec branch
 
-            debug(MODULE, f"Conflicting files: {result['conflicting_files']}")
-        else:
-            debug_success(MODULE, "Git merge-tree: no conflicts detected")
+    Returns:
+        JSON-serializable dict keyed by spec name
+    """
+    debug_section(MODULE, "Merge Preflight Command")
 
+    try:
+        results = check_git_conflicts_batch(project_dir, spec_names)
     except Exception as e:
-        debug_error(MODULE, f"Error checking git conflicts: {e}")
-        import traceback
+        debug_error(MODULE, f"Merge preflight failed: {e}")
+        return {"success": False, "error": str(e), "specs": {}}
 
-        debug_verbose(MODULE, "Exception traceback", traceback=traceback.format_exc())
+    specs = {}
+    for spec_name, result in results.items():
+        non_lock_conflicting_files = [
+            f for f in result["conflicting_files"] if not is_lock_file(f)
+        ]
+        specs[spec_name] = {
+            "hasConflicts": result["has_conflicts"]
+            and len(non_lock_conflicting_files) > 0,
+            "conflictingFiles": non_lock_conflicting_files,
+            "needsRebase": result["needs_rebase"],
+            "commitsBehind": result["commits_behind"],
+            "baseBranch": result["base_branch"],
+            "specBranch": result["spec_branch"],
+        }
 
-    return result
+    return {"success": True, "specs": specs}
 
 
 def handle_merge_preview_command(
@@ -0,0 +1,499 @@
+"""
+Agent Concurrency Governor
+==========================
+
+Process-wide, adaptive limit on concurrently running agent sessions.
+
+Clients from create_client() and create_simple_client() hold a slot for
+the lifetime of their session (``async with client``). Runners that fan
+out sessions therefore share one budget: GitHub/GitLab review and triage,
+ideation, roadmap, the AI analyzer and the coder.
+
+The limit adapts AIMD-style between 1 and AUTO_CLAUDE_MAX_PARALLEL_AGENTS
+(default 4):
+- A session whose first response arrives in normal time raises it by
+  1/limit, i.e. roughly +1 per "limit" healthy sessions.
+- A rate-limit or overload error (429/529) halves it.
+- A first response much slower than the best seen lowers it by 20%.
+Decreases happen at most once per cooldown, so a burst of errors from
+sessions that started together counts once.
+
+Waiting sessions are admitted by priority: interactive work (builds, QA,
+merges) first, then normal work (specs, ideation, roadmap), then
+background work (PR review, triage, batching). Background sessions leave
+one slot free when the limit is above 1, so a build never queues behind a
+full triage run.
+
+Live slot usage is available from get_governor().stats() and from
+listeners registered with add_listener().
+
+Usage:
+    from core.agent_limiter import Priority, agent_slot
+
+    async with agent_slot(Priority.BACKGROUND) as slot:
+        ...
+        slot.record_latency(seconds)
+"""
+
+import asyncio
+import contextvars
+import heapq
+import itertools
+import os
+import re
+import threading
+import time
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any
+
+MAX_PARALLEL_AGENTS_ENV = "AUTO_CLAUDE_MAX_PARALLEL_AGENTS"
+DEFAULT_MAX_PARALLEL_AGENTS = 4
+
+DECREASE_FACTOR = 0.5
+LATENCY_DECREASE_FACTOR = 0.8
+DECREASE_COOLDOWN_SECONDS = 10.0
+# First responses slower than this multiple of the fastest seen count as
+# congestion, but only above the floor (short prompts vary a lot)
+SLOW_LATENCY_RATIO = 3.0
+SLOW_LATENCY_FLOOR_SECONDS = 5.0
+_LATENCY_EWMA_ALPHA = 0.3
+
+# Status codes only count next to "status", "error" or "HTTP", so issue
+# numbers and line numbers in unrelated errors don't shrink the limit
+_RATE_LIMIT_PATTERN = re.compile(
+    r"\b(?:status(?:[ _]code)?|error|http)\W{0,3}(?:429|529)\b"
+    r"|\brate[ _-]?limit|\boverloaded(?:_error)?\b"
+    r"|too many requests",
+    re.IGNORECASE,
+)
+
+
+class Priority(IntEnum):
+    """Admission priority of an agent session (lower is served first)."""
+
+    INTERACTIVE = 0
+    NORMAL = 1
+    BACKGROUND = 2
+
+
+_AGENT_TYPE_PRIORITIES = {
+    "coder": Priority.INTERACTIVE,
+    "planner": Priority.INTERACTIVE,
+    "qa_reviewer": Priority.INTERACTIVE,
+    "qa_fixer": Priority.INTERACTIVE,
+    "merge_resolver": Priority.INTERACTIVE,
+    "commit_message": Priority.INTERACTIVE,
+    "pr_reviewer": Priority.BACKGROUND,
+    "pr_orchestrator_parallel": Priority.BACKGROUND,
+    "pr_followup_parallel": Priority.BACKGROUND,
+    "batch_analysis": Priority.BACKGROUND,
+    "batch_validation": Priority.BACKGROUND,
+}
+
+
+def priority_for_agent_type(agent_type: str) -> Priority:
+    """Default priority of an agent type from AGENT_CONFIGS."""
+    return _AGENT_TYPE_PRIORITIES.get(agent_type, Priority.NORMAL)
+
+
+def is_rate_limit_error(error: BaseException | str) -> bool:
+    """Whether an error (or error text) reports API rate limiting or overload."""
+    return bool(_RATE_LIMIT_PATTERN.search(str(error)))
+
+
+def get_max_parallel_agents() -> int:
+    """Process-wide upper limit on concurrent agent sessions."""
+    try:
+        limit = int(
+            os.environ.get(MAX_PARALLEL_AGENTS_ENV, DEFAULT_MAX_PARALLEL_AGENTS)
+        )
+    except ValueError:
+        return DEFAULT_MAX_PARALLEL_AGENTS
+    return max(1, limit)
+
+
+@dataclass
+class GovernorStats:
+    """Snapshot of governor state for display."""
+
+    limit: int
+    max_limit: int
+    in_use: int
+    in_use_by_priority: dict[str, int]
+    waiting_by_priority: dict[str, int]
+    rate_limits: int = 0
+    latency_ewma: float | None = None
+
+    @property
+    def waiting(self) -> int:
+        return sum(self.waiting_by_priority.values())
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "max_limit": self.max_limit,
+            "in_use": self.in_use,
+            "waiting": self.waiting,
+            "in_use_by_priority": self.in_use_by_priority,
+            "waiting_by_priority": self.waiting_by_priority,
+            "rate_limits": self.rate_limits,
+            "latency_ewma": self.latency_ewma,
+        }
+
+
+@dataclass
+class _Waiter:
+    priority: Priority
+    seq: int
+    loop: asyncio.AbstractEventLoop
+    future: asyncio.Future
+    granted: bool = False
+    cancelled: bool = False
+
+    def __lt__(self, other: "_Waiter") -> bool:
+        return (self.priority, self.seq) < (other.priority, other.seq)
+
+
+@dataclass
+class AgentSlot:
+    """A held slot. Report what the session observed so the limit adapts."""
+
+    governor: "ConcurrencyGovernor"
+    priority: Priority
+    released: bool = field(default=False, init=False)
+
+    def record_latency(self, seconds: float) -> None:
+        """Report the time to the session's first response."""
+        self.governor.record_latency(seconds)
+
+    def record_error(self, error: BaseException | str) -> None:
+        """Report a session error; rate-limit errors shrink the limit."""
+        if is_rate_limit_error(error):
+            self.governor.record_rate_limit()
+
+    def release(self) -> None:
+        if not self.released:
+            self.released = True
+            self.governor.release(self.priority)
+
+
+class ConcurrencyGovernor:
+    """
+    AIMD concurrency limit with priority admission.
+
+    Thread-safe: sessions may run on different event loops (for example
+    runners started in worker threads). Waiters are woken on their own
+    loop.
+    """
+
+    def __init__(
+        self,
+        max_limit: int,
+        min_limit: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_limit = max(min_limit, max_limit)
+        self.min_limit = min_limit
+        self._limit = float(self.max_limit)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._in_use = dict.fromkeys(Priority, 0)
+        self._waiters: list[_Waiter] = []
+        self._seq = itertools.count()
+        self._last_decrease = float("-inf")
+        self._min_latency: float | None = None
+        self._latency_ewma: float | None = None
+        self._rate_limits = 0
+        self._listeners: list[Callable[[GovernorStats], None]] = []
+
+    # ==================== Limit ====================
+
+    @property
+    def limit(self) -> int:
+        return max(self.min_limit, int(self._limit))
+
+    def set_max_limit(self, max_limit: int) -> None:
+        """Change the upper bound (the current limit is clamped to it)."""
+        with self._lock:
+            self.max_limit = max(self.min_limit, max_limit)
+            self._limit = min(self._limit, float(self.max_limit))
+            self._dispatch()
+        self._notify()
+
+    def _decrease(self, factor: float) -> bool:
+        now = self._clock()
+        if now - self._last_decrease < DECREASE_COOLDOWN_SECONDS:
+            return False
+        self._last_decrease = now
+        self._limit = max(float(self.min_limit), self._limit * factor)
+        return True
+
+    def record_rate_limit(self) -> None:
+        """Multiplicative decrease after a rate-limit or overload error."""
+        with self._lock:
+            self._rate_limits += 1
+            self._decrease(DECREASE_FACTOR)
+        self._notify()
+
+    def record_latency(self, seconds: float) -> None:
+        """Additive increase on a normal response, decrease on a slow one."""
+        with self._lock:
+            if self._latency_ewma is None:
+                self._latency_ewma = seconds
+            else:
+                self._latency_ewma += _LATENCY_EWMA_ALPHA * (
+                    seconds - self._latency_ewma
+                )
+            if self._min_latency is None or seconds < self._min_latency:
+                self._min_latency = seconds
+
+            slow = (
+                seconds > SLOW_LATENCY_FLOOR_SECONDS
+                and seconds > SLOW_LATENCY_RATIO * self._min_latency
+            )
+            if slow:
+                self._decrease(LATENCY_DECREASE_FACTOR)
+            else:
+                self._limit = min(
+                    float(self.max_limit), self._limit + 1.0 / max(self._limit, 1.0)
+                )
+                self._dispatch()
+        self._notify()
+
+    # ==================== Slots ====================
+
+    def _capacity(self, priority: Priority) -> int:
+        limit = self.limit
+        if priority == Priority.BACKGROUND and limit > 1:
+            return limit - 1
+        return limit
+
+    def _can_admit(self, priority: Priority) -> bool:
+        return sum(self._in_use.values()) < self._capacity(priority)
+
+    def _has_waiters_before(self, priority: Priority) -> bool:
+        return any(not w.cancelled and w.priority <= priority for w in self._waiters)
+
+    def _dispatch(self) -> None:
+        """Admit queued sessions while there is room. Caller holds the lock."""
+        while self._waiters:
+            waiter = self._waiters[0]
+            if waiter.cancelled:
+                heapq.heappop(self._waiters)
+                continue
+            if not self._can_admit(waiter.priority):
+                return
+            heapq.heappop(self._waiters)
+            try:
+                waiter.loop.call_soon_threadsafe(_resolve, waiter.future)
+            except RuntimeError:
+                # The waiter's loop is closed
+                continue
+            waiter.granted = True
+            self._in_use[waiter.priority] += 1
+
+    def try_acquire(self, priority: Priority = Priority.NORMAL) -> AgentSlot | None:
+        """Take a slot without waiting, or return None."""
+        with self._lock:
+            if self._has_waiters_before(priority) or not self._can_admit(priority):
+                return None
+            self._in_use[priority] += 1
+        self._notify()
+        return AgentSlot(self, priority)
+
+    async def acquire(self, priority: Priority = Priority.NORMAL) -> AgentSlot:
+        """Wait for a slot."""
+        slot = self.try_acquire(priority)
+        if slot is not None:
+            return slot
+
+        loop = asyncio.get_running_loop()
+        waiter = _Waiter(priority, next(self._seq), loop, loop.create_future())
+        with self._lock:
+            heapq.heappush(self._waiters, waiter)
+            self._dispatch()
+        self._notify()
+
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            with self._lock:
+                granted = waiter.granted
+                waiter.cancelled = True
+            if granted:
+                self.release(priority)
+            else:
+                self._notify()
+            raise
+        return AgentSlot(self, priority)
+
+    def release(self, priority: Priority) -> None:
+        with self._lock:
+            self._in_use[priority] = max(0, self._in_use[priority] - 1)
+            self._dispatch()
+        self._notify()
+
+    # ==================== Stats ====================
+
+    def stats(self) -> GovernorStats:
+        with self._lock:
+            waiting = dict.fromkeys((p.name.lower() for p in Priority), 0)
+            for waiter in self._waiters:
+                if not waiter.cancelled:
+                    waiting[waiter.priority.name.lower()] += 1
+            return GovernorStats(
+                limit=self.limit,
+                max_limit=self.max_limit,
+                in_use=sum(self._in_use.values()),
+                in_use_by_priority={
+                    p.name.lower(): count for p, count in self._in_use.items()
+                },
+                waiting_by_priority=waiting,
+                rate_limits=self._rate_limits,
+                latency_ewma=self._latency_ewma,
+            )
+
+    def add_listener(self, listener: Callable[[GovernorStats], None]) -> None:
+        """Call listener with fresh stats whenever slot usage or the limit changes."""
+        with self._lock:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[GovernorStats], None]) -> None:
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def _notify(self) -> None:
+        with self._lock:
+            listeners = list(self._listeners)
+        if not listeners:
+            return
+        stats = self.stats()
+        for listener in listeners:
+            try:
+                listener(stats)
+            except Exception:
+                pass
+
+
+def _resolve(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+_governor: ConcurrencyGovernor | None = None
+_governor_lock = threading.Lock()
+
+# Slot held by the current task, so nested agent_slot() calls do not
+# take a second slot (and cannot deadlock at a limit of 1)
+_current_slot: contextvars.ContextVar[tuple[Any, AgentSlot] | None] = (
+    contextvars.ContextVar("agent_slot", default=None)
+)
+
+
+def get_governor() -> ConcurrencyGovernor:
+    """The process-wide governor (its bound follows the environment)."""
+    global _governor
+    max_limit = get_max_parallel_agents()
+    with _governor_lock:
+        if _governor is None:
+            _governor = ConcurrencyGovernor(max_limit)
+            return _governor
+    if _governor.max_limit != max_limit:
+        _governor.set_max_limit(max_limit)
+    return _governor
+
+
+def reset_governor() -> None:
+    """Discard the process-wide governor (for tests)."""
+    global _governor
+    with _governor_lock:
+        _governor = None
+
+
+@asynccontextmanager
+async def agent_slot(
+    priority: Priority = Priority.NORMAL,
+) -> AsyncIterator[AgentSlot]:
+    """
+    Hold one of the process-wide agent session slots.
+
+    Re-entrant within a task: a nested agent_slot() yields the slot the
+    task already holds. Errors raised inside the block are reported to the
+    governor before the slot is released.
+    """
+    task = asyncio.current_task()
+    held = _current_slot.get()
+    if held is not None and held[0] is task:
+        yield held[1]
+        return
+
+    slot = await get_governor().acquire(priority)
+    token = _current_slot.set((task, slot))
+    try:
+        yield slot
+    except BaseException as e:
+        slot.record_error(e)
+        raise
+    finally:
+        _current_slot.reset(token)
+        slot.release()
+
+
+class GovernedClient:
+    """
+    Agent client wrapper whose session holds a governor slot.
+
+    The slot is taken in ``async with client`` before the session
+    connects and released after it disconnects. The time from query() to
+    the first response message and any rate-limit errors are reported to
+    the governor. Everything else is delegated to the wrapped client.
+    """
+
+    def __init__(self, client: Any, priority: Priority = Priority.NORMAL):
+        self._client = client
+        self.priority = priority
+        self._slot_context = None
+        self._slot: AgentSlot | None = None
+        self._query_started: float | None = None
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
+
+    async def __aenter__(self) -> "GovernedClient":
+        self._slot_context = agent_slot(self.priority)
+        self._slot = await self._slot_context.__aenter__()
+        try:
+            await self._client.__aenter__()
+        except BaseException as e:
+            await self._exit_slot(type(e), e, e.__traceback__)
+            raise
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        try:
+            return bool(await self._client.__aexit__(exc_type, exc, tb))
+        finally:
+            await self._exit_slot(exc_type, exc, tb)
+
+    async def _exit_slot(self, exc_type, exc, tb) -> None:
+        context, self._slot_context, self._slot = self._slot_context, None, None
+        if context is not None:
+            await context.__aexit__(exc_type, exc, tb)
+
+    async def query(self, *args: Any, **kwargs: Any) -> Any:
+        self._query_started = time.monotonic()
+        return await self._client.query(*args, **kwargs)
+
+    async def receive_response(self) -> AsyncIterator[Any]:
+        async for message in self._client.receive_response():
+            if self._query_started is not None and self._slot is not None:
+                self._slot.record_latency(time.monotonic() - self._query_started)
+                self._query_started = None
+            if self._slot is not None and type(message).__name__ == "ResultMessage":
+                if getattr(message, "is_error", False):
+                    self._slot.record_error(getattr(message, "result", "") or "")
+            yield message
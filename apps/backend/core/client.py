@@ -33,6 +33,21 @@ _PROJECT_INDEX_CACHE: dict[str, tuple[dict[str, Any], dict[str, bool], float]] =
 _CACHE_TTL_SECONDS = 300  # 5 minute TTL
 _CACHE_LOCK = threading.Lock()  # Protects _PROJECT_INDEX_CACHE access
 
+# Long-running processes can watch the index and its manifests with inotify
+# instead: entries are then dropped as soon as anything changes, and the TTL
+# no longer applies while the watcher has a freshness record to follow.
+WATCH_PROJECT_INDEX_ENV = "AUTO_CLAUDE_WATCH_PROJECT_INDEX"
+
+
+def _watch_project_index(project_dir: Path) -> bool:
+    """Start an index watcher for the project if watching is enabled."""
+    if os.environ.get(WATCH_PROJECT_INDEX_ENV, "").lower() not in ("true", "1"):
+        return False
+    watcher = watch_project_index(
+        project_dir, lambda: invalidate_project_cache(project_dir)
+    )
+    return watcher is not None and watcher.tracking
+
 
 def _get_cached_project_data(
     project_dir: Path,
@@ -50,13 +65,14 @@ def _get_cached_project_data(
     key = str(project_dir.resolve())
     now = time.time()
     debug = os.environ.get("DEBUG", "").lower() in ("true", "1")
+    watched = _watch_project_index(project_dir)
 
     # Check cache with lock
     with _CACHE_LOCK:
         if key in _PROJECT_INDEX_CACHE:
             cached_index, cached_capabilities, cached_time = _PROJECT_INDEX_CACHE[key]
             cache_age = now - cached_time
-            if cache_age < _CACHE_TTL_SECONDS:
+            if watched or cache_age < _CACHE_TTL_SECONDS:
                 if debug:
                     print(
                         f"[ClientCache] Cache HIT for project index (age: {cache_age:.1f}s / TTL: {_CACHE_TTL_SECONDS}s)"
@@ -87,7 +103,7 @@ def _get_cached_project_data(
         if key in _PROJECT_INDEX_CACHE:
             cached_index, cached_capabilities, cached_time = _PROJECT_INDEX_CACHE[key]
             cache_age = time.time() - cached_time
-            if cache_age < _CACHE_TTL_SECONDS:
+            if watched or cache_age < _CACHE_TTL_SECONDS:
                 # Another thread already cached valid data while we were loading
                 if debug:
                     print(
@@ -133,8 +149,10 @@ from agents.tools_pkg import (
 )
 from claude_agent_sdk import ClaudeAgentOptions, ClaudeSDKClient
 from claude_agent_sdk.types import HookMatcher
+from core.agent_limiter import GovernedClient, Priority, priority_for_agent_type
 from core.auth import get_sdk_env_vars, require_auth_token
 from linear_updater import is_linear_enabled
+from prompts_pkg.index_freshness import watch_project_index
 from prompts_pkg.project_context import detect_project_capabilities, load_project_index
 from security import bash_security_hook
 
@@ -441,7 +459,8 @@ def create_client(
     max_thinking_tokens: int | None = None,
     output_format: dict | None = None,
     agents: dict | None = None,
-) -> ClaudeSDKClient:
+    priority: Priority | None = None,
+) -> GovernedClient:
     """
     Create a Claude Agent SDK client with multi-layered security.
 
@@ -467,9 +486,12 @@ def create_client(
                Format: {"agent-name": {"description": "...", "prompt": "...",
                         "tools": [...], "model": "inherit"}}
                See: https://platform.claude.com/docs/en/agent-sdk/subagents
+        priority: Admission priority for the process-wide concurrency governor
+                 (None = default for agent_type, see core.agent_limiter)
 
     Returns:
-        Configured ClaudeSDKClient
+        Configured ClaudeSDKClient, wrapped so that its session holds a
+        governor slot
 
     Raises:
         ValueError: If agent_type is not found in AGENT_CONFIGS
@@ -754,4 +776,7 @@ def create_client(
     if agents:
         options_kwargs["agents"] = agents
 
-    return ClaudeSDKClient(options=ClaudeAgentOptions(**options_kwargs))
+    return GovernedClient(
+        ClaudeSDKClient(options=ClaudeAgentOptions(**options_kwargs)),
+        priority if priority is not None else priority_for_agent_type(agent_type),
+    )
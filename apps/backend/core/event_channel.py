@@ -0,0 +1,267 @@
+"""
+Out-of-band event channel for frontend UI markers.
+
+By default, task-log markers (``__TASK_LOG_*__:``) and phase events
+(``__EXEC_PHASE__:``) are printed to stdout with a flush per event, and the
+frontend scans all agent stdout for them. When the frontend provides a
+dedicated channel, events are sent there instead:
+
+- ``AUTO_CLAUDE_EVENT_FD``: an inherited, writable file descriptor
+- ``AUTO_CLAUDE_EVENT_SOCKET``: path of a Unix domain socket to connect to
+
+Protocol: each frame is a 4-byte big-endian length followed by a UTF-8 JSON
+array of events, ``[{"type": "TASK_LOG_TOOL_START", "data": {...}}, ...]``.
+Events arriving within ``AUTO_CLAUDE_EVENT_COALESCE_MS`` (default 25ms) are
+coalesced into one frame. If no channel is configured, or the channel
+breaks, callers fall back to the stdout markers.
+"""
+
+import atexit
+import json
+import os
+import socket
+import struct
+import sys
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+EVENT_FD_ENV = "AUTO_CLAUDE_EVENT_FD"
+EVENT_SOCKET_ENV = "AUTO_CLAUDE_EVENT_SOCKET"
+COALESCE_MS_ENV = "AUTO_CLAUDE_EVENT_COALESCE_MS"
+
+DEFAULT_COALESCE_MS = 25
+MAX_BATCH_EVENTS = 256
+
+_FRAME_HEADER = struct.Struct(">I")
+_DEBUG = os.environ.get("DEBUG", "").lower() in ("1", "true", "yes")
+
+
+def format_stdout_marker(event_type: str, data: dict[str, Any]) -> str:
+    """Render an event as its stdout marker (``__<TYPE>__:<json>``)."""
+    return f"__{event_type}__:{json.dumps(data, default=str)}"
+
+
+def encode_frame(events: list[dict[str, Any]]) -> bytes:
+    """Encode a batch of events as one length-prefixed frame."""
+    payload = json.dumps(events, default=str).encode("utf-8")
+    return _FRAME_HEADER.pack(len(payload)) + payload
+
+
+def decode_frames(buffer: bytes) -> tuple[list[list[dict[str, Any]]], bytes]:
+    """
+    Decode all complete frames from a byte buffer.
+
+    Returns:
+        (list of event batches, remaining incomplete bytes)
+    """
+    batches = []
+    offset = 0
+    while len(buffer) - offset >= _FRAME_HEADER.size:
+        (length,) = _FRAME_HEADER.unpack_from(buffer, offset)
+        end = offset + _FRAME_HEADER.size + length
+        if end > len(buffer):
+            break
+        batches.append(json.loads(buffer[offset + _FRAME_HEADER.size : end]))
+        offset = end
+    return batches, buffer[offset:]
+
+
+class EventChannel:
+    """
+    Coalescing, length-prefixed event writer.
+
+    Events are buffered and written by a background thread once per
+    coalescing window (or immediately when the batch is full).
+    """
+
+    def __init__(
+        self,
+        write: Callable[[bytes], Any],
+        close: Callable[[], Any] | None = None,
+        coalesce_ms: float = DEFAULT_COALESCE_MS,
+    ):
+        self._write = write
+        self._close = close
+        self._coalesce = max(coalesce_ms, 0) / 1000
+        self._pending: list[dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.closed = False
+
+    def send(self, event_type: str, data: dict[str, Any]) -> bool:
+        """
+        Queue an event for the channel.
+
+        Returns:
+            False if the channel was already closed (caller should fall back
+            to stdout). Once queued, the event is delivered exactly once:
+            over the channel, or replayed to stdout if the channel breaks.
+        """
+        with self._lock:
+            if self.closed:
+                return False
+            self._pending.append({"type": event_type, "data": dict(data)})
+            batch_full = len(self._pending) >= MAX_BATCH_EVENTS
+
+        if self._coalesce == 0 or batch_full:
+            self.flush()
+        else:
+            self._ensure_flusher()
+            self._wakeup.set()
+        return True
+
+    def flush(self) -> None:
+        """Write all pending events as a single frame."""
+        with self._lock:
+            batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        with self._write_lock:
+            if not self.closed:
+                try:
+                    self._write(encode_frame(batch))
+                    return
+                except (OSError, ValueError) as e:
+                    # Under the queue lock, so no event is queued after this
+                    # without the sender seeing the channel closed
+                    with self._lock:
+                        self.closed = True
+                    if _DEBUG:
+                        print(
+                            f"[event_channel] write failed, using stdout: {e}",
+                            file=sys.stderr,
+                            flush=True,
+                        )
+
+        # Channel is gone - don't lose the batch, replay it as stdout markers
+        for event in batch:
+            try:
+                print(format_stdout_marker(event["type"], event["data"]), flush=True)
+            except (OSError, UnicodeEncodeError):
+                pass
+
+    def close(self) -> None:
+        """Flush remaining events and close the underlying channel."""
+        self.flush()
+        with self._lock:
+            self.closed = True
+        # Events queued since the flush above are replayed to stdout
+        self.flush()
+        self._wakeup.set()
+        if self._close:
+            try:
+                self._close()
+            except OSError:
+                pass
+
+    def _ensure_flusher(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="event-channel", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while not self.closed:
+            self._wakeup.wait()
+            if self.closed:
+                break
+            # Let the window fill up, then write everything in one frame
+            time.sleep(self._coalesce)
+            self._wakeup.clear()
+            self.flush()
+        # Replay anything queued before a failed write closed the channel
+        self.flush()
+
+
+_channel: EventChannel | None = None
+_channel_initialized = False
+_init_lock = threading.Lock()
+
+
+def _open_from_env() -> EventChannel | None:
+    try:
+        coalesce_ms = float(os.environ.get(COALESCE_MS_ENV, DEFAULT_COALESCE_MS))
+    except ValueError:
+        coalesce_ms = DEFAULT_COALESCE_MS
+
+    fd_value = os.environ.get(EVENT_FD_ENV)
+    if fd_value:
+        try:
+            stream = os.fdopen(int(fd_value), "wb", buffering=0)
+        except (OSError, ValueError) as e:
+            if _DEBUG:
+                print(f"[event_channel] bad {EVENT_FD_ENV}: {e}", file=sys.stderr)
+            return None
+
+        def write_all(frame: bytes) -> None:
+            # Unbuffered pipe writes may be partial
+            view = memoryview(frame)
+            while view:
+                written = stream.write(view)
+                view = view[written or 0 :]
+
+        return EventChannel(write_all, stream.close, coalesce_ms)
+
+    socket_path = os.environ.get(EVENT_SOCKET_ENV)
+    if socket_path and hasattr(socket, "AF_UNIX"):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(socket_path)
+        except OSError as e:
+            sock.close()
+            if _DEBUG:
+                print(f"[event_channel] connect failed: {e}", file=sys.stderr)
+            return None
+        return EventChannel(sock.sendall, sock.close, coalesce_ms)
+
+    return None
+
+
+def get_event_channel() -> EventChannel | None:
+    """Get the process-wide event channel, or None if not configured."""
+    global _channel, _channel_initialized
+    if not _channel_initialized:
+        with _init_lock:
+            if not _channel_initialized:
+                _channel = _open_from_env()
+                if _channel is not None:
+                    atexit.register(_channel.close)
+                _channel_initialized = True
+    return _channel
+
+
+def send_event(event_type: str, data: dict[str, Any]) -> bool:
+    """
+    Send an event over the out-of-band channel if one is configured.
+
+    Args:
+        event_type: Marker type without underscores (e.g. "EXEC_PHASE")
+        data: JSON-serializable payload
+
+    Returns:
+        True if the channel accepted the event; False means the caller
+        should print the stdout marker instead
+    """
+    channel = get_event_channel()
+    if channel is None:
+        return False
+    return channel.send(event_type, data)
+
+
+def reset_event_channel() -> None:
+    """Close and forget the current channel (re-reads env on next use)."""
+    global _channel, _channel_initialized
+    with _init_lock:
+        if _channel is not None:
+            _channel.close()
+        _channel = None
+        _channel_initialized = False
@@ -2,6 +2,9 @@
 Execution phase event protocol for frontend synchronization.
 
 Protocol: __EXEC_PHASE__:{"phase":"coding","message":"Starting"}
+
+Events go over the out-of-band channel (core.event_channel) when the
+frontend provides one; stdout markers are the fallback.
 """
 
 import json
@@ -10,6 +13,8 @@ import sys
 from enum import Enum
 from typing import Any
 
+from core.event_channel import send_event
+
 PHASE_MARKER_PREFIX = "__EXEC_PHASE__:"
 _DEBUG = os.environ.get("DEBUG", "").lower() in ("1", "true", "yes")
 
@@ -48,6 +53,9 @@ def emit_phase(
     if subtask is not None:
         payload["subtask"] = subtask
 
+    if send_event("EXEC_PHASE", payload):
+        return
+
     try:
         print(f"{PHASE_MARKER_PREFIX}{json.dumps(payload, default=str)}", flush=True)
     except (OSError, UnicodeEncodeError) as e:
@@ -9,6 +9,7 @@ Enhanced with colored output, icons, and better visual formatting.
 """
 
 import json
+from collections.abc import Iterable
 from pathlib import Path
 
 from ui import (
@@ -417,42 +418,59 @@ def get_next_subtask(spec_dir: Path) -> dict | None:
     try:
         with open(plan_file) as f:
             plan = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
 
-        phases = plan.get("phases", [])
+    return find_next_subtask(plan)
 
-        # Build a map of phase completion
-        phase_complete = {}
-        for phase in phases:
-            phase_id = phase.get("id") or phase.get("phase")
-            subtasks = phase.get("subtasks", [])
-            phase_complete[phase_id] = all(
-                s.get("status") == "completed" for s in subtasks
-            )
 
-        # Find next available subtask
-        for phase in phases:
-            phase_id = phase.get("id") or phase.get("phase")
-            depends_on = phase.get("depends_on", [])
+def find_next_subtask(plan: dict, assume_completed: Iterable[str] = ()) -> dict | None:
+    """
+    Find the next pending subtask in an already-loaded plan.
 
-            # Check if dependencies are satisfied
-            deps_satisfied = all(phase_complete.get(dep, False) for dep in depends_on)
-            if not deps_satisfied:
-                continue
+    Args:
+        plan: Parsed implementation_plan.json
+        assume_completed: Subtask IDs to treat as completed (used to predict
+            what comes after the subtask currently being worked on)
 
-            # Find first pending subtask in this phase
-            for subtask in phase.get("subtasks", []):
-                if subtask.get("status") == "pending":
-                    return {
-                        "phase_id": phase_id,
-                        "phase_name": phase.get("name"),
-                        "phase_num": phase.get("phase"),
-                        **subtask,
-                    }
+    Returns:
+        The next subtask dict to work on, or None if all complete
+    """
+    assumed = set(assume_completed)
 
-        return None
+    def is_completed(subtask: dict) -> bool:
+        return subtask.get("status") == "completed" or subtask.get("id") in assumed
 
-    except (OSError, json.JSONDecodeError):
-        return None
+    phases = plan.get("phases", [])
+
+    # Build a map of phase completion
+    phase_complete = {}
+    for phase in phases:
+        phase_id = phase.get("id") or phase.get("phase")
+        subtasks = phase.get("subtasks", [])
+        phase_complete[phase_id] = all(is_completed(s) for s in subtasks)
+
+    # Find next available subtask
+    for phase in phases:
+        phase_id = phase.get("id") or phase.get("phase")
+        depends_on = phase.get("depends_on", [])
+
+        # Check if dependencies are satisfied
+        deps_satisfied = all(phase_complete.get(dep, False) for dep in depends_on)
+        if not deps_satisfied:
+            continue
+
+        # Find first pending subtask in this phase
+        for subtask in phase.get("subtasks", []):
+            if subtask.get("status") == "pending" and subtask.get("id") not in assumed:
+                return {
+                    "phase_id": phase_id,
+                    "phase_name": phase.get("name"),
+                    "phase_num": phase.get("phase"),
+                    **subtask,
+                }
+
+    return None
 
 
 def format_duration(seconds: float) -> str:
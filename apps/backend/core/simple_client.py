@@ -25,6 +25,7 @@ from pathlib import Path
 
 from agents.tools_pkg import get_agent_config, get_default_thinking_level
 from claude_agent_sdk import ClaudeAgentOptions, ClaudeSDKClient
+from core.agent_limiter import GovernedClient, Priority, priority_for_agent_type
 from core.auth import get_sdk_env_vars, require_auth_token
 from phase_config import get_thinking_budget
 
@@ -36,7 +37,8 @@ def create_simple_client(
     cwd: Path | None = None,
     max_turns: int = 1,
     max_thinking_tokens: int | None = None,
-) -> ClaudeSDKClient:
+    priority: Priority | None = None,
+) -> GovernedClient:
     """
     Create a minimal Claude SDK client for single-turn utility operations.
 
@@ -57,9 +59,12 @@ def create_simple_client(
         max_turns: Maximum conversation turns (default: 1 for single-turn)
         max_thinking_tokens: Override thinking budget (None = use agent default from
                             AGENT_CONFIGS, converted using phase_config.THINKING_BUDGET_MAP)
+        priority: Admission priority for the process-wide concurrency governor
+                 (None = default for agent_type, see core.agent_limiter)
 
     Returns:
-        Configured ClaudeSDKClient for single-turn operations
+        Configured ClaudeSDKClient for single-turn operations, wrapped so that
+        its session holds a governor slot
 
     Raises:
         ValueError: If agent_type is not found in AGENT_CONFIGS
@@ -84,7 +89,7 @@ def create_simple_client(
         thinking_level = get_default_thinking_level(agent_type)
         max_thinking_tokens = get_thinking_budget(thinking_level)
 
-    return ClaudeSDKClient(
+    client = ClaudeSDKClient(
         options=ClaudeAgentOptions(
             model=model,
             system_prompt=system_prompt,
@@ -95,3 +100,7 @@ def create_simple_client(
             max_thinking_tokens=max_thinking_tokens,
         )
     )
+    return GovernedClient(
+        client,
+        priority if priority is not None else priority_for_agent_type(agent_type),
+    )
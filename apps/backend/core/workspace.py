@@ -81,7 +81,6 @@ from core.workspace.display import (
 )
 from core.workspace.git_utils import (
     MAX_PARALLEL_AI_MERGES,
-    _is_auto_claude_file,
     get_existing_build_worktree,
 )
 from core.workspace.git_utils import (
@@ -110,6 +109,7 @@ from core.workspace.models import (
     ParallelMergeResult,
     ParallelMergeTask,
 )
+from core.workspace.preflight import check_git_conflicts
 from merge import (
     FileTimelineTracker,
     MergeOrchestrator,
@@ -538,141 +538,22 @@ def _check_git_conflicts(project_dir: Path, spec_name: str) -> dict:
     Check for git-level conflicts WITHOUT modifying the working directory.
 
     Uses git merge-tree to check conflicts in-memory, avoiding HMR triggers
-    from file system changes.
+    from file system changes. Delegates to the batched merge preflight, which
+    caches results by (base SHA, spec SHA).
 
     Returns:
         Dict with has_conflicts, conflicting_files, etc.
     """
-    import re
-
-    spec_branch = f"auto-claude/{spec_name}"
-    result = {
-        "has_conflicts": False,
-        "conflicting_files": [],
-        "base_branch": "main",
-        "spec_branch": spec_branch,
-    }
-
     try:
-        # Get current branch
-        base_result = subprocess.run(
-            ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-            cwd=project_dir,
-            capture_output=True,
-            text=True,
-        )
-        if base_result.returncode == 0:
-            result["base_branch"] = base_result.stdout.strip()
-
-        # Get merge base
-        merge_base_result = subprocess.run(
-            ["git", "merge-base", result["base_branch"], spec_branch],
-            cwd=project_dir,
-            capture_output=True,
-            text=True,
-        )
-        if merge_base_result.returncode != 0:
-            debug_warning(MODULE, "Could not find merge base")
-            return result
-
-        merge_base = merge_base_result.stdout.strip()
-
-        # Get commit hashes
-        main_commit_result = subprocess.run(
-            ["git", "rev-parse", result["base_branch"]],
-            cwd=project_dir,
-            capture_output=True,
-            text=True,
-        )
-        spec_commit_result = subprocess.run(
-            ["git", "rev-parse", spec_branch],
-            cwd=project_dir,
-            capture_output=True,
-            text=True,
-        )
-
-        if main_commit_result.returncode != 0 or spec_commit_result.returncode != 0:
-            debug_warning(MODULE, "Could not resolve branch commits")
-            return result
-
-        main_commit = main_commit_result.stdout.strip()
-        spec_commit = spec_commit_result.stdout.strip()
-
-        # Use git merge-tree to check for conflicts WITHOUT touching working directory
-        # Note: --write-tree mode only accepts 2 branches (it auto-finds the merge base)
-        merge_tree_result = subprocess.run(
-            [
-                "git",
-                "merge-tree",
-                "--write-tree",
-                "--no-messages",
-                result["base_branch"],  # Use branch names, not commit hashes
-                spec_branch,
-            ],
-            cwd=project_dir,
-            capture_output=True,
-            text=True,
-        )
-
-        # merge-tree returns exit code 1 if there are conflicts
-        if merge_tree_result.returncode != 0:
-            result["has_conflicts"] = True
-
-            # Parse the output for conflicting files
-            output = merge_tree_result.stdout + merge_tree_result.stderr
-            for line in output.split("\n"):
-                if "CONFLICT" in line:
-                    match = re.search(
-                        r"(?:Merge conflict in|CONFLICT.*?:)\s*(.+?)(?:\s*$|\s+\()",
-                        line,
-                    )
-                    if match:
-                        file_path = match.group(1).strip()
-                        # Skip .auto-claude files - they should never be merged
-                        if (
-                            file_path
-                            and file_path not in result["conflicting_files"]
-                            and not _is_auto_claude_file(file_path)
-                        ):
-                            result["conflicting_files"].append(file_path)
-
-            # Fallback: if we didn't parse conflicts, use diff to find files changed in both branches
-            if not result["conflicting_files"]:
-                main_files_result = subprocess.run(
-                    ["git", "diff", "--name-only", merge_base, main_commit],
-                    cwd=project_dir,
-                    capture_output=True,
-                    text=True,
-                )
-                main_files = (
-                    set(main_files_result.stdout.strip().split("\n"))
-                    if main_files_result.stdout.strip()
-                    else set()
-                )
-
-                spec_files_result = subprocess.run(
-                    ["git", "diff", "--name-only", merge_base, spec_commit],
-                    cwd=project_dir,
-                    capture_output=True,
-                    text=True,
-                )
-                spec_files = (
-                    set(spec_files_result.stdout.strip().split("\n"))
-                    if spec_files_result.stdout.strip()
-                    else set()
-                )
-
-                # Files modified in both = potential conflicts
-                # Filter out .auto-claude files - they should never be merged
-                conflicting = main_files & spec_files
-                result["conflicting_files"] = [
-                    f for f in conflicting if not _is_auto_claude_file(f)
-                ]
-
+        return check_git_conflicts(project_dir, spec_name)
     except Exception as e:
         print(muted(f"  Error checking git conflicts: {e}"))
-
-    return result
+        return {
+            "has_conflicts": False,
+            "conflicting_files": [],
+            "base_branch": "main",
+            "spec_branch": f"auto-claude/{spec_name}",
+        }
 
 
 def _resolve_git_conflicts_with_ai(
@@ -20,14 +20,31 @@ import importlib.util
 import sys
 from pathlib import Path
 
-# Import merge functions from workspace.py (which coexists with this package)
-# We use importlib to explicitly load workspace.py since Python prefers the package
-_workspace_file = Path(__file__).parent.parent / "workspace.py"
-_spec = importlib.util.spec_from_file_location("workspace_module", _workspace_file)
-_workspace_module = importlib.util.module_from_spec(_spec)
-_spec.loader.exec_module(_workspace_module)
-merge_existing_build = _workspace_module.merge_existing_build
-_run_parallel_merges = _workspace_module._run_parallel_merges
+# Merge functions live in workspace.py (which coexists with this package).
+# It is loaded explicitly with importlib, since Python prefers the package,
+# and only on first use because it imports the whole merge system.
+_workspace_module = None
+
+
+def _load_workspace_module():
+    global _workspace_module
+    if _workspace_module is None:
+        _workspace_file = Path(__file__).parent.parent / "workspace.py"
+        _spec = importlib.util.spec_from_file_location(
+            "workspace_module", _workspace_file
+        )
+        module = importlib.util.module_from_spec(_spec)
+        _spec.loader.exec_module(module)
+        _workspace_module = module
+    return _workspace_module
+
+
+def __getattr__(name):
+    """Lazy access to the merge operations in workspace.py."""
+    if name in ("merge_existing_build", "_run_parallel_merges"):
+        return getattr(_load_workspace_module(), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Models and Enums
 # Display Functions
@@ -89,6 +106,13 @@ from .models import (
     WorkspaceMode,
 )
 
+# Merge Preflight
+from .preflight import (
+    check_git_conflicts,
+    check_git_conflicts_batch,
+    list_spec_branches,
+)
+
 # Setup Functions
 from .setup import (
     # Export private names for backward compatibility
@@ -122,6 +146,10 @@ __all__ = [
     "is_binary_file",
     "validate_merged_syntax",
     "create_conflict_file_with_git",
+    # Merge Preflight
+    "check_git_conflicts",
+    "check_git_conflicts_batch",
+    "list_spec_branches",
     # Setup
     "choose_workspace",
     "copy_spec_to_worktree",
@@ -484,9 +484,8 @@ def cleanup_all_worktrees(project_dir: Path, confirm: bool = True) -> bool:
             print_status("Cancelled.", "info")
             return False
 
-    # Clean up all worktrees
-    for wt in worktrees:
-        manager.remove_worktree(wt.spec_name, delete_branch=True)
+    # Clean up all worktrees (and the worktree pool)
+    manager.cleanup_all()
 
     print()
     print_status(f"Cleaned up {len(worktrees)} worktree(s).", "success")
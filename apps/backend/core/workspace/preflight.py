@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+Merge Preflight
+===============
+
+Batched, non-destructive git conflict detection for spec branches.
+
+Checking a single spec used to spawn a separate git process for the current
+branch, the merge-base, both rev-parses, merge-tree and two diffs. With a
+queue of pending specs that process spawning dominates the merge preview.
+
+This module checks many ``auto-claude/{spec}`` branches against the base
+branch in one pass:
+- One ``git for-each-ref`` resolves every branch SHA
+- One ``git merge-tree --stdin --write-tree`` merges all pairs in memory
+- Results are cached by (base SHA, spec SHA) on disk, so an unchanged pair
+  is never re-merged, even across CLI invocations from the UI
+"""
+
+import json
+import os
+import subprocess
+import tempfile
+from pathlib import Path
+
+from .git_utils import _is_auto_claude_file
+
+# Import debug utilities
+try:
+    from debug import debug, debug_warning
+except ImportError:
+
+    def debug(*args, **kwargs):
+        pass
+
+    def debug_warning(*args, **kwargs):
+        pass
+
+
+MODULE = "workspace.preflight"
+
+SPEC_BRANCH_PREFIX = "auto-claude/"
+
+# Cached preflight results live next to other per-project state
+PREFLIGHT_CACHE_FILE = "merge-preflight-cache.json"
+
+# Keep the cache bounded - old (base, spec) pairs are never looked up again
+MAX_PREFLIGHT_CACHE_ENTRIES = 500
+
+
+def _empty_result(spec_name: str, base_branch: str) -> dict:
+    """Default result shape (matches the legacy single-spec checks)."""
+    return {
+        "has_conflicts": False,
+        "conflicting_files": [],
+        "needs_rebase": False,
+        "base_branch": base_branch,
+        "spec_branch": f"{SPEC_BRANCH_PREFIX}{spec_name}",
+        "commits_behind": 0,
+    }
+
+
+def _run_git(
+    project_dir: Path, args: list[str], stdin: str | None = None
+) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        ["git", *args],
+        cwd=project_dir,
+        input=stdin,
+        capture_output=True,
+        text=True,
+    )
+
+
+def _resolve_branch_shas(project_dir: Path) -> dict[str, str]:
+    """Map every local branch name to its commit SHA in one git call."""
+    result = _run_git(
+        project_dir,
+        ["for-each-ref", "--format=%(refname:short) %(objectname)", "refs/heads/"],
+    )
+    shas: dict[str, str] = {}
+    if result.returncode != 0:
+        return shas
+    for line in result.stdout.splitlines():
+        name, _, sha = line.rpartition(" ")
+        if name and sha:
+            shas[name] = sha
+    return shas
+
+
+def _parse_stdin_merge_output(output: str, count: int) -> list[tuple[bool, list[str]]]:
+    """
+    Parse ``git merge-tree --stdin --write-tree --name-only --no-messages``.
+
+    Each merge is emitted NUL-separated as ``<status> <tree> <path>* <empty>``,
+    where status is 1 for a clean merge and 0 when there are conflicts.
+
+    Returns:
+        One (has_conflicts, conflicting_paths) tuple per input line
+    """
+    tokens = output.split("\0")
+    parsed: list[tuple[bool, list[str]]] = []
+    i = 0
+    while len(parsed) < count and i + 1 < len(tokens):
+        status = tokens[i]
+        i += 2  # Skip status and tree OID
+        paths: list[str] = []
+        while i < len(tokens) and tokens[i] != "":
+            paths.append(tokens[i])
+            i += 1
+        i += 1  # Skip the empty token that ends the conflicted-file list
+        parsed.append((status != "1", paths))
+    return parsed
+
+
+def _merge_tree_single(
+    project_dir: Path, base_sha: str, spec_sha: str
+) -> tuple[bool, list[str]] | None:
+    """Per-pair fallback for git versions without ``merge-tree --stdin``."""
+    result = _run_git(
+        project_dir,
+        [
+            "merge-tree",
+            "--write-tree",
+            "--name-only",
+            "--no-messages",
+            base_sha,
+            spec_sha,
+        ],
+    )
+    if result.returncode not in (0, 1):
+        return None
+    # First line is the tree OID, followed by conflicted paths
+    lines = [line for line in result.stdout.splitlines()[1:] if line]
+    return result.returncode == 1, lines
+
+
+def _merge_tree_batch(
+    project_dir: Path, pairs: list[tuple[str, str]]
+) -> list[tuple[bool, list[str]] | None]:
+    """Run all in-memory merges, preferring a single ``--stdin`` process."""
+    if not pairs:
+        return []
+
+    stdin = "".join(f"{base} {spec}\n" for base, spec in pairs)
+    result = _run_git(
+        project_dir,
+        ["merge-tree", "--stdin", "--write-tree", "--name-only", "--no-messages"],
+        stdin=stdin,
+    )
+    if result.returncode == 0:
+        parsed = _parse_stdin_merge_output(result.stdout, len(pairs))
+        if len(parsed) == len(pairs):
+            return list(parsed)
+
+    debug_warning(
+        MODULE,
+        "merge-tree --stdin unavailable, falling back to per-spec merges",
+        returncode=result.returncode,
+    )
+    return [_merge_tree_single(project_dir, base, spec) for base, spec in pairs]
+
+
+def _count_commits_behind(project_dir: Path, base_sha: str, spec_sha: str) -> int:
+    """Commits on base since the merge-base (``spec..base``)."""
+    result = _run_git(project_dir, ["rev-list", "--count", f"{spec_sha}..{base_sha}"])
+    if result.returncode == 0 and result.stdout.strip().isdigit():
+        return int(result.stdout.strip())
+    return 0
+
+
+def _cache_path(project_dir: Path) -> Path:
+    return project_dir / ".auto-claude" / PREFLIGHT_CACHE_FILE
+
+
+def _load_cache(project_dir: Path) -> dict[str, dict]:
+    path = _cache_path(project_dir)
+    if not path.exists():
+        return {}
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def _save_cache(project_dir: Path, cache: dict[str, dict]) -> None:
+    path = _cache_path(project_dir)
+    if len(cache) > MAX_PREFLIGHT_CACHE_ENTRIES:
+        # Dicts preserve insertion order - drop the oldest entries
+        cache = dict(list(cache.items())[-MAX_PREFLIGHT_CACHE_ENTRIES:])
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+        os.replace(tmp, path)
+    except OSError as e:
+        debug_warning(MODULE, f"Could not write preflight cache: {e}")
+
+
+def list_spec_branches(project_dir: Path) -> list[str]:
+    """Return the spec names of all ``auto-claude/*`` branches."""
+    return sorted(
+        name[len(SPEC_BRANCH_PREFIX) :]
+        for name in _resolve_branch_shas(project_dir)
+        if name.startswith(SPEC_BRANCH_PREFIX)
+    )
+
+
+def check_git_conflicts_batch(
+    project_dir: Path,
+    spec_names: list[str] | None = None,
+    base_branch: str | None = None,
+    use_cache: bool = True,
+) -> dict[str, dict]:
+    """
+    Check many spec branches for git-level conflicts in one pass.
+
+    Never touches the working directory (no HMR triggers).
+
+    Args:
+        project_dir: Project root directory
+        spec_names: Specs to check (default: every ``auto-claude/*`` branch)
+        base_branch: Branch to merge into (default: current branch)
+        use_cache: Reuse results for unchanged (base SHA, spec SHA) pairs
+
+    Returns:
+        Dict mapping spec name to a result dict with has_conflicts,
+        conflicting_files, needs_rebase, commits_behind, base_branch and
+        spec_branch
+    """
+    project_dir = Path(project_dir)
+
+    if not base_branch:
+        head = _run_git(project_dir, ["rev-parse", "--abbrev-ref", "HEAD"])
+        base_branch = head.stdout.strip() if head.returncode == 0 else "main"
+
+    branch_shas = _resolve_branch_shas(project_dir)
+    if spec_names is None:
+        spec_names = [
+            name[len(SPEC_BRANCH_PREFIX) :]
+            for name in sorted(branch_shas)
+            if name.startswith(SPEC_BRANCH_PREFIX)
+        ]
+
+    results = {name: _empty_result(name, base_branch) for name in spec_names}
+
+    base_sha = branch_shas.get(base_branch)
+    if not base_sha:
+        # Detached HEAD or a non-branch ref - resolve it directly
+        resolved = _run_git(project_dir, ["rev-parse", "--verify", base_branch])
+        if resolved.returncode != 0:
+            debug_warning(MODULE, f"Could not resolve base branch {base_branch}")
+            return results
+        base_sha = resolved.stdout.strip()
+
+    cache = _load_cache(project_dir) if use_cache else {}
+    to_merge: list[tuple[str, str]] = []  # (spec_name, spec_sha)
+
+    for spec_name in spec_names:
+        spec_sha = branch_shas.get(f"{SPEC_BRANCH_PREFIX}{spec_name}")
+        if not spec_sha:
+            debug_warning(MODULE, f"No branch found for spec {spec_name}")
+            continue
+        cached = cache.get(f"{base_sha}:{spec_sha}")
+        if cached is not None:
+            results[spec_name].update(cached)
+        else:
+            to_merge.append((spec_name, spec_sha))
+
+    debug(
+        MODULE,
+        "Merge preflight",
+        base_branch=base_branch,
+        specs=len(spec_names),
+        cache_hits=len(spec_names) - len(to_merge),
+    )
+
+    merged = _merge_tree_batch(
+        project_dir, [(base_sha, spec_sha) for _, spec_sha in to_merge]
+    )
+
+    for (spec_name, spec_sha), outcome in zip(to_merge, merged):
+        if outcome is None:
+            continue
+        has_conflicts, paths = outcome
+        commits_behind = _count_commits_behind(project_dir, base_sha, spec_sha)
+        entry = {
+            "has_conflicts": has_conflicts,
+            # .auto-claude files should never be merged
+            "conflicting_files": [
+                p for p in dict.fromkeys(paths) if not _is_auto_claude_file(p)
+            ],
+            "needs_rebase": commits_behind > 0,
+            "commits_behind": commits_behind,
+        }
+        results[spec_name].update(entry)
+        cache[f"{base_sha}:{spec_sha}"] = entry
+
+    if use_cache and to_merge:
+        _save_cache(project_dir, cache)
+
+    return results
+
+
+def check_git_conflicts(
+    project_dir: Path, spec_name: str, base_branch: str | None = None
+) -> dict:
+    """Single-spec convenience wrapper around check_git_conflicts_batch()."""
+    return check_git_conflicts_batch(project_dir, [spec_name], base_branch)[spec_name]
@@ -12,7 +12,7 @@ import subprocess
 import sys
 from pathlib import Path
 
-from merge import FileTimelineTracker
+from core.worktree_pool import is_sparse_checkout_enabled, sparse_paths_from_plan
 from ui import (
     Icons,
     MenuOption,
@@ -257,8 +257,13 @@ def setup_workspace(
     manager = WorktreeManager(project_dir, base_branch=base_branch)
     manager.setup()
 
+    # Optionally limit the checkout to the directories the plan touches
+    sparse_paths = None
+    if is_sparse_checkout_enabled() and source_spec_dir:
+        sparse_paths = sparse_paths_from_plan(source_spec_dir) or None
+
     # Get or create worktree for THIS SPECIFIC SPEC
-    worktree_info = manager.get_or_create_worktree(spec_name)
+    worktree_info = manager.get_or_create_worktree(spec_name, sparse_paths)
 
     # Copy .env files to worktree so user can run the project
     copied_env_files = copy_env_files_to_worktree(project_dir, worktree_info.path)
@@ -346,6 +351,9 @@ def initialize_timeline_tracking(
     This registers the task's branch point and the files it intends to modify,
     enabling intent-aware merge conflict resolution later.
     """
+    # Imported here: the merge system is heavy and only needed for new tasks
+    from merge import FileTimelineTracker
+
     try:
         tracker = FileTimelineTracker(project_dir)
 
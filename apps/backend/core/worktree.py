@@ -12,6 +12,9 @@ This allows:
 2. Each spec's changes are isolated
 3. Branches persist until explicitly merged
 4. Clear 1:1:1 mapping: spec → worktree → branch
+
+With AUTO_CLAUDE_WORKTREE_POOL_SIZE set, new worktrees are taken from a
+pool of pre-checked-out worktrees in .worktrees/.pool/ (see worktree_pool).
 """
 
 import asyncio
@@ -22,6 +25,8 @@ import subprocess
 from dataclasses import dataclass
 from pathlib import Path
 
+from core.worktree_pool import WorktreePool, WorktreePoolStats, apply_sparse_checkout
+
 
 class WorktreeError(Exception):
     """Error during worktree operations."""
@@ -57,6 +62,9 @@ class WorktreeManager:
         self.base_branch = base_branch or self._detect_base_branch()
         self.worktrees_dir = project_dir / ".worktrees"
         self._merge_lock = asyncio.Lock()
+        self.pool = WorktreePool(
+            project_dir, self.worktrees_dir, self.base_branch, self._run_git
+        )
 
     def _detect_base_branch(self) -> str:
         """
@@ -291,12 +299,18 @@ class WorktreeManager:
 
         return stats
 
-    def create_worktree(self, spec_name: str) -> WorktreeInfo:
+    def create_worktree(
+        self, spec_name: str, sparse_paths: list[str] | None = None
+    ) -> WorktreeInfo:
         """
         Create a worktree for a spec.
 
+        Uses a pooled worktree when one is available, otherwise runs a cold
+        `git worktree add`.
+
         Args:
             spec_name: The spec folder name (e.g., "002-implement-memory")
+            sparse_paths: Directories to sparse-checkout (None for a full checkout)
 
         Returns:
             WorktreeInfo for the created worktree
@@ -327,17 +341,37 @@ class WorktreeManager:
         # Delete branch if it exists (from previous attempt)
         self._run_git(["branch", "-D", branch_name])
 
-        # Create worktree with new branch from base
-        result = self._run_git(
-            ["worktree", "add", "-b", branch_name, str(worktree_path), self.base_branch]
-        )
-
-        if result.returncode != 0:
-            raise WorktreeError(
-                f"Failed to create worktree for {spec_name}: {result.stderr}"
+        if self.pool.acquire(worktree_path, branch_name, sparse_paths):
+            print(
+                f"Reused pooled worktree: {worktree_path.name} on branch {branch_name}"
             )
+        else:
+            # Create worktree with new branch from base
+            result = self._run_git(
+                [
+                    "worktree",
+                    "add",
+                    "-b",
+                    branch_name,
+                    str(worktree_path),
+                    self.base_branch,
+                ]
+            )
+
+            if result.returncode != 0:
+                raise WorktreeError(
+                    f"Failed to create worktree for {spec_name}: {result.stderr}"
+                )
+
+            if sparse_paths and not apply_sparse_checkout(
+                self._run_git, worktree_path, sparse_paths
+            ):
+                print(f"Warning: Sparse checkout failed for {worktree_path.name}")
 
-        print(f"Created worktree: {worktree_path.name} on branch {branch_name}")
+            print(f"Created worktree: {worktree_path.name} on branch {branch_name}")
+
+        # Get a replacement ready for the next spec while this one runs
+        self.pool.fill_in_background()
 
         return WorktreeInfo(
             path=worktree_path,
@@ -347,12 +381,15 @@ class WorktreeManager:
             is_active=True,
         )
 
-    def get_or_create_worktree(self, spec_name: str) -> WorktreeInfo:
+    def get_or_create_worktree(
+        self, spec_name: str, sparse_paths: list[str] | None = None
+    ) -> WorktreeInfo:
         """
         Get existing worktree or create a new one for a spec.
 
         Args:
             spec_name: The spec folder name
+            sparse_paths: Directories to sparse-checkout if a worktree is created
 
         Returns:
             WorktreeInfo for the worktree
@@ -362,20 +399,28 @@ class WorktreeManager:
             print(f"Using existing worktree: {existing.path}")
             return existing
 
-        return self.create_worktree(spec_name)
+        return self.create_worktree(spec_name, sparse_paths)
 
-    def remove_worktree(self, spec_name: str, delete_branch: bool = False) -> None:
+    def remove_worktree(
+        self, spec_name: str, delete_branch: bool = False, reclaim: bool = True
+    ) -> None:
         """
         Remove a spec's worktree.
 
+        Under the pool's "recycle" policy the worktree is reset and returned
+        to the pool instead of deleted.
+
         Args:
             spec_name: The spec folder name
             delete_branch: Whether to also delete the branch
+            reclaim: Whether the worktree may be returned to the pool
         """
         worktree_path = self.get_worktree_path(spec_name)
         branch_name = self.get_branch_name(spec_name)
 
-        if worktree_path.exists():
+        if worktree_path.exists() and reclaim and self.pool.reclaim(worktree_path):
+            print(f"Returned worktree to pool: {worktree_path.name}")
+        elif worktree_path.exists():
             result = self._run_git(
                 ["worktree", "remove", "--force", str(worktree_path)]
             )
@@ -482,7 +527,8 @@ class WorktreeManager:
             return worktrees
 
         for item in self.worktrees_dir.iterdir():
-            if item.is_dir():
+            # Skip the worktree pool and other internal directories
+            if item.is_dir() and not item.name.startswith("."):
                 info = self.get_worktree_info(item.name)
                 if info:
                     worktrees.append(info)
@@ -538,9 +584,10 @@ class WorktreeManager:
         }
 
     def cleanup_all(self) -> None:
-        """Remove all worktrees and their branches."""
+        """Remove all worktrees, their branches and the worktree pool."""
         for worktree in self.list_all_worktrees():
-            self.remove_worktree(worktree.spec_name, delete_branch=True)
+            self.remove_worktree(worktree.spec_name, delete_branch=True, reclaim=False)
+        self.pool.drain()
 
     def cleanup_stale_worktrees(self) -> None:
         """Remove worktrees that aren't registered with git."""
@@ -556,12 +603,19 @@ class WorktreeManager:
 
         # Remove unregistered directories
         for item in self.worktrees_dir.iterdir():
+            if self.pool.is_pool_path(item):
+                continue
             if item.is_dir() and item not in registered_paths:
                 print(f"Removing stale worktree directory: {item.name}")
                 shutil.rmtree(item, ignore_errors=True)
 
+        self.pool.prune_stale()
         self._run_git(["worktree", "prune"])
 
+    def get_pool_stats(self) -> WorktreePoolStats:
+        """Get worktree pool size, hit rate and reclaim policy."""
+        return self.pool.stats()
+
     def get_test_commands(self, spec_name: str) -> list[str]:
         """Detect likely test/run commands for the project."""
         worktree_path = self.get_worktree_path(spec_name)
@@ -0,0 +1,368 @@
+"""
+Worktree Pool
+=============
+
+Pre-warmed, detached worktrees for spec isolation.
+
+Creating a spec worktree cold means `git worktree add` plus a full
+checkout, which dominates task startup on large repositories. The pool
+keeps a few detached, already checked-out worktrees in .worktrees/.pool/.
+Acquiring one moves it to .worktrees/{spec-name}/ and re-targets it to
+the spec branch with a reset, which only rewrites files that differ from
+the base branch. Removed spec worktrees are reset and returned to the
+pool instead of deleted (reclaim policy "recycle"), so the pool also caps
+how many working copies sit on disk.
+
+Configuration (environment):
+    AUTO_CLAUDE_WORKTREE_POOL_SIZE   Idle worktrees to keep ready (default 0, off)
+    AUTO_CLAUDE_WORKTREE_RECLAIM     "recycle" (default) or "discard"
+    AUTO_CLAUDE_WORKTREE_SPARSE      Sparse-checkout new worktrees to the
+                                     directories in the plan's files_to_modify
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import threading
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+POOL_DIR_NAME = ".pool"
+STATS_FILE = "pool_stats.json"
+
+POOL_SIZE_ENV = "AUTO_CLAUDE_WORKTREE_POOL_SIZE"
+RECLAIM_POLICY_ENV = "AUTO_CLAUDE_WORKTREE_RECLAIM"
+SPARSE_CHECKOUT_ENV = "AUTO_CLAUDE_WORKTREE_SPARSE"
+
+RECLAIM_RECYCLE = "recycle"
+RECLAIM_DISCARD = "discard"
+RECLAIM_POLICIES = (RECLAIM_RECYCLE, RECLAIM_DISCARD)
+
+
+def get_pool_size() -> int:
+    """Configured number of idle worktrees to keep ready."""
+    try:
+        return max(0, int(os.environ.get(POOL_SIZE_ENV, "0")))
+    except ValueError:
+        return 0
+
+
+def get_reclaim_policy() -> str:
+    """Configured reclaim policy for removed spec worktrees."""
+    policy = os.environ.get(RECLAIM_POLICY_ENV, RECLAIM_RECYCLE).strip().lower()
+    return policy if policy in RECLAIM_POLICIES else RECLAIM_RECYCLE
+
+
+def is_sparse_checkout_enabled() -> bool:
+    """Whether new spec worktrees should use sparse checkout."""
+    return os.environ.get(SPARSE_CHECKOUT_ENV, "").lower() in ("1", "true", "yes")
+
+
+def sparse_paths_from_plan(spec_dir: Path) -> list[str]:
+    """
+    Directories to check out for a spec, from its implementation plan.
+
+    Collects the parent directories of every subtask's files_to_modify and
+    files_to_create. Returns an empty list if there is no plan (the caller
+    should then do a full checkout).
+    """
+    plan_file = Path(spec_dir) / "implementation_plan.json"
+    try:
+        plan = json.loads(plan_file.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return []
+
+    directories = set()
+    for phase in plan.get("phases", []):
+        for subtask in phase.get("subtasks", []):
+            files = subtask.get("files_to_modify", []) + subtask.get(
+                "files_to_create", []
+            )
+            for file_path in files:
+                parent = Path(file_path).parent.as_posix()
+                if parent not in (".", ""):
+                    directories.add(parent)
+    return sorted(directories)
+
+
+@dataclass
+class WorktreePoolStats:
+    """Pool configuration and usage counters."""
+
+    size: int
+    idle: int
+    reclaim_policy: str
+    hits: int = 0
+    misses: int = 0
+    reclaimed: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of worktree creations served from the pool."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data["hit_rate"] = round(self.hit_rate, 3)
+        return data
+
+
+class WorktreePool:
+    """
+    Pool of detached, pre-checked-out worktrees.
+
+    Every operation falls back gracefully: if a pooled worktree cannot be
+    moved or reset, acquire() returns False and the caller creates the
+    worktree cold.
+    """
+
+    def __init__(
+        self,
+        project_dir: Path,
+        worktrees_dir: Path,
+        base_branch: str,
+        run_git: Callable[..., subprocess.CompletedProcess],
+        size: int | None = None,
+        reclaim_policy: str | None = None,
+    ):
+        self.project_dir = project_dir
+        self.pool_dir = worktrees_dir / POOL_DIR_NAME
+        self.base_branch = base_branch
+        self.size = get_pool_size() if size is None else size
+        self.reclaim_policy = reclaim_policy or get_reclaim_policy()
+        self._run_git = run_git
+        self._lock = threading.Lock()
+        self._fill_thread: threading.Thread | None = None
+
+    # ==================== Slots ====================
+
+    def _registered_paths(self) -> set[Path]:
+        result = self._run_git(["worktree", "list", "--porcelain"])
+        return {
+            Path(line.split(" ", 1)[1]).resolve()
+            for line in result.stdout.split("\n")
+            if line.startswith("worktree ")
+        }
+
+    def idle_slots(self) -> list[Path]:
+        """Pooled worktrees ready to be acquired."""
+        if not self.pool_dir.exists():
+            return []
+        registered = self._registered_paths()
+        return sorted(
+            item
+            for item in self.pool_dir.iterdir()
+            if item.is_dir() and item.resolve() in registered
+        )
+
+    def is_pool_path(self, path: Path) -> bool:
+        """Whether a path is the pool directory or inside it."""
+        path = Path(path).resolve()
+        pool_dir = self.pool_dir.resolve()
+        return path == pool_dir or pool_dir in path.parents
+
+    def _new_slot_path(self) -> Path:
+        index = 0
+        while (self.pool_dir / f"slot-{index}").exists():
+            index += 1
+        return self.pool_dir / f"slot-{index}"
+
+    def _reset_to_base(self, path: Path) -> bool:
+        """Detach a worktree at the base branch with a clean working tree."""
+        self._run_git(["sparse-checkout", "disable"], cwd=path)
+        result = self._run_git(
+            ["checkout", "--force", "--detach", self.base_branch], cwd=path
+        )
+        if result.returncode != 0:
+            return False
+        # -x: ignored files (.env, build output, spec copies) must not leak
+        # into the next spec that gets this slot
+        return self._run_git(["clean", "-ffdx"], cwd=path).returncode == 0
+
+    def fill(self) -> int:
+        """
+        Create idle worktrees until the pool is full.
+
+        Returns:
+            Number of worktrees created
+        """
+        created = 0
+        with self._lock:
+            if self.size <= 0:
+                return 0
+            self.pool_dir.mkdir(parents=True, exist_ok=True)
+            while len(self.idle_slots()) < self.size:
+                result = self._run_git(
+                    [
+                        "worktree",
+                        "add",
+                        "--detach",
+                        str(self._new_slot_path()),
+                        self.base_branch,
+                    ]
+                )
+                if result.returncode != 0:
+                    break
+                created += 1
+        return created
+
+    def fill_in_background(self) -> None:
+        """Refill the pool in a background thread."""
+        if self.size <= 0 or (self._fill_thread and self._fill_thread.is_alive()):
+            return
+        self._fill_thread = threading.Thread(
+            target=self.fill, name="worktree-pool-fill", daemon=True
+        )
+        self._fill_thread.start()
+
+    def wait(self) -> None:
+        """Wait for a background refill to finish."""
+        if self._fill_thread:
+            self._fill_thread.join()
+
+    def acquire(
+        self, target_path: Path, branch: str, sparse_paths: list[str] | None = None
+    ) -> bool:
+        """
+        Move an idle worktree to target_path and check out a new branch.
+
+        The branch is created (or reset) at the base branch.
+
+        Args:
+            target_path: Spec worktree path
+            branch: Spec branch name
+            sparse_paths: Directories for sparse checkout (None for full)
+
+        Returns:
+            True if a pooled worktree was used, False on a pool miss
+        """
+        if self.size <= 0:
+            return False
+
+        with self._lock:
+            slots = self.idle_slots()
+            if not slots:
+                self._record(misses=1)
+                return False
+
+            slot = slots[0]
+            result = self._run_git(["worktree", "move", str(slot), str(target_path)])
+            if result.returncode != 0:
+                self._record(misses=1)
+                return False
+
+        result = self._run_git(
+            ["checkout", "--force", "-B", branch, self.base_branch], cwd=target_path
+        )
+        if result.returncode != 0 or not self._finish_checkout(
+            target_path, sparse_paths
+        ):
+            self._run_git(["worktree", "remove", "--force", str(target_path)])
+            if result.returncode == 0:
+                # The cold fallback creates the branch itself with -b
+                self._run_git(["branch", "-D", branch])
+            self._record(misses=1)
+            return False
+
+        self._record(hits=1)
+        return True
+
+    def _finish_checkout(self, path: Path, sparse_paths: list[str] | None) -> bool:
+        self._run_git(["clean", "-ffdx"], cwd=path)
+        if sparse_paths:
+            return apply_sparse_checkout(self._run_git, path, sparse_paths)
+        return True
+
+    def reclaim(self, path: Path) -> bool:
+        """
+        Return a spec worktree to the pool instead of removing it.
+
+        Only done under the "recycle" policy and while the pool has room.
+
+        Returns:
+            True if the worktree now sits in the pool
+        """
+        if self.size <= 0 or self.reclaim_policy != RECLAIM_RECYCLE:
+            return False
+
+        with self._lock:
+            if len(self.idle_slots()) >= self.size:
+                return False
+            if Path(path).resolve() not in self._registered_paths():
+                return False
+            if not self._reset_to_base(path):
+                return False
+            self.pool_dir.mkdir(parents=True, exist_ok=True)
+            result = self._run_git(
+                ["worktree", "move", str(path), str(self._new_slot_path())]
+            )
+            if result.returncode != 0:
+                return False
+
+        self._record(reclaimed=1)
+        return True
+
+    def drain(self) -> None:
+        """Remove every pooled worktree."""
+        self.wait()
+        with self._lock:
+            for slot in self.idle_slots():
+                self._run_git(["worktree", "remove", "--force", str(slot)])
+            shutil.rmtree(self.pool_dir, ignore_errors=True)
+            self._run_git(["worktree", "prune"])
+
+    def prune_stale(self) -> None:
+        """Delete pool directories git no longer tracks as worktrees."""
+        if not self.pool_dir.exists():
+            return
+        registered = self._registered_paths()
+        for item in self.pool_dir.iterdir():
+            if item.is_dir() and item.resolve() not in registered:
+                print(f"Removing stale pooled worktree: {item.name}")
+                shutil.rmtree(item, ignore_errors=True)
+
+    # ==================== Stats ====================
+
+    def _load_counters(self) -> dict:
+        try:
+            data = json.loads((self.pool_dir / STATS_FILE).read_text())
+            return {k: int(data.get(k, 0)) for k in ("hits", "misses", "reclaimed")}
+        except (OSError, json.JSONDecodeError, AttributeError, ValueError):
+            return {"hits": 0, "misses": 0, "reclaimed": 0}
+
+    def _record(self, **increments: int) -> None:
+        counters = self._load_counters()
+        for key, value in increments.items():
+            counters[key] += value
+        try:
+            self.pool_dir.mkdir(parents=True, exist_ok=True)
+            (self.pool_dir / STATS_FILE).write_text(json.dumps(counters, indent=2))
+        except OSError:
+            pass
+
+    def stats(self) -> WorktreePoolStats:
+        """Pool size, idle worktrees, hit rate and reclaim policy."""
+        return WorktreePoolStats(
+            size=self.size,
+            idle=len(self.idle_slots()),
+            reclaim_policy=self.reclaim_policy,
+            **self._load_counters(),
+        )
+
+
+def apply_sparse_checkout(
+    run_git: Callable[..., subprocess.CompletedProcess],
+    path: Path,
+    sparse_paths: list[str],
+) -> bool:
+    """
+    Restrict a worktree to the given directories (cone mode).
+
+    Top-level files are always included by cone mode. The setting is
+    per-worktree and does not affect the main checkout.
+    """
+    result = run_git(["sparse-checkout", "set", "--cone", *sparse_paths], cwd=path)
+    return result.returncode == 0
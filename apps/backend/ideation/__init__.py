@@ -9,6 +9,7 @@ This module provides components for generating and managing project ideas:
 - Formatter: Formats ideation output
 - Types: Type definitions and dataclasses
 - Config: Configuration management
+- ContextSnapshot: Shared per-run context and per-type result cache
 - PhaseExecutor: Phase execution logic
 - ProjectIndexPhase: Project indexing phase
 - OutputStreamer: Result streaming
@@ -17,6 +18,7 @@ This module provides components for generating and managing project ideas:
 
 from .analyzer import ProjectAnalyzer
 from .config import IdeationConfigManager
+from .context_snapshot import IdeationContextSnapshot, IdeationResultCache
 from .formatter import IdeationFormatter
 from .generator import IdeationGenerator
 from .output_streamer import OutputStreamer
@@ -36,6 +38,8 @@ __all__ = [
     "IdeaPrioritizer",
     "IdeationFormatter",
     "IdeationConfigManager",
+    "IdeationContextSnapshot",
+    "IdeationResultCache",
     "PhaseExecutor",
     "ProjectIndexPhase",
     "OutputStreamer",
@@ -0,0 +1,151 @@
+"""
+Shared context snapshot for ideation generation.
+
+Built once per run after context gathering and graph hints complete, then
+handed to every ideation type. The snapshot is immutable and carries a
+hash of its contents, which keys the per-type result cache: a type is only
+regenerated when the shared context, the project index, or that type's own
+inputs (prompt, graph hints, limits, model) changed.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+CACHE_FILE = "ideation_cache.json"
+
+
+def _hash(data: Any) -> str:
+    encoded = json.dumps(data, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+@dataclass(frozen=True)
+class IdeationContextSnapshot:
+    """Immutable project context shared by all ideation types in a run."""
+
+    existing_features: tuple[str, ...]
+    tech_stack: tuple[str, ...]
+    target_audience: str | None
+    planned_features: tuple[str, ...]
+    project_index_hash: str
+    graph_hints_json: str
+    content_hash: str
+
+    @classmethod
+    def build(
+        cls,
+        context: dict[str, Any],
+        graph_hints: dict[str, list],
+        project_index_file: Path,
+    ) -> "IdeationContextSnapshot":
+        """
+        Freeze gathered context.
+
+        Args:
+            context: Output of ProjectAnalyzer.gather_context()
+            graph_hints: Graph hints by ideation type
+            project_index_file: project_index.json the agents will read
+        """
+        try:
+            project_index_hash = hashlib.sha256(
+                project_index_file.read_bytes()
+            ).hexdigest()[:16]
+        except OSError:
+            project_index_hash = ""
+
+        # Sort the set-derived lists so the hash does not depend on set order
+        shared = {
+            "existing_features": sorted(map(str, context["existing_features"])),
+            "tech_stack": sorted(map(str, context["tech_stack"])),
+            "target_audience": context["target_audience"],
+            "planned_features": sorted(map(str, context["planned_features"])),
+            "project_index_hash": project_index_hash,
+        }
+        return cls(
+            existing_features=tuple(shared["existing_features"]),
+            tech_stack=tuple(shared["tech_stack"]),
+            target_audience=shared["target_audience"],
+            planned_features=tuple(shared["planned_features"]),
+            project_index_hash=project_index_hash,
+            graph_hints_json=json.dumps(graph_hints, sort_keys=True, default=str),
+            content_hash=_hash(shared),
+        )
+
+    @property
+    def graph_hints(self) -> dict[str, list]:
+        """Graph hints by type (a fresh copy)."""
+        return json.loads(self.graph_hints_json)
+
+    def to_prompt(self, ideation_type: str) -> str:
+        """
+        Render the shared context and one type's graph hints for its prompt.
+
+        Args:
+            ideation_type: Ideation type whose graph hints are included
+        """
+
+        def listing(items: tuple[str, ...] | list) -> str:
+            return "\n".join(f"- {item}" for item in items) or "- None"
+
+        sections = [
+            "## Shared Project Context",
+            f"**Tech Stack**: {', '.join(self.tech_stack) or 'Unknown'}",
+            f"**Target Audience**: {self.target_audience or 'Not specified'}",
+            f"### Existing Features\n{listing(self.existing_features)}",
+            "### Planned Features (roadmap and kanban)\n"
+            f"{listing(self.planned_features)}",
+        ]
+        hints = self.graph_hints.get(ideation_type, [])
+        if hints:
+            rendered = [
+                json.dumps(hint, sort_keys=True, default=str)
+                if isinstance(hint, dict | list)
+                else str(hint)
+                for hint in hints
+            ]
+            sections.append(f"### Graph Hints for {ideation_type}\n{listing(rendered)}")
+        return "\n\n".join(sections)
+
+    def type_key(self, ideation_type: str, **inputs: Any) -> str:
+        """
+        Cache key for one ideation type.
+
+        Args:
+            ideation_type: Ideation type
+            **inputs: Type-specific inputs (prompt text, limits, model, ...)
+        """
+        return _hash(
+            {
+                "context": self.content_hash,
+                "type": ideation_type,
+                "graph_hints": self.graph_hints.get(ideation_type, []),
+                **inputs,
+            }
+        )
+
+
+class IdeationResultCache:
+    """Cache keys of the inputs each ideation type's output was generated from."""
+
+    def __init__(self, output_dir: Path):
+        self.cache_file = output_dir / CACHE_FILE
+        try:
+            data = json.loads(self.cache_file.read_text(encoding="utf-8"))
+            self._keys: dict[str, str] = dict(data.get("types", {}))
+        except (OSError, json.JSONDecodeError, AttributeError, TypeError):
+            self._keys = {}
+
+    def get(self, ideation_type: str) -> str | None:
+        return self._keys.get(ideation_type)
+
+    def put(self, ideation_type: str, key: str) -> None:
+        self._keys[ideation_type] = key
+        try:
+            self.cache_file.write_text(
+                json.dumps({"types": self._keys}, indent=2), encoding="utf-8"
+            )
+        except OSError:
+            pass
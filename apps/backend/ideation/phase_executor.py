@@ -16,6 +16,7 @@ from pathlib import Path
 
 from ui import print_key_value, print_status
 
+from .context_snapshot import IdeationContextSnapshot, IdeationResultCache
 from .types import IdeationPhaseResult
 
 
@@ -57,6 +58,11 @@ class PhaseExecutor:
         self.refresh = refresh
         self.append = append
 
+        # Context gathered once per run and shared by all ideation types
+        self._gathered_context: dict | None = None
+        self.snapshot: IdeationContextSnapshot | None = None
+        self.result_cache = IdeationResultCache(output_dir)
+
     async def execute_graph_hints(self) -> IdeationPhaseResult:
         """Retrieve graph hints for all enabled ideation types in parallel.
 
@@ -172,6 +178,7 @@ class PhaseExecutor:
         print_status("Gathering project context...", "progress")
 
         context = self.analyzer.gather_context()
+        self._gathered_context = context
 
         # Check for graph hints and include them
         hints_file = self.output_dir / "graph_hints.json"
@@ -223,6 +230,61 @@ class PhaseExecutor:
             retries=0,
         )
 
+    def build_snapshot(self) -> IdeationContextSnapshot:
+        """Freeze the gathered context and graph hints for the ideation phase.
+
+        Runs after context gathering and graph hints have both finished, so
+        the context file is brought up to date with hints that were not yet
+        written when it was created.
+
+        Returns:
+            The shared IdeationContextSnapshot
+        """
+        context = self._gathered_context
+        if context is None:
+            context = self.analyzer.gather_context()
+            self._gathered_context = context
+
+        graph_hints = {}
+        hints_file = self.output_dir / "graph_hints.json"
+        try:
+            with open(hints_file) as f:
+                graph_hints = json.load(f).get("hints_by_type", {})
+        except (OSError, json.JSONDecodeError, AttributeError):
+            pass
+
+        context_file = self.output_dir / "ideation_context.json"
+        try:
+            with open(context_file) as f:
+                context_data = json.load(f)
+            if context_data.get("graph_hints") != graph_hints:
+                context_data["graph_hints"] = graph_hints
+                with open(context_file, "w") as f:
+                    json.dump(context_data, f, indent=2)
+        except (OSError, json.JSONDecodeError, AttributeError):
+            pass
+
+        self.snapshot = IdeationContextSnapshot.build(
+            context, graph_hints, self.output_dir / "project_index.json"
+        )
+        return self.snapshot
+
+    def _type_cache_key(self, ideation_type: str, prompt_file: str) -> str | None:
+        """Cache key of an ideation type's inputs, or None without a snapshot."""
+        if self.snapshot is None:
+            return None
+        prompt_path = self.generator.prompts_dir / prompt_file
+        try:
+            prompt_text = prompt_path.read_text()
+        except OSError:
+            prompt_text = ""
+        return self.snapshot.type_key(
+            ideation_type,
+            prompt=prompt_text,
+            max_ideas=self.max_ideas_per_type,
+            model=self.generator.model,
+        )
+
     async def execute_ideation_type(
         self, ideation_type: str, max_retries: int = 3
     ) -> IdeationPhaseResult:
@@ -248,8 +310,18 @@ class PhaseExecutor:
             )
 
         output_file = self.output_dir / f"{ideation_type}_ideas.json"
+        cache_key = self._type_cache_key(ideation_type, prompt_file)
+        cached_key = self.result_cache.get(ideation_type)
+        inputs_changed = (
+            cache_key is not None and cached_key is not None and cached_key != cache_key
+        )
 
-        if output_file.exists() and not self.refresh:
+        if output_file.exists() and not self.refresh and inputs_changed:
+            print_status(
+                f"{ideation_type} inputs changed since last run, regenerating...",
+                "info",
+            )
+        elif output_file.exists() and not self.refresh:
             # Load and validate existing ideas - only skip if we have valid ideas
             try:
                 with open(output_file) as f:
@@ -262,6 +334,9 @@ class PhaseExecutor:
                         f"{ideation_type}_ideas.json already exists ({count} ideas)",
                         "success",
                     )
+                    if cached_key is None and cache_key is not None:
+                        # Output predates the cache; it reflects the current inputs
+                        self.result_cache.put(ideation_type, cache_key)
                     return IdeationPhaseResult(
                         phase="ideation",
                         ideation_type=ideation_type,
@@ -301,6 +376,16 @@ class PhaseExecutor:
 Generate up to {self.max_ideas_per_type} {self.generator.get_type_label(ideation_type)} ideas.
 Avoid duplicating features that are already planned (see ideation_context.json).
 Output your ideas to {output_file.name}.
+"""
+        if self.snapshot is not None:
+            # The shared context is already in the prompt; only the project
+            # index still has to be read from disk
+            context += f"""
+{self.snapshot.to_prompt(ideation_type)}
+
+The context above is the content of ideation_context.json and
+graph_hints.json for this run; you do not need to read those files or the
+roadmap and kanban files again. Avoid duplicating the planned features listed.
 """
         success, output = await self.generator.run_agent(
             prompt_file,
@@ -317,6 +402,8 @@ Output your ideas to {output_file.name}.
                 f"Created {output_file.name} ({validation_result['count']} ideas)",
                 "success",
             )
+            if cache_key is not None:
+                self.result_cache.put(ideation_type, cache_key)
             return IdeationPhaseResult(
                 phase="ideation",
                 ideation_type=ideation_type,
@@ -353,6 +440,8 @@ Output your ideas to {output_file.name}.
                         f"Recovery successful: {output_file.name} ({validation_result['count']} ideas)",
                         "success",
                     )
+                    if cache_key is not None:
+                        self.result_cache.put(ideation_type, cache_key)
                     return IdeationPhaseResult(
                         phase="ideation",
                         ideation_type=ideation_type,
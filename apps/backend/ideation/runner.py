@@ -3,8 +3,11 @@ Ideation Runner - Main orchestration logic.
 
 Orchestrates the ideation creation process through multiple phases:
 1. Project Index - Analyze project structure
-2. Context & Graph Hints - Gather context in parallel
-3. Ideation Generation - Generate ideas in parallel
+2. Context & Graph Hints - Gather context in parallel, then freeze it into
+   a snapshot shared by all ideation types
+3. Ideation Generation - Generate ideas in parallel (bounded by the
+   process-wide agent limiter); types whose inputs are unchanged since
+   their last successful run reuse their output
 4. Merge - Combine all outputs
 """
 
@@ -160,6 +163,15 @@ class IdeationOrchestrator:
             return False
         # Note: hints_result.success is always True (graceful degradation)
 
+        # Freeze the context once; every ideation type shares this snapshot
+        snapshot = self.phase_executor.build_snapshot()
+        debug(
+            "ideation_runner",
+            "Context snapshot built",
+            context_hash=snapshot.content_hash,
+            project_index_hash=snapshot.project_index_hash,
+        )
+
         # Phase 3: Run all ideation types IN PARALLEL
         debug(
             "ideation_runner",
@@ -4,6 +4,7 @@ Graphiti Memory System - Modular Architecture
 This package provides a clean separation of concerns for Graphiti memory:
 - graphiti.py: Main facade and coordination
 - client.py: Database connection management
+- connection_manager.py: Process-wide client reuse
 - queries.py: Episode storage operations
 - search.py: Semantic search and retrieval
 - schema.py: Data structures and constants
@@ -12,6 +13,11 @@ Public API exports maintain backward compatibility with the original
 graphiti_memory.py module.
 """
 
+from .connection_manager import (
+    GraphitiConnectionManager,
+    close_graphiti_connections,
+    get_connection_manager,
+)
 from .graphiti import GraphitiMemory
 from .schema import (
     EPISODE_TYPE_CODEBASE_DISCOVERY,
@@ -28,6 +34,9 @@ from .schema import (
 # Re-export for convenience
 __all__ = [
     "GraphitiMemory",
+    "GraphitiConnectionManager",
+    "get_connection_manager",
+    "close_graphiti_connections",
     "GroupIdMode",
     "MAX_CONTEXT_RESULTS",
     "EPISODE_TYPE_SESSION_INSIGHT",
@@ -0,0 +1,251 @@
+"""
+Process-wide connection manager for Graphiti clients.
+
+Initializing a GraphitiClient is expensive: it builds the LLM, embedder and
+cross-encoder providers, opens the LadybugDB/Kuzu driver and builds indices.
+GraphitiMemory instances are created per subtask, so without sharing every
+coder iteration pays that setup and tears it down again minutes later.
+
+The manager keeps one initialized client per (database path, provider
+signature). GraphitiMemory acts as the group-scoped facade on top of it -
+every query and episode already carries its own group_id, so one client can
+serve any number of specs. Clients are health-checked before reuse and
+closed on their own event loop: when that loop shuts down (asyncio.run),
+or at process exit for loops that are still open.
+"""
+
+import asyncio
+import atexit
+import logging
+import os
+import threading
+import time
+from collections.abc import AsyncGenerator
+from dataclasses import dataclass, field
+
+from graphiti_config import GraphitiConfig, GraphitiState
+
+from .client import GraphitiClient
+
+logger = logging.getLogger(__name__)
+
+# Seconds between active health checks of a pooled client
+HEALTH_CHECK_INTERVAL = float(os.environ.get("GRAPHITI_HEALTH_CHECK_INTERVAL", "60"))
+# Seconds to wait for a client on another thread's loop to close at exit
+SHUTDOWN_TIMEOUT = 10.0
+
+ConnectionKey = tuple[str, str]
+
+
+def get_connection_key(config: GraphitiConfig) -> ConnectionKey:
+    """
+    Build the pooling key for a configuration.
+
+    Clients are only shared when they talk to the same database with the
+    same providers (and therefore the same embedding dimension).
+    """
+    db_path = str(config.get_db_path().resolve())
+    signature = f"{config.llm_provider}:{config.get_provider_signature()}"
+    return db_path, signature
+
+
+@dataclass
+class _PooledClient:
+    client: GraphitiClient
+    loop: asyncio.AbstractEventLoop
+    created_at: float = field(default_factory=time.monotonic)
+    last_checked: float = field(default_factory=time.monotonic)
+
+
+class GraphitiConnectionManager:
+    """
+    Keeps one initialized GraphitiClient per (db path, provider signature).
+
+    Clients are bound to the event loop that created them (provider HTTP
+    clients can't be shared across loops), so a client requested from a
+    different loop is closed and replaced, and a loop's clients are closed
+    while that loop shuts down.
+    """
+
+    def __init__(self, health_check_interval: float = HEALTH_CHECK_INTERVAL):
+        self.health_check_interval = health_check_interval
+        self._clients: dict[ConnectionKey, _PooledClient] = {}
+        # asyncio.Lock is loop-bound, so keep the loop that owns each lock
+        self._init_locks: dict[
+            ConnectionKey, tuple[asyncio.AbstractEventLoop, asyncio.Lock]
+        ] = {}
+        self._lock = threading.Lock()
+        self._stats = {"created": 0, "reused": 0, "health_failures": 0}
+        # Per loop, an async generator finalized by loop.shutdown_asyncgens()
+        self._loop_watchers: dict[asyncio.AbstractEventLoop, AsyncGenerator] = {}
+
+    async def acquire(
+        self,
+        config: GraphitiConfig,
+        state: GraphitiState | None = None,
+    ) -> GraphitiClient | None:
+        """
+        Get an initialized client for the configuration, creating it if needed.
+
+        Args:
+            config: Graphiti configuration
+            state: Optional GraphitiState, used only when a new client
+                has to be initialized (index building)
+
+        Returns:
+            Initialized GraphitiClient, or None if initialization failed
+        """
+        key = get_connection_key(config)
+        loop = asyncio.get_running_loop()
+
+        with self._lock:
+            lock_entry = self._init_locks.get(key)
+            if lock_entry is None or lock_entry[0] is not loop:
+                lock_entry = (loop, asyncio.Lock())
+                self._init_locks[key] = lock_entry
+            init_lock = lock_entry[1]
+
+        async with init_lock:
+            entry = self._clients.get(key)
+            if entry is not None:
+                if entry.loop is loop and await self._is_healthy(entry):
+                    self._stats["reused"] += 1
+                    return entry.client
+                await self._discard(key, entry)
+
+            client = GraphitiClient(config)
+            if not await client.initialize(state):
+                return None
+
+            with self._lock:
+                self._clients[key] = _PooledClient(client=client, loop=loop)
+                self._stats["created"] += 1
+            await self._watch_loop(loop)
+            logger.info(f"Graphiti connection opened for {key[0]} ({key[1]})")
+            return client
+
+    async def _is_healthy(self, entry: _PooledClient) -> bool:
+        client = entry.client
+        if not client.is_initialized or client.graphiti is None:
+            return False
+
+        now = time.monotonic()
+        if now - entry.last_checked < self.health_check_interval:
+            return True
+
+        try:
+            driver = getattr(client.graphiti, "driver", None)
+            if driver is not None:
+                await driver.execute_query("RETURN 1")
+        except Exception as e:
+            logger.warning(f"Graphiti health check failed, reconnecting: {e}")
+            self._stats["health_failures"] += 1
+            return False
+
+        entry.last_checked = now
+        return True
+
+    async def _watch_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Close the loop's clients when it shuts down (see _close_loop_clients)."""
+        if loop in self._loop_watchers:
+            return
+        watcher = self._close_loop_clients(loop)
+        self._loop_watchers[loop] = watcher
+        # The first step registers the generator with the loop, which
+        # finalizes it in shutdown_asyncgens() - while the loop still runs
+        await watcher.asend(None)
+
+    async def _close_loop_clients(
+        self, loop: asyncio.AbstractEventLoop
+    ) -> AsyncGenerator[None, None]:
+        try:
+            yield
+        finally:
+            self._loop_watchers.pop(loop, None)
+            with self._lock:
+                keys = [k for k, e in self._clients.items() if e.loop is loop]
+                entries = [self._clients.pop(k) for k in keys]
+            for entry in entries:
+                await self._close_entry(entry)
+
+    async def _close_entry(self, entry: _PooledClient) -> None:
+        """Close a pooled client on the event loop it belongs to."""
+        try:
+            if entry.loop is asyncio.get_running_loop():
+                await entry.client.close()
+            elif entry.loop.is_running():
+                await asyncio.wrap_future(
+                    asyncio.run_coroutine_threadsafe(entry.client.close(), entry.loop)
+                )
+            elif not entry.loop.is_closed():
+                # An idle loop can't run inside this one, but can in a thread
+                await asyncio.to_thread(
+                    entry.loop.run_until_complete, entry.client.close()
+                )
+            else:
+                logger.debug("Dropping Graphiti client whose event loop has closed")
+        except Exception as e:
+            logger.warning(f"Error closing Graphiti client: {e}")
+
+    async def _discard(self, key: ConnectionKey, entry: _PooledClient) -> None:
+        with self._lock:
+            if self._clients.get(key) is entry:
+                del self._clients[key]
+        # Must close before re-opening - the embedded DB holds a file lock
+        await self._close_entry(entry)
+
+    async def close_all(self) -> None:
+        """Close every pooled client."""
+        with self._lock:
+            entries = list(self._clients.values())
+            self._clients.clear()
+            self._init_locks.clear()
+        for entry in entries:
+            await self._close_entry(entry)
+
+    def shutdown(self) -> None:
+        """Synchronously close all clients (registered with atexit)."""
+        with self._lock:
+            entries = list(self._clients.values())
+            self._clients.clear()
+            self._init_locks.clear()
+        for entry in entries:
+            try:
+                if entry.loop.is_closed():
+                    # Closed without shutdown_asyncgens(); nothing can run
+                    # the client's close any more
+                    continue
+                if entry.loop.is_running():
+                    asyncio.run_coroutine_threadsafe(
+                        entry.client.close(), entry.loop
+                    ).result(SHUTDOWN_TIMEOUT)
+                else:
+                    entry.loop.run_until_complete(entry.client.close())
+            except Exception as e:
+                logger.debug(f"Graphiti shutdown failed: {e}")
+
+    def get_stats(self) -> dict:
+        """Get pool statistics (created, reused, health_failures, open)."""
+        with self._lock:
+            return {**self._stats, "open": len(self._clients)}
+
+
+_manager: GraphitiConnectionManager | None = None
+_manager_lock = threading.Lock()
+
+
+def get_connection_manager() -> GraphitiConnectionManager:
+    """Get the process-wide connection manager."""
+    global _manager
+    if _manager is None:
+        with _manager_lock:
+            if _manager is None:
+                _manager = GraphitiConnectionManager()
+                atexit.register(_manager.shutdown)
+    return _manager
+
+
+async def close_graphiti_connections() -> None:
+    """Close all pooled Graphiti clients (e.g. at the end of a build)."""
+    if _manager is not None:
+        await _manager.close_all()
@@ -3,6 +3,7 @@ Main GraphitiMemory class - facade for the modular memory system.
 
 Provides a high-level interface that delegates to specialized modules:
 - client.py: Database connection and lifecycle
+- connection_manager.py: Process-wide sharing of initialized clients
 - queries.py: Episode storage operations
 - search.py: Semantic search and retrieval
 - schema.py: Data structures and constants
@@ -16,6 +17,7 @@ from pathlib import Path
 from graphiti_config import GraphitiConfig, GraphitiState
 
 from .client import GraphitiClient
+from .connection_manager import get_connection_manager
 from .queries import GraphitiQueries
 from .schema import MAX_CONTEXT_RESULTS, GroupIdMode
 from .search import GraphitiSearch
@@ -45,6 +47,7 @@ class GraphitiMemory:
         spec_dir: Path,
         project_dir: Path,
         group_id_mode: str = GroupIdMode.SPEC,
+        shared_client: bool = True,
     ):
         """
         Initialize Graphiti memory manager.
@@ -55,10 +58,13 @@ class GraphitiMemory:
             group_id_mode: How to scope the memory namespace:
                 - "spec": Each spec gets isolated memory (default)
                 - "project": All specs share project-wide context
+            shared_client: Reuse the process-wide client for this database
+                instead of opening (and closing) a private one
         """
         self.spec_dir = spec_dir
         self.project_dir = project_dir
         self.group_id_mode = group_id_mode
+        self.shared_client = shared_client
         self.config = GraphitiConfig.from_env()
         self.state: GraphitiState | None = None
 
@@ -154,23 +160,32 @@ class GraphitiMemory:
             self.state = None
 
         try:
-            # Create client
-            self._client = GraphitiClient(self.config)
-
-            # Initialize client with state tracking
-            if not await self._client.initialize(self.state):
-                self._available = False
-                return False
+            if self.shared_client:
+                # Reuse the pooled client (initialized once per process)
+                self._client = await get_connection_manager().acquire(
+                    self.config, self.state
+                )
+                if self._client is None:
+                    self._available = False
+                    return False
+            else:
+                self._client = GraphitiClient(self.config)
+
+                # Initialize client with state tracking
+                if not await self._client.initialize(self.state):
+                    self._client = None
+                    self._available = False
+                    return False
 
             # Update state if needed
             if not self.state:
                 self.state = GraphitiState()
-                self.state.initialized = True
-                self.state.database = self.config.database
-                self.state.created_at = datetime.now(timezone.utc).isoformat()
-                self.state.llm_provider = self.config.llm_provider
-                self.state.embedder_provider = self.config.embedder_provider
-                self.state.save(self.spec_dir)
+                self._save_initialized_state()
+            elif not self.state.initialized:
+                # A pooled client was already initialized (indices built) by
+                # another spec, so record that for this spec too
+                self.state.indices_built = True
+                self._save_initialized_state()
 
             # Create query and search modules
             self._queries = GraphitiQueries(
@@ -199,12 +214,25 @@ class GraphitiMemory:
             self._available = False
             return False
 
+    def _save_initialized_state(self) -> None:
+        """Mark this spec's state as initialized with the current providers."""
+        self.state.initialized = True
+        self.state.database = self.config.database
+        self.state.created_at = datetime.now(timezone.utc).isoformat()
+        self.state.llm_provider = self.config.llm_provider
+        self.state.embedder_provider = self.config.embedder_provider
+        self.state.save(self.spec_dir)
+
     async def close(self) -> None:
         """
-        Close the Graphiti client and clean up connections.
+        Release the Graphiti client.
+
+        A shared client stays open for the next GraphitiMemory; it is closed
+        by the connection manager at process exit.
         """
         if self._client:
-            await self._client.close()
+            if not self.shared_client:
+                await self._client.close()
             self._client = None
             self._queries = None
             self._search = None
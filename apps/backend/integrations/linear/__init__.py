@@ -13,10 +13,13 @@ from .updater import (
     STATUS_IN_PROGRESS,
     STATUS_IN_REVIEW,
     STATUS_TODO,
+    LinearSyncQueue,
     LinearTaskState,
     create_linear_task,
+    flush_linear_updates,
     get_linear_api_key,
     is_linear_enabled,
+    schedule_linear_flush,
     update_linear_status,
 )
 
@@ -28,12 +31,15 @@ __all__ = [
     "LinearConfig",
     "LinearManager",
     "LinearIntegration",
+    "LinearSyncQueue",
     "LinearTaskState",
     "LinearUpdater",
     "is_linear_enabled",
     "get_linear_api_key",
     "create_linear_task",
     "update_linear_status",
+    "flush_linear_updates",
+    "schedule_linear_flush",
     "STATUS_TODO",
     "STATUS_IN_PROGRESS",
     "STATUS_IN_REVIEW",
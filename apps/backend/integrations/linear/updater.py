@@ -11,6 +11,11 @@ Design Principles:
 - Python orchestrator controls when updates happen
 - Small prompts that can't lose context
 - Graceful degradation if Linear unavailable
+- Updates are queued, not sent inline: status changes coalesce (only the
+  latest pending status is sent) and comments are batched into one
+  mini-agent call, flushed at phase boundaries or on a timer in the
+  background. Pending updates are persisted in .linear_task.json so they
+  survive a crash and are sent by the next run.
 
 Status Flow:
   Todo -> In Progress -> In Review -> (human) -> Done
@@ -20,9 +25,10 @@ Status Flow:
     +-- Task created from spec
 """
 
+import asyncio
 import json
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -39,6 +45,10 @@ STATUS_CANCELED = "Canceled"
 # State file name
 LINEAR_TASK_FILE = ".linear_task.json"
 
+# Seconds queued updates wait before a timer flush (override via env)
+FLUSH_INTERVAL_ENV = "AUTO_CLAUDE_LINEAR_FLUSH_SECONDS"
+DEFAULT_FLUSH_INTERVAL = 60.0
+
 # Linear MCP tools needed for updates
 LINEAR_TOOLS = [
     "mcp__linear-server__list_teams",
@@ -58,6 +68,9 @@ class LinearTaskState:
     team_id: str | None = None
     status: str = STATUS_TODO
     created_at: str | None = None
+    # Queued updates not yet sent to Linear
+    pending_status: str | None = None
+    pending_comments: list[str] = field(default_factory=list)
 
     def to_dict(self) -> dict:
         return {
@@ -66,8 +79,18 @@ class LinearTaskState:
             "team_id": self.team_id,
             "status": self.status,
             "created_at": self.created_at,
+            "pending_status": self.pending_status,
+            "pending_comments": self.pending_comments,
         }
 
+    @property
+    def has_pending(self) -> bool:
+        """Whether there are queued updates to send."""
+        return bool(
+            self.pending_comments
+            or (self.pending_status and self.pending_status != self.status)
+        )
+
     @classmethod
     def from_dict(cls, data: dict) -> "LinearTaskState":
         return cls(
@@ -76,6 +99,8 @@ class LinearTaskState:
             team_id=data.get("team_id"),
             status=data.get("status", STATUS_TODO),
             created_at=data.get("created_at"),
+            pending_status=data.get("pending_status"),
+            pending_comments=list(data.get("pending_comments") or []),
         )
 
     def save(self, spec_dir: Path) -> None:
@@ -256,50 +281,224 @@ TEAM_ID: [the team ID]
     return state
 
 
+def _escape(text: str) -> str:
+    """Escape text for embedding in a quoted prompt argument."""
+    return text.replace('"', '\\"').replace("\n", "\\n")
+
+
+def _build_sync_prompt(
+    state: LinearTaskState, status: str | None, comments: list[str]
+) -> str:
+    """Build one prompt applying a status change and/or a batched comment."""
+    steps = []
+    if status:
+        steps.append(
+            f"""Update the issue status:
+   a. Use mcp__linear-server__list_issue_statuses with teamId: "{state.team_id}" to find the state ID for "{status}"
+   b. Use mcp__linear-server__update_issue with:
+      - issueId: "{state.task_id}"
+      - stateId: [the state ID for "{status}" from step a]"""
+        )
+    if comments:
+        body = _escape("\n".join(f"- {comment}" for comment in comments))
+        steps.append(
+            "Add a comment using mcp__linear-server__create_comment with:\n"
+            f'   - issueId: "{state.task_id}"\n'
+            f'   - body: "{body}"'
+        )
+
+    numbered = "\n\n".join(f"{i}. {step}" for i, step in enumerate(steps, 1))
+    return f"""Apply these updates to Linear issue {state.task_id}:
+
+{numbered}
+
+Confirm when done.
+"""
+
+
+def get_flush_interval() -> float:
+    """Seconds queued Linear updates wait before a timer flush."""
+    try:
+        return max(
+            0.0, float(os.environ.get(FLUSH_INTERVAL_ENV, DEFAULT_FLUSH_INTERVAL))
+        )
+    except ValueError:
+        return DEFAULT_FLUSH_INTERVAL
+
+
+class LinearSyncQueue:
+    """
+    Background queue of Linear updates for one spec.
+
+    Enqueuing only writes to .linear_task.json and never waits on Linear.
+    A flush sends the latest pending status and all pending comments in a
+    single mini-agent call. Flushes run as background tasks, either right
+    away (request_flush, used at phase boundaries) or after the flush
+    interval; only items that were actually sent are cleared, so a failed
+    or interrupted flush leaves them queued for the next attempt. Updates
+    queued while a flush is running get a follow-up flush of their own.
+    """
+
+    def __init__(self, spec_dir: Path):
+        self.spec_dir = Path(spec_dir)
+        self._task: asyncio.Task | None = None
+        self._timer = False  # Whether _task is still waiting on the timer
+        # Delay for another flush once the running one ends; set when updates
+        # are queued after it read the state
+        self._rerun_delay: float | None = None
+        self._lock: asyncio.Lock | None = None
+        self._lock_loop: asyncio.AbstractEventLoop | None = None
+
+    def _load(self) -> LinearTaskState | None:
+        state = LinearTaskState.load(self.spec_dir)
+        if not state or not state.task_id:
+            return None
+        return state
+
+    def enqueue_status(self, status: str) -> bool:
+        """Queue a status change, superseding any pending one."""
+        state = self._load()
+        if not state:
+            print("No Linear task found for this spec")
+            return False
+        state.pending_status = status
+        state.save(self.spec_dir)
+        self._schedule(get_flush_interval())
+        return True
+
+    def enqueue_comment(self, comment: str) -> bool:
+        """Queue a comment for the next batch."""
+        state = self._load()
+        if not state:
+            print("No Linear task found for this spec")
+            return False
+        state.pending_comments.append(comment)
+        state.save(self.spec_dir)
+        self._schedule(get_flush_interval())
+        return True
+
+    def request_flush(self) -> None:
+        """Flush pending updates in the background as soon as possible."""
+        state = self._load()
+        if state and state.has_pending:
+            self._schedule(0)
+
+    def _schedule(self, delay: float) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop: updates stay queued on disk for the next flush
+            return
+
+        task = self._task
+        if task and not task.done() and task.get_loop() is loop:
+            if not self._timer:
+                # The running flush only sends what it already read
+                if self._rerun_delay is None or delay < self._rerun_delay:
+                    self._rerun_delay = delay
+                return
+            if delay > 0:
+                # A flush is already due; it picks up everything queued
+                return
+            task.cancel()
+
+        self._timer = delay > 0
+        self._task = loop.create_task(self._flush_after(delay))
+
+    async def _flush_after(self, delay: float) -> None:
+        if delay:
+            await asyncio.sleep(delay)
+        self._timer = False
+        self._rerun_delay = None
+        await self.flush()
+
+        rerun, self._rerun_delay = self._rerun_delay, None
+        if rerun is not None:
+            self._timer = rerun > 0
+            self._task = asyncio.get_running_loop().create_task(
+                self._flush_after(rerun)
+            )
+
+    def _get_lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+
+    async def flush(self) -> bool:
+        """
+        Send all pending updates now.
+
+        Returns:
+            True if nothing is left pending, False otherwise
+        """
+        async with self._get_lock():
+            state = self._load()
+            if not state:
+                return False
+
+            status = state.pending_status
+            if status == state.status:
+                status = None
+            comments = list(state.pending_comments)
+            if not status and not comments:
+                return True
+
+            response = await _run_linear_agent(
+                _build_sync_prompt(state, status, comments)
+            )
+            if not response:
+                return False
+
+            # Reload: more updates may have been queued while the agent ran
+            state = self._load()
+            if not state:
+                return False
+            if status:
+                state.status = status
+                print(f"Updated Linear task {state.task_id} to: {status}")
+            if state.pending_status == state.status:
+                state.pending_status = None
+            state.pending_comments = state.pending_comments[len(comments) :]
+            state.save(self.spec_dir)
+            if comments:
+                print(f"Added comment to Linear task {state.task_id}")
+            return not state.has_pending
+
+
+_sync_queues: dict[Path, LinearSyncQueue] = {}
+
+
+def get_linear_sync_queue(spec_dir: Path) -> LinearSyncQueue:
+    """Get the sync queue for a spec directory."""
+    key = Path(spec_dir).resolve()
+    queue = _sync_queues.get(key)
+    if queue is None:
+        queue = _sync_queues[key] = LinearSyncQueue(spec_dir)
+    return queue
+
+
 async def update_linear_status(
     spec_dir: Path,
     new_status: str,
 ) -> bool:
     """
-    Update the Linear task status.
+    Queue a Linear task status update.
+
+    Superseded transitions are coalesced; only the latest status is sent.
 
     Args:
         spec_dir: Spec directory with .linear_task.json
         new_status: New status (STATUS_TODO, STATUS_IN_PROGRESS, STATUS_IN_REVIEW, STATUS_DONE)
 
     Returns:
-        True if successful, False otherwise
+        True if queued, False otherwise
     """
     if not is_linear_enabled():
         return False
 
-    state = LinearTaskState.load(spec_dir)
-    if not state or not state.task_id:
-        print("No Linear task found for this spec")
-        return False
-
-    # Don't update if already at this status
-    if state.status == new_status:
-        return True
-
-    prompt = f"""Update Linear issue status:
-
-1. First, use mcp__linear-server__list_issue_statuses with teamId: "{state.team_id}" to find the state ID for "{new_status}"
-2. Then, use mcp__linear-server__update_issue with:
-   - issueId: "{state.task_id}"
-   - stateId: [the state ID for "{new_status}" from step 1]
-
-Confirm when done.
-"""
-
-    response = await _run_linear_agent(prompt)
-    if response:
-        state.status = new_status
-        state.save(spec_dir)
-        print(f"Updated Linear task {state.task_id} to: {new_status}")
-        return True
-
-    return False
+    return get_linear_sync_queue(spec_dir).enqueue_status(new_status)
 
 
 async def add_linear_comment(
@@ -307,41 +506,44 @@ async def add_linear_comment(
     comment: str,
 ) -> bool:
     """
-    Add a comment to the Linear task.
+    Queue a comment on the Linear task.
+
+    Queued comments are sent together as one comment.
 
     Args:
         spec_dir: Spec directory with .linear_task.json
         comment: Comment text to add
 
     Returns:
-        True if successful, False otherwise
+        True if queued, False otherwise
     """
     if not is_linear_enabled():
         return False
 
-    state = LinearTaskState.load(spec_dir)
-    if not state or not state.task_id:
-        print("No Linear task found for this spec")
-        return False
+    return get_linear_sync_queue(spec_dir).enqueue_comment(comment)
 
-    # Escape any quotes in the comment
-    safe_comment = comment.replace('"', '\\"').replace("\n", "\\n")
 
-    prompt = f"""Add a comment to Linear issue:
+def schedule_linear_flush(spec_dir: Path) -> None:
+    """
+    Start sending queued updates in the background.
 
-Use mcp__linear-server__create_comment with:
-- issueId: "{state.task_id}"
-- body: "{safe_comment}"
+    Called at phase boundaries and on startup (to send updates left over
+    from an interrupted run). Never waits on Linear.
+    """
+    if is_linear_enabled():
+        get_linear_sync_queue(spec_dir).request_flush()
 
-Confirm when done.
-"""
 
-    response = await _run_linear_agent(prompt)
-    if response:
-        print(f"Added comment to Linear task {state.task_id}")
-        return True
+async def flush_linear_updates(spec_dir: Path) -> bool:
+    """
+    Send queued updates and wait for the result.
 
-    return False
+    Returns:
+        True if nothing is left pending, False otherwise
+    """
+    if not is_linear_enabled():
+        return False
+    return await get_linear_sync_queue(spec_dir).flush()
 
 
 # === Convenience functions for specific transitions ===
@@ -355,6 +557,7 @@ async def linear_task_started(spec_dir: Path) -> bool:
     success = await update_linear_status(spec_dir, STATUS_IN_PROGRESS)
     if success:
         await add_linear_comment(spec_dir, "Build started - planning phase initiated")
+        schedule_linear_flush(spec_dir)
     return success
 
 
@@ -392,7 +595,9 @@ async def linear_build_complete(spec_dir: Path) -> bool:
     Called when all subtasks are completed.
     """
     comment = "All subtasks completed - moving to QA validation"
-    return await add_linear_comment(spec_dir, comment)
+    success = await add_linear_comment(spec_dir, comment)
+    schedule_linear_flush(spec_dir)
+    return success
 
 
 async def linear_qa_started(spec_dir: Path) -> bool:
@@ -403,16 +608,20 @@ async def linear_qa_started(spec_dir: Path) -> bool:
     success = await update_linear_status(spec_dir, STATUS_IN_REVIEW)
     if success:
         await add_linear_comment(spec_dir, "QA validation started")
+        schedule_linear_flush(spec_dir)
     return success
 
 
 async def linear_qa_approved(spec_dir: Path) -> bool:
     """
     Record QA approval (stays In Review for human).
-    Called when QA approves the build.
+    Called when QA approves the build; this ends the run, so it waits
+    for the queue to flush.
     """
     comment = "QA approved - awaiting human review for merge"
-    return await add_linear_comment(spec_dir, comment)
+    if not await add_linear_comment(spec_dir, comment):
+        return False
+    return await flush_linear_updates(spec_dir)
 
 
 async def linear_qa_rejected(
@@ -431,10 +640,13 @@ async def linear_qa_rejected(
 async def linear_qa_max_iterations(spec_dir: Path, iterations: int) -> bool:
     """
     Record QA max iterations reached.
-    Called when QA loop exhausts retries.
+    Called when QA loop exhausts retries; this ends the run, so it waits
+    for the queue to flush.
     """
     comment = f"QA reached max iterations ({iterations}) - needs human intervention"
-    return await add_linear_comment(spec_dir, comment)
+    if not await add_linear_comment(spec_dir, comment):
+        return False
+    return await flush_linear_updates(spec_dir)
 
 
 async def linear_task_stuck(
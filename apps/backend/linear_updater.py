@@ -6,10 +6,13 @@ Re-exports from integrations.linear.updater for clean imports.
 """
 
 from integrations.linear.updater import (
+    LinearSyncQueue,
     LinearTaskState,
     add_linear_comment,
     create_linear_task,
+    flush_linear_updates,
     get_linear_api_key,
+    get_linear_sync_queue,
     is_linear_enabled,
     linear_build_complete,
     linear_qa_approved,
@@ -20,14 +23,18 @@ from integrations.linear.updater import (
     linear_subtask_failed,
     linear_task_started,
     linear_task_stuck,
+    schedule_linear_flush,
     update_linear_status,
 )
 
 __all__ = [
+    "LinearSyncQueue",
     "LinearTaskState",
     "add_linear_comment",
     "create_linear_task",
+    "flush_linear_updates",
     "get_linear_api_key",
+    "get_linear_sync_queue",
     "is_linear_enabled",
     "linear_build_complete",
     "linear_qa_approved",
@@ -38,5 +45,6 @@ __all__ = [
     "linear_subtask_failed",
     "linear_task_started",
     "linear_task_stuck",
+    "schedule_linear_flush",
     "update_linear_status",
 ]
@@ -0,0 +1,236 @@
+"""
+Parser pooling and incremental parsing for tree-sitter analysis.
+
+Many tasks touch the same hot files, and every task's diff starts from the
+same baseline content. This module lets the semantic analyzer:
+
+- Create each tree-sitter Language once per process and one Parser per
+  thread and extension (parsers are not thread-safe, so they are not
+  shared across threads).
+- Keep parsed baseline trees, and the elements extracted from them, in a
+  process-wide LRU keyed by content hash.
+- Parse the "after" side incrementally: the cached baseline tree is
+  copied, edited with the changed byte range, and handed to the parser as
+  the old tree, so only the changed region is re-parsed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import threading
+from bisect import bisect_left
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any
+
+_CHUNK = 4096
+_NEWLINE = re.compile(b"\n")
+
+DEFAULT_TREE_CACHE_SIZE = 128
+
+
+@dataclass(frozen=True)
+class TextEdit:
+    """A single contiguous byte-range edit, in tree-sitter's terms."""
+
+    start_byte: int
+    old_end_byte: int
+    new_end_byte: int
+    start_point: tuple[int, int]
+    old_end_point: tuple[int, int]
+    new_end_point: tuple[int, int]
+
+    def as_kwargs(self) -> dict[str, Any]:
+        return {
+            "start_byte": self.start_byte,
+            "old_end_byte": self.old_end_byte,
+            "new_end_byte": self.new_end_byte,
+            "start_point": self.start_point,
+            "old_end_point": self.old_end_point,
+            "new_end_point": self.new_end_point,
+        }
+
+
+def _common_prefix(old: bytes, new: bytes, limit: int) -> int:
+    """Length of the common prefix, comparing in chunks."""
+    i = 0
+    while i < limit:
+        end = min(i + _CHUNK, limit)
+        if old[i:end] != new[i:end]:
+            while old[i] == new[i]:
+                i += 1
+            return i
+        i = end
+    return limit
+
+
+def _common_suffix(old: bytes, new: bytes, limit: int) -> int:
+    """Length of the common suffix (at most limit), comparing in chunks."""
+    n = 0
+    len_old, len_new = len(old), len(new)
+    while n < limit:
+        step = min(_CHUNK, limit - n)
+        if (
+            old[len_old - n - step : len_old - n]
+            != new[len_new - n - step : len_new - n]
+        ):
+            while old[len_old - n - 1] == new[len_new - n - 1]:
+                n += 1
+            return n
+        n += step
+    return limit
+
+
+def _point(data: bytes, offset: int) -> tuple[int, int]:
+    """(row, byte column) of a byte offset."""
+    row = data.count(b"\n", 0, offset)
+    return row, offset - (data.rfind(b"\n", 0, offset) + 1)
+
+
+def compute_edit(old: bytes, new: bytes) -> TextEdit | None:
+    """
+    Describe how to turn old into new as one edit.
+
+    The edit spans from the first differing byte to the last, which is
+    exactly the range tree-sitter needs to re-parse.
+
+    Returns:
+        The edit, or None if the contents are identical
+    """
+    if old == new:
+        return None
+
+    prefix = _common_prefix(old, new, min(len(old), len(new)))
+    suffix = _common_suffix(old, new, min(len(old), len(new)) - prefix)
+    old_end = len(old) - suffix
+    new_end = len(new) - suffix
+
+    return TextEdit(
+        start_byte=prefix,
+        old_end_byte=old_end,
+        new_end_byte=new_end,
+        start_point=_point(old, prefix),
+        old_end_point=_point(old, old_end),
+        new_end_point=_point(new, new_end),
+    )
+
+
+class LineIndex:
+    """Maps byte offsets to 1-indexed line numbers in O(log n)."""
+
+    def __init__(self, data: bytes):
+        self._newlines = [m.start() for m in _NEWLINE.finditer(data)]
+
+    def line_of(self, byte_pos: int) -> int:
+        return bisect_left(self._newlines, byte_pos) + 1
+
+
+@dataclass
+class ParsedSource:
+    """A parsed file version and what has been derived from it."""
+
+    source: str
+    data: bytes
+    tree: Any
+    lines: LineIndex = field(init=False)
+    elements: dict | None = None
+
+    def __post_init__(self) -> None:
+        self.lines = LineIndex(self.data)
+
+
+def content_key(ext: str, data: bytes) -> tuple[str, str]:
+    """Cache key for a file version."""
+    return ext, hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+class ParserPool:
+    """Per-process Language objects and per-thread Parsers."""
+
+    def __init__(self, languages: dict[str, Any]):
+        self._raw_languages = languages
+        self._languages: dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @property
+    def extensions(self) -> set[str]:
+        return set(self._raw_languages)
+
+    def _language(self, ext: str) -> Any:
+        with self._lock:
+            language = self._languages.get(ext)
+            if language is None:
+                from tree_sitter import Language
+
+                language = self._languages[ext] = Language(self._raw_languages[ext])
+            return language
+
+    def get(self, ext: str) -> Any:
+        """Get this thread's parser for an extension."""
+        parsers = self._local.__dict__.setdefault("parsers", {})
+        parser = parsers.get(ext)
+        if parser is None:
+            from tree_sitter import Parser
+
+            parser = Parser()
+            parser.language = self._language(ext)
+            parsers[ext] = parser
+        return parser
+
+
+class TreeCache:
+    """Thread-safe LRU of parsed file versions."""
+
+    def __init__(self, max_entries: int = DEFAULT_TREE_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str], ParsedSource] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple[str, str]) -> ParsedSource | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: tuple[str, str], entry: ParsedSource) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def parse_incremental(parser: Any, base: ParsedSource | None, data: bytes) -> Any:
+    """
+    Parse data, reusing base's tree for the unchanged regions.
+
+    The cached base tree is shared across tasks and threads, so it is
+    copied before being edited.
+    """
+    if base is None:
+        return parser.parse(data)
+
+    edit = compute_edit(base.data, data)
+    if edit is None:
+        return base.tree
+
+    old_tree = base.tree.copy()
+    old_tree.edit(**edit.as_kwargs())
+    return parser.parse(data, old_tree)
@@ -8,6 +8,37 @@ import difflib
 import re
 
 from ..types import ChangeType, FileAnalysis, SemanticChange
+from .models import ExtractedElement
+
+_PY_DEFINITION = re.compile(r"^(\s*)(?:async\s+)?(def|class)\s+(\w+)")
+_JS_DEFINITIONS = [
+    (
+        "function",
+        re.compile(
+            r"^\s*(?:export\s+)?(?:default\s+)?(?:async\s+)?function\s*\*?\s*(\w+)"
+        ),
+    ),
+    (
+        "class",
+        re.compile(r"^\s*(?:export\s+)?(?:default\s+)?(?:abstract\s+)?class\s+(\w+)"),
+    ),
+    (
+        "function",
+        re.compile(
+            r"^\s*(?:export\s+)?(?:const|let|var)\s+(\w+)\s*(?::[^=]+)?=\s*"
+            r"(?:async\s+)?(?:function\b|\([^)]*\)\s*(?::[^=]+)?=>|\w+\s*=>)"
+        ),
+    ),
+    (
+        "interface",
+        re.compile(r"^\s*(?:export\s+)?(?:interface|type|enum)\s+(\w+)"),
+    ),
+]
+_JS_METHOD = re.compile(
+    r"^\s+(?:(?:public|private|protected|static|readonly|async|get|set)\s+)*"
+    r"(\w+)\s*\([^)]*\)\s*(?::[^{]+)?\{"
+)
+_JS_KEYWORDS = {"if", "for", "while", "switch", "catch", "return", "function"}
 
 
 def analyze_with_regex(
@@ -197,3 +228,137 @@ def get_function_pattern(ext: str) -> re.Pattern | None:
         ),
     }
     return patterns.get(ext)
+
+
+def extract_elements_with_regex(content: str, ext: str) -> dict[str, ExtractedElement]:
+    """
+    Extract top-level definitions (and class methods) without tree-sitter.
+
+    Uses indentation for Python and brace matching for JS/TS, so results are
+    approximate but good enough to locate and rank definitions.
+
+    Args:
+        content: File content
+        ext: File extension
+
+    Returns:
+        Elements keyed like the tree-sitter extractors ("function:name", ...)
+    """
+    lines = content.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+    if ext == ".py":
+        return _extract_python_regex(lines)
+    if ext in {".js", ".jsx", ".ts", ".tsx"}:
+        return _extract_js_regex(lines)
+    return {}
+
+
+def _extract_python_regex(lines: list[str]) -> dict[str, ExtractedElement]:
+    elements: dict[str, ExtractedElement] = {}
+    classes: list[tuple[int, str]] = []  # (indent, name) of enclosing classes
+
+    for i, line in enumerate(lines):
+        match = _PY_DEFINITION.match(line)
+        if not match:
+            continue
+        indent = len(match.group(1).expandtabs())
+        kind, name = match.group(2), match.group(3)
+
+        while classes and classes[-1][0] >= indent:
+            classes.pop()
+        parent = classes[-1][1] if classes else None
+
+        # The body ends before the next non-blank line at the same or lower indent
+        end = i
+        for j in range(i + 1, len(lines)):
+            stripped = lines[j].strip()
+            if not stripped:
+                continue
+            if len(lines[j]) - len(
+                lines[j].lstrip()
+            ) <= indent and not stripped.startswith((")", "]", "}")):
+                break
+            end = j
+
+        if kind == "class":
+            key, element_type, full_name = f"class:{name}", "class", name
+            classes.append((indent, name))
+        else:
+            full_name = f"{parent}.{name}" if parent else name
+            key, element_type = f"function:{full_name}", "function"
+
+        elements[key] = ExtractedElement(
+            element_type=element_type,
+            name=full_name,
+            start_line=i + 1,
+            end_line=end + 1,
+            content="\n".join(lines[i : end + 1]),
+            parent=parent if element_type == "function" else None,
+        )
+
+    return elements
+
+
+def _find_block_end(lines: list[str], start: int) -> int:
+    """Index of the line closing the first brace block opened at/after start."""
+    depth = 0
+    opened = False
+    for j in range(start, len(lines)):
+        for char in lines[j]:
+            if char == "{":
+                depth += 1
+                opened = True
+            elif char == "}":
+                depth -= 1
+        if opened and depth <= 0:
+            return j
+        if not opened and lines[j].rstrip().endswith(";"):
+            # Single-statement definition (e.g. a concise arrow function)
+            return j
+    return len(lines) - 1
+
+
+def _extract_js_regex(lines: list[str]) -> dict[str, ExtractedElement]:
+    elements: dict[str, ExtractedElement] = {}
+    class_name: str | None = None
+    class_end = -1
+
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        if i > class_end:
+            class_name = None
+
+        for element_type, pattern in _JS_DEFINITIONS:
+            match = pattern.match(line)
+            if match:
+                name = match.group(1)
+                end = _find_block_end(lines, i)
+                elements[f"{element_type}:{name}"] = ExtractedElement(
+                    element_type=element_type,
+                    name=name,
+                    start_line=i + 1,
+                    end_line=end + 1,
+                    content="\n".join(lines[i : end + 1]),
+                )
+                if element_type == "class":
+                    class_name, class_end = name, end
+                    break  # Methods are picked up below
+                i = end
+                break
+        else:
+            method = _JS_METHOD.match(line) if class_name else None
+            if method and method.group(1) not in _JS_KEYWORDS:
+                name = f"{class_name}.{method.group(1)}"
+                end = _find_block_end(lines, i)
+                elements[f"function:{name}"] = ExtractedElement(
+                    element_type="function",
+                    name=name,
+                    start_line=i + 1,
+                    end_line=end + 1,
+                    content="\n".join(lines[i : end + 1]),
+                    parent=class_name,
+                )
+                i = end
+        i += 1
+
+    return elements
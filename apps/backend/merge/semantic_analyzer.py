@@ -9,6 +9,11 @@ meaningful semantic changes like "added import", "modified function",
 "wrapped JSX element" rather than line-level diffs.
 
 When tree-sitter is not available, falls back to regex-based heuristics.
+
+Parsers are pooled per process (one per thread and language) and parsed
+baseline trees are cached across analyzers, so the many tasks touching one
+hot file share a single baseline parse and only re-parse the ranges they
+changed (see semantic_analysis.parse_cache).
 """
 
 from __future__ import annotations
@@ -57,7 +62,7 @@ MODULE = "merge.semantic_analyzer"
 TREE_SITTER_AVAILABLE = False
 try:
     import tree_sitter  # noqa: F401
-    from tree_sitter import Language, Node, Parser, Tree
+    from tree_sitter import Node, Tree
 
     TREE_SITTER_AVAILABLE = True
     logger.info("tree-sitter available, using AST-based analysis")
@@ -95,7 +100,22 @@ if TREE_SITTER_AVAILABLE:
 # Import our modular components
 from .semantic_analysis.comparison import compare_elements
 from .semantic_analysis.models import ExtractedElement
-from .semantic_analysis.regex_analyzer import analyze_with_regex
+from .semantic_analysis.parse_cache import (
+    LineIndex,
+    ParsedSource,
+    ParserPool,
+    TreeCache,
+    content_key,
+    parse_incremental,
+)
+from .semantic_analysis.regex_analyzer import (
+    analyze_with_regex,
+    extract_elements_with_regex,
+)
+
+# Shared by every SemanticAnalyzer in the process
+_PARSER_POOL = ParserPool(LANGUAGES_AVAILABLE)
+_TREE_CACHE = TreeCache()
 
 if TREE_SITTER_AVAILABLE:
     from .semantic_analysis.js_analyzer import extract_js_elements
@@ -117,8 +137,12 @@ class SemanticAnalyzer:
     """
 
     def __init__(self):
-        """Initialize the analyzer with available parsers."""
-        self._parsers: dict[str, Parser] = {}
+        """Initialize the analyzer with the process-wide parser pool."""
+        self._parser_pool = _PARSER_POOL
+        self._tree_cache = _TREE_CACHE
+        self._extensions: set[str] = (
+            self._parser_pool.extensions if TREE_SITTER_AVAILABLE else set()
+        )
 
         debug(
             MODULE,
@@ -127,15 +151,10 @@ class SemanticAnalyzer:
         )
 
         if TREE_SITTER_AVAILABLE:
-            for ext, lang in LANGUAGES_AVAILABLE.items():
-                parser = Parser()
-                parser.language = Language(lang)
-                self._parsers[ext] = parser
-                debug_detailed(MODULE, f"Initialized parser for {ext}")
             debug_success(
                 MODULE,
                 "SemanticAnalyzer initialized",
-                parsers=list(self._parsers.keys()),
+                parsers=sorted(self._extensions),
             )
         else:
             debug(MODULE, "Using regex-based fallback (tree-sitter not available)")
@@ -172,7 +191,7 @@ class SemanticAnalyzer:
         )
 
         # Use tree-sitter if available for this language
-        if ext in self._parsers:
+        if ext in self._extensions:
             debug_detailed(MODULE, f"Using tree-sitter parser for {ext}")
             analysis = self._analyze_with_tree_sitter(file_path, before, after, ext)
         else:
@@ -209,20 +228,21 @@ class SemanticAnalyzer:
         ext: str,
     ) -> FileAnalysis:
         """Analyze using tree-sitter AST parsing."""
-        parser = self._parsers[ext]
-
         # Normalize line endings to LF for consistent cross-platform behavior
         # This ensures byte positions and line counts work correctly on all platforms
         before_normalized = before.replace("\r\n", "\n").replace("\r", "\n")
         after_normalized = after.replace("\r\n", "\n").replace("\r", "\n")
 
-        tree_before = parser.parse(bytes(before_normalized, "utf-8"))
-        tree_after = parser.parse(bytes(after_normalized, "utf-8"))
+        # The baseline is shared by every task touching this file: parse it
+        # once and re-parse only the changed range for the "after" side
+        parsed_before = self._parse_cached(before_normalized, ext)
+        parsed_after = self._parse(after_normalized, ext, base=parsed_before)
 
         # Extract structural elements from both versions
-        # Use normalized content to match tree-sitter byte positions
-        elements_before = self._extract_elements(tree_before, before_normalized, ext)
-        elements_after = self._extract_elements(tree_after, after_normalized, ext)
+        elements_before = self._cached_elements(parsed_before, ext)
+        elements_after = self._extract_elements(
+            parsed_after.tree, parsed_after.source, ext, parsed_after
+        )
 
         # Compare and generate semantic changes
         changes = compare_elements(elements_before, elements_after, ext)
@@ -253,22 +273,51 @@ class SemanticAnalyzer:
 
         return analysis
 
+    def _parse(
+        self, source: str, ext: str, base: ParsedSource | None = None
+    ) -> ParsedSource:
+        """Parse normalized source, incrementally from base if given."""
+        data = bytes(source, "utf-8")
+        tree = parse_incremental(self._parser_pool.get(ext), base, data)
+        return ParsedSource(source=source, data=data, tree=tree)
+
+    def _parse_cached(self, source: str, ext: str) -> ParsedSource:
+        """Parse normalized source, reusing the process-wide tree cache."""
+        key = content_key(ext, bytes(source, "utf-8"))
+        parsed = self._tree_cache.get(key)
+        if parsed is None:
+            parsed = self._parse(source, ext)
+            self._tree_cache.put(key, parsed)
+        return parsed
+
+    def _cached_elements(
+        self, parsed: ParsedSource, ext: str
+    ) -> dict[str, ExtractedElement]:
+        """Elements of a cached parse, extracted once and copied per caller."""
+        if parsed.elements is None:
+            parsed.elements = self._extract_elements(
+                parsed.tree, parsed.source, ext, parsed
+            )
+        return dict(parsed.elements)
+
     def _extract_elements(
         self,
         tree: Tree,
         source: str,
         ext: str,
+        parsed: ParsedSource | None = None,
     ) -> dict[str, ExtractedElement]:
         """Extract structural elements from a syntax tree."""
         elements: dict[str, ExtractedElement] = {}
-        source_bytes = bytes(source, "utf-8")
+        source_bytes = parsed.data if parsed else bytes(source, "utf-8")
+        lines = parsed.lines if parsed else LineIndex(source_bytes)
 
         def get_text(node: Node) -> str:
             return source_bytes[node.start_byte : node.end_byte].decode("utf-8")
 
         def get_line(byte_pos: int) -> int:
             # Convert byte position to line number (1-indexed)
-            return source[:byte_pos].count("\n") + 1
+            return lines.line_of(byte_pos)
 
         # Language-specific extraction
         if ext == ".py":
@@ -278,6 +327,28 @@ class SemanticAnalyzer:
 
         return elements
 
+    def extract_elements(
+        self, file_path: str, content: str
+    ) -> dict[str, ExtractedElement]:
+        """
+        Extract the structural elements (imports, functions, classes) of a file.
+
+        Uses tree-sitter when a parser is available for the file type and
+        falls back to regex heuristics otherwise.
+
+        Args:
+            file_path: Path to the file (used for the extension)
+            content: File content
+
+        Returns:
+            Dict mapping element keys (e.g. "function:Foo.bar") to elements
+        """
+        ext = Path(file_path).suffix.lower()
+        if ext in self._extensions:
+            normalized = content.replace("\r\n", "\n").replace("\r", "\n")
+            return self._cached_elements(self._parse_cached(normalized, ext), ext)
+        return extract_elements_with_regex(content, ext)
+
     def analyze_file(self, file_path: str, content: str) -> FileAnalysis:
         """
         Analyze a single file's structure (not a diff).
@@ -299,7 +370,7 @@ class SemanticAnalyzer:
         """Get the set of supported file extensions."""
         if TREE_SITTER_AVAILABLE:
             # Tree-sitter extensions plus regex fallbacks
-            return set(self._parsers.keys()) | {".py", ".js", ".jsx", ".ts", ".tsx"}
+            return self._extensions | {".py", ".js", ".jsx", ".ts", ".tsx"}
         else:
             # Only regex-supported extensions
             return {".py", ".js", ".jsx", ".ts", ".tsx"}
@@ -93,6 +93,84 @@ class TimelineGitHelper:
         except Exception:
             return None
 
+    def get_file_contents_at_commits(
+        self, requests: list[tuple[str, str]]
+    ) -> dict[tuple[str, str], str | None]:
+        """
+        Get the content of many files at many commits in a single git process.
+
+        Streams every ``<commit>:<path>`` object name through one
+        ``git cat-file --batch`` instead of spawning ``git show`` per file.
+
+        Args:
+            requests: List of (commit_hash, file_path) pairs
+
+        Returns:
+            Dictionary mapping each (commit_hash, file_path) pair to its
+            content, or None if the file doesn't exist at that commit
+        """
+        contents: dict[tuple[str, str], str | None] = {}
+        unique = list(dict.fromkeys(requests))
+        if not unique:
+            return contents
+
+        # Object names containing newlines can't be expressed in batch input
+        batchable = [req for req in unique if "\n" not in req[1]]
+        for req in unique:
+            contents[req] = None
+
+        if not batchable:
+            return contents
+
+        stdin = "".join(
+            f"{commit_hash}:{file_path}\n" for commit_hash, file_path in batchable
+        ).encode("utf-8")
+
+        try:
+            result = subprocess.run(
+                ["git", "cat-file", "--batch"],
+                cwd=self.project_path,
+                input=stdin,
+                capture_output=True,
+            )
+        except Exception as e:
+            debug_error(MODULE, f"git cat-file --batch failed: {e}")
+            return contents
+
+        if result.returncode != 0:
+            debug_warning(
+                MODULE,
+                "git cat-file --batch exited with error",
+                returncode=result.returncode,
+            )
+            return contents
+
+        output = result.stdout
+        pos = 0
+        for req in batchable:
+            header_end = output.find(b"\n", pos)
+            if header_end == -1:
+                break
+            header = output[pos:header_end]
+            pos = header_end + 1
+
+            # Header is "<sha> <type> <size>" or "<name> missing|ambiguous";
+            # the name may contain spaces, so only trust the trailing fields
+            if header.endswith((b" missing", b" ambiguous")):
+                continue
+            fields = header.rsplit(maxsplit=2)
+            if len(fields) != 3 or not fields[2].isdigit():
+                continue
+
+            size = int(fields[2])
+            data = output[pos : pos + size]
+            pos += size + 1  # Skip the trailing newline after the object
+
+            if fields[1] == b"blob":
+                contents[req] = data.decode("utf-8", errors="replace")
+
+        return contents
+
     def get_files_changed_in_commit(self, commit_hash: str) -> list[str]:
         """
         Get list of files changed in a commit.
@@ -173,6 +251,31 @@ class TimelineGitHelper:
 
         return info
 
+    def get_commits_in_range(self, from_commit: str, to_commit: str) -> list[str]:
+        """
+        List commits reachable from to_commit but not from from_commit.
+
+        Used to ingest a fast-forward (e.g. ``git pull``) in one pass.
+
+        Args:
+            from_commit: Exclusive starting point (e.g. ORIG_HEAD)
+            to_commit: Inclusive end point (e.g. HEAD)
+
+        Returns:
+            Commit hashes in chronological order (oldest first)
+        """
+        try:
+            result = subprocess.run(
+                ["git", "rev-list", "--reverse", f"{from_commit}..{to_commit}"],
+                cwd=self.project_path,
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            return [c for c in result.stdout.strip().split("\n") if c]
+        except subprocess.CalledProcessError:
+            return []
+
     def get_worktree_file_content(self, task_id: str, file_path: str) -> str:
         """
         Get file content from a task's worktree.
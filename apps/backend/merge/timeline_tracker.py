@@ -127,14 +127,17 @@ class FileTimelineTracker:
 
         timestamp = datetime.now()
 
+        # Read every branch-point blob in one git process
+        contents = self.git.get_file_contents_at_commits(
+            [(branch_point_commit, file_path) for file_path in files_to_modify]
+        )
+
         for file_path in files_to_modify:
             # Get or create timeline for this file
             timeline = self._get_or_create_timeline(file_path)
 
             # Get file content at branch point
-            content = self.git.get_file_content_at_commit(
-                file_path, branch_point_commit
-            )
+            content = contents.get((branch_point_commit, file_path))
             if content is None:
                 # File doesn't exist at this commit - might be created by task
                 content = ""
@@ -157,7 +160,8 @@ class FileTimelineTracker:
             )
 
             timeline.add_task_view(task_view)
-            self._persist_timeline(file_path)
+
+        self._persist_timelines(files_to_modify)
 
         debug_success(
             MODULE, f"Task {task_id} registered with {len(files_to_modify)} files"
@@ -174,44 +178,93 @@ class FileTimelineTracker:
             commit_hash: Git commit hash
         """
         debug(MODULE, f"on_main_branch_commit: {commit_hash}")
+        self.on_main_branch_commits([commit_hash])
+
+    def on_main_branch_commits(self, commit_hashes: list[str]) -> int:
+        """
+        Ingest one or more main branch commits in a single pass.
+
+        Commit metadata is fetched once per commit, file contents for every
+        tracked file are read through one ``git cat-file --batch`` process,
+        and each touched timeline plus the index is written exactly once.
+        Used for large commits and for fast-forwards such as ``git pull``.
+
+        Args:
+            commit_hashes: Git commit hashes in chronological order
 
-        # Get list of files changed in this commit
-        changed_files = self.git.get_files_changed_in_commit(commit_hash)
+        Returns:
+            Number of timeline events recorded
+        """
+        debug(MODULE, f"on_main_branch_commits: {len(commit_hashes)} commits")
 
-        for file_path in changed_files:
+        # Collect (commit, tracked files, metadata) before touching any blobs
+        pending: list[tuple[str, list[str], dict]] = []
+        for commit_hash in commit_hashes:
+            changed_files = self.git.get_files_changed_in_commit(commit_hash)
             # Only update existing timelines (we don't create new ones for random files)
-            if file_path not in self._timelines:
+            tracked = [f for f in changed_files if f in self._timelines]
+            if not tracked:
                 continue
+            pending.append(
+                (commit_hash, tracked, self.git.get_commit_info(commit_hash))
+            )
 
-            timeline = self._timelines[file_path]
+        if not pending:
+            return 0
 
-            # Get file content at this commit
-            content = self.git.get_file_content_at_commit(file_path, commit_hash)
-            if content is None:
-                continue
+        contents = self.git.get_file_contents_at_commits(
+            [
+                (commit_hash, file_path)
+                for commit_hash, tracked, _ in pending
+                for file_path in tracked
+            ]
+        )
 
-            # Get commit metadata
-            commit_info = self.git.get_commit_info(commit_hash)
-
-            # Create main branch event
-            event = MainBranchEvent(
-                commit_hash=commit_hash,
-                timestamp=datetime.now(),
-                content=content,
-                source="human",
-                commit_message=commit_info.get("message", ""),
-                author=commit_info.get("author"),
-                diff_summary=commit_info.get("diff_summary"),
-            )
+        updated: set[str] = set()
+        events = 0
+        for commit_hash, tracked, commit_info in pending:
+            timestamp = datetime.now()
+            for file_path in tracked:
+                content = contents.get((commit_hash, file_path))
+                if content is None:
+                    continue
 
-            timeline.add_main_event(event)
-            self._persist_timeline(file_path)
+                event = MainBranchEvent(
+                    commit_hash=commit_hash,
+                    timestamp=timestamp,
+                    content=content,
+                    source="human",
+                    commit_message=commit_info.get("message", ""),
+                    author=commit_info.get("author"),
+                    diff_summary=commit_info.get("diff_summary"),
+                )
+                self._timelines[file_path].add_main_event(event)
+                updated.add(file_path)
+                events += 1
+
+        self._persist_timelines(updated)
 
         debug_success(
             MODULE,
-            f"Processed main commit {commit_hash[:8]}",
-            files_updated=len(changed_files),
+            f"Processed {len(pending)} main commits",
+            files_updated=len(updated),
+            events=events,
         )
+        return events
+
+    def on_main_branch_range(self, from_commit: str, to_commit: str) -> int:
+        """
+        Ingest every commit in ``from_commit..to_commit`` in one pass.
+
+        Args:
+            from_commit: Exclusive starting point (e.g. ORIG_HEAD after a pull)
+            to_commit: Inclusive end point (e.g. HEAD)
+
+        Returns:
+            Number of timeline events recorded
+        """
+        commits = self.git.get_commits_in_range(from_commit, to_commit)
+        return self.on_main_branch_commits(commits)
 
     def on_task_worktree_change(
         self,
@@ -612,3 +665,14 @@ class FileTimelineTracker:
 
         self.persistence.save_timeline(file_path, timeline)
         self.persistence.update_index(list(self._timelines.keys()))
+
+    def _persist_timelines(self, file_paths: set[str] | list[str]) -> None:
+        """Save several timelines, then flush the index once."""
+        if not file_paths:
+            return
+
+        for file_path in file_paths:
+            timeline = self._timelines.get(file_path)
+            if timeline:
+                self.persistence.save_timeline(file_path, timeline)
+        self.persistence.update_index(list(self._timelines.keys()))
@@ -7,6 +7,8 @@ Used by git hooks and manual operations.
 
 Usage:
     python -m auto_claude.merge.tracker_cli notify-commit <hash>
+    python -m auto_claude.merge.tracker_cli notify-commits <hash> [<hash> ...]
+    python -m auto_claude.merge.tracker_cli notify-commits --range ORIG_HEAD..HEAD
     python -m auto_claude.merge.tracker_cli show-timeline <file_path>
     python -m auto_claude.merge.tracker_cli show-drift <task_id>
 """
@@ -48,6 +50,24 @@ def cmd_notify_commit(args):
     print("[FileTimelineTracker] Commit processed successfully")
 
 
+def cmd_notify_commits(args):
+    """Ingest several commits (or a fast-forward range) in one batched pass."""
+    tracker = get_tracker()
+
+    if args.range:
+        if ".." not in args.range:
+            print(f"Invalid range (expected A..B): {args.range}")
+            sys.exit(1)
+        from_commit, to_commit = args.range.split("..", 1)
+        print(f"[FileTimelineTracker] Processing range: {args.range}")
+        updated = tracker.on_main_branch_range(from_commit, to_commit or "HEAD")
+    else:
+        print(f"[FileTimelineTracker] Processing {len(args.commit_hashes)} commits")
+        updated = tracker.on_main_branch_commits(args.commit_hashes)
+
+    print(f"[FileTimelineTracker] Recorded {updated} timeline events")
+
+
 def cmd_show_timeline(args):
     """Show the timeline for a file."""
     tracker = get_tracker()
@@ -182,6 +202,19 @@ def main():
     notify_parser.add_argument("commit_hash", help="The commit hash")
     notify_parser.set_defaults(func=cmd_notify_commit)
 
+    # notify-commits
+    notify_many_parser = subparsers.add_parser(
+        "notify-commits",
+        help="Batch-ingest several commits (e.g. after a git pull fast-forward)",
+    )
+    notify_many_parser.add_argument(
+        "commit_hashes", nargs="*", help="Commit hashes, oldest first"
+    )
+    notify_many_parser.add_argument(
+        "--range", help="Commit range to ingest, e.g. ORIG_HEAD..HEAD"
+    )
+    notify_many_parser.set_defaults(func=cmd_notify_commits)
+
     # show-timeline
     timeline_parser = subparsers.add_parser(
         "show-timeline", help="Show the timeline for a file"
@@ -8,6 +8,7 @@ Re-exports from core.progress for clean imports.
 from core.progress import (
     count_subtasks,
     count_subtasks_detailed,
+    find_next_subtask,
     format_duration,
     get_current_phase,
     get_next_subtask,
@@ -23,6 +24,7 @@ from core.progress import (
 __all__ = [
     "count_subtasks",
     "count_subtasks_detailed",
+    "find_next_subtask",
     "format_duration",
     "get_current_phase",
     "get_next_subtask",
@@ -27,6 +27,7 @@ from .framework_detector import FrameworkDetector
 from .models import SecurityProfile
 from .stack_detector import StackDetector
 from .structure_analyzer import StructureAnalyzer
+from .tree_scanner import scan_project_tree
 
 
 class ProjectAnalyzer:
@@ -131,14 +132,6 @@ class ProjectAnalyzer:
             "docker-compose.yaml",
         ]
 
-        # Glob patterns for project files that can be anywhere in the tree
-        glob_patterns = [
-            "*.csproj",  # C# projects
-            "*.sln",  # Visual Studio solutions
-            "*.fsproj",  # F# projects
-            "*.vbproj",  # VB.NET projects
-        ]
-
         hasher = hashlib.md5(usedforsecurity=False)
         files_found = 0
 
@@ -152,36 +145,23 @@ class ProjectAnalyzer:
                 except OSError:
                     continue
 
-        # Check glob patterns for project files that can be anywhere
-        for pattern in glob_patterns:
-            for filepath in self.project_dir.glob(f"**/{pattern}"):
-                try:
-                    stat = filepath.stat()
-                    rel_path = filepath.relative_to(self.project_dir)
-                    hasher.update(f"{rel_path}:{stat.st_mtime}:{stat.st_size}".encode())
-                    files_found += 1
-                except OSError:
-                    continue
+        # .NET project files can be anywhere - one pruned, cached walk finds
+        # them (skipping node_modules, .git, worktrees, build output, ...)
+        tree = scan_project_tree(self.project_dir)
+        for rel_path in tree.dotnet_projects:
+            try:
+                stat = (self.project_dir / rel_path).stat()
+                hasher.update(f"{rel_path}:{stat.st_mtime}:{stat.st_size}".encode())
+                files_found += 1
+            except OSError:
+                continue
 
         # If no config files found, hash the project directory structure
         # to at least detect when files are added/removed
         if files_found == 0:
             # Count source files as a proxy for project structure
-            source_exts = [
-                "*.py",
-                "*.js",
-                "*.ts",
-                "*.go",
-                "*.rs",
-                "*.dart",
-                "*.cs",
-                "*.swift",
-                "*.kt",
-                "*.java",
-            ]
-            for ext in source_exts:
-                count = len(list(self.project_dir.glob(f"**/{ext}")))
-                hasher.update(f"{ext}:{count}".encode())
+            for ext, count in tree.source_counts.items():
+                hasher.update(f"*{ext}:{count}".encode())
             # Also include the project directory name for uniqueness
             hasher.update(self.project_dir.name.encode())
 
@@ -0,0 +1,164 @@
+"""
+Project Tree Scanner
+====================
+
+Single pruned walk of the project tree used by the project hash.
+
+The security profile is re-validated on every agent session, so the
+project hash must be cheap. Instead of running one recursive glob per
+pattern (which descends into node_modules, .git and worktrees), the tree is
+walked once with heavy directories pruned, and the result is cached per
+project. The cache is validated by the mtimes of the visited directories:
+a directory's mtime changes whenever an entry is added, removed or renamed
+in it, which is exactly when the scan result can change.
+"""
+
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+
+# Directories that never contain project manifests we care about
+PRUNED_DIRS = {
+    "node_modules",
+    ".git",
+    ".hg",
+    ".svn",
+    "__pycache__",
+    ".venv",
+    "venv",
+    ".tox",
+    ".nox",
+    "dist",
+    "build",
+    ".next",
+    ".nuxt",
+    "target",
+    "vendor",
+    "bin",
+    "obj",
+    ".idea",
+    ".vscode",
+    ".pytest_cache",
+    ".mypy_cache",
+    ".ruff_cache",
+    "coverage",
+    "htmlcov",
+    ".turbo",
+    ".cache",
+    ".gradle",
+    "Pods",
+    ".dart_tool",
+    ".worktrees",
+    ".auto-claude",
+}
+
+# .NET project files can live anywhere in the tree
+DOTNET_PROJECT_SUFFIXES = (".csproj", ".sln", ".fsproj", ".vbproj")
+
+# Source extensions counted when a project has no manifest at all
+SOURCE_EXTENSIONS = (
+    ".py",
+    ".js",
+    ".ts",
+    ".go",
+    ".rs",
+    ".dart",
+    ".cs",
+    ".swift",
+    ".kt",
+    ".java",
+)
+
+
+@dataclass
+class TreeScan:
+    """Result of one pruned walk of a project tree."""
+
+    dotnet_projects: list[str] = field(default_factory=list)
+    source_counts: dict[str, int] = field(default_factory=dict)
+    dir_mtimes: dict[str, int] = field(default_factory=dict)
+
+
+_cache: dict[Path, TreeScan] = {}
+_cache_lock = threading.Lock()
+
+
+def _is_pruned(name: str) -> bool:
+    return name in PRUNED_DIRS or name.endswith(".egg-info")
+
+
+def _walk(project_dir: Path) -> TreeScan:
+    scan = TreeScan(source_counts=dict.fromkeys(SOURCE_EXTENSIONS, 0))
+    stack = [str(project_dir)]
+
+    while stack:
+        current = stack.pop()
+        try:
+            scan.dir_mtimes[current] = os.stat(current).st_mtime_ns
+            entries = os.scandir(current)
+        except OSError:
+            continue
+
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not _is_pruned(entry.name):
+                            stack.append(entry.path)
+                        continue
+                except OSError:
+                    continue
+
+                name = entry.name
+                if name.endswith(DOTNET_PROJECT_SUFFIXES):
+                    scan.dotnet_projects.append(
+                        os.path.relpath(entry.path, project_dir)
+                    )
+                ext = os.path.splitext(name)[1]
+                if ext in scan.source_counts:
+                    scan.source_counts[ext] += 1
+
+    scan.dotnet_projects.sort()
+    return scan
+
+
+def _is_fresh(scan: TreeScan) -> bool:
+    for path, mtime in scan.dir_mtimes.items():
+        try:
+            if os.stat(path).st_mtime_ns != mtime:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def scan_project_tree(project_dir: Path, use_cache: bool = True) -> TreeScan:
+    """
+    Walk the project once (pruned), reusing the last scan if still valid.
+
+    Args:
+        project_dir: Root directory of the project
+        use_cache: Reuse a previous scan whose directories are unchanged
+
+    Returns:
+        TreeScan with .NET project paths and source file counts
+    """
+    project_dir = Path(project_dir).resolve()
+
+    if use_cache:
+        with _cache_lock:
+            cached = _cache.get(project_dir)
+        if cached is not None and _is_fresh(cached):
+            return cached
+
+    scan = _walk(project_dir)
+    with _cache_lock:
+        _cache[project_dir] = scan
+    return scan
+
+
+def clear_tree_scan_cache() -> None:
+    """Drop all cached scans (mainly for tests)."""
+    with _cache_lock:
+        _cache.clear()
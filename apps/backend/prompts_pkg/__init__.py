@@ -13,7 +13,14 @@ from .project_context import (
     load_project_index,
     should_refresh_project_index,
 )
+from .prompt_builder import (
+    PromptBlock,
+    PromptBuilder,
+    format_prompt_cache_report,
+    get_prompt_cache_report,
+)
 from .prompt_generator import (
+    build_subtask_prompt_blocks,
     format_context_for_prompt,
     generate_environment_context,
     generate_planner_prompt,
@@ -24,6 +31,8 @@ from .prompt_generator import (
 
 # Import all functions from prompts
 from .prompts import (
+    build_coding_prompt_blocks,
+    build_qa_reviewer_prompt_blocks,
     get_coding_prompt,
     get_followup_planner_prompt,
     get_planner_prompt,
@@ -37,14 +46,17 @@ __all__ = [
     "get_relative_spec_path",
     "generate_environment_context",
     "generate_subtask_prompt",
+    "build_subtask_prompt_blocks",
     "generate_planner_prompt",
     "load_subtask_context",
     "format_context_for_prompt",
     # prompts functions
     "get_planner_prompt",
     "get_coding_prompt",
+    "build_coding_prompt_blocks",
     "get_followup_planner_prompt",
     "get_qa_reviewer_prompt",
+    "build_qa_reviewer_prompt_blocks",
     "get_qa_fixer_prompt",
     "is_first_run",
     # project_context functions
@@ -52,4 +64,9 @@ __all__ = [
     "detect_project_capabilities",
     "get_mcp_tools_for_project",
     "should_refresh_project_index",
+    # prompt_builder
+    "PromptBlock",
+    "PromptBuilder",
+    "get_prompt_cache_report",
+    "format_prompt_cache_report",
 ]
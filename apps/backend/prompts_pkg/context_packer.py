@@ -0,0 +1,333 @@
+"""
+Context Packer
+==============
+
+Fits the file context of a subtask prompt into a token budget.
+
+Instead of the first N lines of every pattern file and file to modify, the
+packer extracts definitions with the merge system's semantic analyzer
+(tree-sitter, or regex heuristics when tree-sitter isn't installed), ranks
+them by relevance to the subtask description and emits, in order:
+- import headers of the files to modify
+- the most relevant definitions in full
+- signatures of the remaining definitions as an outline
+
+When everything fits in the budget, files are included whole.
+"""
+
+import math
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+CONTEXT_TOKEN_BUDGET_ENV = "AUTO_CLAUDE_CONTEXT_TOKEN_BUDGET"
+
+# Default token budget for the file context of one subtask prompt
+DEFAULT_CONTEXT_TOKEN_BUDGET = 8000
+
+# Rough estimate: 4 chars per token for code
+CHARS_PER_TOKEN = 4
+
+# Import/docstring header shown for files to modify (lines)
+MAX_HEADER_LINES = 40
+
+# Signatures longer than this are cut (multi-line parameter lists)
+MAX_SIGNATURE_LINES = 6
+
+ROLE_FILES_TO_MODIFY = "files_to_modify"
+ROLE_PATTERNS = "patterns"
+
+_DEFINITION_TYPES = {"function", "class", "interface"}
+
+_STOPWORDS = {
+    "the",
+    "and",
+    "for",
+    "with",
+    "from",
+    "into",
+    "that",
+    "this",
+    "add",
+    "new",
+    "use",
+    "using",
+    "update",
+    "make",
+    "should",
+    "when",
+    "all",
+    "any",
+    "not",
+    "are",
+    "its",
+    "via",
+    "file",
+    "files",
+    "code",
+    "implement",
+    "support",
+}
+
+_WORD = re.compile(r"[A-Za-z][A-Za-z0-9]*")
+_CAMEL = re.compile(r"[A-Z]+(?=[A-Z][a-z]|\d|\b)|[A-Z]?[a-z]+|[A-Z]+|\d+")
+
+
+def get_context_token_budget() -> int:
+    """Configured token budget for subtask file context."""
+    try:
+        return int(
+            os.environ.get(CONTEXT_TOKEN_BUDGET_ENV, DEFAULT_CONTEXT_TOKEN_BUDGET)
+        )
+    except ValueError:
+        return DEFAULT_CONTEXT_TOKEN_BUDGET
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token estimate for a piece of code or prose."""
+    return len(text) // CHARS_PER_TOKEN
+
+
+def extract_terms(text: str) -> set[str]:
+    """
+    Split text into lowercase search terms.
+
+    Identifiers are split on snake_case and camelCase boundaries, so
+    ``getUserProfile`` and ``user_profile`` both yield ``user``/``profile``.
+    """
+    terms: set[str] = set()
+    for word in _WORD.findall(text):
+        parts = [p.lower() for p in _CAMEL.findall(word)] or [word.lower()]
+        if len(parts) > 1:
+            terms.add(word.lower())
+        terms.update(parts)
+    return {t for t in terms if len(t) >= 3 and t not in _STOPWORDS}
+
+
+@dataclass
+class _Definition:
+    name: str
+    start: int  # 1-based, inclusive
+    end: int
+    signature_end: int
+    score: float
+    parent: str | None = None
+
+
+@dataclass
+class _SourceFile:
+    path: str
+    role: str
+    lines: list[str]
+    definitions: list[_Definition] = field(default_factory=list)
+    header_end: int = 0
+    score: float = 0.0
+    selected: set[int] = field(default_factory=set)
+
+    def cost(self, start: int, end: int) -> int:
+        """Token cost of lines start..end that aren't selected yet."""
+        return sum(
+            estimate_tokens(self.lines[i - 1]) + 1
+            for i in range(start, end + 1)
+            if i not in self.selected
+        )
+
+    def select(self, start: int, end: int) -> None:
+        self.selected.update(range(start, end + 1))
+
+
+_analyzer = None
+
+
+def _extract_definitions(path: str, content: str) -> list:
+    """Definitions (functions, classes, types) found by the semantic analyzer."""
+    global _analyzer
+    try:
+        if _analyzer is None:
+            from merge.semantic_analyzer import SemanticAnalyzer
+
+            _analyzer = SemanticAnalyzer()
+        elements = _analyzer.extract_elements(path, content)
+    except Exception:
+        return []
+    return sorted(
+        (e for e in elements.values() if e.element_type in _DEFINITION_TYPES),
+        key=lambda e: e.start_line,
+    )
+
+
+def _signature_end(lines: list[str], start: int, end: int) -> int:
+    """Last line of a definition's signature (through ':' or '{')."""
+    for i in range(start, min(end, start + MAX_SIGNATURE_LINES - 1) + 1):
+        stripped = lines[i - 1].rstrip()
+        if stripped.endswith((":", "{", "=>")) or "{" in stripped:
+            return i
+    return start
+
+
+def _score(name: str, body: str, query: set[str]) -> float:
+    """Relevance of a definition: name matches weigh more than body matches."""
+    if not query:
+        return 0.0
+    name_hits = len(query & extract_terms(name))
+    body_terms = extract_terms(body)
+    body_hits = len(query & body_terms)
+    # Dampen long bodies so big classes don't win on sheer vocabulary
+    return 3.0 * name_hits + body_hits / math.sqrt(1 + len(body_terms) / 50)
+
+
+def _load_file(path: str, role: str, content: str, query: set[str]) -> _SourceFile:
+    lines = content.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+    source = _SourceFile(path=path, role=role, lines=lines)
+
+    for element in _extract_definitions(path, content):
+        start = max(1, element.start_line)
+        end = min(len(lines), max(start, element.end_line))
+        body = "\n".join(lines[start - 1 : end])
+        source.definitions.append(
+            _Definition(
+                name=element.name,
+                start=start,
+                end=end,
+                signature_end=_signature_end(lines, start, end),
+                score=_score(element.name, body, query),
+                parent=element.parent,
+            )
+        )
+
+    first = source.definitions[0].start if source.definitions else len(lines) + 1
+    source.header_end = min(first - 1, MAX_HEADER_LINES)
+    source.score = _score(Path(path).stem, content, query)
+    return source
+
+
+def _render(source: _SourceFile) -> str:
+    total = len(source.lines)
+    if not source.selected:
+        return f"... ({total} lines omitted - no definitions relevant to this subtask)"
+
+    out: list[str] = []
+    previous = 0
+    for line_no in sorted(source.selected):
+        if line_no > previous + 1:
+            out.append(f"... (lines {previous + 1}-{line_no - 1} omitted)")
+        out.append(source.lines[line_no - 1])
+        previous = line_no
+    if any(line.strip() for line in source.lines[previous:]):
+        out.append(f"... ({total - previous} more lines omitted)")
+    return "\n".join(out)
+
+
+def pack_context(
+    project_dir: Path,
+    files_to_modify: list[str],
+    patterns_from: list[str],
+    query: str,
+    token_budget: int | None = None,
+) -> dict[str, dict[str, str]]:
+    """
+    Select the file context most relevant to a subtask within a token budget.
+
+    Args:
+        project_dir: Project root
+        files_to_modify: Files the subtask changes (prioritized)
+        patterns_from: Reference files showing the patterns to follow
+        query: Text describing the subtask (description, id, ...)
+        token_budget: Approximate maximum tokens of file content
+            (default: get_context_token_budget())
+
+    Returns:
+        Dict with "files_to_modify" and "patterns", each mapping file path
+        to the packed content (as used by format_context_for_prompt)
+    """
+    if token_budget is None:
+        token_budget = get_context_token_budget()
+
+    result: dict[str, dict[str, str]] = {
+        ROLE_FILES_TO_MODIFY: {},
+        ROLE_PATTERNS: {},
+    }
+
+    contents: list[tuple[str, str, str]] = []  # (path, role, content)
+    for role, paths in (
+        (ROLE_FILES_TO_MODIFY, files_to_modify),
+        (ROLE_PATTERNS, patterns_from),
+    ):
+        for rel in paths:
+            full_path = project_dir / rel
+            if not full_path.exists():
+                continue
+            try:
+                contents.append((rel, role, full_path.read_text()))
+            except Exception:
+                result[role][rel] = "(Could not read file)"
+
+    # Everything fits - no need to cut anything
+    if sum(estimate_tokens(c) for _, _, c in contents) <= token_budget:
+        for rel, role, content in contents:
+            result[role][rel] = content
+        return result
+
+    terms = extract_terms(query)
+    sources = [_load_file(rel, role, content, terms) for rel, role, content in contents]
+    remaining = token_budget
+
+    def take(source: _SourceFile, start: int, end: int) -> bool:
+        nonlocal remaining
+        cost = source.cost(start, end)
+        if cost > remaining:
+            return False
+        source.select(start, end)
+        remaining -= cost
+        return True
+
+    def role_weight(source: _SourceFile) -> float:
+        return 1.5 if source.role == ROLE_FILES_TO_MODIFY else 1.0
+
+    by_name = {
+        (id(source), d.name): d for source in sources for d in source.definitions
+    }
+
+    # 1. Import headers of the files being modified (bounded by
+    # MAX_HEADER_LINES), so large definitions can't crowd them out
+    for source in sources:
+        if source.role == ROLE_FILES_TO_MODIFY and source.header_end > 0:
+            take(source, 1, source.header_end)
+
+    # 2. Relevant definitions, best first: in full, else just the signature
+    ranked = sorted(
+        (
+            (d.score * role_weight(source), source, d)
+            for source in sources
+            for d in source.definitions
+            if d.score > 0
+        ),
+        key=lambda item: (-item[0], item[2].start),
+    )
+    for _, source, definition in ranked:
+        parent = (
+            by_name.get((id(source), definition.parent)) if definition.parent else None
+        )
+        if parent is not None:
+            # Keep the enclosing class line so the method reads in context
+            take(source, parent.start, parent.signature_end)
+        if not take(source, definition.start, definition.end):
+            take(source, definition.start, definition.signature_end)
+
+    # 3. Files without recognizable structure, most relevant first
+    for source in sorted(sources, key=lambda s: -s.score * role_weight(s)):
+        if source.definitions or (source.score <= 0 and source.role == ROLE_PATTERNS):
+            continue
+        for line_no in range(1, len(source.lines) + 1):
+            if not take(source, line_no, line_no):
+                break
+
+    # 4. Outline: signatures of everything else, files to modify first
+    for source in sorted(sources, key=lambda s: s.role != ROLE_FILES_TO_MODIFY):
+        for definition in source.definitions:
+            take(source, definition.start, definition.signature_end)
+
+    for source in sources:
+        result[source.role][source.path] = _render(source)
+    return result
@@ -0,0 +1,443 @@
+"""
+Project Index Freshness
+=======================
+
+Tracks the manifests a project index was built from.
+
+When analyze_project() writes project_index.json it also records every
+manifest it can find in the service tree (package.json, pyproject.toml,
+go.mod, ... down to MAX_MANIFEST_DEPTH, so nested monorepo packages such
+as apps/*/packages/* are covered) and the directories that contain
+packages, including the project root, with their mtimes, in
+project_index.freshness.json. Checking freshness is then one stat pass over
+exactly those paths: a changed, added or removed manifest, or a changed
+package directory (a package added or removed), means the index is stale.
+
+Long-running processes can watch the same paths with inotify (Linux only)
+and be told the moment anything changes instead of polling.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import json
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+from collections.abc import Callable, Iterable
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+FRESHNESS_FILE = "project_index.freshness.json"
+FRESHNESS_VERSION = 1
+MAX_MANIFEST_DEPTH = 4
+
+# Files whose changes can alter services, frameworks or dependencies
+MANIFEST_FILES = frozenset(
+    {
+        "package.json",
+        "pyproject.toml",
+        "requirements.txt",
+        "Pipfile",
+        "setup.py",
+        "Gemfile",
+        "go.mod",
+        "Cargo.toml",
+        "composer.json",
+        "pom.xml",
+        "build.gradle",
+        "pnpm-workspace.yaml",
+        "lerna.json",
+        "nx.json",
+        "turbo.json",
+        "rush.json",
+    }
+)
+
+DEFAULT_SKIP_DIRS = frozenset(
+    {
+        "node_modules",
+        "__pycache__",
+        "dist",
+        "build",
+        "target",
+        "vendor",
+        "venv",
+        "env",
+        "coverage",
+    }
+)
+
+
+def get_freshness_file(project_dir: Path) -> Path:
+    return project_dir / ".auto-claude" / FRESHNESS_FILE
+
+
+def _mtime_ns(path: Path) -> int | None:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def discover_manifests(
+    project_dir: Path,
+    skip_dirs: Iterable[str] = DEFAULT_SKIP_DIRS,
+    max_depth: int = MAX_MANIFEST_DEPTH,
+) -> tuple[list[Path], list[Path]]:
+    """
+    Find manifest files in the project tree.
+
+    Args:
+        project_dir: Project root
+        skip_dirs: Directory names not descended into (hidden dirs are
+            always skipped)
+        max_depth: Maximum directory depth below the root to search
+
+    Returns:
+        (manifests, package_dirs) where package_dirs are the non-root
+        directories that directly contain a directory with a manifest
+    """
+    skip = set(skip_dirs)
+    manifests: list[Path] = []
+    package_dirs: set[Path] = set()
+
+    stack = [(project_dir, 0)]
+    while stack:
+        directory, depth = stack.pop()
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            continue
+
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if (
+                        depth < max_depth
+                        and not entry.name.startswith(".")
+                        and entry.name not in skip
+                    ):
+                        stack.append((Path(entry.path), depth + 1))
+                elif entry.name in MANIFEST_FILES:
+                    manifests.append(Path(entry.path))
+                    if depth >= 2:
+                        package_dirs.add(directory.parent)
+            except OSError:
+                continue
+
+    return sorted(manifests), sorted(package_dirs)
+
+
+def record_index_manifests(
+    project_dir: Path,
+    index_file: Path,
+    skip_dirs: Iterable[str] = DEFAULT_SKIP_DIRS,
+) -> dict:
+    """
+    Record the manifests and package directories an index was built from.
+
+    Writes project_index.freshness.json next to ``index_file``.
+
+    Returns:
+        The freshness record
+    """
+    project_dir = project_dir.resolve()
+    manifests, package_dirs = discover_manifests(project_dir, skip_dirs)
+
+    # Root manifests that do not exist yet still matter if they appear, and
+    # the root itself catches a new first-level package
+    tracked = set(manifests) | {project_dir / name for name in MANIFEST_FILES}
+    tracked |= set(package_dirs) | {project_dir}
+
+    record = {
+        "version": FRESHNESS_VERSION,
+        "index_mtime_ns": _mtime_ns(index_file),
+        "paths": {
+            path.relative_to(project_dir).as_posix(): _mtime_ns(path)
+            for path in sorted(tracked)
+        },
+    }
+
+    freshness_file = index_file.with_name(FRESHNESS_FILE)
+    try:
+        freshness_file.parent.mkdir(parents=True, exist_ok=True)
+        freshness_file.write_text(json.dumps(record, indent=2), encoding="utf-8")
+    except OSError as e:
+        logger.debug(f"Could not write {freshness_file}: {e}")
+    return record
+
+
+def load_freshness_record(project_dir: Path) -> dict | None:
+    """
+    Load the freshness record of the project's index.
+
+    Returns:
+        The record, or None if missing, unreadable, or not written for the
+        current project_index.json
+    """
+    try:
+        record = json.loads(get_freshness_file(project_dir).read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    if not isinstance(record, dict) or record.get("version") != FRESHNESS_VERSION:
+        return None
+
+    index_file = project_dir / ".auto-claude" / "project_index.json"
+    if record.get("index_mtime_ns") != _mtime_ns(index_file):
+        return None  # Index was rewritten by something else
+    return record
+
+
+def is_index_stale(project_dir: Path) -> bool | None:
+    """
+    Check the recorded manifests of the project index in one stat pass.
+
+    Returns:
+        True if any tracked path changed, appeared or disappeared, False if
+        none did, None if there is no usable freshness record
+    """
+    if is_marked_stale(project_dir):
+        return True
+
+    record = load_freshness_record(project_dir)
+    if record is None:
+        return None
+
+    for rel_path, recorded in record.get("paths", {}).items():
+        if _mtime_ns(project_dir / rel_path) != recorded:
+            return True
+    return False
+
+
+# =============================================================================
+# INOTIFY WATCHER
+# =============================================================================
+
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_WATCH_MASK = (
+    _IN_CLOSE_WRITE
+    | _IN_MODIFY
+    | _IN_ATTRIB
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+    | _IN_DELETE_SELF
+)
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+def _load_libc():
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1  # noqa: B018 - raises AttributeError if unsupported
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+class ProjectIndexWatcher:
+    """
+    Watches a project's index and recorded manifests with inotify.
+
+    ``on_change`` runs on the watcher thread whenever project_index.json is
+    rewritten or a tracked manifest or package directory changes; the
+    latter also marks the index stale until it is regenerated.
+    """
+
+    def __init__(self, project_dir: Path, on_change: Callable[[], None]):
+        self.project_dir = project_dir.resolve()
+        self.on_change = on_change
+        self.stale = False
+        # Whether a freshness record is watched, not just the index file
+        self.tracking = False
+        self._libc = None
+        self._fd = -1
+        self._stop_r = self._stop_w = -1
+        self._thread: threading.Thread | None = None
+        self._watches: dict[int, tuple[Path, set[str] | None]] = {}
+        self._lock = threading.Lock()
+
+    def start(self) -> bool:
+        """Start watching. Returns False if inotify is unavailable."""
+        self._libc = _load_libc()
+        if self._libc is None:
+            return False
+        fd = self._libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if fd < 0:
+            return False
+        self._fd = fd
+        self._stop_r, self._stop_w = os.pipe()
+        self._rewatch()
+
+        self._thread = threading.Thread(
+            target=self._run, name="project-index-watcher", daemon=True
+        )
+        self._thread.start()
+        return True
+
+    def stop(self) -> None:
+        if self._fd < 0:
+            return
+        os.write(self._stop_w, b"x")
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+        for fd in (self._fd, self._stop_r, self._stop_w):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self._fd = -1
+
+    def _add_watch(self, directory: Path, names: set[str] | None) -> None:
+        wd = self._libc.inotify_add_watch(
+            self._fd, os.fsencode(str(directory)), _WATCH_MASK
+        )
+        if wd < 0:
+            return
+        _, existing = self._watches.get(wd, (directory, set()))
+        if names is None or existing is None:
+            merged = None
+        else:
+            merged = existing | names
+        self._watches[wd] = (directory, merged)
+
+    def _rewatch(self) -> None:
+        """Watch the directories of everything the freshness record tracks."""
+        with self._lock:
+            for wd in list(self._watches):
+                self._libc.inotify_rm_watch(self._fd, wd)
+            self._watches.clear()
+
+            self._add_watch(
+                self.project_dir / ".auto-claude",
+                {"project_index.json", FRESHNESS_FILE},
+            )
+            record = load_freshness_record(self.project_dir)
+            self.tracking = record is not None
+            record = record or {}
+            names_by_dir: dict[Path, set[str] | None] = {}
+            for rel_path in record.get("paths", {}):
+                path = self.project_dir / rel_path
+                if path.is_dir():
+                    # Package directory: any entry added or removed matters
+                    names_by_dir[path] = None
+                elif names_by_dir.get(path.parent, set()) is not None:
+                    names_by_dir.setdefault(path.parent, set()).add(path.name)
+            for directory, names in names_by_dir.items():
+                self._add_watch(directory, names)
+
+    def _run(self) -> None:
+        while True:
+            try:
+                ready, _, _ = select.select([self._fd, self._stop_r], [], [])
+            except (OSError, ValueError):
+                return
+            if self._stop_r in ready:
+                return
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                continue
+            except OSError:
+                return
+            self._handle_events(data)
+
+    def _handle_events(self, data: bytes) -> None:
+        index_rewritten = manifest_changed = False
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+            name_bytes = data[
+                offset + _EVENT_HEADER.size : offset + _EVENT_HEADER.size + length
+            ]
+            offset += _EVENT_HEADER.size + length
+            name = os.fsdecode(name_bytes.rstrip(b"\0"))
+
+            with self._lock:
+                directory, names = self._watches.get(wd, (None, set()))
+            if directory is None:
+                continue
+            if directory.name == ".auto-claude" and directory.parent == (
+                self.project_dir
+            ):
+                if name in ("project_index.json", FRESHNESS_FILE):
+                    index_rewritten = True
+            elif names is None:
+                if name in MANIFEST_FILES or (
+                    mask & _IN_ISDIR
+                    and not name.startswith(".")
+                    and name not in DEFAULT_SKIP_DIRS
+                ):
+                    manifest_changed = True
+            elif name in names or mask & _IN_DELETE_SELF:
+                manifest_changed = True
+
+        if index_rewritten:
+            self.stale = False
+            self._rewatch()
+        if manifest_changed:
+            self.stale = True
+        if index_rewritten or manifest_changed:
+            try:
+                self.on_change()
+            except Exception as e:
+                logger.debug(f"Project index watcher callback failed: {e}")
+
+
+_WATCHERS: dict[str, ProjectIndexWatcher] = {}
+_WATCHERS_LOCK = threading.Lock()
+
+
+def watch_project_index(
+    project_dir: Path, on_change: Callable[[], None]
+) -> ProjectIndexWatcher | None:
+    """
+    Start (once per project) an inotify watcher for the project's index.
+
+    Returns:
+        The watcher, or None if inotify is unavailable
+    """
+    key = str(project_dir.resolve())
+    with _WATCHERS_LOCK:
+        watcher = _WATCHERS.get(key)
+        if watcher is not None:
+            return watcher
+        watcher = ProjectIndexWatcher(project_dir, on_change)
+        if not watcher.start():
+            return None
+        _WATCHERS[key] = watcher
+        return watcher
+
+
+def is_marked_stale(project_dir: Path) -> bool:
+    """True if a watcher saw a tracked manifest change since the last index."""
+    watcher = _WATCHERS.get(str(project_dir.resolve()))
+    return watcher is not None and watcher.stale
+
+
+def stop_index_watchers() -> None:
+    """Stop all project index watchers."""
+    with _WATCHERS_LOCK:
+        watchers = list(_WATCHERS.values())
+        _WATCHERS.clear()
+    for watcher in watchers:
+        watcher.stop()
@@ -13,6 +13,8 @@ saving context window and keeping agents focused.
 import json
 from pathlib import Path
 
+from .index_freshness import is_index_stale
+
 
 def load_project_index(project_dir: Path) -> dict:
     """
@@ -170,6 +172,9 @@ def should_refresh_project_index(project_dir: Path) -> bool:
 
     Uses smart caching: only refresh if dependency files (package.json,
     pyproject.toml, etc.) have been modified since the last index generation.
+    Indexes written by analyze_project() carry a freshness record of every
+    manifest found in the service tree, checked in a single stat pass; older
+    indexes fall back to checking the root and first-level subdirectories.
 
     Args:
         project_dir: Root directory of the project
@@ -182,6 +187,10 @@ def should_refresh_project_index(project_dir: Path) -> bool:
     if not index_file.exists():
         return True  # No index, must generate
 
+    stale = is_index_stale(project_dir)
+    if stale is not None:
+        return stale
+
     try:
         index_mtime = index_file.stat().st_mtime
     except OSError:
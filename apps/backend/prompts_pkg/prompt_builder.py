@@ -0,0 +1,195 @@
+"""
+Prompt Builder
+==============
+
+Assembles prompts as a cacheable prefix followed by a volatile suffix.
+
+Model providers cache prompts by prefix: a request only reuses the cache up
+to the first byte that differs from an earlier request. Prompts that put
+the subtask, recovery hints or memory context before the large, unchanging
+instructions therefore never hit the cache. PromptBuilder keeps the two
+apart:
+- stable blocks (prompt .md files, spec paths, project capabilities) form
+  the prefix and must be byte-identical across sessions of a spec
+- volatile blocks (subtask, retry hints, memory, session info) follow
+
+Each session's prefix hash is appended to ``memory/prompt_prefixes.jsonl``
+in the spec directory, and get_prompt_cache_report() estimates from that
+log how much of each phase's prompts could be served from the cache.
+"""
+
+import hashlib
+import json
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+PROMPT_PREFIX_LOG = "prompt_prefixes.jsonl"
+
+# Provider prompt caches expire after ~5 minutes without a hit
+CACHE_TTL_SECONDS = 300
+
+# Rough estimate: 4 chars per token
+CHARS_PER_TOKEN = 4
+
+
+@dataclass
+class PromptBlock:
+    """A named piece of a prompt."""
+
+    name: str
+    content: str
+    cacheable: bool
+
+
+@dataclass
+class PromptBuilder:
+    """
+    Collects prompt blocks and renders stable blocks before volatile ones.
+
+    Example:
+        builder = PromptBuilder("coding")
+        builder.add_stable("instructions", instructions)
+        builder.add_volatile("subtask", subtask_section)
+        prompt = builder.build()
+    """
+
+    phase: str
+    blocks: list[PromptBlock] = field(default_factory=list)
+
+    def add_stable(self, name: str, content: str) -> "PromptBuilder":
+        """Add a block that is identical across sessions of a spec."""
+        if content:
+            self.blocks.append(PromptBlock(name, content, cacheable=True))
+        return self
+
+    def add_volatile(self, name: str, content: str) -> "PromptBuilder":
+        """Add a block that changes between sessions."""
+        if content:
+            self.blocks.append(PromptBlock(name, content, cacheable=False))
+        return self
+
+    @property
+    def prefix(self) -> str:
+        return "".join(b.content for b in self.blocks if b.cacheable)
+
+    @property
+    def suffix(self) -> str:
+        return "".join(b.content for b in self.blocks if not b.cacheable)
+
+    def build(self) -> str:
+        """Render the prompt: all stable blocks, then all volatile blocks."""
+        return self.prefix + self.suffix
+
+    def prefix_hash(self) -> str:
+        return hashlib.sha256(self.prefix.encode("utf-8")).hexdigest()[:16]
+
+    def record(self, spec_dir: Path, session: int | None = None) -> None:
+        """
+        Append this prompt's prefix hash and sizes to the spec's prefix log.
+
+        Args:
+            spec_dir: Spec directory (log lives in memory/)
+            session: Optional session number for reference
+        """
+        entry = {
+            "phase": self.phase,
+            "session": session,
+            "timestamp": time.time(),
+            "prefix_hash": self.prefix_hash(),
+            "prefix_tokens": len(self.prefix) // CHARS_PER_TOKEN,
+            "total_tokens": len(self.build()) // CHARS_PER_TOKEN,
+            "stable_blocks": [b.name for b in self.blocks if b.cacheable],
+        }
+        log_file = spec_dir / "memory" / PROMPT_PREFIX_LOG
+        try:
+            log_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(log_file, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry) + "\n")
+        except OSError:
+            pass
+
+
+def load_prefix_log(spec_dir: Path) -> list[dict]:
+    """Load all recorded prompt prefixes for a spec (oldest first)."""
+    log_file = spec_dir / "memory" / PROMPT_PREFIX_LOG
+    if not log_file.exists():
+        return []
+    entries = []
+    try:
+        with open(log_file, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+    except OSError:
+        return []
+    return entries
+
+
+def get_prompt_cache_report(spec_dir: Path) -> dict[str, dict]:
+    """
+    Estimate the prompt cache-hit ratio per phase from the prefix log.
+
+    A session counts as a cache hit if the same prefix was sent within the
+    cache TTL before it; its prefix tokens are then considered cached.
+
+    Args:
+        spec_dir: Spec directory
+
+    Returns:
+        Dict mapping phase to sessions, cache_hits, distinct_prefixes,
+        cached_tokens, total_tokens and estimated_hit_ratio
+    """
+    report: dict[str, dict] = {}
+    last_seen: dict[str, float] = {}
+
+    for entry in load_prefix_log(spec_dir):
+        phase = entry.get("phase", "unknown")
+        stats = report.setdefault(
+            phase,
+            {
+                "sessions": 0,
+                "cache_hits": 0,
+                "distinct_prefixes": set(),
+                "cached_tokens": 0,
+                "total_tokens": 0,
+            },
+        )
+        prefix_hash = entry.get("prefix_hash", "")
+        timestamp = entry.get("timestamp", 0.0)
+
+        stats["sessions"] += 1
+        stats["total_tokens"] += entry.get("total_tokens", 0)
+        stats["distinct_prefixes"].add(prefix_hash)
+
+        previous = last_seen.get(prefix_hash)
+        if previous is not None and timestamp - previous <= CACHE_TTL_SECONDS:
+            stats["cache_hits"] += 1
+            stats["cached_tokens"] += entry.get("prefix_tokens", 0)
+        last_seen[prefix_hash] = timestamp
+
+    for stats in report.values():
+        stats["distinct_prefixes"] = len(stats["distinct_prefixes"])
+        total = stats["total_tokens"]
+        stats["estimated_hit_ratio"] = (
+            round(stats["cached_tokens"] / total, 3) if total else 0.0
+        )
+    return report
+
+
+def format_prompt_cache_report(report: dict[str, dict]) -> str:
+    """Render get_prompt_cache_report() output as a text table."""
+    if not report:
+        return "No prompts recorded for this spec yet."
+
+    lines = [
+        f"{'Phase':<14}{'Sessions':>10}{'Hits':>8}{'Prefixes':>10}{'Hit ratio':>12}",
+    ]
+    for phase, stats in sorted(report.items()):
+        lines.append(
+            f"{phase:<14}{stats['sessions']:>10}{stats['cache_hits']:>8}"
+            f"{stats['distinct_prefixes']:>10}{stats['estimated_hit_ratio']:>12.1%}"
+        )
+    return "\n".join(lines)
@@ -15,6 +15,44 @@ This approach:
 import json
 from pathlib import Path
 
+from .context_packer import get_context_token_budget, pack_context
+from .prompt_builder import PromptBuilder
+
+# Subtask instructions shared by every subtask. Kept free of subtask details so
+# it stays in the cacheable prompt prefix; the commit command follows later.
+SUBTASK_INSTRUCTIONS = """# Subtask Implementation Task
+
+You are implementing ONE subtask of the implementation plan. The subtask, its
+files and how to verify it are described at the end of this prompt.
+
+## Instructions
+
+1. **Read the pattern files** to understand code style and conventions
+2. **Read the files to modify** (if any) to understand current implementation
+3. **Implement the subtask** following the patterns exactly
+4. **Run verification** and fix any issues
+5. **Commit your changes** with the commit command given for the subtask
+6. **Update the plan** - set this subtask's status to "completed" in implementation_plan.json
+
+## Quality Checklist
+
+Before marking complete, verify:
+- [ ] Follows patterns from reference files
+- [ ] No console.log/print debugging statements
+- [ ] Error handling in place
+- [ ] Verification passes
+- [ ] Clean commit with descriptive message
+
+## Important
+
+- Focus ONLY on this subtask - don't modify unrelated code
+- If verification fails, FIX IT before committing
+- If you encounter a blocker, document it in build-progress.txt
+
+---
+
+"""
+
 
 def get_relative_spec_path(spec_dir: Path, project_dir: Path) -> str:
     """
@@ -95,6 +133,38 @@ def generate_subtask_prompt(
     Returns:
         A focused prompt string (~100 lines instead of 900)
     """
+    return build_subtask_prompt_blocks(
+        spec_dir, project_dir, subtask, phase, attempt_count, recovery_hints
+    ).build()
+
+
+def build_subtask_prompt_blocks(
+    spec_dir: Path,
+    project_dir: Path,
+    subtask: dict,
+    phase: dict,
+    attempt_count: int = 0,
+    recovery_hints: list[str] | None = None,
+) -> PromptBuilder:
+    """
+    Assemble the subtask prompt as cacheable and volatile blocks.
+
+    The environment context and the generic instructions are identical for
+    every subtask of a spec and form the cacheable prefix. Everything about
+    the specific subtask follows as the volatile suffix.
+
+    Args:
+        Same as generate_subtask_prompt
+
+    Returns:
+        PromptBuilder for the "coding" phase
+    """
+    builder = PromptBuilder("coding")
+    builder.add_stable(
+        "environment", generate_environment_context(project_dir, spec_dir)
+    )
+    builder.add_stable("instructions", SUBTASK_INSTRUCTIONS)
+
     subtask_id = subtask.get("id", "unknown")
     description = subtask.get("description", "No description")
     service = subtask.get("service", "all")
@@ -103,17 +173,10 @@ def generate_subtask_prompt(
     patterns_from = subtask.get("patterns_from", [])
     verification = subtask.get("verification", {})
 
-    # Get relative spec path
-    relative_spec = get_relative_spec_path(spec_dir, project_dir)
-
-    # Build the prompt
     sections = []
 
-    # Environment context first
-    sections.append(generate_environment_context(project_dir, spec_dir))
-
     # Header
-    sections.append(f"""# Subtask Implementation Task
+    sections.append(f"""## Your Subtask
 
 **Subtask ID:** `{subtask_id}`
 **Phase:** {phase.get("name", phase.get("id", "Unknown"))}
@@ -200,40 +263,20 @@ Verify:""")
         instructions = verification.get("instructions", "Manual verification required")
         sections.append(f"**Manual Verification:**\n{instructions}\n")
 
-    # Instructions
-    sections.append(f"""## Instructions
+    # Commit command
+    sections.append(f"""## Commit
 
-1. **Read the pattern files** to understand code style and conventions
-2. **Read the files to modify** (if any) to understand current implementation
-3. **Implement the subtask** following the patterns exactly
-4. **Run verification** and fix any issues
-5. **Commit your changes:**
-   ```bash
-   git add .
-   git commit -m "auto-claude: {subtask_id} - {description[:50]}"
-   ```
-6. **Update the plan** - set this subtask's status to "completed" in implementation_plan.json
-
-## Quality Checklist
-
-Before marking complete, verify:
-- [ ] Follows patterns from reference files
-- [ ] No console.log/print debugging statements
-- [ ] Error handling in place
-- [ ] Verification passes
-- [ ] Clean commit with descriptive message
-
-## Important
-
-- Focus ONLY on this subtask - don't modify unrelated code
-- If verification fails, FIX IT before committing
-- If you encounter a blocker, document it in build-progress.txt
+```bash
+git add .
+git commit -m "auto-claude: {subtask_id} - {description[:50]}"
+```
 """)
 
     # Note: Linear updates are now handled by Python orchestrator via linear_updater.py
     # Agents no longer need to call Linear MCP tools directly
 
-    return "\n".join(sections)
+    builder.add_volatile("subtask", "\n".join(sections))
+    return builder
 
 
 def generate_planner_prompt(spec_dir: Path, project_dir: Path | None = None) -> str:
@@ -297,15 +340,23 @@ def load_subtask_context(
     project_dir: Path,
     subtask: dict,
     max_file_lines: int = 200,
+    token_budget: int | None = None,
 ) -> dict:
     """
     Load minimal context needed for a subtask.
 
+    File context is packed into a token budget: the definitions most
+    relevant to the subtask are included in full and the rest as an outline
+    (see context_packer). A budget of 0 or less falls back to including the
+    first ``max_file_lines`` lines of every file.
+
     Args:
         spec_dir: Spec directory
         project_dir: Project root
         subtask: The subtask being implemented
-        max_file_lines: Maximum lines to include per file
+        max_file_lines: Maximum lines to include per file (unpacked mode)
+        token_budget: Approximate token budget for file content
+            (default: AUTO_CLAUDE_CONTEXT_TOKEN_BUDGET or 8000)
 
     Returns:
         Dict with file contents and relevant context
@@ -316,6 +367,29 @@ def load_subtask_context(
         "spec_excerpt": None,
     }
 
+    if token_budget is None:
+        token_budget = get_context_token_budget()
+
+    if token_budget > 0:
+        query = " ".join(
+            str(part)
+            for part in (
+                subtask.get("description", ""),
+                subtask.get("id", ""),
+                *subtask.get("files_to_create", []),
+            )
+        )
+        packed = pack_context(
+            project_dir,
+            files_to_modify=subtask.get("files_to_modify", []),
+            patterns_from=subtask.get("patterns_from", []),
+            query=query,
+            token_budget=token_budget,
+        )
+        context["patterns"] = packed["patterns"]
+        context["files_to_modify"] = packed["files_to_modify"]
+        return context
+
     # Load pattern files (truncated)
     for pattern_path in subtask.get("patterns_from", []):
         full_path = project_dir / pattern_path
@@ -15,6 +15,7 @@ from .project_context import (
     get_mcp_tools_for_project,
     load_project_index,
 )
+from .prompt_builder import PromptBuilder
 
 # Directory containing prompt files
 # prompts/ is a sibling directory of prompts_pkg/, so go up one level first
@@ -75,6 +76,22 @@ def get_coding_prompt(spec_dir: Path) -> str:
     Returns:
         The coding agent prompt content with spec path
     """
+    return build_coding_prompt_blocks(spec_dir).build()
+
+
+def build_coding_prompt_blocks(spec_dir: Path) -> PromptBuilder:
+    """
+    Assemble the coding agent prompt as cacheable and volatile blocks.
+
+    The spec paths and coder.md form the cacheable prefix; recovery context
+    and human input change between sessions and come after it.
+
+    Args:
+        spec_dir: Directory containing the spec.md and implementation_plan.json
+
+    Returns:
+        PromptBuilder for the "coding" phase
+    """
     prompt_file = PROMPTS_DIR / "coder.md"
 
     if not prompt_file.exists():
@@ -98,30 +115,37 @@ The project root is the parent of auto-claude/. All code goes in the project roo
 ---
 
 """
+    builder = PromptBuilder("coding")
+    builder.add_stable("spec_location", spec_context)
+    builder.add_stable("coder", prompt)
 
     # Check for recovery context (stuck subtasks, retry hints)
     recovery_context = _get_recovery_context(spec_dir)
     if recovery_context:
-        spec_context += recovery_context
+        builder.add_volatile("recovery", "\n\n---\n\n" + recovery_context)
 
     # Check for human input file
     human_input_file = spec_dir / "HUMAN_INPUT.md"
     if human_input_file.exists():
         human_input = human_input_file.read_text().strip()
         if human_input:
-            spec_context += f"""## HUMAN INPUT (READ THIS FIRST!)
+            builder.add_volatile(
+                "human_input",
+                f"""
+
+---
+
+## HUMAN INPUT (READ THIS FIRST!)
 
 The human has left you instructions. READ AND FOLLOW THESE CAREFULLY:
 
 {human_input}
 
 After addressing this input, you may delete or clear the HUMAN_INPUT.md file.
+""",
+            )
 
----
-
-"""
-
-    return spec_context + prompt
+    return builder
 
 
 def _get_recovery_context(spec_dir: Path) -> str:
@@ -315,6 +339,24 @@ def get_qa_reviewer_prompt(spec_dir: Path, project_dir: Path) -> str:
     Returns:
         The QA reviewer prompt with project-specific tools injected
     """
+    return build_qa_reviewer_prompt_blocks(spec_dir, project_dir).build()
+
+
+def build_qa_reviewer_prompt_blocks(spec_dir: Path, project_dir: Path) -> PromptBuilder:
+    """
+    Assemble the QA reviewer prompt as a cacheable prefix.
+
+    Everything here depends only on the spec and the project capabilities,
+    so it is byte-identical across QA sessions. Callers append session
+    details (memory, iteration, previous errors) as volatile blocks.
+
+    Args:
+        spec_dir: Directory containing the spec files
+        project_dir: Root directory of the project
+
+    Returns:
+        PromptBuilder for the "qa_review" phase
+    """
     # Load base QA reviewer prompt
     base_prompt = _load_prompt_file("qa_reviewer.md")
 
@@ -392,7 +434,10 @@ The project root is: `{project_dir}`
         base_prompt += "\n\n---\n\n## PROJECT-SPECIFIC VALIDATION TOOLS\n\n"
         base_prompt += "\n\n---\n\n".join(mcp_sections)
 
-    return spec_context + base_prompt
+    builder = PromptBuilder("qa_review")
+    builder.add_stable("spec_location", spec_context)
+    builder.add_stable("qa_reviewer", base_prompt)
+    return builder
 
 
 def get_qa_fixer_prompt(spec_dir: Path, project_dir: Path) -> str:
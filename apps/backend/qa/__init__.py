@@ -17,6 +17,7 @@ Module structure:
     - reviewer.py: QA reviewer agent session
     - fixer.py: QA fixer agent session
     - report.py: Issue tracking, reporting, escalation
+    - issue_index.py: Fingerprint index for recurring issue lookup
     - criteria.py: Acceptance criteria and status management
 """
 
@@ -34,13 +35,6 @@ from .criteria import (
     should_run_fixes,
     should_run_qa,
 )
-from .fixer import (
-    load_qa_fixer_prompt,
-    run_qa_fixer_session,
-)
-
-# Main loop
-from .loop import MAX_QA_ITERATIONS, run_qa_validation_loop
 
 # Report & tracking
 from .report import (
@@ -52,6 +46,7 @@ from .report import (
     check_test_discovery,
     create_manual_test_plan,
     escalate_to_human,
+    get_issue_index,
     get_iteration_history,
     get_recurring_issue_summary,
     has_recurring_issues,
@@ -59,9 +54,6 @@ from .report import (
     record_iteration,
 )
 
-# Agent sessions
-from .reviewer import run_qa_agent_session
-
 # Public API
 __all__ = [
     # Configuration
@@ -85,6 +77,7 @@ __all__ = [
     "get_iteration_history",
     "record_iteration",
     "has_recurring_issues",
+    "get_issue_index",
     "get_recurring_issue_summary",
     "escalate_to_human",
     "create_manual_test_plan",
@@ -97,3 +90,20 @@ __all__ = [
     "load_qa_fixer_prompt",
     "run_qa_fixer_session",
 ]
+
+
+def __getattr__(name):
+    """Lazy imports for the agent sessions, which load the agent SDK."""
+    if name in ("load_qa_fixer_prompt", "run_qa_fixer_session"):
+        from . import fixer
+
+        return getattr(fixer, name)
+    elif name in ("MAX_QA_ITERATIONS", "run_qa_validation_loop"):
+        from . import loop
+
+        return getattr(loop, name)
+    elif name == "run_qa_agent_session":
+        from .reviewer import run_qa_agent_session
+
+        return run_qa_agent_session
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
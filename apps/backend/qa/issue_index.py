@@ -0,0 +1,178 @@
+"""
+Issue Fingerprint Index
+=======================
+
+MinHash/LSH index over normalized QA issue keys.
+
+Recurring-issue detection used to compare every current issue against
+every historical issue with SequenceMatcher. The index keeps one entry per
+distinct key (with an occurrence count) and buckets entries by LSH band,
+so a lookup only runs the exact comparison against keys that share a band
+with the query.
+
+Keys are fingerprinted with MinHash over character 3-grams. With 32 bands
+of 2 rows, keys whose 3-gram Jaccard similarity is 0.4 collide in at least
+one band with probability > 0.99; keys the exact comparison would treat as
+the same issue sit well above that.
+
+Keys have the form ``title|file|line``. The exact comparison also matches
+reworded titles at the same location, which need not share a band, so keys
+with the same location are always candidates too. Keys without a file or
+line have no location and are only matched through their bands.
+
+The index is stored in ``qa_issue_index.json`` in the spec directory.
+"""
+
+import hashlib
+import random
+from collections.abc import Iterable
+from typing import Any
+
+INDEX_VERSION = 1
+NUM_PERMUTATIONS = 64
+BAND_ROWS = 2
+SHINGLE_SIZE = 3
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_rng = random.Random(0x1551E)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(NUM_PERMUTATIONS)
+]
+
+
+def _shingles(key: str) -> set[str]:
+    if len(key) <= SHINGLE_SIZE:
+        return {key}
+    return {key[i : i + SHINGLE_SIZE] for i in range(len(key) - SHINGLE_SIZE + 1)}
+
+
+def _hash64(value: str) -> int:
+    return int.from_bytes(
+        hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "big"
+    )
+
+
+def _location(key: str) -> str:
+    """The ``file|line`` part of a ``title|file|line`` key ("" if both empty)."""
+    location = key.partition("|")[2]
+    return location if location.strip("|") else ""
+
+
+def minhash_signature(key: str) -> list[int]:
+    """MinHash signature of a key's character shingles."""
+    hashes = [_hash64(s) for s in _shingles(key)]
+    return [
+        min((a * h + b) % _MERSENNE_PRIME for h in hashes) for a, b in _PERMUTATIONS
+    ]
+
+
+def band_hashes(key: str) -> list[str]:
+    """LSH band digests for a key (one per band, in band order)."""
+    signature = minhash_signature(key)
+    return [
+        hashlib.blake2b(
+            repr(signature[start : start + BAND_ROWS]).encode(), digest_size=4
+        ).hexdigest()
+        for start in range(0, NUM_PERMUTATIONS, BAND_ROWS)
+    ]
+
+
+class IssueIndex:
+    """
+    LSH index of normalized issue keys with occurrence counts.
+
+    Usage:
+        index = IssueIndex.from_keys(keys)
+        for key, count in index.candidates(query_key):
+            ...  # verify with the exact similarity
+    """
+
+    def __init__(self):
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._buckets: dict[tuple[int, str], list[str]] = {}
+        self._locations: dict[str, list[str]] = {}
+
+    @classmethod
+    def from_keys(cls, keys: Iterable[str]) -> "IssueIndex":
+        index = cls()
+        for key in keys:
+            index.add(key)
+        return index
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any] | None) -> "IssueIndex | None":
+        """Load a stored index; None if missing or built with other parameters."""
+        if not isinstance(data, dict):
+            return None
+        if (
+            data.get("version") != INDEX_VERSION
+            or data.get("num_permutations") != NUM_PERMUTATIONS
+            or data.get("band_rows") != BAND_ROWS
+        ):
+            return None
+
+        index = cls()
+        for key, entry in data.get("entries", {}).items():
+            bands = entry.get("bands")
+            if not isinstance(bands, list) or len(bands) * BAND_ROWS != (
+                NUM_PERMUTATIONS
+            ):
+                return None
+            index._insert(key, int(entry.get("count", 1)), bands)
+        return index
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "version": INDEX_VERSION,
+            "num_permutations": NUM_PERMUTATIONS,
+            "band_rows": BAND_ROWS,
+            "entries": self._entries,
+        }
+
+    @property
+    def total(self) -> int:
+        """Number of issues indexed (sum of occurrence counts)."""
+        return sum(entry["count"] for entry in self._entries.values())
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, key: str, count: int = 1) -> None:
+        """Record occurrences of a key."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry["count"] += count
+            return
+        self._insert(key, count, band_hashes(key))
+
+    def _insert(self, key: str, count: int, bands: list[str]) -> None:
+        self._entries[key] = {"count": count, "bands": bands}
+        for band, digest in enumerate(bands):
+            self._buckets.setdefault((band, digest), []).append(key)
+        location = _location(key)
+        if location:
+            self._locations.setdefault(location, []).append(key)
+
+    def candidates(self, key: str) -> list[tuple[str, int]]:
+        """Indexed keys sharing an LSH band or the location with ``key``."""
+        if key in self._entries:
+            bands = self._entries[key]["bands"]
+        else:
+            bands = band_hashes(key)
+
+        buckets = [
+            self._buckets.get((band, digest), ()) for band, digest in enumerate(bands)
+        ]
+        location = _location(key)
+        if location:
+            buckets.append(self._locations.get(location, ()))
+
+        seen: set[str] = set()
+        result = []
+        for bucket in buckets:
+            for other in bucket:
+                if other not in seen:
+                    seen.add(other)
+                    result.append((other, self._entries[other]["count"]))
+        return result
@@ -14,10 +14,14 @@ from pathlib import Path
 from typing import Any
 
 from .criteria import load_implementation_plan, save_implementation_plan
+from .issue_index import IssueIndex
 
 # Configuration
 RECURRING_ISSUE_THRESHOLD = 3  # Escalate if same issue appears this many times
 ISSUE_SIMILARITY_THRESHOLD = 0.8  # Consider issues "same" if similarity >= this
+# Distinct historical issues below which a direct comparison beats the index
+MIN_INDEXED_ISSUES = 200
+ISSUE_INDEX_FILE = "qa_issue_index.json"
 
 
 # =============================================================================
@@ -74,6 +78,14 @@ def record_iteration(
     if duration_seconds is not None:
         record["duration_seconds"] = round(duration_seconds, 2)
 
+    # Keep the issue fingerprint index in step with the history
+    index = _load_issue_index(spec_dir, plan["qa_iteration_history"])
+    for issue in issues:
+        index.add(_normalize_issue_key(issue))
+    _save_issue_index(spec_dir, index)
+    # Older versions stored the index in the plan itself
+    plan.pop("qa_issue_index", None)
+
     plan["qa_iteration_history"].append(record)
 
     # Update summary stats
@@ -127,34 +139,109 @@ def _issue_similarity(issue1: dict[str, Any], issue2: dict[str, Any]) -> float:
     Returns:
         Similarity score between 0.0 and 1.0
     """
-    key1 = _normalize_issue_key(issue1)
-    key2 = _normalize_issue_key(issue2)
+    return _key_similarity(_normalize_issue_key(issue1), _normalize_issue_key(issue2))
+
+
+def _key_similarity(key1: str, key2: str) -> float:
+    """
+    Similarity of two normalized issue keys.
 
-    return SequenceMatcher(None, key1, key2).ratio()
+    Character similarity of the whole key, or - for issues at the same
+    file and line - overlap of the title words, so reworded titles of the
+    same issue still match.
+    """
+    ratio = SequenceMatcher(None, key1, key2).ratio()
+    if ratio >= ISSUE_SIMILARITY_THRESHOLD:
+        return ratio
+
+    title1, _, location1 = key1.partition("|")
+    title2, _, location2 = key2.partition("|")
+    if location1 != location2:
+        return ratio
+    words1 = set(title1.split())
+    words2 = set(title2.split())
+    if not words1 or not words2:
+        return ratio
+    return max(ratio, len(words1 & words2) / len(words1 | words2))
+
+
+def _history_keys(history: list[dict[str, Any]]) -> list[str]:
+    return [
+        _normalize_issue_key(issue)
+        for record in history
+        for issue in record.get("issues", [])
+    ]
+
+
+def _load_issue_index(spec_dir: Path, history: list[dict[str, Any]]) -> IssueIndex:
+    """Stored issue index of a spec, rebuilt if missing or out of date."""
+    data = None
+    index_file = spec_dir / ISSUE_INDEX_FILE
+    if index_file.exists():
+        try:
+            with open(index_file) as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            data = None
+
+    index = IssueIndex.from_dict(data)
+    issue_count = sum(len(record.get("issues", [])) for record in history)
+    if index is None or index.total != issue_count:
+        index = IssueIndex.from_keys(_history_keys(history))
+    return index
+
+
+def _save_issue_index(spec_dir: Path, index: IssueIndex) -> None:
+    try:
+        with open(spec_dir / ISSUE_INDEX_FILE, "w") as f:
+            json.dump(index.to_dict(), f)
+    except OSError:
+        pass
+
+
+def get_issue_index(spec_dir: Path) -> IssueIndex:
+    """
+    Get the fingerprint index of all historical issues for a spec.
+
+    Returns:
+        IssueIndex stored in qa_issue_index.json next to the plan (rebuilt
+        from qa_iteration_history if missing or stale).
+    """
+    return _load_issue_index(spec_dir, get_iteration_history(spec_dir))
 
 
 def has_recurring_issues(
     current_issues: list[dict[str, Any]],
     history: list[dict[str, Any]],
     threshold: int = RECURRING_ISSUE_THRESHOLD,
+    index: IssueIndex | None = None,
 ) -> tuple[bool, list[dict[str, Any]]]:
     """
     Check if any current issues have appeared repeatedly in history.
 
+    Historical issues are looked up through a fingerprint index, so only
+    likely matches are compared exactly. Without a prebuilt index, a short
+    history is compared directly instead of paying to build one.
+
     Args:
         current_issues: Issues from current iteration
         history: Previous iteration records
         threshold: Number of occurrences to consider "recurring"
+        index: Prebuilt index of the historical issues (see get_issue_index);
+            built from history if not given
 
     Returns:
         (has_recurring, recurring_issues) tuple
     """
-    # Flatten all historical issues
-    historical_issues = []
-    for record in history:
-        historical_issues.extend(record.get("issues", []))
-
-    if not historical_issues:
+    key_counts: Counter[str] = Counter()
+    if index is None:
+        key_counts.update(_history_keys(history))
+        if len(key_counts) >= MIN_INDEXED_ISSUES:
+            index = IssueIndex()
+            for key, count in key_counts.items():
+                index.add(key, count)
+
+    if not (index or key_counts):
         return False, []
 
     recurring = []
@@ -162,10 +249,11 @@ def has_recurring_issues(
     for current in current_issues:
         occurrence_count = 1  # Count current occurrence
 
-        for historical in historical_issues:
-            similarity = _issue_similarity(current, historical)
-            if similarity >= ISSUE_SIMILARITY_THRESHOLD:
-                occurrence_count += 1
+        key = _normalize_issue_key(current)
+        candidates = index.candidates(key) if index is not None else key_counts.items()
+        for historical_key, count in candidates:
+            if _key_similarity(key, historical_key) >= ISSUE_SIMILARITY_THRESHOLD:
+                occurrence_count += count
 
         if occurrence_count >= threshold:
             recurring.append(
@@ -202,10 +290,7 @@ def get_recurring_issue_summary(
         matched = False
 
         for existing_key in issue_groups:
-            if (
-                SequenceMatcher(None, key, existing_key).ratio()
-                >= ISSUE_SIMILARITY_THRESHOLD
-            ):
+            if _key_similarity(key, existing_key) >= ISSUE_SIMILARITY_THRESHOLD:
                 issue_groups[existing_key].append(issue)
                 matched = True
                 break
@@ -16,7 +16,7 @@ from pathlib import Path
 from agents.memory_manager import get_graphiti_context, save_session_memory
 from claude_agent_sdk import ClaudeSDKClient
 from debug import debug, debug_detailed, debug_error, debug_section, debug_success
-from prompts_pkg import get_qa_reviewer_prompt
+from prompts_pkg import build_qa_reviewer_prompt_blocks
 from security.tool_input_validator import get_safe_tool_input
 from task_logger import (
     LogEntryType,
@@ -80,11 +80,11 @@ async def run_qa_agent_session(
 
     # Load QA prompt with dynamically-injected project-specific MCP tools
     # This includes Electron validation for Electron apps, Puppeteer for web, etc.
-    prompt = get_qa_reviewer_prompt(spec_dir, project_dir)
+    builder = build_qa_reviewer_prompt_blocks(spec_dir, project_dir)
     debug_detailed(
         "qa_reviewer",
         "Loaded QA reviewer prompt with project-specific tools",
-        prompt_length=len(prompt),
+        prompt_length=len(builder.prefix),
         project_dir=str(project_dir),
     )
 
@@ -98,13 +98,16 @@ async def run_qa_agent_session(
         },
     )
     if qa_memory_context:
-        prompt += "\n\n" + qa_memory_context
+        builder.add_volatile("memory", "\n\n" + qa_memory_context)
         print("✓ Memory context loaded for QA reviewer")
         debug_success("qa_reviewer", "Graphiti memory context loaded for QA")
 
     # Add session context
-    prompt += f"\n\n---\n\n**QA Session**: {qa_session}\n"
-    prompt += f"**Max Iterations**: {max_iterations}\n"
+    builder.add_volatile(
+        "session",
+        f"\n\n---\n\n**QA Session**: {qa_session}\n"
+        f"**Max Iterations**: {max_iterations}\n",
+    )
 
     # Add error context for self-correction if previous iteration failed
     if previous_error:
@@ -114,7 +117,9 @@ async def run_qa_agent_session(
             error_type=previous_error.get("error_type"),
             consecutive_errors=previous_error.get("consecutive_errors"),
         )
-        prompt += f"""
+        builder.add_volatile(
+            "previous_error",
+            f"""
 
 ---
 
@@ -178,11 +183,16 @@ This is attempt {previous_error.get("consecutive_errors", 1) + 1}. If you fail t
 
 ---
 
-"""
+""",
+        )
         print(
             f"\n⚠️  Retry with self-correction context (attempt {previous_error.get('consecutive_errors', 1) + 1})"
         )
 
+    # Stable instructions first, session details last (prompt cache prefix)
+    prompt = builder.build()
+    builder.record(spec_dir, session=qa_session)
+
     try:
         debug("qa_reviewer", "Sending query to Claude SDK...")
         await client.query(prompt)
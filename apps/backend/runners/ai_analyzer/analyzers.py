@@ -8,6 +8,9 @@ from typing import Any
 class BaseAnalyzer:
     """Base class for all analyzers."""
 
+    # Bump when a subclass changes its prompt to invalidate cached results
+    PROMPT_VERSION = 1
+
     def __init__(self, project_index: dict[str, Any]):
         """
         Initialize analyzer.
@@ -1,7 +1,13 @@
 """
 Cache management for AI analysis results.
+
+Each analyzer's result is cached on its own, keyed by the analyzer's prompt
+version and a hash of its prompt. The prompt embeds exactly the parts of
+the project index the analyzer reads, so a change to one service or one
+analyzer only invalidates the analyzers whose prompts changed.
 """
 
+import hashlib
 import json
 import time
 from pathlib import Path
@@ -23,36 +29,81 @@ class CacheManager:
         self.cache_dir = cache_dir
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.cache_file = self.cache_dir / "ai_insights.json"
+        self.analyzer_cache_dir = self.cache_dir / "analyzers"
 
-    def get_cached_result(self, skip_cache: bool = False) -> dict[str, Any] | None:
+    @staticmethod
+    def make_key(prompt: str, prompt_version: int) -> str:
         """
-        Retrieve cached analysis result if valid.
+        Build the cache key for an analyzer run.
 
         Args:
+            prompt: Prompt the analyzer would send
+            prompt_version: Analyzer's PROMPT_VERSION
+
+        Returns:
+            Cache key string
+        """
+        digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:16]
+        return f"v{prompt_version}-{digest}"
+
+    def _analyzer_file(self, analyzer_name: str) -> Path:
+        return self.analyzer_cache_dir / f"{analyzer_name}.json"
+
+    def get_analyzer_result(
+        self, analyzer_name: str, key: str, skip_cache: bool = False
+    ) -> dict[str, Any] | None:
+        """
+        Retrieve a cached analyzer result if its key matches and it is fresh.
+
+        Args:
+            analyzer_name: Analyzer name
+            key: Cache key from make_key()
             skip_cache: If True, always return None (force re-analysis)
 
         Returns:
-            Cached analysis result or None if cache invalid/expired
+            Cached analyzer result or None if missing, stale or expired
         """
         if skip_cache:
             return None
 
-        if not self.cache_file.exists():
+        try:
+            entry = json.loads(self._analyzer_file(analyzer_name).read_text())
+        except (OSError, json.JSONDecodeError):
             return None
 
-        cache_age = time.time() - self.cache_file.stat().st_mtime
-        hours_old = cache_age / 3600
+        if not isinstance(entry, dict) or entry.get("key") != key:
+            return None
 
+        hours_old = (time.time() - entry.get("cached_at", 0)) / 3600
         if hours_old >= self.CACHE_VALIDITY_HOURS:
-            print(f"⚠️  Cache expired ({hours_old:.1f} hours old), re-analyzing...")
             return None
 
-        print(f"✓ Using cached AI insights ({hours_old:.1f} hours old)")
-        return json.loads(self.cache_file.read_text())
+        return entry.get("result")
+
+    def save_analyzer_result(
+        self, analyzer_name: str, key: str, result: dict[str, Any], duration: float
+    ) -> None:
+        """
+        Cache one analyzer's result.
+
+        Args:
+            analyzer_name: Analyzer name
+            key: Cache key from make_key()
+            result: Parsed analyzer result
+            duration: Seconds the analyzer took
+        """
+        self.analyzer_cache_dir.mkdir(parents=True, exist_ok=True)
+        entry = {
+            "key": key,
+            "cached_at": time.time(),
+            "duration_seconds": round(duration, 2),
+            "result": result,
+        }
+        self._analyzer_file(analyzer_name).write_text(json.dumps(entry, indent=2))
 
     def save_result(self, result: dict[str, Any]) -> None:
         """
-        Save analysis result to cache.
+        Save the combined analysis result.
 
         Args:
             result: Analysis result to cache
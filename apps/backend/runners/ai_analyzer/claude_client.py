@@ -3,6 +3,8 @@ Claude SDK client wrapper for AI analysis.
 """
 
 import json
+import os
+import tempfile
 from pathlib import Path
 from typing import Any
 
@@ -70,6 +72,9 @@ class ClaudeAnalysisClient:
         """
         Create temporary security settings file.
 
+        Each query gets its own file: analyzers run concurrently, and one
+        run removing a shared file could leave another's CLI without it.
+
         Returns:
             Path to settings file
         """
@@ -85,11 +90,15 @@ class ClaudeAnalysisClient:
             },
         }
 
-        settings_file = self.project_dir / ".claude_ai_analyzer_settings.json"
-        with open(settings_file, "w") as f:
+        fd, path = tempfile.mkstemp(
+            prefix=".claude_ai_analyzer_settings_",
+            suffix=".json",
+            dir=self.project_dir,
+        )
+        with os.fdopen(fd, "w") as f:
             json.dump(settings, f, indent=2)
 
-        return settings_file
+        return Path(path)
 
     def _create_client(self, settings_file: Path) -> Any:
         """
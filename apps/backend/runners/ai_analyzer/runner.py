@@ -1,12 +1,20 @@
 """
 Main orchestrator for AI-powered project analysis.
+
+Analyzers run concurrently, up to a configurable limit
+(AUTO_CLAUDE_AI_ANALYZER_CONCURRENCY, default 3) and the process-wide agent
+limit, and each analyzer's result is cached separately.
 """
 
+import asyncio
+import os
 import time
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from core.agent_limiter import agent_slot
+
 from .analyzers import AnalyzerFactory
 from .cache_manager import CacheManager
 from .claude_client import CLAUDE_SDK_AVAILABLE, ClaudeAnalysisClient
@@ -15,20 +23,39 @@ from .models import AnalyzerType
 from .result_parser import ResultParser
 from .summary_printer import SummaryPrinter
 
+CONCURRENCY_ENV = "AUTO_CLAUDE_AI_ANALYZER_CONCURRENCY"
+DEFAULT_CONCURRENCY = 3
+
+
+def get_analyzer_concurrency() -> int:
+    """Maximum number of analyzers run at once."""
+    try:
+        return max(1, int(os.environ.get(CONCURRENCY_ENV, DEFAULT_CONCURRENCY)))
+    except ValueError:
+        return DEFAULT_CONCURRENCY
+
 
 class AIAnalyzerRunner:
     """Orchestrates AI-powered project analysis."""
 
-    def __init__(self, project_dir: Path, project_index: dict[str, Any]):
+    def __init__(
+        self,
+        project_dir: Path,
+        project_index: dict[str, Any],
+        max_concurrency: int | None = None,
+    ):
         """
         Initialize AI analyzer.
 
         Args:
             project_dir: Root directory of project
             project_index: Output from programmatic analyzer (analyzer.py)
+            max_concurrency: Analyzers run at once (default from
+                AUTO_CLAUDE_AI_ANALYZER_CONCURRENCY)
         """
         self.project_dir = project_dir
         self.project_index = project_index
+        self.max_concurrency = max_concurrency or get_analyzer_concurrency()
         self.cache_manager = CacheManager(project_dir / ".auto-claude" / "ai_cache")
         self.cost_estimator = CostEstimator(project_dir, project_index)
         self.result_parser = ResultParser()
@@ -49,31 +76,37 @@ class AIAnalyzerRunner:
         """
         self._print_header()
 
-        # Check for cached analysis
-        cached_result = self.cache_manager.get_cached_result(skip_cache)
-        if cached_result:
-            return cached_result
-
-        if not CLAUDE_SDK_AVAILABLE:
-            print("✗ Claude Agent SDK not available. Cannot run AI analysis.")
-            return {"error": "Claude SDK not installed"}
-
-        # Estimate cost before running
-        cost_estimate = self.cost_estimator.estimate_cost()
-        self.summary_printer.print_cost_estimate(cost_estimate.__dict__)
-
         # Initialize results
-        insights = {
+        insights: dict[str, Any] = {
             "analysis_timestamp": datetime.now().isoformat(),
             "project_dir": str(self.project_dir),
-            "cost_estimate": cost_estimate.__dict__,
+            "analyzer_timings": {},
         }
 
         # Determine which analyzers to run
         analyzers_to_run = self._get_analyzers_to_run(selected_analyzers)
 
-        # Run each analyzer
-        await self._run_analyzers(analyzers_to_run, insights)
+        # Use cached results where the analyzer's inputs are unchanged
+        pending = self._load_cached_results(analyzers_to_run, insights, skip_cache)
+
+        if pending:
+            if not CLAUDE_SDK_AVAILABLE:
+                print("✗ Claude Agent SDK not available. Cannot run AI analysis.")
+                return {"error": "Claude SDK not installed"}
+
+            # Estimate cost before running
+            cost_estimate = self.cost_estimator.estimate_cost()
+            self.summary_printer.print_cost_estimate(cost_estimate.__dict__)
+            insights["cost_estimate"] = cost_estimate.__dict__
+
+            await self._run_analyzers(pending, insights)
+
+        # Report results in the requested order
+        for name in analyzers_to_run:
+            insights[name] = insights.pop(name)
+        insights["analyzer_timings"] = {
+            name: insights["analyzer_timings"][name] for name in analyzers_to_run
+        }
 
         # Calculate overall score
         insights["overall_score"] = self._calculate_overall_score(
@@ -114,33 +147,100 @@ class AIAnalyzerRunner:
 
         return AnalyzerType.all_analyzers()
 
-    async def _run_analyzers(
-        self, analyzers_to_run: list[str], insights: dict[str, Any]
-    ) -> None:
+    def _prepare_analyzer(self, analyzer_name: str) -> tuple[Any, str, str]:
+        """
+        Create an analyzer and build its prompt and cache key.
+
+        Returns:
+            (analyzer, prompt, cache_key)
+        """
+        analyzer = AnalyzerFactory.create(analyzer_name, self.project_index)
+        prompt = analyzer.get_prompt()
+        key = CacheManager.make_key(prompt, analyzer.PROMPT_VERSION)
+        return analyzer, prompt, key
+
+    def _load_cached_results(
+        self, analyzers_to_run: list[str], insights: dict[str, Any], skip_cache: bool
+    ) -> list[str]:
         """
-        Run all specified analyzers.
+        Fill in cached analyzer results.
 
         Args:
             analyzers_to_run: List of analyzer names to run
             insights: Dictionary to store results
+            skip_cache: If True, ignore cached results
+
+        Returns:
+            Analyzers that still need to run
         """
+        pending = []
         for analyzer_name in analyzers_to_run:
-            print(f"\n🤖 Running {analyzer_name.replace('_', ' ').title()} Analyzer...")
-            start_time = time.time()
-
             try:
-                result = await self._run_single_analyzer(analyzer_name)
-                insights[analyzer_name] = result
+                _, _, key = self._prepare_analyzer(analyzer_name)
+            except Exception:
+                pending.append(analyzer_name)  # Report the error when run
+                continue
+
+            cached = self.cache_manager.get_analyzer_result(
+                analyzer_name, key, skip_cache
+            )
+            if cached is None:
+                pending.append(analyzer_name)
+                continue
+
+            insights[analyzer_name] = cached
+            insights["analyzer_timings"][analyzer_name] = {
+                "duration_seconds": 0.0,
+                "cached": True,
+            }
+            print(f"✓ Using cached {_display_name(analyzer_name)} results")
+        return pending
 
-                duration = time.time() - start_time
-                score = result.get("score", 0)
-                print(f"   ✓ Completed in {duration:.1f}s (score: {score}/100)")
-
-            except Exception as e:
-                print(f"   ✗ Error: {e}")
-                insights[analyzer_name] = {"error": str(e)}
+    async def _run_analyzers(
+        self, analyzers_to_run: list[str], insights: dict[str, Any]
+    ) -> None:
+        """
+        Run the specified analyzers concurrently, up to max_concurrency.
 
-    async def _run_single_analyzer(self, analyzer_name: str) -> dict[str, Any]:
+        Args:
+            analyzers_to_run: List of analyzer names to run
+            insights: Dictionary to store results
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run(analyzer_name: str) -> None:
+            async with semaphore, agent_slot():
+                print(f"\n🤖 Running {_display_name(analyzer_name)} Analyzer...")
+                start_time = time.time()
+
+                try:
+                    result, key = await self._run_single_analyzer(analyzer_name)
+                except Exception as e:
+                    duration = time.time() - start_time
+                    print(f"   ✗ {_display_name(analyzer_name)} error: {e}")
+                    insights[analyzer_name] = {"error": str(e)}
+                else:
+                    duration = time.time() - start_time
+                    insights[analyzer_name] = result
+                    self.cache_manager.save_analyzer_result(
+                        analyzer_name, key, result, duration
+                    )
+                    score = result.get("score", 0)
+                    print(
+                        f"   ✓ {_display_name(analyzer_name)} completed in "
+                        f"{duration:.1f}s (score: {score}/100)"
+                    )
+
+                insights["analyzer_timings"][analyzer_name] = {
+                    "duration_seconds": round(duration, 2),
+                    "cached": False,
+                }
+
+        await asyncio.gather(*(run(name) for name in analyzers_to_run))
+
+    async def _run_single_analyzer(
+        self, analyzer_name: str
+    ) -> tuple[dict[str, Any], str]:
         """
         Run a specific AI analyzer.
 
@@ -148,13 +248,10 @@ class AIAnalyzerRunner:
             analyzer_name: Name of the analyzer to run
 
         Returns:
-            Analysis result dictionary
+            (analysis result dictionary, cache key)
         """
-        # Create analyzer instance
-        analyzer = AnalyzerFactory.create(analyzer_name, self.project_index)
-
-        # Get prompt and default result
-        prompt = analyzer.get_prompt()
+        # Create analyzer instance, prompt and default result
+        analyzer, prompt, key = self._prepare_analyzer(analyzer_name)
         default_result = analyzer.get_default_result()
 
         # Run Claude query
@@ -162,7 +259,7 @@ class AIAnalyzerRunner:
         response = await client.run_analysis_query(prompt)
 
         # Parse and return result
-        return self.result_parser.parse_json_response(response, default_result)
+        return self.result_parser.parse_json_response(response, default_result), key
 
     def _calculate_overall_score(
         self, analyzers_to_run: list[str], insights: dict[str, Any]
@@ -193,3 +290,7 @@ class AIAnalyzerRunner:
             insights: Analysis results dictionary
         """
         self.summary_printer.print_summary(insights)
+
+
+def _display_name(analyzer_name: str) -> str:
+    return analyzer_name.replace("_", " ").title()
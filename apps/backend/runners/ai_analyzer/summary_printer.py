@@ -34,6 +34,7 @@ class SummaryPrinter:
             return
 
         SummaryPrinter._print_scores(insights)
+        SummaryPrinter._print_timings(insights)
         SummaryPrinter._print_security_issues(insights)
         SummaryPrinter._print_performance_issues(insights)
 
@@ -50,6 +51,21 @@ class SummaryPrinter:
                 display_name = name.replace("_", " ").title()
                 print(f"   {display_name:<25} {score}/100")
 
+    @staticmethod
+    def _print_timings(insights: dict[str, Any]) -> None:
+        """Print per-analyzer latency."""
+        timings = insights.get("analyzer_timings", {})
+        if not timings:
+            return
+
+        print("\n⏱️  Analyzer Latency:")
+        for name, timing in timings.items():
+            display_name = name.replace("_", " ").title()
+            if timing.get("cached"):
+                print(f"   {display_name:<25} cached")
+            else:
+                print(f"   {display_name:<25} {timing.get('duration_seconds', 0):.1f}s")
+
     @staticmethod
     def _print_security_issues(insights: dict[str, Any]) -> None:
         """Print security vulnerabilities summary."""
@@ -14,12 +14,19 @@ Example:
 
     # Skip cache
     python ai_analyzer_runner.py --skip-cache
+
+    # Run at most two analyzers at a time
+    python ai_analyzer_runner.py --concurrency 2
 """
 
 import asyncio
 import json
+import sys
 from pathlib import Path
 
+# Add auto-claude to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
 
 def main() -> int:
     """CLI entry point."""
@@ -46,6 +53,12 @@ def main() -> int:
         nargs="+",
         help="Run only specific analyzers (code_relationships, business_logic, etc.)",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        help="Maximum analyzers to run at once (default: 3)",
+    )
 
     args = parser.parse_args()
 
@@ -67,7 +80,9 @@ def main() -> int:
         return 1
 
     # Create and run analyzer
-    analyzer = AIAnalyzerRunner(args.project_dir, project_index)
+    analyzer = AIAnalyzerRunner(
+        args.project_dir, project_index, max_concurrency=args.concurrency
+    )
 
     # Run async analysis
     insights = asyncio.run(
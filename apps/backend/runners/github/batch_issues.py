@@ -4,7 +4,8 @@ Issue Batching Service
 
 Groups similar issues together for combined auto-fix:
 - Uses semantic similarity from duplicates.py
-- Creates issue clusters using agglomerative clustering
+- Creates issue clusters with union-find over similar pairs
+- Adds newly opened issues to existing batches without re-clustering
 - Generates combined specs for issue batches
 - Tracks batch state and progress
 """
@@ -26,10 +27,14 @@ try:
     from .batch_validator import BatchValidator
     from .duplicates import SIMILAR_THRESHOLD
     from .file_lock import locked_json_write
+    from .issue_clustering import JOIN_THRESHOLD, IssueSimilarityIndex, cluster_issues
+    from .state_store import NS_BATCH_INDEX, get_state_store
 except (ImportError, ValueError, SystemError):
     from batch_validator import BatchValidator
     from duplicates import SIMILAR_THRESHOLD
     from file_lock import locked_json_write
+    from issue_clustering import JOIN_THRESHOLD, IssueSimilarityIndex, cluster_issues
+    from state_store import NS_BATCH_INDEX, get_state_store
 
 
 class ClaudeBatchAnalyzer:
@@ -439,31 +444,26 @@ class IssueBatcher:
         self._batch_index: dict[int, str] = {}  # issue_number -> batch_id
         self._load_batch_index()
 
-    def _load_batch_index(self) -> None:
-        """Load batch index from disk."""
-        index_file = self.github_dir / "batches" / "index.json"
-        if index_file.exists():
-            with open(index_file) as f:
-                data = json.load(f)
-            self._batch_index = {
-                int(k): v for k, v in data.get("issue_to_batch", {}).items()
-            }
+        # Built on first add_issue() from the pending batches
+        self._similarity_index: IssueSimilarityIndex | None = None
 
-    def _save_batch_index(self) -> None:
-        """Save batch index to disk."""
-        batches_dir = self.github_dir / "batches"
-        batches_dir.mkdir(parents=True, exist_ok=True)
+    def _load_batch_index(self) -> None:
+        """Load batch index from the state store."""
+        self._batch_index = {
+            int(k): v
+            for k, v in get_state_store(self.github_dir).items(NS_BATCH_INDEX).items()
+        }
 
-        index_file = batches_dir / "index.json"
-        with open(index_file, "w") as f:
-            json.dump(
-                {
-                    "issue_to_batch": self._batch_index,
-                    "updated_at": datetime.now(timezone.utc).isoformat(),
-                },
-                f,
-                indent=2,
-            )
+    def _save_batch_index(self, issue_numbers: list[int]) -> None:
+        """Write the index entries of the given issues to the state store."""
+        store = get_state_store(self.github_dir)
+        with store.transaction() as conn:
+            for issue_number in issue_numbers:
+                batch_id = self._batch_index.get(issue_number)
+                if batch_id is None:
+                    store.delete(NS_BATCH_INDEX, issue_number, conn=conn)
+                else:
+                    store.put(NS_BATCH_INDEX, issue_number, batch_id, conn=conn)
 
     def _generate_batch_id(self, primary_issue: int) -> str:
         """Generate unique batch ID."""
@@ -725,53 +725,16 @@ class IssueBatcher:
         similarity_matrix: dict[tuple[int, int], float],
     ) -> list[list[int]]:
         """
-        Cluster issues using simple agglomerative approach.
+        Cluster issues with union-find over pairs above the threshold.
 
         Returns list of clusters, each cluster is a list of issue numbers.
         """
-        issue_numbers = [i["number"] for i in issues]
-
-        # Start with each issue in its own cluster
-        clusters: list[set[int]] = [{n} for n in issue_numbers]
-
-        # Merge clusters that have similar issues
-        def cluster_similarity(c1: set[int], c2: set[int]) -> float:
-            """Average similarity between clusters."""
-            scores = []
-            for a in c1:
-                for b in c2:
-                    if (a, b) in similarity_matrix:
-                        scores.append(similarity_matrix[(a, b)])
-            return sum(scores) / len(scores) if scores else 0.0
-
-        # Iteratively merge most similar clusters
-        while len(clusters) > 1:
-            best_score = 0.0
-            best_pair = (-1, -1)
-
-            for i in range(len(clusters)):
-                for j in range(i + 1, len(clusters)):
-                    score = cluster_similarity(clusters[i], clusters[j])
-                    if score > best_score:
-                        best_score = score
-                        best_pair = (i, j)
-
-            # Stop if best similarity is below threshold
-            if best_score < self.similarity_threshold:
-                break
-
-            # Merge clusters
-            i, j = best_pair
-            merged = clusters[i] | clusters[j]
-
-            # Don't exceed max batch size
-            if len(merged) > self.max_batch_size:
-                break
-
-            clusters = [c for k, c in enumerate(clusters) if k not in (i, j)]
-            clusters.append(merged)
-
-        return [list(c) for c in clusters]
+        return cluster_issues(
+            [i["number"] for i in issues],
+            similarity_matrix,
+            threshold=self.similarity_threshold,
+            max_batch_size=self.max_batch_size,
+        )
 
     def _extract_common_themes(
         self,
@@ -932,8 +895,9 @@ class IssueBatcher:
                 self._batch_index[item.issue_number] = batch.batch_id
 
             # Save batch
-            batch.save(self.github_dir)
+            await batch.save(self.github_dir)
             final_batches.append(batch)
+            self._index_batch(batch)
 
             logger.info(
                 f"Saved batch {batch.batch_id} with {len(batch.issues)} issues: "
@@ -942,10 +906,115 @@ class IssueBatcher:
             )
 
         # Save index
-        self._save_batch_index()
+        self._save_batch_index(
+            [item.issue_number for batch in final_batches for item in batch.issues]
+        )
 
         return final_batches
 
+    def _index_batch(self, batch: IssueBatch) -> None:
+        """Add a pending batch's issues to the similarity index, if built."""
+        if self._similarity_index is None or batch.status != BatchStatus.PENDING:
+            return
+        for item in batch.issues:
+            self._similarity_index.add(item.issue_number, item.title, item.body)
+
+    def _get_similarity_index(self) -> IssueSimilarityIndex:
+        """Similarity index over the issues of batches that can still grow."""
+        if self._similarity_index is None:
+            self._similarity_index = IssueSimilarityIndex()
+            for batch in self.get_all_batches():
+                self._index_batch(batch)
+        return self._similarity_index
+
+    async def add_issue(
+        self,
+        issue: dict[str, Any],
+        min_similarity: float = JOIN_THRESHOLD,
+    ) -> IssueBatch | None:
+        """
+        Add a newly opened issue to the most similar existing batch.
+
+        Only pending batches below max_batch_size can take new issues.
+        Candidates come from a MinHash index over batched issues, so this
+        does not re-cluster the backlog.
+
+        Args:
+            issue: Issue dict with number, title, body, labels
+            min_similarity: Minimum word-set Jaccard similarity to a batched issue
+
+        Returns:
+            The batch the issue now belongs to, or None if no batch matched
+            (the issue is left for the next create_batches run)
+        """
+        number = issue["number"]
+        if number in self._batch_index:
+            return self.get_batch_for_issue(number)
+
+        index = self._get_similarity_index()
+        title = issue.get("title", "")
+        body = issue.get("body", "") or ""
+
+        for neighbour, _ in index.nearest(title, body, min_similarity):
+            batch = self.get_batch_for_issue(neighbour)
+            if (
+                batch is None
+                or batch.status != BatchStatus.PENDING
+                or len(batch.issues) >= self.max_batch_size
+            ):
+                continue
+
+            index.add(number, title, body)
+            batch.issues.append(
+                IssueBatchItem(
+                    issue_number=number,
+                    title=title,
+                    body=body,
+                    labels=[label.get("name", "") for label in issue.get("labels", [])],
+                    similarity_to_primary=index.similarity(batch.primary_issue, number),
+                )
+            )
+            await batch.save(self.github_dir)
+            self._batch_index[number] = batch.batch_id
+            self._save_batch_index([number])
+
+            logger.info(
+                f"Added issue #{number} to batch {batch.batch_id} "
+                f"(similar to #{neighbour})"
+            )
+            return batch
+
+        return None
+
+    async def add_issues(
+        self,
+        issues: list[dict[str, Any]],
+        exclude_issue_numbers: set[int] | None = None,
+    ) -> list[IssueBatch]:
+        """
+        Add new issues to similar existing batches (see add_issue).
+
+        Run before create_batches, so only the issues no pending batch can
+        take are clustered again.
+
+        Args:
+            issues: List of issue dicts with number, title, body, labels
+            exclude_issue_numbers: Issues to leave alone
+
+        Returns:
+            Batches that took at least one of the issues
+        """
+        exclude = exclude_issue_numbers or set()
+        grown: dict[str, IssueBatch] = {}
+        for issue in issues:
+            number = issue["number"]
+            if number in exclude or number in self._batch_index:
+                continue
+            batch = await self.add_issue(issue)
+            if batch is not None:
+                grown[batch.batch_id] = batch
+        return list(grown.values())
+
     async def _validate_and_split_batches(
         self,
         initial_batches: list[tuple[IssueBatch, list[dict[str, Any]]]],
@@ -1144,7 +1213,9 @@ class IssueBatcher:
         # Remove from index
         for issue_num in batch.get_issue_numbers():
             self._batch_index.pop(issue_num, None)
-        self._save_batch_index()
+            if self._similarity_index is not None:
+                self._similarity_index.remove(issue_num)
+        self._save_batch_index(batch.get_issue_numbers())
 
         # Delete batch file
         batch_file = self.github_dir / "batches" / f"batch_{batch_id}.json"
@@ -18,7 +18,11 @@ from typing import Any
 logger = logging.getLogger(__name__)
 
 # Check for Claude SDK availability without importing (avoids unused import warning)
-CLAUDE_SDK_AVAILABLE = importlib.util.find_spec("claude_agent_sdk") is not None
+try:
+    CLAUDE_SDK_AVAILABLE = importlib.util.find_spec("claude_agent_sdk") is not None
+except ValueError:
+    # Already in sys.modules without a module spec
+    CLAUDE_SDK_AVAILABLE = True
 
 # Default model and thinking configuration
 DEFAULT_MODEL = "claude-sonnet-4-20250514"
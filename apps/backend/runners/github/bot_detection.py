@@ -35,9 +35,9 @@ from datetime import datetime, timedelta
 from pathlib import Path
 
 try:
-    from .file_lock import FileLock, atomic_write
+    from .state_store import NS_BOT_DETECTION, get_state_store
 except (ImportError, ValueError, SystemError):
-    from file_lock import FileLock, atomic_write
+    from state_store import NS_BOT_DETECTION, get_state_store
 
 
 @dataclass
@@ -65,26 +65,54 @@ class BotDetectionState:
             last_review_times=data.get("last_review_times", {}),
         )
 
-    def save(self, state_dir: Path) -> None:
-        """Save state to disk with file locking for concurrent safety."""
-        state_dir.mkdir(parents=True, exist_ok=True)
-        state_file = state_dir / "bot_detection_state.json"
+    def _entry(self, pr_key: str) -> dict | None:
+        """Store row for one PR (None if the PR isn't tracked)."""
+        entry = {}
+        if pr_key in self.reviewed_commits:
+            entry["reviewed_commits"] = self.reviewed_commits[pr_key]
+        if pr_key in self.last_review_times:
+            entry["last_review_time"] = self.last_review_times[pr_key]
+        return entry or None
 
-        # Use file locking to prevent concurrent write corruption
-        with FileLock(state_file, timeout=5.0, exclusive=True):
-            with atomic_write(state_file) as f:
-                json.dump(self.to_dict(), f, indent=2)
+    def save(self, state_dir: Path, pr_keys: list[str] | None = None) -> None:
+        """
+        Save state to the runner's state store.
 
-    @classmethod
-    def load(cls, state_dir: Path) -> BotDetectionState:
-        """Load state from disk."""
-        state_file = state_dir / "bot_detection_state.json"
+        Args:
+            state_dir: GitHub state directory
+            pr_keys: Only write these PRs (others' rows are left untouched,
+                so concurrent workers don't overwrite each other). By default
+                the stored state is replaced with this one.
+        """
+        store = get_state_store(state_dir)
+        if pr_keys is None:
+            store.replace_namespace(
+                NS_BOT_DETECTION,
+                {
+                    pr_key: self._entry(pr_key)
+                    for pr_key in {*self.reviewed_commits, *self.last_review_times}
+                },
+            )
+            return
 
-        if not state_file.exists():
-            return cls()
+        with store.transaction() as conn:
+            for pr_key in pr_keys:
+                entry = self._entry(pr_key)
+                if entry is None:
+                    store.delete(NS_BOT_DETECTION, pr_key, conn=conn)
+                else:
+                    store.put(NS_BOT_DETECTION, pr_key, entry, conn=conn)
 
-        with open(state_file) as f:
-            return cls.from_dict(json.load(f))
+    @classmethod
+    def load(cls, state_dir: Path) -> BotDetectionState:
+        """Load state from the runner's state store."""
+        state = cls()
+        for pr_key, entry in get_state_store(state_dir).items(NS_BOT_DETECTION).items():
+            if "reviewed_commits" in entry:
+                state.reviewed_commits[pr_key] = entry["reviewed_commits"]
+            if entry.get("last_review_time") is not None:
+                state.last_review_times[pr_key] = entry["last_review_time"]
+        return state
 
 
 class BotDetector:
@@ -354,19 +382,23 @@ class BotDetector:
             commit_sha: The commit SHA that was reviewed
         """
         pr_key = str(pr_number)
-
-        # Add to reviewed commits
-        if pr_key not in self.state.reviewed_commits:
-            self.state.reviewed_commits[pr_key] = []
-
-        if commit_sha not in self.state.reviewed_commits[pr_key]:
-            self.state.reviewed_commits[pr_key].append(commit_sha)
-
-        # Update last review time
-        self.state.last_review_times[pr_key] = datetime.now().isoformat()
-
-        # Save state
-        self.state.save(self.state_dir)
+        reviewed_at = datetime.now().isoformat()
+
+        def add_review(entry: dict | None) -> dict:
+            # Merge with the stored row - another worker may have reviewed
+            # other commits of this PR since we loaded our state
+            entry = entry or {}
+            commits = entry.setdefault("reviewed_commits", [])
+            if commit_sha not in commits:
+                commits.append(commit_sha)
+            entry["last_review_time"] = reviewed_at
+            return entry
+
+        entry = get_state_store(self.state_dir).update(
+            NS_BOT_DETECTION, pr_key, add_review
+        )
+        self.state.reviewed_commits[pr_key] = entry["reviewed_commits"]
+        self.state.last_review_times[pr_key] = reviewed_at
 
         print(
             f"[BotDetector] Marked PR #{pr_number} as reviewed at {commit_sha[:8]} "
@@ -388,7 +420,7 @@ class BotDetector:
         if pr_key in self.state.last_review_times:
             del self.state.last_review_times[pr_key]
 
-        self.state.save(self.state_dir)
+        self.state.save(self.state_dir, pr_keys=[pr_key])
 
         print(f"[BotDetector] Cleared state for PR #{pr_number}")
 
@@ -445,7 +477,7 @@ class BotDetector:
                 del self.state.last_review_times[pr_key]
 
         if prs_to_remove:
-            self.state.save(self.state_dir)
+            self.state.save(self.state_dir, pr_keys=prs_to_remove)
             print(
                 f"[BotDetector] Cleaned up {len(prs_to_remove)} stale PRs "
                 f"(older than {max_age_days} days)"
@@ -0,0 +1,305 @@
+"""
+Chunked PR Review
+=================
+
+Review mode for PRs too large for a single review pass.
+
+A single pass sees the PR diff cut at 50,000 characters or, when GitHub
+refuses the full diff (PRTooLargeError), the patches of the first 50
+files. Chunked review instead splits the changed files into groups that
+each fit one pass, reviews the groups concurrently and merges the
+findings.
+
+- Files are grouped by directory, and a directory is only split across
+  chunks when it does not fit in one on its own.
+- Chunks are produced lazily and at most `concurrency` are in flight, so
+  memory stays bounded however many files the PR touches.
+- Findings stream out as chunks complete, de-duplicated by file, line and
+  title, so the first ones are available long before the last chunk ends.
+
+Usage:
+    review = ChunkedReview(context.changed_files, review_chunk)
+    async for finding in review.stream():
+        ...
+    print(review.stats.time_to_first_finding)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from pathlib import PurePosixPath
+
+try:
+    from .context_gatherer import ChangedFile
+    from .models import PRReviewFinding
+except (ImportError, ValueError, SystemError):
+    from context_gatherer import ChangedFile
+    from models import PRReviewFinding
+
+CHARS_PER_TOKEN = 4
+# A single review pass shows at most 50 file patches and 50,000 characters
+SINGLE_PASS_DIFF_CHARS = 50_000
+DEFAULT_CHUNK_TOKENS = 12_000
+MAX_FILES_PER_CHUNK = 50
+DEFAULT_CONCURRENCY = 4
+# Findings waiting for the consumer before chunk workers pause
+_QUEUE_SIZE = 100
+
+
+def module_of(path: str) -> str:
+    """Module a changed file belongs to (its directory)."""
+    return str(PurePosixPath(path).parent)
+
+
+def file_tokens(file: ChangedFile) -> int:
+    """Rough token cost of reviewing one file's patch."""
+    return (len(file.path) + len(file.patch)) // CHARS_PER_TOKEN + 1
+
+
+def needs_chunked_review(
+    files: list[ChangedFile], diff: str = "", diff_truncated: bool = False
+) -> bool:
+    """
+    Whether a PR's changes do not fit in a single review pass.
+
+    Args:
+        files: Changed files of the PR (with per-file patches)
+        diff: Full PR diff, if GitHub returned one
+        diff_truncated: Whether the full diff was unavailable
+
+    Returns:
+        True if a single pass would see a truncated diff
+    """
+    if diff and not diff_truncated:
+        # Chunks are built from per-file patches, so they must be present
+        return len(diff) > SINGLE_PASS_DIFF_CHARS and any(f.patch for f in files)
+    if len(files) > MAX_FILES_PER_CHUNK:
+        return True
+    return sum(len(f.patch) for f in files) > SINGLE_PASS_DIFF_CHARS
+
+
+@dataclass
+class ReviewChunk:
+    """A group of changed files reviewed in one pass."""
+
+    index: int
+    files: list[ChangedFile]
+    tokens: int
+
+    @property
+    def modules(self) -> list[str]:
+        return sorted({module_of(f.path) for f in self.files})
+
+
+def partition_files(
+    files: Iterable[ChangedFile],
+    max_tokens: int = DEFAULT_CHUNK_TOKENS,
+    max_files: int = MAX_FILES_PER_CHUNK,
+) -> Iterator[ReviewChunk]:
+    """
+    Split changed files into token-bounded chunks along module boundaries.
+
+    Files are ordered by path, so neighbouring directories end up in the
+    same chunk. A directory is kept whole unless it alone exceeds the
+    budget; then it is split between files. A single file over the budget
+    gets a chunk of its own.
+
+    Args:
+        files: Changed files of the PR
+        max_tokens: Token budget per chunk
+        max_files: File limit per chunk
+
+    Yields:
+        ReviewChunk objects in path order
+    """
+    index = 0
+    current: list[ChangedFile] = []
+    current_tokens = 0
+
+    def fits(group_tokens: int, group_files: int) -> bool:
+        return (
+            current_tokens + group_tokens <= max_tokens
+            and len(current) + group_files <= max_files
+        )
+
+    def flush() -> ReviewChunk:
+        nonlocal index, current, current_tokens
+        chunk = ReviewChunk(index, current, current_tokens)
+        index += 1
+        current, current_tokens = [], 0
+        return chunk
+
+    ordered = sorted(files, key=lambda f: f.path)
+    start = 0
+    while start < len(ordered):
+        # Collect the next module's files
+        module = module_of(ordered[start].path)
+        end = start
+        while end < len(ordered) and module_of(ordered[end].path) == module:
+            end += 1
+        group = ordered[start:end]
+        group_tokens = sum(file_tokens(f) for f in group)
+        start = end
+
+        if current and not fits(group_tokens, len(group)):
+            yield flush()
+        if fits(group_tokens, len(group)):
+            current.extend(group)
+            current_tokens += group_tokens
+            continue
+
+        # The module alone is over budget: split it between files
+        for file in group:
+            tokens = file_tokens(file)
+            if current and not fits(tokens, 1):
+                yield flush()
+            current.append(file)
+            current_tokens += tokens
+        if current:
+            yield flush()
+
+    if current:
+        yield flush()
+
+
+class FindingMerger:
+    """De-duplicates findings reported by different chunks."""
+
+    def __init__(self) -> None:
+        self._seen: set[tuple[str, int, str]] = set()
+        self.duplicates = 0
+
+    @staticmethod
+    def key(finding: PRReviewFinding) -> tuple[str, int, str]:
+        return (finding.file, finding.line, " ".join(finding.title.lower().split()))
+
+    def add(self, finding: PRReviewFinding) -> bool:
+        """Record a finding; False if an equivalent one was already seen."""
+        key = self.key(finding)
+        if key in self._seen:
+            self.duplicates += 1
+            return False
+        self._seen.add(key)
+        return True
+
+
+@dataclass
+class ChunkedReviewStats:
+    """Progress and timing of a chunked review."""
+
+    files: int = 0
+    chunks: int = 0
+    chunks_failed: int = 0
+    findings: int = 0
+    duplicates: int = 0
+    time_to_first_finding: float | None = None
+    duration: float | None = None
+    errors: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return {
+            "strategy": "chunked",
+            "files": self.files,
+            "chunks": self.chunks,
+            "chunks_failed": self.chunks_failed,
+            "findings_count": self.findings,
+            "duplicates": self.duplicates,
+            "time_to_first_finding": self.time_to_first_finding,
+            "duration": self.duration,
+        }
+
+
+ChunkReviewer = Callable[[ReviewChunk], Awaitable[list[PRReviewFinding]]]
+
+
+class ChunkedReview:
+    """Reviews the chunks of a large PR concurrently and streams findings."""
+
+    def __init__(
+        self,
+        files: list[ChangedFile],
+        review_chunk: ChunkReviewer,
+        max_tokens: int = DEFAULT_CHUNK_TOKENS,
+        max_files: int = MAX_FILES_PER_CHUNK,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        on_chunk_done: Callable[[ReviewChunk, ChunkedReviewStats], None] | None = None,
+    ):
+        """
+        Args:
+            files: Changed files of the PR
+            review_chunk: Reviews one chunk and returns its findings
+            max_tokens: Token budget per chunk
+            max_files: File limit per chunk
+            concurrency: Chunks reviewed at the same time
+            on_chunk_done: Called after each chunk (for progress reporting)
+        """
+        self.files = files
+        self.review_chunk = review_chunk
+        self.max_tokens = max_tokens
+        self.max_files = max_files
+        self.concurrency = max(1, concurrency)
+        self.on_chunk_done = on_chunk_done
+        self.stats = ChunkedReviewStats(files=len(files))
+
+    async def _worker(
+        self,
+        chunks: Iterator[ReviewChunk],
+        queue: asyncio.Queue,
+    ) -> None:
+        for chunk in chunks:
+            try:
+                findings = await self.review_chunk(chunk)
+            except Exception as e:
+                self.stats.chunks_failed += 1
+                self.stats.errors.append(f"chunk {chunk.index}: {e}")
+                print(
+                    f"[AI] Chunk {chunk.index} ({', '.join(chunk.modules[:3])}) "
+                    f"failed: {e}",
+                    flush=True,
+                )
+                findings = []
+            self.stats.chunks += 1
+            for finding in findings:
+                await queue.put(finding)
+            if self.on_chunk_done:
+                self.on_chunk_done(chunk, self.stats)
+        # Tell the consumer this worker is done
+        await queue.put(None)
+
+    async def stream(self) -> AsyncIterator[PRReviewFinding]:
+        """Yield unique findings as chunks complete."""
+        started = time.monotonic()
+        merger = FindingMerger()
+        # Workers share one lazy iterator, so chunks are built as needed
+        chunks = partition_files(self.files, self.max_tokens, self.max_files)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=_QUEUE_SIZE)
+        workers = [
+            asyncio.create_task(self._worker(chunks, queue))
+            for _ in range(self.concurrency)
+        ]
+        running = len(workers)
+        try:
+            while running:
+                finding = await queue.get()
+                if finding is None:
+                    running -= 1
+                    continue
+                if not merger.add(finding):
+                    self.stats.duplicates = merger.duplicates
+                    continue
+                self.stats.findings += 1
+                if self.stats.time_to_first_finding is None:
+                    self.stats.time_to_first_finding = time.monotonic() - started
+                yield finding
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            self.stats.duration = time.monotonic() - started
+
+    async def run(self) -> list[PRReviewFinding]:
+        """Review all chunks and return the merged findings."""
+        return [finding async for finding in self.stream()]
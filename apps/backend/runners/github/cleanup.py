@@ -38,8 +38,26 @@ from enum import Enum
 from pathlib import Path
 from typing import Any
 
-from .purge_strategy import PurgeResult, PurgeStrategy
-from .storage_metrics import StorageMetrics, StorageMetricsCalculator
+try:
+    from .purge_strategy import PurgeResult, PurgeStrategy
+    from .state_store import (
+        NS_AUTOFIX_QUEUE,
+        NS_BATCH_INDEX,
+        NS_PR_REVIEWS,
+        StateStoreError,
+        get_state_store,
+    )
+    from .storage_metrics import StorageMetrics, StorageMetricsCalculator
+except (ImportError, ValueError, SystemError):
+    from purge_strategy import PurgeResult, PurgeStrategy
+    from state_store import (
+        NS_AUTOFIX_QUEUE,
+        NS_BATCH_INDEX,
+        NS_PR_REVIEWS,
+        StateStoreError,
+        get_state_store,
+    )
+    from storage_metrics import StorageMetrics, StorageMetricsCalculator
 
 
 class RetentionPolicy(str, Enum):
@@ -338,50 +356,31 @@ class DataCleaner:
         dry_run: bool,
         result: CleanupResult,
     ) -> None:
-        """Prune stale entries from index files."""
-        index_files = [
-            self.state_dir / "pr" / "index.json",
-            self.state_dir / "issues" / "index.json",
-            self.state_dir / "autofix" / "index.json",
-        ]
-
-        for index_path in index_files:
-            if not index_path.exists():
-                continue
-
-            try:
-                with open(index_path) as f:
-                    index_data = json.load(f)
-
-                if not isinstance(index_data, dict):
-                    continue
-
-                items = index_data.get("items", {})
-                if not isinstance(items, dict):
-                    continue
-
-                pruned = 0
-                to_remove = []
-
-                for key, entry in items.items():
-                    # Check if referenced file exists
-                    file_path = entry.get("file_path") or entry.get("path")
-                    if file_path:
-                        if not Path(file_path).exists():
-                            to_remove.append(key)
-                            pruned += 1
-
-                if to_remove and not dry_run:
-                    for key in to_remove:
-                        del items[key]
-
-                    with open(index_path, "w") as f:
-                        json.dump(index_data, f, indent=2)
-
-                result.pruned_index_entries += pruned
+        """Prune state store index rows whose JSON document is gone."""
+        # Namespace -> document path for a row (key, value)
+        documents = {
+            NS_PR_REVIEWS: lambda key, _: self.state_dir / "pr" / f"review_{key}.json",
+            NS_AUTOFIX_QUEUE: lambda key, _: (
+                self.state_dir / "issues" / f"autofix_{key}.json"
+            ),
+            NS_BATCH_INDEX: lambda _, batch_id: (
+                self.state_dir / "batches" / f"batch_{batch_id}.json"
+            ),
+        }
 
-            except (OSError, json.JSONDecodeError, KeyError):
-                result.errors.append(f"Error pruning index: {index_path}")
+        try:
+            store = get_state_store(self.state_dir)
+            for namespace, document_for in documents.items():
+                stale = [
+                    key
+                    for key, value in store.items(namespace).items()
+                    if not document_for(key, value).exists()
+                ]
+                if stale and not dry_run:
+                    store.delete_many(namespace, stale)
+                result.pruned_index_entries += len(stale)
+        except StateStoreError as e:
+            result.errors.append(f"Error pruning state store indexes: {e}")
 
     async def _clean_audit_logs(
         self,
@@ -0,0 +1,232 @@
+"""
+Issue Clustering
+================
+
+Near-linear clustering of issues into batches.
+
+The agglomerative clustering this replaces rescanned every pair of clusters
+after each merge, which is O(n^3) in the number of issues. Here clusters
+are built with union-find over the thresholded similarity graph: edges at
+or above the threshold are applied strongest first, and a union that would
+push a cluster past the maximum batch size is skipped. That costs
+O(E log E) in the number of edges, and the similarity matrix is sparse
+(only pairs an analyzer marked as related), so E stays close to n.
+
+Incremental updates use a MinHash/LSH index over the words of each batched
+issue. A newly opened issue is compared only against issues that share an
+LSH band with it, so it can join an existing batch without re-clustering
+the backlog.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import random
+import re
+from collections.abc import Iterable
+
+# Word-set Jaccard similarity a new issue needs to join an existing batch
+JOIN_THRESHOLD = 0.5
+
+NUM_PERMUTATIONS = 64
+BAND_ROWS = 4  # 16 bands: pairs at Jaccard 0.5 collide with probability > 0.6
+
+_MIN_WORD_LENGTH = 3
+_WORD = re.compile(r"[a-z0-9_]+")
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_rng = random.Random(0xBA7C4)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(NUM_PERMUTATIONS)
+]
+
+
+class UnionFind:
+    """Disjoint sets with union by size and path halving."""
+
+    def __init__(self, items: Iterable[int]):
+        self._parent = {item: item for item in items}
+        self._size = dict.fromkeys(self._parent, 1)
+
+    def __contains__(self, item: int) -> bool:
+        return item in self._parent
+
+    def find(self, item: int) -> int:
+        parent = self._parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def size(self, item: int) -> int:
+        return self._size[self.find(item)]
+
+    def union(self, a: int, b: int, max_size: int | None = None) -> bool:
+        """
+        Merge the sets containing a and b.
+
+        Returns:
+            True if the sets were merged, False if they were already one set
+            or the merged set would be larger than max_size
+        """
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return False
+        size = self._size[root_a] + self._size[root_b]
+        if max_size is not None and size > max_size:
+            return False
+        if self._size[root_a] < self._size[root_b]:
+            root_a, root_b = root_b, root_a
+        self._parent[root_b] = root_a
+        self._size[root_a] = size
+        return True
+
+    def groups(self) -> list[list[int]]:
+        """All sets, ordered by their first item in insertion order."""
+        groups: dict[int, list[int]] = {}
+        for item in self._parent:
+            groups.setdefault(self.find(item), []).append(item)
+        return list(groups.values())
+
+
+def cluster_issues(
+    issue_numbers: list[int],
+    similarity_matrix: dict[tuple[int, int], float],
+    threshold: float,
+    max_batch_size: int,
+) -> list[list[int]]:
+    """
+    Cluster issues into batches with union-find.
+
+    Args:
+        issue_numbers: Issues to cluster
+        similarity_matrix: Pairwise scores; either or both directions of a
+            pair may be present, and missing pairs are unrelated
+        threshold: Minimum score for two issues to share a batch
+        max_batch_size: Maximum issues per batch
+
+    Returns:
+        List of clusters, each a list of issue numbers
+    """
+    uf = UnionFind(issue_numbers)
+
+    edges: dict[tuple[int, int], float] = {}
+    for (a, b), score in similarity_matrix.items():
+        if a == b or score < threshold or a not in uf or b not in uf:
+            continue
+        pair = (a, b) if a < b else (b, a)
+        edges[pair] = max(score, edges.get(pair, score))
+
+    for a, b in sorted(edges, key=lambda pair: (-edges[pair], pair)):
+        uf.union(a, b, max_batch_size)
+
+    return uf.groups()
+
+
+def issue_words(title: str, body: str | None = None) -> frozenset[str]:
+    """Normalized word set of an issue's title and body."""
+    text = f"{title} {body or ''}".lower()
+    return frozenset(
+        word for word in _WORD.findall(text) if len(word) >= _MIN_WORD_LENGTH
+    )
+
+
+def _hash64(value: str) -> int:
+    return int.from_bytes(
+        hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "big"
+    )
+
+
+def _band_keys(words: frozenset[str]) -> list[tuple[int, tuple[int, ...]]]:
+    hashes = [_hash64(word) for word in words]
+    signature = [
+        min((a * h + b) % _MERSENNE_PRIME for h in hashes) for a, b in _PERMUTATIONS
+    ]
+    return [
+        (start, tuple(signature[start : start + BAND_ROWS]))
+        for start in range(0, NUM_PERMUTATIONS, BAND_ROWS)
+    ]
+
+
+def jaccard(a: frozenset[str], b: frozenset[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class IssueSimilarityIndex:
+    """
+    MinHash/LSH index of issues for nearest-neighbour lookups.
+
+    Usage:
+        index = IssueSimilarityIndex()
+        index.add(123, title, body)
+        for number, score in index.nearest(title, body, JOIN_THRESHOLD):
+            ...
+    """
+
+    def __init__(self):
+        self._words: dict[int, frozenset[str]] = {}
+        self._bands: dict[int, list[tuple[int, tuple[int, ...]]]] = {}
+        self._buckets: dict[tuple[int, tuple[int, ...]], set[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    def __contains__(self, issue_number: int) -> bool:
+        return issue_number in self._words
+
+    def add(self, issue_number: int, title: str, body: str | None = None) -> None:
+        """Index an issue, replacing any previous entry for it."""
+        self.remove(issue_number)
+        words = issue_words(title, body)
+        if not words:
+            return
+        bands = _band_keys(words)
+        self._words[issue_number] = words
+        self._bands[issue_number] = bands
+        for band in bands:
+            self._buckets.setdefault(band, set()).add(issue_number)
+
+    def remove(self, issue_number: int) -> None:
+        self._words.pop(issue_number, None)
+        for band in self._bands.pop(issue_number, []):
+            bucket = self._buckets.get(band)
+            if bucket is not None:
+                bucket.discard(issue_number)
+                if not bucket:
+                    del self._buckets[band]
+
+    def similarity(self, a: int, b: int) -> float:
+        """Exact word-set Jaccard similarity of two indexed issues."""
+        return jaccard(self._words.get(a, frozenset()), self._words.get(b, frozenset()))
+
+    def nearest(
+        self, title: str, body: str | None = None, threshold: float = JOIN_THRESHOLD
+    ) -> list[tuple[int, float]]:
+        """
+        Indexed issues similar to the given title and body.
+
+        Candidates come from the LSH buckets and are verified with the exact
+        Jaccard similarity.
+
+        Returns:
+            (issue_number, similarity) pairs at or above threshold, most
+            similar first
+        """
+        words = issue_words(title, body)
+        if not words:
+            return []
+
+        candidates: set[int] = set()
+        for band in _band_keys(words):
+            candidates |= self._buckets.get(band, set())
+
+        scored = [
+            (number, jaccard(words, self._words[number])) for number in candidates
+        ]
+        return sorted(
+            ((number, score) for number, score in scored if score >= threshold),
+            key=lambda item: (-item[1], item[0]),
+        )
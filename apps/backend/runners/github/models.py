@@ -17,9 +17,11 @@ from enum import Enum
 from pathlib import Path
 
 try:
-    from .file_lock import locked_json_update, locked_json_write
+    from .file_lock import locked_json_write
+    from .state_store import NS_AUTOFIX_QUEUE, NS_PR_REVIEWS, get_state_store
 except (ImportError, ValueError, SystemError):
-    from file_lock import locked_json_update, locked_json_write
+    from file_lock import locked_json_write
+    from state_store import NS_AUTOFIX_QUEUE, NS_PR_REVIEWS, get_state_store
 
 
 class ReviewSeverity(str, Enum):
@@ -492,42 +494,16 @@ class PRReviewResult:
         await self._update_index(pr_dir)
 
     async def _update_index(self, pr_dir: Path) -> None:
-        """Update the PR review index with file locking."""
-        index_file = pr_dir / "index.json"
-
-        def update_index(current_data):
-            """Update function for atomic index update."""
-            if current_data is None:
-                current_data = {"reviews": [], "last_updated": None}
-
-            # Update or add entry
-            reviews = current_data.get("reviews", [])
-            existing = next(
-                (r for r in reviews if r["pr_number"] == self.pr_number), None
-            )
-
-            entry = {
-                "pr_number": self.pr_number,
-                "repo": self.repo,
-                "overall_status": self.overall_status,
-                "findings_count": len(self.findings),
-                "reviewed_at": self.reviewed_at,
-            }
-
-            if existing:
-                reviews = [
-                    entry if r["pr_number"] == self.pr_number else r for r in reviews
-                ]
-            else:
-                reviews.append(entry)
-
-            current_data["reviews"] = reviews
-            current_data["last_updated"] = datetime.now().isoformat()
-
-            return current_data
-
-        # Atomic locked update
-        await locked_json_update(index_file, update_index, timeout=5.0)
+        """Update this PR's entry in the review index (state store)."""
+        entry = {
+            "pr_number": self.pr_number,
+            "repo": self.repo,
+            "overall_status": self.overall_status,
+            "findings_count": len(self.findings),
+            "reviewed_at": self.reviewed_at,
+        }
+        store = get_state_store(pr_dir.parent)
+        await store.put_async(NS_PR_REVIEWS, self.pr_number, entry)
 
     @classmethod
     def load(cls, github_dir: Path, pr_number: int) -> PRReviewResult | None:
@@ -723,48 +699,17 @@ class AutoFixState:
         await self._update_index(issues_dir)
 
     async def _update_index(self, issues_dir: Path) -> None:
-        """Update the issues index with auto-fix queue using file locking."""
-        index_file = issues_dir / "index.json"
-
-        def update_index(current_data):
-            """Update function for atomic index update."""
-            if current_data is None:
-                current_data = {
-                    "triaged": [],
-                    "auto_fix_queue": [],
-                    "last_updated": None,
-                }
-
-            # Update auto-fix queue
-            queue = current_data.get("auto_fix_queue", [])
-            existing = next(
-                (q for q in queue if q["issue_number"] == self.issue_number), None
-            )
-
-            entry = {
-                "issue_number": self.issue_number,
-                "repo": self.repo,
-                "status": self.status.value,
-                "spec_id": self.spec_id,
-                "pr_number": self.pr_number,
-                "updated_at": self.updated_at,
-            }
-
-            if existing:
-                queue = [
-                    entry if q["issue_number"] == self.issue_number else q
-                    for q in queue
-                ]
-            else:
-                queue.append(entry)
-
-            current_data["auto_fix_queue"] = queue
-            current_data["last_updated"] = datetime.now().isoformat()
-
-            return current_data
-
-        # Atomic locked update
-        await locked_json_update(index_file, update_index, timeout=5.0)
+        """Update this issue's entry in the auto-fix queue (state store)."""
+        entry = {
+            "issue_number": self.issue_number,
+            "repo": self.repo,
+            "status": self.status.value,
+            "spec_id": self.spec_id,
+            "pr_number": self.pr_number,
+            "updated_at": self.updated_at,
+        }
+        store = get_state_store(issues_dir.parent)
+        await store.put_async(NS_AUTOFIX_QUEUE, self.issue_number, entry)
 
     @classmethod
     def load(cls, github_dir: Path, issue_number: int) -> AutoFixState | None:
@@ -9,6 +9,7 @@ Features:
 - Pattern-based file discovery
 - Optional repository filtering
 - Archive directory cleanup
+- State store rows (trust, PR review index, auto-fix queue)
 - Comprehensive error handling
 
 Usage:
@@ -23,11 +24,32 @@ Usage:
 from __future__ import annotations
 
 import json
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+try:
+    from .state_store import (
+        NS_AUTOFIX_QUEUE,
+        NS_PR_REVIEWS,
+        NS_TRUST,
+        StateStoreError,
+        get_state_store,
+    )
+except (ImportError, ValueError, SystemError):
+    from state_store import (
+        NS_AUTOFIX_QUEUE,
+        NS_PR_REVIEWS,
+        NS_TRUST,
+        StateStoreError,
+        get_state_store,
+    )
+
+# State store namespaces whose rows carry the entity's JSON keys and repo
+ENTITY_NAMESPACES = (NS_PR_REVIEWS, NS_AUTOFIX_QUEUE)
+
 
 @dataclass
 class PurgeResult:
@@ -155,6 +177,14 @@ class PurgeStrategy:
             for file_path in self.archive_dir.rglob(file_pattern):
                 self._try_delete_file_simple(file_path, result)
 
+        # Index rows in the state store
+        self._delete_store_rows(
+            lambda entry: (
+                entry.get(key) == value and (not repo or entry.get("repo") == repo)
+            ),
+            result,
+        )
+
         result.completed_at = datetime.now(timezone.utc)
         return result
 
@@ -202,9 +232,45 @@ class PurgeStrategy:
             except OSError as e:
                 result.errors.append(f"Error deleting repo directory {repo_dir}: {e}")
 
+        # Trust state and the repo's index rows in the state store
+        try:
+            store = get_state_store(self.state_dir)
+            if store.get(NS_TRUST, repo) is not None:
+                store.delete(NS_TRUST, repo)
+                result.deleted_count += 1
+        except StateStoreError as e:
+            result.errors.append(f"Error deleting trust state for {repo}: {e}")
+        self._delete_store_rows(lambda entry: entry.get("repo") == repo, result)
+
         result.completed_at = datetime.now(timezone.utc)
         return result
 
+    def _delete_store_rows(
+        self,
+        matches: Callable[[dict[str, Any]], bool],
+        result: PurgeResult,
+    ) -> None:
+        """
+        Delete PR review and auto-fix queue rows whose entry matches.
+
+        Args:
+            matches: Predicate on a row's entry
+            result: PurgeResult to update
+        """
+        try:
+            store = get_state_store(self.state_dir)
+            for namespace in ENTITY_NAMESPACES:
+                keys = [
+                    key
+                    for key, entry in store.items(namespace).items()
+                    if isinstance(entry, dict) and matches(entry)
+                ]
+                if keys:
+                    store.delete_many(namespace, keys)
+                    result.deleted_count += len(keys)
+        except StateStoreError as e:
+            result.errors.append(f"Error deleting state store rows: {e}")
+
     def _try_delete_file(
         self,
         file_path: Path,
@@ -120,6 +120,15 @@ class BatchProcessor:
                 "batching", 40, "Clustering and validating batches with AI..."
             )
 
+            # New issues similar to a pending batch join it instead of being
+            # clustered again with the rest of the backlog
+            grown = await batcher.add_issues(issues, exclude_issues)
+            if grown:
+                print(
+                    f"[BATCH] Added new issues to {len(grown)} existing batches",
+                    flush=True,
+                )
+
             # Create batches (includes AI validation)
             batches = await batcher.create_batches(issues, exclude_issues)
 
@@ -466,7 +475,7 @@ class BatchProcessor:
                 batcher._batch_index[item.issue_number] = batch.batch_id
 
             # Save batch
-            batch.save(self.github_dir)
+            await batch.save(self.github_dir)
             created_batches.append(batch)
 
             # Create AutoFixState for primary issue
@@ -540,6 +549,6 @@ class BatchProcessor:
 
         for batch in pending:
             batch.update_status(BatchStatus.ANALYZING)
-            batch.save(self.github_dir)
+            await batch.save(self.github_dir)
 
         return len(pending)
@@ -8,11 +8,17 @@ Core logic for multi-pass PR code review.
 from __future__ import annotations
 
 import asyncio
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import Any
 
 try:
+    from ..chunked_review import (
+        ChunkedReview,
+        ChunkedReviewStats,
+        ReviewChunk,
+        needs_chunked_review,
+    )
     from ..context_gatherer import PRContext
     from ..models import (
         AICommentTriage,
@@ -24,6 +30,12 @@ try:
     from .prompt_manager import PromptManager
     from .response_parsers import ResponseParser
 except (ImportError, ValueError, SystemError):
+    from chunked_review import (
+        ChunkedReview,
+        ChunkedReviewStats,
+        ReviewChunk,
+        needs_chunked_review,
+    )
     from context_gatherer import PRContext
     from models import (
         AICommentTriage,
@@ -99,6 +111,24 @@ class PRReviewEngine:
 
         return False
 
+    def needs_chunked_review(self, context: PRContext) -> bool:
+        """
+        Whether the PR is too large for the configured reviewer.
+
+        The multi-pass review sees the diff cut at 50,000 characters. The
+        parallel orchestrator reads files through its tools, so it is only
+        limited when GitHub did not return the full diff.
+        """
+        if (
+            self.config.use_parallel_orchestrator
+            and context.diff
+            and not context.diff_truncated
+        ):
+            return False
+        return needs_chunked_review(
+            context.changed_files, context.diff, context.diff_truncated
+        )
+
     def deduplicate_findings(
         self, findings: list[PRReviewFinding]
     ) -> list[PRReviewFinding]:
@@ -277,6 +307,32 @@ class PRReviewEngine:
         Returns:
             Tuple of (findings, structural_issues, ai_triages, quick_scan_summary)
         """
+        # PRs too large for the reviewer are reviewed in chunks, alongside
+        # the structural and AI comment triage passes
+        if self.needs_chunked_review(context):
+            side_passes = {"Structural": self._run_structural_pass(context)}
+            if context.ai_bot_comments:
+                side_passes["AI Triage"] = self._run_ai_triage_pass(context)
+            chunked, *side_results = await asyncio.gather(
+                self.run_chunked_review(context),
+                *side_passes.values(),
+                return_exceptions=True,
+            )
+            if isinstance(chunked, BaseException):
+                raise chunked
+            findings, summary = chunked
+
+            structural_issues = []
+            ai_triages = []
+            for name, result in zip(side_passes, side_results):
+                if isinstance(result, BaseException):
+                    print(f"[AI] Pass '{name}' failed: {result}", flush=True)
+                elif name == "Structural":
+                    structural_issues = self.parser.parse_structural_issues(result)
+                else:
+                    ai_triages = self.parser.parse_ai_comment_triages(result)
+            return findings, structural_issues, ai_triages, summary
+
         # Use parallel orchestrator with SDK subagents if enabled
         if self.config.use_parallel_orchestrator:
             print(
@@ -461,6 +517,78 @@ class PRReviewEngine:
 
         return unique_findings, structural_issues, ai_triages, scan_result
 
+    async def run_chunked_review(
+        self, context: PRContext
+    ) -> tuple[list[PRReviewFinding], dict]:
+        """
+        Review a large PR in token-bounded chunks of changed files.
+
+        Each chunk gets the security and quality passes over its own
+        patches. Findings from all chunks are merged and de-duplicated.
+
+        Returns:
+            Tuple of (findings, summary with chunk counts and timings)
+        """
+        print(
+            f"[AI] PR too large for one pass ({len(context.changed_files)} files) - "
+            "reviewing in chunks...",
+            flush=True,
+        )
+        self._report_progress(
+            "analyzing",
+            35,
+            f"Reviewing {len(context.changed_files)} files in chunks...",
+            pr_number=context.pr_number,
+        )
+
+        async def review_chunk(chunk: ReviewChunk) -> list[PRReviewFinding]:
+            chunk_context = replace(
+                context,
+                description=(
+                    f"{context.description}\n\n"
+                    f"(Large PR reviewed in parts. This is part {chunk.index + 1}, "
+                    f"covering {len(chunk.files)} of {len(context.changed_files)} "
+                    f"changed files in: {', '.join(chunk.modules[:10])})"
+                ),
+                changed_files=chunk.files,
+                diff="",
+                diff_truncated=True,
+                total_additions=sum(f.additions for f in chunk.files),
+                total_deletions=sum(f.deletions for f in chunk.files),
+            )
+            findings = []
+            for review_pass in (ReviewPass.SECURITY, ReviewPass.QUALITY):
+                findings.extend(await self.run_review_pass(review_pass, chunk_context))
+            return findings
+
+        def on_chunk_done(chunk: ReviewChunk, stats: ChunkedReviewStats) -> None:
+            print(
+                f"[AI] Chunk {chunk.index + 1} reviewed ({len(chunk.files)} files); "
+                f"{stats.chunks} chunks, {stats.findings} findings so far",
+                flush=True,
+            )
+            self._report_progress(
+                "analyzing",
+                min(80, 35 + stats.chunks),
+                f"Reviewed {stats.chunks} chunks ({stats.findings} findings)...",
+                pr_number=context.pr_number,
+            )
+
+        review = ChunkedReview(
+            context.changed_files, review_chunk, on_chunk_done=on_chunk_done
+        )
+        findings = await review.run()
+        stats = review.stats
+        print(
+            f"[AI] Chunked review complete: {len(findings)} findings from "
+            f"{stats.chunks} chunks ({stats.chunks_failed} failed, "
+            f"{stats.duplicates} duplicates merged)",
+            flush=True,
+        )
+        if stats.chunks and stats.chunks_failed == stats.chunks:
+            raise RuntimeError(f"All review chunks failed: {stats.errors[0]}")
+        return findings, stats.to_dict()
+
     async def _run_structural_pass(self, context: PRContext) -> str:
         """Run the structural review pass."""
         from core.client import create_client
@@ -61,6 +61,7 @@ class TriageEngine:
         self, issue: dict, all_issues: list[dict]
     ) -> TriageResult:
         """Triage a single issue using AI."""
+        from core.agent_limiter import Priority
         from core.client import create_client
 
         # Build context with issue and potential duplicates
@@ -76,6 +77,7 @@ class TriageEngine:
             spec_dir=self.github_dir,
             model=self.config.model,
             agent_type="qa_reviewer",
+            priority=Priority.BACKGROUND,
         )
 
         try:
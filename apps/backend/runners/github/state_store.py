@@ -0,0 +1,524 @@
+"""
+Transactional State Store for GitHub Automation
+===============================================
+
+Embedded SQLite store (WAL mode) for the runner's mutable state.
+
+The runner used to keep each piece of state in its own JSON file and update
+it by loading, mutating and atomically rewriting the whole file under a
+FileLock. With several bot workers those updates serialize on the lock and
+rewrite ever-growing files. The store keeps the same data as one row per
+item (per PR, per repo, per issue) in ``state.db`` next to the JSON files:
+- readers never block (WAL), writers only lock for the rows' transaction
+- read-modify-write runs in a single ``BEGIN IMMEDIATE`` transaction
+- concurrent processes wait via SQLite's busy timeout instead of polling
+
+Namespaces used by the runner:
+    bot_detection   PR number -> reviewed commits and last review time
+    trust           repo -> TrustState
+    batch_index     issue number -> batch id
+    pr_reviews      PR number -> review index entry
+    autofix_queue   issue number -> auto-fix queue entry
+
+Documents the desktop app reads directly (review_N.json, autofix_N.json,
+triage_N.json, batch_*.json) stay JSON files.
+
+On first open, the legacy JSON state files are imported once and renamed to
+``*.migrated`` (see migrate_json_state).
+
+Example Usage:
+    store = get_state_store(github_dir)
+    store.put("trust", "owner/repo", state.to_dict())
+
+    def add_commit(entry):
+        entry = entry or {"reviewed_commits": []}
+        entry["reviewed_commits"].append(sha)
+        return entry
+
+    store.update("bot_detection", "42", add_commit)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+STATE_DB_NAME = "state.db"
+
+# Seconds a writer waits for another process's transaction before failing
+DEFAULT_BUSY_TIMEOUT = 5.0
+
+NS_BOT_DETECTION = "bot_detection"
+NS_TRUST = "trust"
+NS_BATCH_INDEX = "batch_index"
+NS_PR_REVIEWS = "pr_reviews"
+NS_AUTOFIX_QUEUE = "autofix_queue"
+
+_MIGRATION_KEY = "json_migrated_at"
+_MIGRATED_SUFFIX = ".migrated"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS state (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+class StateStoreError(Exception):
+    """Raised when the state store cannot be opened or written."""
+
+    pass
+
+
+class StateStore:
+    """
+    Key/value store with JSON values, grouped by namespace.
+
+    Each thread gets its own SQLite connection, so the store can be used
+    from the event loop and from executor threads alike.
+
+    Args:
+        db_path: Path to the SQLite database file (created if needed)
+        busy_timeout: Seconds to wait for a competing writer
+    """
+
+    def __init__(self, db_path: str | Path, busy_timeout: float = DEFAULT_BUSY_TIMEOUT):
+        self.db_path = Path(db_path)
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        # Bumped by close(); threads holding an older connection reopen
+        self._generation = 0
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        if not self.db_path.exists():
+            # Trust state lives here too - keep the file owner-only
+            os.close(os.open(str(self.db_path), os.O_CREAT | os.O_WRONLY, 0o600))
+
+        with self.transaction() as conn:
+            for statement in _SCHEMA.split(";"):
+                if statement.strip():
+                    conn.execute(statement)
+
+    # ------------------------------------------------------------------
+    # Connections and transactions
+    # ------------------------------------------------------------------
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.generation != self._generation:
+            try:
+                conn = sqlite3.connect(
+                    str(self.db_path),
+                    timeout=self.busy_timeout,
+                    isolation_level=None,  # Explicit transactions only
+                    check_same_thread=False,
+                )
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+            except sqlite3.Error as e:
+                raise StateStoreError(
+                    f"Cannot open state store {self.db_path}: {e}"
+                ) from e
+            self._local.conn = conn
+            self._local.generation = self._generation
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Write transaction spanning several operations.
+
+        IMMEDIATE takes the write lock up front, so a read-modify-write can't
+        interleave with another writer's.
+
+        Example:
+            with store.transaction() as conn:
+                store.put("trust", "a/b", data, conn=conn)
+                store.delete("batch_index", "12", conn=conn)
+        """
+        conn = self._connection()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+        except sqlite3.OperationalError as e:
+            raise StateStoreError(f"State store busy: {self.db_path}: {e}") from e
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def close(self) -> None:
+        """Close all connections opened by this store (reopened on next use)."""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+            self._generation += 1
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def get(self, namespace: str, key: str | int, default: Any = None) -> Any:
+        """Get the value stored under namespace/key."""
+        row = (
+            self._connection()
+            .execute(
+                "SELECT value FROM state WHERE namespace = ? AND key = ?",
+                (namespace, str(key)),
+            )
+            .fetchone()
+        )
+        return json.loads(row[0]) if row else default
+
+    def items(self, namespace: str) -> dict[str, Any]:
+        """All key/value pairs of a namespace."""
+        rows = (
+            self._connection()
+            .execute(
+                "SELECT key, value FROM state WHERE namespace = ? ORDER BY key",
+                (namespace,),
+            )
+            .fetchall()
+        )
+        return {key: json.loads(value) for key, value in rows}
+
+    def count(self, namespace: str) -> int:
+        """Number of keys in a namespace."""
+        row = (
+            self._connection()
+            .execute("SELECT COUNT(*) FROM state WHERE namespace = ?", (namespace,))
+            .fetchone()
+        )
+        return row[0]
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def put(
+        self,
+        namespace: str,
+        key: str | int,
+        value: Any,
+        conn: sqlite3.Connection | None = None,
+    ) -> None:
+        """Insert or replace the value under namespace/key."""
+        if conn is not None:
+            self._put(conn, namespace, str(key), value)
+            return
+        with self.transaction() as conn:
+            self._put(conn, namespace, str(key), value)
+
+    async def put_async(self, namespace: str, key: str | int, value: Any) -> None:
+        """put() run in the default executor."""
+        await asyncio.get_running_loop().run_in_executor(
+            None, self.put, namespace, key, value
+        )
+
+    def put_many(self, namespace: str, values: dict[str | int, Any]) -> None:
+        """Insert or replace several keys in one transaction."""
+        with self.transaction() as conn:
+            for key, value in values.items():
+                self._put(conn, namespace, str(key), value)
+
+    def replace_namespace(self, namespace: str, values: dict[str | int, Any]) -> None:
+        """Make a namespace contain exactly the given keys."""
+        with self.transaction() as conn:
+            conn.execute("DELETE FROM state WHERE namespace = ?", (namespace,))
+            for key, value in values.items():
+                self._put(conn, namespace, str(key), value)
+
+    def delete(
+        self,
+        namespace: str,
+        key: str | int,
+        conn: sqlite3.Connection | None = None,
+    ) -> None:
+        """Remove namespace/key (no error if missing)."""
+        sql = "DELETE FROM state WHERE namespace = ? AND key = ?"
+        if conn is not None:
+            conn.execute(sql, (namespace, str(key)))
+            return
+        with self.transaction() as conn:
+            conn.execute(sql, (namespace, str(key)))
+
+    def delete_many(self, namespace: str, keys: Iterable[str | int]) -> None:
+        """Remove several keys of a namespace in one transaction."""
+        with self.transaction() as conn:
+            conn.executemany(
+                "DELETE FROM state WHERE namespace = ? AND key = ?",
+                [(namespace, str(key)) for key in keys],
+            )
+
+    def update(
+        self,
+        namespace: str,
+        key: str | int,
+        updater: Callable[[Any], Any],
+    ) -> Any:
+        """
+        Atomic read-modify-write of a single key.
+
+        Args:
+            namespace: Namespace of the key
+            key: Key to update
+            updater: Function taking the current value (None if missing) and
+                returning the new value; returning None deletes the key
+
+        Returns:
+            The new value
+        """
+        key = str(key)
+        with self.transaction() as conn:
+            row = conn.execute(
+                "SELECT value FROM state WHERE namespace = ? AND key = ?",
+                (namespace, key),
+            ).fetchone()
+            value = updater(json.loads(row[0]) if row else None)
+            if value is None:
+                self.delete(namespace, key, conn=conn)
+            else:
+                self._put(conn, namespace, key, value)
+        return value
+
+    async def update_async(
+        self,
+        namespace: str,
+        key: str | int,
+        updater: Callable[[Any], Any],
+    ) -> Any:
+        """update() run in the default executor."""
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self.update, namespace, key, updater
+        )
+
+    @staticmethod
+    def _put(conn: sqlite3.Connection, namespace: str, key: str, value: Any) -> None:
+        conn.execute(
+            "INSERT INTO state (namespace, key, value, updated_at) "
+            "VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (namespace, key) DO UPDATE SET "
+            "value = excluded.value, updated_at = excluded.updated_at",
+            (namespace, key, json.dumps(value), time.time()),
+        )
+
+    # ------------------------------------------------------------------
+    # Metadata
+    # ------------------------------------------------------------------
+
+    def get_meta(self, key: str) -> str | None:
+        row = (
+            self._connection()
+            .execute("SELECT value FROM meta WHERE key = ?", (key,))
+            .fetchone()
+        )
+        return row[0] if row else None
+
+    def _set_meta(self, conn: sqlite3.Connection, key: str, value: str) -> None:
+        conn.execute(
+            "INSERT INTO meta (key, value) VALUES (?, ?) "
+            "ON CONFLICT (key) DO UPDATE SET value = excluded.value",
+            (key, value),
+        )
+
+
+# =============================================================================
+# JSON MIGRATION
+# =============================================================================
+
+
+def _read_json(path: Path) -> Any:
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning(f"Skipping unreadable state file {path}: {e}")
+        return None
+
+
+def _legacy_entries(state_dir: Path) -> tuple[dict[str, dict], list[Path]]:
+    """Collect rows to import from the legacy JSON files, per namespace."""
+    rows: dict[str, dict] = {}
+    files: list[Path] = []
+
+    bot_file = state_dir / "bot_detection_state.json"
+    if bot_file.exists():
+        data = _read_json(bot_file) or {}
+        commits = data.get("reviewed_commits", {})
+        times = data.get("last_review_times", {})
+        rows[NS_BOT_DETECTION] = {
+            str(pr): {
+                "reviewed_commits": commits.get(pr, []),
+                "last_review_time": times.get(pr),
+            }
+            for pr in {*commits, *times}
+        }
+        files.append(bot_file)
+
+    trust_dir = state_dir / "trust"
+    if trust_dir.is_dir():
+        trust_rows = {}
+        for trust_file in sorted(trust_dir.glob("*.json")):
+            data = _read_json(trust_file)
+            if isinstance(data, dict) and data.get("repo"):
+                trust_rows[data["repo"]] = data
+                files.append(trust_file)
+        rows[NS_TRUST] = trust_rows
+
+    batch_index = state_dir / "batches" / "index.json"
+    if batch_index.exists():
+        data = _read_json(batch_index) or {}
+        rows[NS_BATCH_INDEX] = {
+            str(k): v for k, v in data.get("issue_to_batch", {}).items()
+        }
+        files.append(batch_index)
+
+    pr_index = state_dir / "pr" / "index.json"
+    if pr_index.exists():
+        data = _read_json(pr_index) or {}
+        rows[NS_PR_REVIEWS] = {
+            str(r["pr_number"]): r for r in data.get("reviews", []) if "pr_number" in r
+        }
+        files.append(pr_index)
+
+    # Only the auto-fix queue is carried over: the index's "triaged" list was
+    # never populated (triage results live in triage_N.json), and the
+    # .migrated backup keeps it anyway
+    issues_index = state_dir / "issues" / "index.json"
+    if issues_index.exists():
+        data = _read_json(issues_index) or {}
+        rows[NS_AUTOFIX_QUEUE] = {
+            str(q["issue_number"]): q
+            for q in data.get("auto_fix_queue", [])
+            if "issue_number" in q
+        }
+        files.append(issues_index)
+
+    return rows, files
+
+
+def migrate_json_state(store: StateStore, state_dir: Path) -> int:
+    """
+    Import the legacy JSON state files into the store (once).
+
+    Existing rows win over imported ones, so re-running after a partial
+    migration can't overwrite newer state. Imported files are renamed to
+    ``<name>.migrated`` and kept as a backup.
+
+    Args:
+        store: Store to import into
+        state_dir: GitHub state directory (.auto-claude/github)
+
+    Returns:
+        Number of rows imported (0 if already migrated)
+    """
+    if store.get_meta(_MIGRATION_KEY) is not None:
+        return 0
+
+    rows, files = _legacy_entries(state_dir)
+    imported = 0
+    with store.transaction() as conn:
+        # Another process may have migrated while we were reading
+        if conn.execute(
+            "SELECT 1 FROM meta WHERE key = ?", (_MIGRATION_KEY,)
+        ).fetchone():
+            return 0
+        for namespace, values in rows.items():
+            for key, value in values.items():
+                cursor = conn.execute(
+                    "INSERT OR IGNORE INTO state (namespace, key, value, updated_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (namespace, key, json.dumps(value), time.time()),
+                )
+                imported += cursor.rowcount
+        store._set_meta(conn, _MIGRATION_KEY, str(time.time()))
+
+    for path in files:
+        try:
+            path.replace(path.with_name(path.name + _MIGRATED_SUFFIX))
+        except OSError as e:
+            logger.warning(f"Could not rename migrated state file {path}: {e}")
+
+    if imported:
+        logger.info(f"Migrated {imported} state entries from JSON to {store.db_path}")
+    return imported
+
+
+# =============================================================================
+# STORE REGISTRY
+# =============================================================================
+
+# Open stores kept per process; the least recently used are closed beyond this
+MAX_OPEN_STORES = 16
+
+_stores: OrderedDict[tuple[int, Path], StateStore] = OrderedDict()
+_stores_lock = threading.Lock()
+
+
+def get_state_store(state_dir: str | Path) -> StateStore:
+    """
+    Get the state store for a GitHub state directory.
+
+    Stores are shared per directory within a process (and re-opened after a
+    fork). The first open migrates legacy JSON state files.
+
+    Args:
+        state_dir: GitHub state directory (.auto-claude/github)
+
+    Returns:
+        StateStore backed by ``<state_dir>/state.db``
+    """
+    state_dir = Path(state_dir).resolve()
+    cache_key = (os.getpid(), state_dir)
+    evicted = []
+    with _stores_lock:
+        store = _stores.get(cache_key)
+        if store is None:
+            store = StateStore(state_dir / STATE_DB_NAME)
+            migrate_json_state(store, state_dir)
+            _stores[cache_key] = store
+            while len(_stores) > MAX_OPEN_STORES:
+                evicted.append(_stores.popitem(last=False)[1])
+        else:
+            _stores.move_to_end(cache_key)
+    for old in evicted:
+        old.close()
+    return store
+
+
+def close_state_stores() -> None:
+    """Close all cached stores (tests, shutdown)."""
+    with _stores_lock:
+        stores = list(_stores.values())
+        _stores.clear()
+    for store in stores:
+        store.close()
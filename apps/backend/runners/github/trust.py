@@ -15,13 +15,17 @@ Trust increases with accuracy, decreases with overrides.
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import IntEnum
 from pathlib import Path
 from typing import Any
 
+try:
+    from .state_store import NS_TRUST, get_state_store
+except (ImportError, ValueError, SystemError):
+    from state_store import NS_TRUST, get_state_store
+
 
 class TrustLevel(IntEnum):
     """Trust levels with increasing autonomy."""
@@ -405,45 +409,24 @@ class TrustManager:
 
     def __init__(self, state_dir: Path):
         self.state_dir = state_dir
-        self.trust_dir = state_dir / "trust"
-        self.trust_dir.mkdir(parents=True, exist_ok=True)
+        # Owner-only SQLite store shared with the other runner state
+        self._store = get_state_store(state_dir)
         self._states: dict[str, TrustState] = {}
 
-    def _get_state_file(self, repo: str) -> Path:
-        safe_name = repo.replace("/", "_")
-        return self.trust_dir / f"{safe_name}.json"
-
     def get_state(self, repo: str) -> TrustState:
         """Get trust state for a repository."""
         if repo in self._states:
             return self._states[repo]
 
-        state_file = self._get_state_file(repo)
-        if state_file.exists():
-            with open(state_file) as f:
-                data = json.load(f)
-                state = TrustState.from_dict(data)
-        else:
-            state = TrustState(repo=repo)
+        data = self._store.get(NS_TRUST, repo)
+        state = TrustState.from_dict(data) if data else TrustState(repo=repo)
 
         self._states[repo] = state
         return state
 
     def save_state(self, repo: str) -> None:
-        """Save trust state for a repository with secure file permissions."""
-        import os
-
-        state = self.get_state(repo)
-        state_file = self._get_state_file(repo)
-
-        # Write with restrictive permissions (0o600 = owner read/write only)
-        fd = os.open(str(state_file), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
-        try:
-            with os.fdopen(fd, "w") as f:
-                json.dump(state.to_dict(), f, indent=2)
-        except Exception:
-            os.close(fd)
-            raise
+        """Save trust state for a repository."""
+        self._store.put(NS_TRUST, repo, self.get_state(repo).to_dict())
 
     def get_trust_level(self, repo: str) -> TrustLevel:
         """Get current trust level for a repository."""
@@ -512,12 +495,9 @@ class TrustManager:
 
     def get_all_states(self) -> list[TrustState]:
         """Get trust states for all repos."""
-        states = []
-        for file in self.trust_dir.glob("*.json"):
-            with open(file) as f:
-                data = json.load(f)
-                states.append(TrustState.from_dict(data))
-        return states
+        return [
+            TrustState.from_dict(data) for data in self._store.items(NS_TRUST).values()
+        ]
 
     def get_summary(self) -> dict[str, Any]:
         """Get summary of trust across all repos."""
@@ -2,16 +2,23 @@
 GitLab API Client
 =================
 
-Client for GitLab API operations.
-Uses direct API calls with PRIVATE-TOKEN authentication.
+Async client for GitLab API operations.
+Uses direct API calls with PRIVATE-TOKEN authentication over pooled
+keep-alive connections, with ETag revalidation for GET requests.
+HTTP(S)_PROXY/NO_PROXY are honoured (HTTPS is tunnelled with CONNECT) and
+GET requests follow redirects.
 """
 
 from __future__ import annotations
 
+import asyncio
+import base64
+import http.client
 import json
-import time
+import threading
 import urllib.parse
 import urllib.request
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
@@ -33,6 +40,12 @@ def encode_project_path(project: str) -> str:
     return urllib.parse.quote(project, safe="")
 
 
+# Most GET responses kept for ETag revalidation per client
+DEFAULT_ETAG_CACHE_SIZE = 256
+# Redirects followed for one GET request
+MAX_REDIRECTS = 5
+_REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+
 # Valid GitLab API endpoint patterns
 VALID_ENDPOINT_PATTERNS = (
     "/projects/",
@@ -71,18 +84,192 @@ def validate_endpoint(endpoint: str) -> None:
         )
 
 
+class GitLabConnectionPool:
+    """
+    Keep-alive HTTP(S) connections to one GitLab instance.
+
+    Idle connections are reused across requests instead of opening a new
+    TCP/TLS connection each time. Safe to use from worker threads.
+
+    A proxy from the environment (urllib.request.getproxies, minus hosts
+    matched by NO_PROXY) is used like urllib does: plain HTTP requests are
+    sent to the proxy with an absolute URL, HTTPS is tunnelled via CONNECT.
+    """
+
+    def __init__(self, instance_url: str, max_idle: int = 8):
+        parts = urllib.parse.urlsplit(instance_url)
+        self.scheme = parts.scheme or "https"
+        self.host = parts.hostname or ""
+        self.port = parts.port
+        self.max_idle = max_idle
+        self._idle: list[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+        self.connections_opened = 0
+
+        self.proxy: urllib.parse.SplitResult | None = None
+        self._proxy_headers: dict[str, str] = {}
+        proxy_url = urllib.request.getproxies().get(self.scheme)
+        if proxy_url and not urllib.request.proxy_bypass(self.host):
+            if "://" not in proxy_url:
+                proxy_url = f"http://{proxy_url}"
+            self.proxy = urllib.parse.urlsplit(proxy_url)
+            if self.proxy.username:
+                credentials = urllib.parse.unquote(self.proxy.username)
+                credentials += ":" + urllib.parse.unquote(self.proxy.password or "")
+                token = base64.b64encode(credentials.encode()).decode("ascii")
+                self._proxy_headers["Proxy-Authorization"] = f"Basic {token}"
+
+    @property
+    def origin(self) -> str:
+        """scheme://host[:port] of the instance this pool talks to."""
+        netloc = f"{self.host}:{self.port}" if self.port else self.host
+        return f"{self.scheme}://{netloc}"
+
+    def _new_connection(self, timeout: float) -> http.client.HTTPConnection:
+        self.connections_opened += 1
+        if self.proxy is None:
+            host, port = self.host, self.port
+        else:
+            host, port = self.proxy.hostname, self.proxy.port
+
+        if self.scheme == "http":
+            return http.client.HTTPConnection(host, port, timeout=timeout)
+        conn = http.client.HTTPSConnection(host, port, timeout=timeout)
+        if self.proxy is not None:
+            conn.set_tunnel(self.host, self.port, headers=self._proxy_headers)
+        return conn
+
+    def _request_target(
+        self, path: str, headers: dict[str, str]
+    ) -> tuple[str, dict[str, str]]:
+        """Request line target and headers (absolute URL via an HTTP proxy)."""
+        if self.proxy is None or self.scheme != "http":
+            return path, headers
+        return f"{self.origin}{path}", {**headers, **self._proxy_headers}
+
+    def _acquire(self, timeout: float) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            if self._idle:
+                conn = self._idle.pop()
+                conn.timeout = timeout
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+                return conn, True
+        return self._new_connection(timeout), False
+
+    def _release(self, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        body: bytes | None,
+        headers: dict[str, str],
+        timeout: float,
+    ) -> tuple[int, http.client.HTTPMessage, bytes]:
+        """
+        Send one request and read the full response (blocking).
+
+        A reused connection the server has since closed is retried once on
+        a fresh connection.
+
+        Returns:
+            Tuple of (status, headers, body)
+        """
+        path, headers = self._request_target(path, headers)
+        conn, reused = self._acquire(timeout)
+        try:
+            try:
+                conn.request(method, path, body=body, headers=headers)
+                response = conn.getresponse()
+            except (http.client.RemoteDisconnected, ConnectionError):
+                if not reused:
+                    raise
+                conn.close()
+                conn = self._new_connection(timeout)
+                conn.request(method, path, body=body, headers=headers)
+                response = conn.getresponse()
+            data = response.read()
+        except Exception:
+            conn.close()
+            raise
+
+        if response.will_close:
+            conn.close()
+        else:
+            self._release(conn)
+        return response.status, response.headers, data
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+
+def _retry_after_seconds(retry_after: str | None, attempt: int) -> float:
+    """Wait time for a 429, from Retry-After or exponential backoff."""
+    # Default to exponential backoff: 1s, 2s, 4s
+    wait_time = 2**attempt
+    if retry_after:
+        try:
+            # Try parsing as integer seconds first
+            wait_time = int(retry_after)
+        except ValueError:
+            # Try parsing as HTTP-date (e.g., "Wed, 21 Oct 2015 07:28:00 GMT")
+            try:
+                retry_date = parsedate_to_datetime(retry_after)
+                now = datetime.now(timezone.utc)
+                delta = (retry_date - now).total_seconds()
+                wait_time = max(1, int(delta))  # At least 1 second
+            except (ValueError, TypeError):
+                # Parsing failed, keep exponential backoff default
+                pass
+    return wait_time
+
+
 class GitLabClient:
-    """Client for GitLab API operations."""
+    """
+    Async client for GitLab API operations.
+
+    Requests go over a keep-alive connection pool. The blocking socket I/O
+    runs in a worker thread and rate-limit backoff uses asyncio.sleep, so a
+    slow request never stalls the event loop. GET responses are cached by
+    ETag in a bounded LRU and revalidated with If-None-Match; a 304 reuses
+    the cached body.
+
+    Use it as an async context manager (or call close()) so pooled
+    keep-alive sockets are released when the work is done.
+    """
 
     def __init__(
         self,
         project_dir: Path,
         config: GitLabConfig,
         default_timeout: float = 30.0,
+        etag_cache_size: int = DEFAULT_ETAG_CACHE_SIZE,
     ):
         self.project_dir = Path(project_dir)
         self.config = config
         self.default_timeout = default_timeout
+        self.pool = GitLabConnectionPool(config.instance_url)
+        # Pools for other origins reached through redirects
+        self._redirect_pools: dict[str, GitLabConnectionPool] = {}
+        self.etag_cache_size = etag_cache_size
+        # GET path -> (etag, raw response body), least recently used first
+        self._etag_cache: OrderedDict[str, tuple[str, bytes]] = OrderedDict()
+
+    async def __aenter__(self) -> GitLabClient:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
 
     def _api_url(self, endpoint: str) -> str:
         """Build full API URL."""
@@ -91,7 +278,19 @@ class GitLabClient:
             endpoint = f"/{endpoint}"
         return f"{base}/api/v4{endpoint}"
 
-    def _fetch(
+    def _api_path(self, endpoint: str) -> str:
+        """Build the request path (without scheme and host) for an endpoint."""
+        parts = urllib.parse.urlsplit(self._api_url(endpoint))
+        return f"{parts.path}?{parts.query}" if parts.query else parts.path
+
+    @staticmethod
+    def _decode(body: bytes) -> Any:
+        try:
+            return json.loads(body.decode("utf-8"))
+        except json.JSONDecodeError as e:
+            raise Exception(f"Invalid JSON response from GitLab: {e}") from e
+
+    async def _fetch(
         self,
         endpoint: str,
         method: str = "GET",
@@ -101,93 +300,119 @@ class GitLabClient:
     ) -> Any:
         """Make an API request to GitLab with rate limit handling."""
         validate_endpoint(endpoint)
-        url = self._api_url(endpoint)
+        path = self._api_path(endpoint)
         headers = {
             "PRIVATE-TOKEN": self.config.token,
             "Content-Type": "application/json",
         }
 
+        cached = self._etag_cache.get(path) if method == "GET" else None
+        if cached:
+            self._etag_cache.move_to_end(path)
+            headers["If-None-Match"] = cached[0]
+
         request_data = None
         if data:
             request_data = json.dumps(data).encode("utf-8")
 
-        last_error = None
         for attempt in range(max_retries):
-            req = urllib.request.Request(
-                url,
-                data=request_data,
-                headers=headers,
-                method=method,
+            status, response_headers, body = await self._send(
+                method, path, request_data, headers, timeout or self.default_timeout
             )
 
-            try:
-                with urllib.request.urlopen(
-                    req, timeout=timeout or self.default_timeout
-                ) as response:
-                    if response.status == 204:
-                        return None
-                    response_body = response.read().decode("utf-8")
-                    try:
-                        return json.loads(response_body)
-                    except json.JSONDecodeError as e:
-                        raise Exception(
-                            f"Invalid JSON response from GitLab: {e}"
-                        ) from e
-            except urllib.error.HTTPError as e:
-                error_body = e.read().decode("utf-8") if e.fp else ""
-                last_error = e
-
-                # Handle rate limit (429) with exponential backoff
-                if e.code == 429:
-                    # Default to exponential backoff: 1s, 2s, 4s
-                    wait_time = 2**attempt
-
-                    # Check for Retry-After header (can be integer seconds or HTTP-date)
-                    retry_after = e.headers.get("Retry-After")
-                    if retry_after:
-                        try:
-                            # Try parsing as integer seconds first
-                            wait_time = int(retry_after)
-                        except ValueError:
-                            # Try parsing as HTTP-date (e.g., "Wed, 21 Oct 2015 07:28:00 GMT")
-                            try:
-                                retry_date = parsedate_to_datetime(retry_after)
-                                now = datetime.now(timezone.utc)
-                                delta = (retry_date - now).total_seconds()
-                                wait_time = max(1, int(delta))  # At least 1 second
-                            except (ValueError, TypeError):
-                                # Parsing failed, keep exponential backoff default
-                                pass
-
-                    if attempt < max_retries - 1:
-                        print(
-                            f"[GitLab] Rate limited (429). Retrying in {wait_time}s "
-                            f"(attempt {attempt + 1}/{max_retries})...",
-                            flush=True,
-                        )
-                        time.sleep(wait_time)
-                        continue
-
-                raise Exception(f"GitLab API error {e.code}: {error_body}") from e
+            if status == 304 and cached:
+                return self._decode(cached[1])
+            if status == 204:
+                return None
+            if 200 <= status < 300:
+                result = self._decode(body)
+                etag = response_headers.get("ETag")
+                if method == "GET" and etag:
+                    self._cache_response(path, etag, body)
+                return result
+
+            # Handle rate limit (429) with non-blocking backoff
+            if status == 429 and attempt < max_retries - 1:
+                wait_time = _retry_after_seconds(
+                    response_headers.get("Retry-After"), attempt
+                )
+                print(
+                    f"[GitLab] Rate limited (429). Retrying in {wait_time}s "
+                    f"(attempt {attempt + 1}/{max_retries})...",
+                    flush=True,
+                )
+                await asyncio.sleep(wait_time)
+                continue
+
+            error_body = body.decode("utf-8", errors="replace")
+            raise Exception(f"GitLab API error {status}: {error_body}")
 
         # Should not reach here, but just in case
-        raise Exception(f"GitLab API error after {max_retries} retries") from last_error
+        raise Exception(f"GitLab API error after {max_retries} retries")
 
-    def get_mr(self, mr_iid: int) -> dict:
+    def _pool_for(self, origin: str) -> GitLabConnectionPool:
+        if origin == self.pool.origin:
+            return self.pool
+        pool = self._redirect_pools.get(origin)
+        if pool is None:
+            pool = self._redirect_pools[origin] = GitLabConnectionPool(origin)
+        return pool
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        body: bytes | None,
+        headers: dict[str, str],
+        timeout: float,
+    ) -> tuple[int, http.client.HTTPMessage, bytes]:
+        """Send a request in a worker thread, following redirects for GET."""
+        pool = self.pool
+        for _ in range(MAX_REDIRECTS + 1):
+            status, response_headers, data = await asyncio.to_thread(
+                pool.request, method, path, body, headers, timeout
+            )
+            location = response_headers.get("Location")
+            if method != "GET" or status not in _REDIRECT_STATUSES or not location:
+                return status, response_headers, data
+
+            target = urllib.parse.urlsplit(
+                urllib.parse.urljoin(f"{pool.origin}{path}", location)
+            )
+            if pool.scheme == "https" and target.scheme != "https":
+                raise Exception(f"Refusing GitLab redirect from HTTPS to {location}")
+            pool = self._pool_for(f"{target.scheme}://{target.netloc}")
+            path = f"{target.path}?{target.query}" if target.query else target.path
+        raise Exception(f"GitLab API error: more than {MAX_REDIRECTS} redirects")
+
+    def _cache_response(self, path: str, etag: str, body: bytes) -> None:
+        """Remember a GET response, evicting the least recently used ones."""
+        self._etag_cache[path] = (etag, body)
+        self._etag_cache.move_to_end(path)
+        while len(self._etag_cache) > self.etag_cache_size:
+            self._etag_cache.popitem(last=False)
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        self.pool.close()
+        for pool in self._redirect_pools.values():
+            pool.close()
+
+    async def get_mr(self, mr_iid: int) -> dict:
         """Get MR details."""
         encoded_project = encode_project_path(self.config.project)
-        return self._fetch(f"/projects/{encoded_project}/merge_requests/{mr_iid}")
+        return await self._fetch(f"/projects/{encoded_project}/merge_requests/{mr_iid}")
 
-    def get_mr_changes(self, mr_iid: int) -> dict:
+    async def get_mr_changes(self, mr_iid: int) -> dict:
         """Get MR changes (diff)."""
         encoded_project = encode_project_path(self.config.project)
-        return self._fetch(
+        return await self._fetch(
             f"/projects/{encoded_project}/merge_requests/{mr_iid}/changes"
         )
 
-    def get_mr_diff(self, mr_iid: int) -> str:
+    async def get_mr_diff(self, mr_iid: int) -> str:
         """Get the full diff for an MR."""
-        changes = self.get_mr_changes(mr_iid)
+        changes = await self.get_mr_changes(mr_iid)
         diffs = []
         for change in changes.get("changes", []):
             diff = change.get("diff", "")
@@ -195,50 +420,64 @@ class GitLabClient:
                 diffs.append(diff)
         return "\n".join(diffs)
 
-    def get_mr_commits(self, mr_iid: int) -> list[dict]:
+    async def get_mr_commits(self, mr_iid: int) -> list[dict]:
         """Get commits for an MR."""
         encoded_project = encode_project_path(self.config.project)
-        return self._fetch(
+        return await self._fetch(
             f"/projects/{encoded_project}/merge_requests/{mr_iid}/commits"
         )
 
-    def get_current_user(self) -> dict:
+    async def get_mr_bundle(self, mr_iid: int) -> tuple[dict, dict, list[dict]]:
+        """
+        Fetch MR details, changes and commits concurrently.
+
+        Returns:
+            Tuple of (mr, changes, commits)
+        """
+        mr, changes, commits = await asyncio.gather(
+            self.get_mr(mr_iid),
+            self.get_mr_changes(mr_iid),
+            self.get_mr_commits(mr_iid),
+        )
+        return mr, changes, commits
+
+    async def get_current_user(self) -> dict:
         """Get current authenticated user."""
-        return self._fetch("/user")
+        return await self._fetch("/user")
 
-    def post_mr_note(self, mr_iid: int, body: str) -> dict:
+    async def post_mr_note(self, mr_iid: int, body: str) -> dict:
         """Post a note (comment) to an MR."""
         encoded_project = encode_project_path(self.config.project)
-        return self._fetch(
+        return await self._fetch(
             f"/projects/{encoded_project}/merge_requests/{mr_iid}/notes",
             method="POST",
             data={"body": body},
         )
 
-    def approve_mr(self, mr_iid: int) -> dict:
+    async def approve_mr(self, mr_iid: int) -> dict:
         """Approve an MR."""
         encoded_project = encode_project_path(self.config.project)
-        return self._fetch(
+        return await self._fetch(
             f"/projects/{encoded_project}/merge_requests/{mr_iid}/approve",
             method="POST",
         )
 
-    def merge_mr(self, mr_iid: int, squash: bool = False) -> dict:
+    async def merge_mr(self, mr_iid: int, squash: bool = False) -> dict:
         """Merge an MR."""
         encoded_project = encode_project_path(self.config.project)
         data = {}
         if squash:
             data["squash"] = True
-        return self._fetch(
+        return await self._fetch(
             f"/projects/{encoded_project}/merge_requests/{mr_iid}/merge",
             method="PUT",
             data=data if data else None,
         )
 
-    def assign_mr(self, mr_iid: int, user_ids: list[int]) -> dict:
+    async def assign_mr(self, mr_iid: int, user_ids: list[int]) -> dict:
         """Assign users to an MR."""
         encoded_project = encode_project_path(self.config.project)
-        return self._fetch(
+        return await self._fetch(
             f"/projects/{encoded_project}/merge_requests/{mr_iid}",
             method="PUT",
             data={"assignee_ids": user_ids},
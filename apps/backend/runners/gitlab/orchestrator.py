@@ -52,13 +52,12 @@ class GitLabOrchestrator:
     Orchestrates GitLab automation workflows.
 
     Usage:
-        orchestrator = GitLabOrchestrator(
+        async with GitLabOrchestrator(
             project_dir=Path("/path/to/project"),
             config=config,
-        )
-
-        # Review an MR
-        result = await orchestrator.review_mr(mr_iid=123)
+        ) as orchestrator:
+            # Review an MR
+            result = await orchestrator.review_mr(mr_iid=123)
     """
 
     def __init__(
@@ -96,6 +95,16 @@ class GitLabOrchestrator:
             progress_callback=self._forward_progress,
         )
 
+    async def __aenter__(self) -> GitLabOrchestrator:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the GitLab client's pooled connections."""
+        self.client.close()
+
     def _report_progress(
         self,
         phase: str,
@@ -123,14 +132,8 @@ class GitLabOrchestrator:
         """Gather context for an MR."""
         print(f"[GitLab] Fetching MR !{mr_iid} data...", flush=True)
 
-        # Get MR details
-        mr_data = self.client.get_mr(mr_iid)
-
-        # Get changes
-        changes_data = self.client.get_mr_changes(mr_iid)
-
-        # Get commits
-        commits = self.client.get_mr_commits(mr_iid)
+        # MR details, changes and commits are independent; fetch them together
+        mr_data, changes_data, commits = await self.client.get_mr_bundle(mr_iid)
 
         # Build diff from changes
         diffs = []
@@ -131,15 +131,15 @@ async def cmd_review_mr(args) -> int:
     )
 
     print("[DEBUG] Creating orchestrator...", flush=True)
-    orchestrator = GitLabOrchestrator(
+    async with GitLabOrchestrator(
         project_dir=args.project_dir,
         config=config,
         progress_callback=print_progress,
-    )
-    print("[DEBUG] Orchestrator created", flush=True)
+    ) as orchestrator:
+        print("[DEBUG] Orchestrator created", flush=True)
 
-    print(f"[DEBUG] Calling orchestrator.review_mr({args.mr_iid})...", flush=True)
-    result = await orchestrator.review_mr(args.mr_iid)
+        print(f"[DEBUG] Calling orchestrator.review_mr({args.mr_iid})...", flush=True)
+        result = await orchestrator.review_mr(args.mr_iid)
     print(f"[DEBUG] review_mr returned, success={result.success}", flush=True)
 
     if result.success:
@@ -183,22 +183,23 @@ async def cmd_followup_review_mr(args) -> int:
     )
 
     print("[DEBUG] Creating orchestrator...", flush=True)
-    orchestrator = GitLabOrchestrator(
+    async with GitLabOrchestrator(
         project_dir=args.project_dir,
         config=config,
         progress_callback=print_progress,
-    )
-    print("[DEBUG] Orchestrator created", flush=True)
+    ) as orchestrator:
+        print("[DEBUG] Orchestrator created", flush=True)
 
-    print(
-        f"[DEBUG] Calling orchestrator.followup_review_mr({args.mr_iid})...", flush=True
-    )
+        print(
+            f"[DEBUG] Calling orchestrator.followup_review_mr({args.mr_iid})...",
+            flush=True,
+        )
 
-    try:
-        result = await orchestrator.followup_review_mr(args.mr_iid)
-    except ValueError as e:
-        print(f"\nFollow-up review failed: {e}")
-        return 1
+        try:
+            result = await orchestrator.followup_review_mr(args.mr_iid)
+        except ValueError as e:
+            print(f"\nFollow-up review failed: {e}")
+            return 1
 
     print(f"[DEBUG] followup_review_mr returned, success={result.success}", flush=True)
 
@@ -17,6 +17,8 @@ Main functions:
 - validate_command: Standalone validation function for testing
 - get_security_profile: Get or create security profile for a project
 - reset_profile_cache: Reset cached security profile
+- warm_profile_cache: Pre-analyze several projects/worktrees concurrently
+- get_profile_cache_stats: Profile cache hit/miss statistics
 
 Command parsing:
 - extract_commands: Extract command names from shell strings
@@ -46,8 +48,11 @@ from .parser import (
 
 # Profile management
 from .profile import (
+    discover_worktree_dirs,
+    get_profile_cache_stats,
     get_security_profile,
     reset_profile_cache,
+    warm_profile_cache,
 )
 
 # Tool input validation
@@ -81,6 +86,9 @@ __all__ = [
     "validate_command",
     "get_security_profile",
     "reset_profile_cache",
+    "warm_profile_cache",
+    "discover_worktree_dirs",
+    "get_profile_cache_stats",
     # Parsing utilities
     "extract_commands",
     "split_command_segments",
@@ -4,8 +4,19 @@ Security Profile Management
 
 Manages security profiles for projects, including caching and validation.
 Uses project_analyzer to create dynamic security profiles based on detected stacks.
+
+Profiles are cached per (project_dir, spec_dir) in a small LRU so that
+processes alternating between many worktrees and repos (the GitHub bot,
+parallel spec runs) don't re-run analysis on every switch. Each entry is
+validated against the mtime of its own profile file.
 """
 
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass
 from pathlib import Path
 
 from project_analyzer import (
@@ -18,35 +29,105 @@ from project_analyzer import (
 # GLOBAL STATE
 # =============================================================================
 
-# Cache the security profile to avoid re-analyzing on every command
-_cached_profile: SecurityProfile | None = None
-_cached_project_dir: Path | None = None
-_cached_spec_dir: Path | None = None  # Track spec directory for cache key
-_cached_profile_mtime: float | None = None  # Track file modification time
+PROFILE_CACHE_SIZE_ENV = "AUTO_CLAUDE_PROFILE_CACHE_SIZE"
+DEFAULT_MAX_CACHED_PROFILES = 32
+
+
+def _get_max_cached_profiles() -> int:
+    """Configured profile cache size (the default if unset or invalid)."""
+    try:
+        return int(os.environ.get(PROFILE_CACHE_SIZE_ENV, DEFAULT_MAX_CACHED_PROFILES))
+    except ValueError:
+        return DEFAULT_MAX_CACHED_PROFILES
+
+
+# Maximum number of (project_dir, spec_dir) profiles kept in memory
+MAX_CACHED_PROFILES = _get_max_cached_profiles()
+
+_CacheKey = tuple[Path, Path | None]
+
+
+@dataclass
+class _CacheEntry:
+    profile: SecurityProfile
+    mtime: float | None  # Profile file mtime when cached (None = no file)
+
+
+# Cache security profiles to avoid re-analyzing on every command
+_profile_cache: OrderedDict[_CacheKey, _CacheEntry] = OrderedDict()
+_cache_lock = threading.Lock()
+
+# Per-key locks so concurrent callers (e.g. warmup + hook) analyze a key once
+_key_locks: dict[_CacheKey, threading.Lock] = {}
 
+_stats = {"hits": 0, "misses": 0, "invalidations": 0, "evictions": 0}
 
-def _get_profile_path(project_dir: Path) -> Path:
-    """Get the security profile file path for a project."""
-    return project_dir / ProjectAnalyzer.PROFILE_FILENAME
 
+def _get_profile_path(project_dir: Path, spec_dir: Path | None = None) -> Path:
+    """Get the security profile file path (spec_dir wins, like ProjectAnalyzer)."""
+    base = spec_dir if spec_dir else project_dir
+    return base / ProjectAnalyzer.PROFILE_FILENAME
 
-def _get_profile_mtime(project_dir: Path) -> float | None:
+
+def _get_profile_mtime(project_dir: Path, spec_dir: Path | None = None) -> float | None:
     """Get the modification time of the security profile file, or None if not exists."""
-    profile_path = _get_profile_path(project_dir)
+    profile_path = _get_profile_path(project_dir, spec_dir)
     try:
         return profile_path.stat().st_mtime if profile_path.exists() else None
     except OSError:
         return None
 
 
+def _make_key(project_dir: Path, spec_dir: Path | None) -> _CacheKey:
+    return (
+        Path(project_dir).resolve(),
+        Path(spec_dir).resolve() if spec_dir else None,
+    )
+
+
+def _lookup(key: _CacheKey) -> SecurityProfile | None:
+    """Return a still-valid cached profile and mark it recently used."""
+    with _cache_lock:
+        entry = _profile_cache.get(key)
+        if entry is None:
+            return None
+
+        # Cache is valid if:
+        # - Both are None (file never existed and still doesn't)
+        # - Both have same mtime (file unchanged)
+        if _get_profile_mtime(*key) != entry.mtime:
+            # File was created or modified - invalidate this entry
+            # (This happens when analyzer creates the file after agent starts)
+            del _profile_cache[key]
+            _stats["invalidations"] += 1
+            return None
+
+        _profile_cache.move_to_end(key)
+        _stats["hits"] += 1
+        return entry.profile
+
+
+def _store(key: _CacheKey, profile: SecurityProfile) -> None:
+    with _cache_lock:
+        _profile_cache[key] = _CacheEntry(profile, _get_profile_mtime(*key))
+        _profile_cache.move_to_end(key)
+        while len(_profile_cache) > max(MAX_CACHED_PROFILES, 1):
+            evicted, _ = _profile_cache.popitem(last=False)
+            _stats["evictions"] += 1
+            # Keep the lock while another thread is still analyzing the key
+            lock = _key_locks.get(evicted)
+            if lock is not None and not lock.locked():
+                del _key_locks[evicted]
+
+
 def get_security_profile(
     project_dir: Path, spec_dir: Path | None = None
 ) -> SecurityProfile:
     """
     Get the security profile for a project, using cache when possible.
 
-    The cache is invalidated when:
-    - The project directory changes
+    Each (project_dir, spec_dir) pair has its own cache entry, which is
+    invalidated when:
     - The security profile file is created (was None, now exists)
     - The security profile file is modified (mtime changed)
 
@@ -57,41 +138,110 @@ def get_security_profile(
     Returns:
         SecurityProfile for the project
     """
-    global _cached_profile, _cached_project_dir, _cached_spec_dir, _cached_profile_mtime
+    key = _make_key(project_dir, spec_dir)
+
+    profile = _lookup(key)
+    if profile is not None:
+        return profile
+
+    with _cache_lock:
+        key_lock = _key_locks.setdefault(key, threading.Lock())
+
+    with key_lock:
+        # Another thread may have analyzed this key while we waited
+        profile = _lookup(key)
+        if profile is not None:
+            return profile
+
+        with _cache_lock:
+            _stats["misses"] += 1
+
+        # Analyze and cache
+        profile = get_or_create_profile(key[0], key[1])
+        _store(key, profile)
+        return profile
+
+
+def warm_profile_cache(
+    targets: Iterable[Path | tuple[Path, Path | None]],
+    max_workers: int = 4,
+    block: bool = True,
+) -> int:
+    """
+    Analyze several projects/worktrees concurrently to pre-fill the cache.
 
+    Intended for startup, so the first command in each worktree doesn't pay
+    for project analysis.
+
+    Args:
+        targets: Project dirs, or (project_dir, spec_dir) pairs
+        max_workers: Maximum number of concurrent analyses
+        block: Wait for all analyses to finish before returning
+
+    Returns:
+        Number of distinct profiles scheduled for warmup
+    """
+    keys: list[_CacheKey] = []
+    for target in targets:
+        if isinstance(target, tuple):
+            key = _make_key(*target)
+        else:
+            key = _make_key(target, None)
+        if key not in keys:
+            keys.append(key)
+
+    if not keys:
+        return 0
+
+    executor = ThreadPoolExecutor(
+        max_workers=max(1, min(max_workers, len(keys))),
+        thread_name_prefix="profile-warmup",
+    )
+    futures = [executor.submit(get_security_profile, *key) for key in keys]
+    executor.shutdown(wait=False)
+
+    if block:
+        wait(futures)
+    return len(keys)
+
+
+def discover_worktree_dirs(project_dir: Path) -> list[Path]:
+    """
+    List the project root plus every spec worktree under .worktrees/.
+
+    Args:
+        project_dir: Main project directory
+
+    Returns:
+        Paths suitable for warm_profile_cache()
+    """
     project_dir = Path(project_dir).resolve()
-    resolved_spec_dir = Path(spec_dir).resolve() if spec_dir else None
-
-    # Check if cache is valid (both project_dir and spec_dir must match)
-    if (
-        _cached_profile is not None
-        and _cached_project_dir == project_dir
-        and _cached_spec_dir == resolved_spec_dir
-    ):
-        # Check if file has been created or modified since caching
-        current_mtime = _get_profile_mtime(project_dir)
-        # Cache is valid if:
-        # - Both are None (file never existed and still doesn't)
-        # - Both have same mtime (file unchanged)
-        if current_mtime == _cached_profile_mtime:
-            return _cached_profile
+    dirs = [project_dir]
+    worktrees_dir = project_dir / ".worktrees"
+    if worktrees_dir.is_dir():
+        dirs.extend(sorted(p for p in worktrees_dir.iterdir() if p.is_dir()))
+    return dirs
 
-        # File was created or modified - invalidate cache
-        # (This happens when analyzer creates the file after agent starts)
 
-    # Analyze and cache
-    _cached_profile = get_or_create_profile(project_dir, spec_dir)
-    _cached_project_dir = project_dir
-    _cached_spec_dir = resolved_spec_dir
-    _cached_profile_mtime = _get_profile_mtime(project_dir)
+def get_profile_cache_stats() -> dict:
+    """
+    Get profile cache statistics.
 
-    return _cached_profile
+    Returns:
+        Dict with hits, misses, invalidations, evictions, size and hit_rate
+    """
+    with _cache_lock:
+        stats = dict(_stats)
+        stats["size"] = len(_profile_cache)
+    lookups = stats["hits"] + stats["misses"]
+    stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+    return stats
 
 
 def reset_profile_cache() -> None:
-    """Reset the cached profile (useful for testing or re-analysis)."""
-    global _cached_profile, _cached_project_dir, _cached_spec_dir, _cached_profile_mtime
-    _cached_profile = None
-    _cached_project_dir = None
-    _cached_spec_dir = None
-    _cached_profile_mtime = None
+    """Reset the cached profiles and statistics (useful for testing or re-analysis)."""
+    with _cache_lock:
+        _profile_cache.clear()
+        _key_locks.clear()
+        for name in _stats:
+            _stats[name] = 0
@@ -5,6 +5,7 @@ Service Orchestrator Module
 
 Orchestrates multi-service environments for testing.
 Handles docker-compose, monorepo service discovery, and health checks.
+Health checks run concurrently for all services (see services.readiness).
 
 The service orchestrator is used by:
 - QA Agent: To start services before integration/e2e tests
@@ -23,11 +24,24 @@ Usage:
 import json
 import shlex
 import subprocess
-import time
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from .readiness import (
+    LogTail,
+    ReadinessReport,
+    ServiceCheck,
+    compose_log_reader,
+    http_probe,
+    log_probe,
+    tcp_probe,
+    wait_for_services,
+)
+
+# docker-compose label with a regex for the log line that marks a service ready
+READY_LOG_LABEL = "auto-claude.ready-log"
+
 # =============================================================================
 # DATA CLASSES
 # =============================================================================
@@ -44,8 +58,11 @@ class ServiceConfig:
         port: Port the service runs on
         type: Type of service (docker, local, mock)
         health_check_url: URL for health check
+        health_check_derived: Whether health_check_url was guessed from the
+            port rather than configured
         startup_command: Command to start the service
         startup_timeout: Timeout in seconds for startup
+        ready_log_pattern: Regex for the output line that marks the service ready
     """
 
     name: str
@@ -53,8 +70,10 @@ class ServiceConfig:
     port: int | None = None
     type: str = "docker"  # docker, local, mock
     health_check_url: str | None = None
+    health_check_derived: bool = False
     startup_command: str | None = None
     startup_timeout: int = 120
+    ready_log_pattern: str | None = None
 
 
 @dataclass
@@ -67,12 +86,14 @@ class OrchestrationResult:
         services_started: List of services that were started
         services_failed: List of services that failed to start
         errors: List of error messages
+        time_to_ready: Seconds each service took to become ready
     """
 
     success: bool = False
     services_started: list[str] = field(default_factory=list)
     services_failed: list[str] = field(default_factory=list)
     errors: list[str] = field(default_factory=list)
+    time_to_ready: dict[str, float] = field(default_factory=dict)
 
 
 # =============================================================================
@@ -101,6 +122,7 @@ class ServiceOrchestrator:
         self._compose_file: Path | None = None
         self._services: list[ServiceConfig] = []
         self._processes: dict[str, subprocess.Popen] = {}
+        self._log_tails: dict[str, LogTail] = {}
         self._discover_services()
 
     def _discover_services(self) -> None:
@@ -198,11 +220,26 @@ class ServiceOrchestrator:
                         port=port,
                         type="docker",
                         health_check_url=health_url,
+                        health_check_derived=health_url is not None,
+                        ready_log_pattern=self._compose_label(config, READY_LOG_LABEL),
                     )
                 )
         except Exception:
             pass
 
+    @staticmethod
+    def _compose_label(config: dict[str, Any], key: str) -> str | None:
+        """Read a label from a compose service (mapping or KEY=VALUE list)."""
+        labels = config.get("labels") or {}
+        if isinstance(labels, dict):
+            value = labels.get(key)
+            return str(value) if value is not None else None
+        for label in labels:
+            name, _, value = str(label).partition("=")
+            if name == key:
+                return value
+        return None
+
     def _discover_monorepo_services(self) -> None:
         """Discover services in a monorepo structure."""
         # Common monorepo patterns
@@ -315,12 +352,15 @@ class ServiceOrchestrator:
                 return result
 
             # Wait for health checks
-            if self._wait_for_health(timeout):
+            report = self._wait_for_health(timeout)
+            result.time_to_ready = report.ready
+            if report.all_ready:
                 result.success = True
                 result.services_started = [s.name for s in self._services]
             else:
-                result.errors.append("Services did not become healthy in time")
-                result.services_failed = [s.name for s in self._services]
+                result.errors.append(self._not_ready_error(report))
+                result.services_started = list(report.ready)
+                result.services_failed = list(report.not_ready)
 
         except subprocess.TimeoutExpired:
             result.errors.append("docker-compose startup timed out")
@@ -345,9 +385,10 @@ class ServiceOrchestrator:
                         if service.path
                         else self.project_dir,
                         stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
+                        stderr=subprocess.STDOUT,
                     )
                     self._processes[service.name] = proc
+                    self._log_tails[service.name] = LogTail(proc.stdout)
                     result.services_started.append(service.name)
                 except Exception as e:
                     result.errors.append(f"Failed to start {service.name}: {str(e)}")
@@ -355,10 +396,12 @@ class ServiceOrchestrator:
 
         # Wait for services to be ready
         if result.services_started:
-            if self._wait_for_health(timeout):
+            report = self._wait_for_health(timeout)
+            result.time_to_ready = report.ready
+            if report.all_ready:
                 result.success = True
             else:
-                result.errors.append("Services did not become healthy in time")
+                result.errors.append(self._not_ready_error(report))
 
         return result
 
@@ -395,6 +438,7 @@ class ServiceOrchestrator:
                 except Exception:
                     pass
         self._processes.clear()
+        self._log_tails.clear()
 
     def _get_docker_compose_cmd(self) -> list[str] | None:
         """Get the docker-compose command (v1 or v2)."""
@@ -424,45 +468,68 @@ class ServiceOrchestrator:
 
         return None
 
-    def _wait_for_health(self, timeout: int) -> bool:
+    def _readiness_check(self, service: ServiceConfig) -> ServiceCheck | None:
         """
-        Wait for all services to become healthy.
+        Build the readiness check for a service.
 
-        Args:
-            timeout: Maximum time to wait in seconds
-
-        Returns:
-            True if all services became healthy
+        A ready-log pattern takes precedence, then a configured HTTP health
+        URL, then a TCP connect to the port. A health URL derived from the
+        port is not probed over HTTP, since the service may not speak HTTP.
+        Services with none of these are not waited for.
         """
-        start_time = time.time()
-
-        while time.time() - start_time < timeout:
-            all_healthy = True
+        proc = self._processes.get(service.name)
+        alive = (lambda: proc.poll() is None) if proc else None
+
+        if service.ready_log_pattern:
+            tail = self._log_tails.get(service.name)
+            if tail is not None:
+                event = tail.watch(service.ready_log_pattern)
+                return ServiceCheck(service.name, event.is_set, wake=event, alive=alive)
+            docker_cmd = self._get_docker_compose_cmd() if self._compose_file else None
+            if docker_cmd:
+                read_lines = compose_log_reader(
+                    docker_cmd, service.name, str(self.project_dir)
+                )
+                return ServiceCheck(
+                    service.name, log_probe(read_lines, service.ready_log_pattern)
+                )
 
-            for service in self._services:
-                if service.port:
-                    if not self._check_port(service.port):
-                        all_healthy = False
-                        break
+        if service.health_check_url and not service.health_check_derived:
+            return ServiceCheck(
+                service.name, http_probe(service.health_check_url), alive=alive
+            )
+        if service.port:
+            return ServiceCheck(
+                service.name, tcp_probe("localhost", service.port), alive=alive
+            )
+        return None
 
-            if all_healthy:
-                return True
+    def _wait_for_health(self, timeout: int) -> ReadinessReport:
+        """
+        Wait for all services to become healthy.
 
-            time.sleep(2)
+        Services are probed concurrently with adaptive backoff against one
+        overall deadline.
 
-        return False
+        Args:
+            timeout: Maximum time to wait in seconds
 
-    def _check_port(self, port: int) -> bool:
-        """Check if a port is responding."""
-        import socket
+        Returns:
+            ReadinessReport with per-service time-to-ready
+        """
+        checks = [
+            check
+            for check in map(self._readiness_check, self._services)
+            if check is not None
+        ]
+        return wait_for_services(checks, timeout)
 
-        try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.settimeout(1)
-                result = s.connect_ex(("localhost", port))
-                return result == 0
-        except Exception:
-            return False
+    @staticmethod
+    def _not_ready_error(report: ReadinessReport) -> str:
+        details = ", ".join(
+            f"{name} ({reason})" for name, reason in report.not_ready.items()
+        )
+        return f"Services did not become healthy in time: {details}"
 
     def to_dict(self) -> dict[str, Any]:
         """Convert orchestration config to dictionary."""
@@ -477,6 +544,7 @@ class ServiceOrchestrator:
                     "port": s.port,
                     "type": s.type,
                     "health_check_url": s.health_check_url,
+                    "ready_log_pattern": s.ready_log_pattern,
                 }
                 for s in self._services
             ],
@@ -585,12 +653,17 @@ def main() -> None:
                         "success": result.success,
                         "services_started": result.services_started,
                         "errors": result.errors,
+                        "time_to_ready": result.time_to_ready,
                     },
                     indent=2,
                 )
             )
         else:
             print(f"Started: {result.services_started}")
+            for name, seconds in sorted(
+                result.time_to_ready.items(), key=lambda item: -item[1]
+            ):
+                print(f"  {name}: ready in {seconds:.2f}s")
             if result.errors:
                 print(f"Errors: {result.errors}")
     elif args.stop:
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+Service Readiness Module
+========================
+
+Concurrent readiness checks for orchestrated services.
+
+Every service is probed in its own thread against one overall deadline,
+so a project with several services waits for the slowest one rather than
+the sum of all of them. Probes start fast and back off (0.1s growing to
+2s), and log-line probes wake their waiter as soon as the line is written
+instead of waiting for the next poll.
+
+Probes:
+- TCP: the port accepts a connection
+- HTTP: the URL answers with any non-5xx status
+- Log line: a regex matches a line of the service's output
+
+Usage:
+    from services.readiness import ServiceCheck, tcp_probe, wait_for_services
+
+    report = wait_for_services(
+        [ServiceCheck("api", tcp_probe("localhost", 8000))], timeout=60
+    )
+    if report.all_ready:
+        print(report.ready)  # {"api": 0.42}
+"""
+
+import http.client
+import re
+import socket
+import subprocess
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import IO
+
+Probe = Callable[[], bool]
+
+
+# =============================================================================
+# BACKOFF
+# =============================================================================
+
+
+@dataclass
+class Backoff:
+    """
+    Delay schedule between probes: fast at first, slower over time.
+
+    Attributes:
+        initial: First delay in seconds
+        factor: Growth factor per probe
+        maximum: Upper bound for a single delay
+    """
+
+    initial: float = 0.1
+    factor: float = 1.5
+    maximum: float = 2.0
+
+    def delays(self) -> Iterator[float]:
+        delay = self.initial
+        while True:
+            yield delay
+            delay = min(delay * self.factor, self.maximum)
+
+
+# =============================================================================
+# PROBES
+# =============================================================================
+
+
+def tcp_probe(host: str, port: int, timeout: float = 1.0) -> Probe:
+    """Probe that succeeds once host:port accepts a TCP connection."""
+
+    def probe() -> bool:
+        try:
+            with socket.create_connection((host, port), timeout=timeout):
+                return True
+        except OSError:
+            return False
+
+    return probe
+
+
+def http_probe(url: str, timeout: float = 2.0) -> Probe:
+    """
+    Probe that succeeds once the URL answers with a non-5xx status.
+
+    Client errors count as ready: a 404 from a service without a health
+    endpoint still means the server is accepting requests. So does a port
+    that accepts the connection but answers with something other than HTTP.
+    Proxy settings from the environment are ignored, since the URL points
+    at a service started on this machine.
+    """
+    opener = urllib.request.build_opener(urllib.request.ProxyHandler({}))
+
+    def probe() -> bool:
+        try:
+            with opener.open(url, timeout=timeout) as response:
+                return response.status < 500
+        except urllib.error.HTTPError as e:
+            return e.code < 500
+        except http.client.HTTPException:
+            return True
+        except (OSError, ValueError):
+            return False
+
+    return probe
+
+
+def log_probe(read_lines: Callable[[], Iterable[str]], pattern: str) -> Probe:
+    """Probe that succeeds once any line from read_lines matches pattern."""
+    regex = re.compile(pattern)
+    matched = False
+
+    def probe() -> bool:
+        nonlocal matched
+        if not matched:
+            matched = any(regex.search(line) for line in read_lines())
+        return matched
+
+    return probe
+
+
+class LogTail:
+    """
+    Drains a process output stream and keeps its most recent lines.
+
+    Reading the pipe also stops a chatty service from blocking on a full
+    stdout buffer. Patterns registered with watch() are matched as lines
+    arrive, and their events are set on the first match.
+    """
+
+    def __init__(self, stream: IO[bytes], max_lines: int = 1000) -> None:
+        self._lines: deque[str] = deque(maxlen=max_lines)
+        self._watches: list[tuple[re.Pattern[str], threading.Event]] = []
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(
+            target=self._read, args=(stream,), name="service-log-tail", daemon=True
+        )
+        self._thread.start()
+
+    def _read(self, stream: IO[bytes]) -> None:
+        try:
+            for raw in iter(stream.readline, b""):
+                line = raw.decode("utf-8", errors="replace").rstrip("\n")
+                with self._lock:
+                    self._lines.append(line)
+                    for regex, event in self._watches:
+                        if not event.is_set() and regex.search(line):
+                            event.set()
+        except (OSError, ValueError):
+            pass
+
+    def lines(self) -> list[str]:
+        """Snapshot of the buffered lines."""
+        with self._lock:
+            return list(self._lines)
+
+    def watch(self, pattern: str) -> threading.Event:
+        """Event set when a line (already buffered or future) matches."""
+        regex = re.compile(pattern)
+        event = threading.Event()
+        with self._lock:
+            if any(regex.search(line) for line in self._lines):
+                event.set()
+            self._watches.append((regex, event))
+        return event
+
+
+# =============================================================================
+# WAITING
+# =============================================================================
+
+
+@dataclass
+class ServiceCheck:
+    """
+    How to tell that one service is ready.
+
+    Attributes:
+        name: Service name
+        probe: Returns True once the service is ready
+        wake: Event that is set when the probe may have changed, so the
+            waiter re-probes immediately instead of sleeping out the delay
+        alive: Returns False once the service has exited (fails fast)
+    """
+
+    name: str
+    probe: Probe
+    wake: threading.Event | None = None
+    alive: Callable[[], bool] | None = None
+
+
+@dataclass
+class ReadinessReport:
+    """
+    Outcome of waiting for services.
+
+    Attributes:
+        ready: Seconds each ready service took to become ready
+        not_ready: Reason for each service that did not become ready
+    """
+
+    ready: dict[str, float] = field(default_factory=dict)
+    not_ready: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def all_ready(self) -> bool:
+        return not self.not_ready
+
+    def summary(self) -> list[str]:
+        """One line per service, slowest first."""
+        lines = [
+            f"{name}: ready in {seconds:.2f}s"
+            for name, seconds in sorted(self.ready.items(), key=lambda i: -i[1])
+        ]
+        lines.extend(f"{name}: {reason}" for name, reason in self.not_ready.items())
+        return lines
+
+
+def _wait_for_check(
+    check: ServiceCheck, deadline: float, backoff: Backoff
+) -> tuple[float | None, str]:
+    start = time.monotonic()
+    delays = backoff.delays()
+    while not check.probe():
+        if check.alive is not None and not check.alive():
+            return None, "exited before becoming ready"
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None, f"not ready after {time.monotonic() - start:.1f}s"
+        delay = min(next(delays), remaining)
+        if check.wake is not None:
+            check.wake.wait(delay)
+        else:
+            time.sleep(delay)
+    return time.monotonic() - start, ""
+
+
+def wait_for_services(
+    checks: list[ServiceCheck],
+    timeout: float,
+    backoff: Backoff | None = None,
+) -> ReadinessReport:
+    """
+    Probe all services concurrently until they are ready or time runs out.
+
+    Args:
+        checks: One check per service
+        timeout: Overall deadline in seconds, shared by all services
+        backoff: Delay schedule between probes of one service
+
+    Returns:
+        ReadinessReport with per-service time-to-ready
+    """
+    report = ReadinessReport()
+    if not checks:
+        return report
+
+    backoff = backoff or Backoff()
+    deadline = time.monotonic() + timeout
+
+    with ThreadPoolExecutor(
+        max_workers=len(checks), thread_name_prefix="service-readiness"
+    ) as pool:
+        futures = {
+            check.name: pool.submit(_wait_for_check, check, deadline, backoff)
+            for check in checks
+        }
+        for name, future in futures.items():
+            seconds, reason = future.result()
+            if seconds is None:
+                report.not_ready[name] = reason
+            else:
+                report.ready[name] = seconds
+
+    return report
+
+
+def compose_log_reader(
+    compose_cmd: list[str], service: str, cwd: str
+) -> Callable[[], list[str]]:
+    """Line reader over `docker compose logs` for one service."""
+
+    def read_lines() -> list[str]:
+        try:
+            proc = subprocess.run(
+                compose_cmd + ["logs", "--no-color", "--tail", "500", service],
+                cwd=cwd,
+                capture_output=True,
+                text=True,
+                timeout=10,
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            return []
+        return proc.stdout.splitlines()
+
+    return read_lines
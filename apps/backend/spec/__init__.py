@@ -25,15 +25,8 @@ Usage:
     success = await orchestrator.run()
 """
 
-from .complexity import (
-    Complexity,
-    ComplexityAnalyzer,
-    ComplexityAssessment,
-    run_ai_complexity_assessment,
-    save_assessment,
-)
-from .phases import PhaseExecutor, PhaseResult
-from .pipeline import SpecOrchestrator, get_specs_dir
+# Lazy imports: the pipeline pulls in the agent SDK, which callers that
+# only need get_specs_dir() (e.g. `run.py --list`) should not pay for.
 
 __all__ = [
     # Main orchestrator
@@ -49,3 +42,26 @@ __all__ = [
     "PhaseExecutor",
     "PhaseResult",
 ]
+
+
+def __getattr__(name):
+    """Lazy imports to avoid loading the spec pipeline until it is used."""
+    if name in (
+        "Complexity",
+        "ComplexityAnalyzer",
+        "ComplexityAssessment",
+        "run_ai_complexity_assessment",
+        "save_assessment",
+    ):
+        from . import complexity
+
+        return getattr(complexity, name)
+    elif name in ("PhaseExecutor", "PhaseResult"):
+        from . import phases
+
+        return getattr(phases, name)
+    elif name in ("SpecOrchestrator", "get_specs_dir"):
+        from . import pipeline
+
+        return getattr(pipeline, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
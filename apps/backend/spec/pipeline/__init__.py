@@ -13,10 +13,18 @@ Components:
 from init import init_auto_claude_dir
 
 from .models import get_specs_dir
-from .orchestrator import SpecOrchestrator
 
 __all__ = [
     "SpecOrchestrator",
     "get_specs_dir",
     "init_auto_claude_dir",
 ]
+
+
+def __getattr__(name):
+    """Lazy import of the orchestrator, which loads the agent SDK."""
+    if name == "SpecOrchestrator":
+        from .orchestrator import SpecOrchestrator
+
+        return SpecOrchestrator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
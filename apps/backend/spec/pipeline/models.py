@@ -14,7 +14,6 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 from init import init_auto_claude_dir
-from task_logger import update_task_logger_path
 from ui import Icons, highlight, print_status
 
 if TYPE_CHECKING:
@@ -250,6 +249,8 @@ def rename_spec_dir_from_requirements(spec_dir: Path) -> bool:
         shutil.move(str(spec_dir), str(new_spec_dir))
 
         # Update the global task logger to use the new path
+        from task_logger import update_task_logger_path
+
         update_task_logger_path(new_spec_dir)
 
         print_status(f"Spec folder: {highlight(new_dir_name)}", "success")
@@ -14,6 +14,7 @@ The spec creation process has mandatory checkpoints:
 
 from .auto_fix import auto_fix_plan
 from .models import ValidationResult
+from .snapshot import SpecSnapshot
 from .spec_validator import SpecValidator
 
-__all__ = ["SpecValidator", "ValidationResult", "auto_fix_plan"]
+__all__ = ["SpecSnapshot", "SpecValidator", "ValidationResult", "auto_fix_plan"]
@@ -0,0 +1,124 @@
+"""
+Spec Snapshot
+=============
+
+Shared, mtime-keyed view of the files in a spec directory.
+
+The validators all read the same few files (context.json, spec.md,
+implementation_plan.json) and run repeatedly during the spec pipeline.
+A snapshot reads and parses each file once; parsed values are kept in a
+process-wide cache keyed by path, mtime and size, so an unchanged file is
+never re-read, while any write to it invalidates the entry.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+# (mtime_ns, size) of a file, or None if it does not exist
+FileStamp = tuple[int, int] | None
+
+_cache_lock = threading.Lock()
+# (path, kind) -> (stamp, value); value is an exception for invalid JSON
+_parsed_cache: dict[tuple[str, str], tuple[FileStamp, Any]] = {}
+
+
+def file_stamp(path: Path) -> FileStamp:
+    """Modification stamp of a file."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _cached(path: Path, kind: str, load) -> Any:
+    key = (str(path), kind)
+    stamp = file_stamp(path)
+    with _cache_lock:
+        entry = _parsed_cache.get(key)
+    if entry is not None and entry[0] == stamp:
+        value = entry[1]
+    else:
+        try:
+            value = load(path)
+        except json.JSONDecodeError as e:
+            value = e
+        with _cache_lock:
+            _parsed_cache[key] = (stamp, value)
+    if isinstance(value, json.JSONDecodeError):
+        raise json.JSONDecodeError(value.msg, value.doc, value.pos)
+    return value
+
+
+def _load_json(path: Path) -> Any:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _read_text(path: Path) -> str:
+    return path.read_text(encoding="utf-8")
+
+
+def clear_snapshot_cache() -> None:
+    """Drop all cached file contents."""
+    with _cache_lock:
+        _parsed_cache.clear()
+
+
+class SpecSnapshot:
+    """Read-through view of a spec directory shared by the validators."""
+
+    def __init__(self, spec_dir: Path):
+        """Initialize the snapshot.
+
+        Args:
+            spec_dir: Path to the spec directory
+        """
+        self.spec_dir = Path(spec_dir)
+
+    def path(self, name: str) -> Path:
+        return self.spec_dir / name
+
+    def exists(self, name: str) -> bool:
+        return self.path(name).exists()
+
+    def read_text(self, name: str) -> str:
+        """Contents of a text file in the spec directory.
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        return _cached(self.path(name), "text", _read_text)
+
+    def load_json(self, name: str) -> Any:
+        """Parsed contents of a JSON file in the spec directory.
+
+        The returned object is shared between callers and must not be
+        modified.
+
+        Raises:
+            OSError: If the file cannot be read
+            json.JSONDecodeError: If the file is not valid JSON
+        """
+        return _cached(self.path(name), "json", _load_json)
+
+    def fingerprint(self) -> tuple:
+        """Stamps of every file the validators depend on.
+
+        Covers the top-level files of the spec directory and the
+        project-level project_index.json that the prerequisites check
+        falls back to. Equal fingerprints mean nothing has changed.
+        """
+        try:
+            entries = sorted(
+                (entry.name, entry.stat().st_mtime_ns, entry.stat().st_size)
+                for entry in os.scandir(self.spec_dir)
+                if entry.is_file()
+            )
+        except OSError:
+            return (None,)
+        project_index = self.spec_dir.parent.parent / "project_index.json"
+        return tuple(entries), file_stamp(project_index)
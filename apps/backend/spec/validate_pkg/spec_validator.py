@@ -3,11 +3,21 @@ Spec Validator
 ==============
 
 Main validator class that orchestrates all validation checkpoints.
+
+The validators share one SpecSnapshot, so each file is parsed once, and
+validate_all() runs them concurrently. A passing validate_all() is
+remembered by the spec directory's fingerprint; until a file in the
+directory changes, later calls return the same results without
+re-validating.
 """
 
+import copy
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from .models import ValidationResult
+from .snapshot import SpecSnapshot
 from .validators import (
     ContextValidator,
     ImplementationPlanValidator,
@@ -15,6 +25,16 @@ from .validators import (
     SpecDocumentValidator,
 )
 
+_passes_lock = threading.Lock()
+# Resolved spec dir -> (fingerprint, results) of the last fully passing run
+_last_passes: dict[str, tuple[tuple, list[ValidationResult]]] = {}
+
+
+def clear_validation_cache() -> None:
+    """Forget all remembered passing validations."""
+    with _passes_lock:
+        _last_passes.clear()
+
 
 class SpecValidator:
     """Validates spec outputs at each checkpoint."""
@@ -26,25 +46,51 @@ class SpecValidator:
             spec_dir: Path to the spec directory
         """
         self.spec_dir = Path(spec_dir)
+        self.snapshot = SpecSnapshot(self.spec_dir)
 
         # Initialize individual validators
-        self._prereqs_validator = PrereqsValidator(self.spec_dir)
-        self._context_validator = ContextValidator(self.spec_dir)
-        self._spec_document_validator = SpecDocumentValidator(self.spec_dir)
-        self._implementation_plan_validator = ImplementationPlanValidator(self.spec_dir)
+        self._prereqs_validator = PrereqsValidator(self.spec_dir, self.snapshot)
+        self._context_validator = ContextValidator(self.spec_dir, self.snapshot)
+        self._spec_document_validator = SpecDocumentValidator(
+            self.spec_dir, self.snapshot
+        )
+        self._implementation_plan_validator = ImplementationPlanValidator(
+            self.spec_dir, self.snapshot
+        )
 
     def validate_all(self) -> list[ValidationResult]:
         """Run all validations.
 
+        The checkpoints are independent and run concurrently. If the spec
+        directory is unchanged since the last run in which every
+        checkpoint passed, that run's results are returned instead.
+
         Returns:
             List of validation results for all checkpoints
         """
-        results = [
-            self.validate_prereqs(),
-            self.validate_context(),
-            self.validate_spec_document(),
-            self.validate_implementation_plan(),
+        key = str(self.spec_dir.resolve())
+        fingerprint = self.snapshot.fingerprint()
+        with _passes_lock:
+            last = _last_passes.get(key)
+        if last is not None and last[0] == fingerprint:
+            return copy.deepcopy(last[1])
+
+        checks = [
+            self.validate_prereqs,
+            self.validate_context,
+            self.validate_spec_document,
+            self.validate_implementation_plan,
         ]
+        with ThreadPoolExecutor(
+            max_workers=len(checks), thread_name_prefix="spec-validate"
+        ) as pool:
+            results = list(pool.map(lambda check: check(), checks))
+
+        with _passes_lock:
+            if all(r.valid for r in results):
+                _last_passes[key] = (fingerprint, copy.deepcopy(results))
+            else:
+                _last_passes.pop(key, None)
         return results
 
     def validate_prereqs(self) -> ValidationResult:
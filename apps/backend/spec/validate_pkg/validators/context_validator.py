@@ -10,18 +10,21 @@ from pathlib import Path
 
 from ..models import ValidationResult
 from ..schemas import CONTEXT_SCHEMA
+from ..snapshot import SpecSnapshot
 
 
 class ContextValidator:
     """Validates context.json exists and has required structure."""
 
-    def __init__(self, spec_dir: Path):
+    def __init__(self, spec_dir: Path, snapshot: SpecSnapshot | None = None):
         """Initialize the context validator.
 
         Args:
             spec_dir: Path to the spec directory
+            snapshot: Shared view of the spec directory (created if omitted)
         """
         self.spec_dir = Path(spec_dir)
+        self.snapshot = snapshot or SpecSnapshot(self.spec_dir)
 
     def validate(self) -> ValidationResult:
         """Validate context.json exists and has required structure.
@@ -33,9 +36,7 @@ class ContextValidator:
         warnings = []
         fixes = []
 
-        context_file = self.spec_dir / "context.json"
-
-        if not context_file.exists():
+        if not self.snapshot.exists("context.json"):
             errors.append("context.json not found")
             fixes.append(
                 "Run: python auto-claude/context.py --task '[task]' --services '[services]' --output context.json"
@@ -43,8 +44,7 @@ class ContextValidator:
             return ValidationResult(False, "context", errors, warnings, fixes)
 
         try:
-            with open(context_file) as f:
-                context = json.load(f)
+            context = self.snapshot.load_json("context.json")
         except json.JSONDecodeError as e:
             errors.append(f"context.json is invalid JSON: {e}")
             fixes.append("Regenerate context.json or fix JSON syntax")
@@ -10,18 +10,21 @@ from pathlib import Path
 
 from ..models import ValidationResult
 from ..schemas import IMPLEMENTATION_PLAN_SCHEMA
+from ..snapshot import SpecSnapshot
 
 
 class ImplementationPlanValidator:
     """Validates implementation_plan.json exists and has valid schema."""
 
-    def __init__(self, spec_dir: Path):
+    def __init__(self, spec_dir: Path, snapshot: SpecSnapshot | None = None):
         """Initialize the implementation plan validator.
 
         Args:
             spec_dir: Path to the spec directory
+            snapshot: Shared view of the spec directory (created if omitted)
         """
         self.spec_dir = Path(spec_dir)
+        self.snapshot = snapshot or SpecSnapshot(self.spec_dir)
 
     def validate(self) -> ValidationResult:
         """Validate implementation_plan.json exists and has valid schema.
@@ -33,9 +36,7 @@ class ImplementationPlanValidator:
         warnings = []
         fixes = []
 
-        plan_file = self.spec_dir / "implementation_plan.json"
-
-        if not plan_file.exists():
+        if not self.snapshot.exists("implementation_plan.json"):
             errors.append("implementation_plan.json not found")
             fixes.append(
                 f"Run: python auto-claude/planner.py --spec-dir {self.spec_dir}"
@@ -43,8 +44,7 @@ class ImplementationPlanValidator:
             return ValidationResult(False, "plan", errors, warnings, fixes)
 
         try:
-            with open(plan_file) as f:
-                plan = json.load(f)
+            plan = self.snapshot.load_json("implementation_plan.json")
         except json.JSONDecodeError as e:
             errors.append(f"implementation_plan.json is invalid JSON: {e}")
             fixes.append(
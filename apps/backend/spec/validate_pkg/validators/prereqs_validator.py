@@ -8,18 +8,21 @@ Validates that required prerequisites exist before spec creation.
 from pathlib import Path
 
 from ..models import ValidationResult
+from ..snapshot import SpecSnapshot
 
 
 class PrereqsValidator:
     """Validates prerequisites exist."""
 
-    def __init__(self, spec_dir: Path):
+    def __init__(self, spec_dir: Path, snapshot: SpecSnapshot | None = None):
         """Initialize the prerequisites validator.
 
         Args:
             spec_dir: Path to the spec directory
+            snapshot: Shared view of the spec directory (created if omitted)
         """
         self.spec_dir = Path(spec_dir)
+        self.snapshot = snapshot or SpecSnapshot(self.spec_dir)
 
     def validate(self) -> ValidationResult:
         """Validate prerequisites exist.
@@ -38,8 +41,8 @@ class PrereqsValidator:
             return ValidationResult(False, "prereqs", errors, warnings, fixes)
 
         # Check project_index.json
-        project_index = self.spec_dir / "project_index.json"
-        if not project_index.exists():
+        project_index = self.snapshot.path("project_index.json")
+        if not self.snapshot.exists("project_index.json"):
             # Check if it exists at auto-claude level
             auto_build_index = self.spec_dir.parent.parent / "project_index.json"
             if auto_build_index.exists():
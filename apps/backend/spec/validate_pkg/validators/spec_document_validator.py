@@ -10,18 +10,21 @@ from pathlib import Path
 
 from ..models import ValidationResult
 from ..schemas import SPEC_RECOMMENDED_SECTIONS, SPEC_REQUIRED_SECTIONS
+from ..snapshot import SpecSnapshot
 
 
 class SpecDocumentValidator:
     """Validates spec.md exists and has required sections."""
 
-    def __init__(self, spec_dir: Path):
+    def __init__(self, spec_dir: Path, snapshot: SpecSnapshot | None = None):
         """Initialize the spec document validator.
 
         Args:
             spec_dir: Path to the spec directory
+            snapshot: Shared view of the spec directory (created if omitted)
         """
         self.spec_dir = Path(spec_dir)
+        self.snapshot = snapshot or SpecSnapshot(self.spec_dir)
 
     def validate(self) -> ValidationResult:
         """Validate spec.md exists and has required sections.
@@ -33,14 +36,12 @@ class SpecDocumentValidator:
         warnings = []
         fixes = []
 
-        spec_file = self.spec_dir / "spec.md"
-
-        if not spec_file.exists():
+        if not self.snapshot.exists("spec.md"):
             errors.append("spec.md not found")
             fixes.append("Create spec.md with required sections")
             return ValidationResult(False, "spec", errors, warnings, fixes)
 
-        content = spec_file.read_text()
+        content = self.snapshot.read_text("spec.md")
 
         # Check for required sections
         for section in SPEC_REQUIRED_SECTIONS:
@@ -4,10 +4,15 @@ Streaming marker functionality for real-time UI updates.
 
 import json
 
+from core.event_channel import send_event
+
 
 def emit_marker(marker_type: str, data: dict, enabled: bool = True) -> None:
     """
-    Emit a streaming marker to stdout for UI consumption.
+    Emit a streaming marker for UI consumption.
+
+    Sent over the out-of-band event channel when the frontend provides one,
+    otherwise printed to stdout.
 
     Args:
         marker_type: Type of marker (e.g., "PHASE_START", "TOOL_END")
@@ -17,6 +22,8 @@ def emit_marker(marker_type: str, data: dict, enabled: bool = True) -> None:
     if not enabled:
         return
     try:
+        if send_event(f"TASK_LOG_{marker_type.upper()}", data):
+            return
         marker = f"__TASK_LOG_{marker_type.upper()}__:{json.dumps(data)}"
         print(marker, flush=True)
     except Exception:
@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+Tests for the agent concurrency governor.
+
+Tests cover:
+- Priority admission and the background reservation
+- AIMD limit changes from latency and rate-limit errors
+- Cancellation and use from several event loops
+- GovernedClient slot, latency and error reporting
+"""
+
+import asyncio
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "apps" / "backend"))
+
+from core import agent_limiter
+from core.agent_limiter import (
+    DECREASE_COOLDOWN_SECONDS,
+    MAX_PARALLEL_AGENTS_ENV,
+    ConcurrencyGovernor,
+    GovernedClient,
+    Priority,
+    agent_slot,
+    is_rate_limit_error,
+    priority_for_agent_type,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def fresh_governor(monkeypatch):
+    """Process-wide governor with a limit of 2."""
+    monkeypatch.setenv(MAX_PARALLEL_AGENTS_ENV, "2")
+    agent_limiter.reset_governor()
+    yield agent_limiter.get_governor()
+    agent_limiter.reset_governor()
+
+
+class TestAdmission:
+    """Tests for slot admission order."""
+
+    async def test_waiters_admitted_by_priority(self):
+        governor = ConcurrencyGovernor(max_limit=1)
+        first = await governor.acquire(Priority.INTERACTIVE)
+        order = []
+
+        async def wait(priority: Priority, name: str):
+            slot = await governor.acquire(priority)
+            order.append(name)
+            slot.release()
+
+        tasks = [
+            asyncio.create_task(wait(Priority.BACKGROUND, "background")),
+            asyncio.create_task(wait(Priority.NORMAL, "normal")),
+            asyncio.create_task(wait(Priority.INTERACTIVE, "interactive")),
+        ]
+        await asyncio.sleep(0)
+        assert governor.stats().waiting == 3
+
+        first.release()
+        await asyncio.gather(*tasks)
+
+        assert order == ["interactive", "normal", "background"]
+
+    async def test_background_leaves_a_slot_free(self):
+        governor = ConcurrencyGovernor(max_limit=3)
+
+        background = [governor.try_acquire(Priority.BACKGROUND) for _ in range(3)]
+        assert background[2] is None
+        assert governor.try_acquire(Priority.INTERACTIVE) is not None
+        assert governor.stats().in_use_by_priority == {
+            "interactive": 1,
+            "normal": 0,
+            "background": 2,
+        }
+
+    async def test_new_request_does_not_jump_the_queue(self):
+        governor = ConcurrencyGovernor(max_limit=1)
+        held = await governor.acquire()
+        waiter = asyncio.create_task(governor.acquire(Priority.INTERACTIVE))
+        await asyncio.sleep(0)
+
+        held.release()
+        assert governor.try_acquire(Priority.INTERACTIVE) is None
+        (await waiter).release()
+
+    async def test_cancelled_waiter_gives_up_its_place(self):
+        governor = ConcurrencyGovernor(max_limit=1)
+        held = await governor.acquire()
+        waiter = asyncio.create_task(governor.acquire())
+        await asyncio.sleep(0)
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        held.release()
+
+        assert governor.stats().in_use == 0
+        assert governor.stats().waiting == 0
+
+    def test_event_loops_in_threads_share_the_limit(self):
+        governor = ConcurrencyGovernor(max_limit=2)
+        lock = threading.Lock()
+        active = peak = 0
+
+        async def session():
+            nonlocal active, peak
+            slot = await governor.acquire()
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            await asyncio.sleep(0.02)
+            with lock:
+                active -= 1
+            slot.release()
+
+        async def sessions():
+            await asyncio.gather(*(session() for _ in range(4)))
+
+        def run_loop():
+            asyncio.run(asyncio.wait_for(sessions(), 10))
+
+        threads = [threading.Thread(target=run_loop) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert peak == 2
+        assert governor.stats().in_use == 0
+
+
+class TestAdaptiveLimit:
+    """Tests for AIMD limit changes."""
+
+    def test_rate_limit_halves_once_per_cooldown(self, clock):
+        governor = ConcurrencyGovernor(max_limit=8, clock=clock)
+
+        governor.record_rate_limit()
+        governor.record_rate_limit()
+        assert governor.limit == 4
+
+        clock.now += DECREASE_COOLDOWN_SECONDS
+        governor.record_rate_limit()
+        assert governor.limit == 2
+        assert governor.stats().rate_limits == 3
+
+    def test_limit_never_drops_below_one(self, clock):
+        governor = ConcurrencyGovernor(max_limit=2, clock=clock)
+        for _ in range(5):
+            governor.record_rate_limit()
+            clock.now += DECREASE_COOLDOWN_SECONDS
+
+        assert governor.limit == 1
+
+    def test_normal_latency_recovers_additively(self, clock):
+        governor = ConcurrencyGovernor(max_limit=8, clock=clock)
+        governor.record_rate_limit()
+        assert governor.limit == 4
+
+        for _ in range(5):
+            governor.record_latency(1.0)
+        assert governor.limit == 5
+
+        for _ in range(100):
+            governor.record_latency(1.0)
+        assert governor.limit == 8
+
+    def test_slow_response_decreases_limit(self, clock):
+        governor = ConcurrencyGovernor(max_limit=10, clock=clock)
+        governor.record_latency(2.0)
+
+        governor.record_latency(4.0)
+        assert governor.limit == 10
+        governor.record_latency(30.0)
+        assert governor.limit == 8
+
+    async def test_increase_admits_waiters(self, clock):
+        governor = ConcurrencyGovernor(max_limit=2, clock=clock)
+        governor.record_rate_limit()
+        held = await governor.acquire()
+        waiter = asyncio.create_task(governor.acquire())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        governor.record_latency(1.0)
+        (await asyncio.wait_for(waiter, 1)).release()
+        held.release()
+
+    def test_listeners_receive_stats(self):
+        governor = ConcurrencyGovernor(max_limit=3)
+        seen = []
+        governor.add_listener(lambda stats: seen.append((stats.in_use, stats.limit)))
+
+        slot = governor.try_acquire()
+        slot.release()
+        slot.release()
+
+        assert seen == [(1, 3), (0, 3)]
+
+    def test_rate_limit_detection(self):
+        assert is_rate_limit_error(RuntimeError("API error 429: Too Many Requests"))
+        assert is_rate_limit_error("overloaded_error")
+        assert not is_rate_limit_error(ValueError("port 4290 in use"))
+        assert is_rate_limit_error("Request failed with status code 529")
+        assert is_rate_limit_error("Error: 429")
+        assert is_rate_limit_error("rate_limit_error: slow down")
+        assert not is_rate_limit_error(RuntimeError("PR #429 not found"))
+        assert not is_rate_limit_error("SyntaxError at app.py line 529")
+        assert priority_for_agent_type("coder") == Priority.INTERACTIVE
+        assert priority_for_agent_type("pr_reviewer") == Priority.BACKGROUND
+        assert priority_for_agent_type("ideation") == Priority.NORMAL
+
+
+class FakeMessage:
+    def __init__(self, text: str = "", is_error: bool = False):
+        self.result = text
+        self.is_error = is_error
+
+
+ResultMessage = type("ResultMessage", (FakeMessage,), {})
+
+
+class FakeClient:
+    def __init__(self, messages=(), enter_error: Exception | None = None):
+        self.messages = list(messages)
+        self.enter_error = enter_error
+        self.entered = self.exited = False
+        self.model = "sonnet"
+
+    async def __aenter__(self):
+        if self.enter_error:
+            raise self.enter_error
+        self.entered = True
+        return self
+
+    async def __aexit__(self, *exc):
+        self.exited = True
+        return False
+
+    async def query(self, prompt: str):
+        pass
+
+    async def receive_response(self):
+        for message in self.messages:
+            yield message
+
+
+class TestGovernedClient:
+    """Tests for the client wrapper."""
+
+    async def test_session_holds_a_slot(self, fresh_governor):
+        client = GovernedClient(FakeClient([FakeMessage("hi")]), Priority.INTERACTIVE)
+
+        async with client:
+            assert fresh_governor.stats().in_use_by_priority["interactive"] == 1
+            await client.query("hello")
+            messages = [m async for m in client.receive_response()]
+
+        assert [m.result for m in messages] == ["hi"]
+        assert client.model == "sonnet"
+        assert fresh_governor.stats().in_use == 0
+        assert fresh_governor.stats().latency_ewma is not None
+
+    async def test_rate_limit_errors_reduce_limit(self, fresh_governor):
+        with pytest.raises(RuntimeError):
+            async with GovernedClient(
+                FakeClient(enter_error=RuntimeError("529 overloaded"))
+            ):
+                pass
+        assert fresh_governor.limit == 1
+        assert fresh_governor.stats().in_use == 0
+
+    async def test_error_result_message_is_classified(self, fresh_governor):
+        client = GovernedClient(FakeClient([ResultMessage("Rate limit reached", True)]))
+
+        async with client:
+            await client.query("hello")
+            async for _ in client.receive_response():
+                pass
+
+        assert fresh_governor.stats().rate_limits == 1
+
+    async def test_nested_slot_is_reentrant(self, fresh_governor, monkeypatch):
+        monkeypatch.setenv(MAX_PARALLEL_AGENTS_ENV, "1")
+
+        async with agent_slot():
+            async with GovernedClient(FakeClient()):
+                assert fresh_governor.stats().in_use == 1
+
+        assert fresh_governor.stats().in_use == 0
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Tests for the AI analyzer runner.
+
+Covers:
+- Concurrent analyzer fan-out bounded by the configured limit
+- Per-analyzer result caching
+- Per-analyzer latency in the results and summary
+"""
+
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "apps" / "backend"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "apps" / "backend" / "runners"))
+
+from ai_analyzer import AIAnalyzerRunner, AnalyzerType
+from ai_analyzer import runner as runner_module
+from ai_analyzer.analyzers import SecurityAnalyzer
+from ai_analyzer.claude_client import ClaudeAnalysisClient
+
+QUERY_SECONDS = 0.1
+
+
+def _project_index(route: str = "/api/users") -> dict:
+    return {
+        "services": {
+            "backend": {
+                "api": {
+                    "routes": [{"methods": ["GET"], "path": route, "file": "a.py"}]
+                },
+                "database": {"models": {"User": {}}},
+            }
+        }
+    }
+
+
+class FakeClient:
+    """Stands in for ClaudeAnalysisClient, tracking concurrent queries."""
+
+    queries: list[str] = []
+    active = 0
+    peak = 0
+
+    def __init__(self, project_dir):
+        pass
+
+    async def run_analysis_query(self, prompt: str) -> str:
+        cls = FakeClient
+        cls.queries.append(prompt)
+        cls.active += 1
+        cls.peak = max(cls.peak, cls.active)
+        try:
+            await asyncio.sleep(QUERY_SECONDS)
+        finally:
+            cls.active -= 1
+        return json.dumps({"score": 80})
+
+    @classmethod
+    def reset(cls):
+        cls.queries = []
+        cls.active = 0
+        cls.peak = 0
+
+
+@pytest.fixture
+def fake_client():
+    FakeClient.reset()
+    with (
+        patch.object(runner_module, "ClaudeAnalysisClient", FakeClient),
+        patch.object(runner_module, "CLAUDE_SDK_AVAILABLE", True),
+    ):
+        yield FakeClient
+
+
+class TestConcurrentAnalyzers:
+    """Analyzers run concurrently up to max_concurrency."""
+
+    async def test_fan_out_respects_limit(self, temp_dir, fake_client):
+        runner = AIAnalyzerRunner(temp_dir, _project_index(), max_concurrency=3)
+
+        start = time.perf_counter()
+        insights = await runner.run_full_analysis()
+        elapsed = time.perf_counter() - start
+
+        analyzers = AnalyzerType.all_analyzers()
+        assert len(fake_client.queries) == len(analyzers)
+        assert fake_client.peak == 3
+        # Six analyzers in two waves rather than six sequential queries
+        assert elapsed < QUERY_SECONDS * len(analyzers) * 0.75
+        assert insights["overall_score"] == 80
+        assert list(insights["analyzer_timings"]) == analyzers
+
+    async def test_concurrency_from_env(self, temp_dir, monkeypatch):
+        monkeypatch.setenv(runner_module.CONCURRENCY_ENV, "2")
+        assert AIAnalyzerRunner(temp_dir, _project_index()).max_concurrency == 2
+
+    async def test_failed_analyzer_does_not_stop_others(self, temp_dir, fake_client):
+        runner = AIAnalyzerRunner(temp_dir, {"services": {}})
+
+        insights = await runner.run_full_analysis()
+
+        assert "error" in insights["code_relationships"]
+        assert insights["security"]["score"] == 80
+
+
+class TestPerAnalyzerCache:
+    """Each analyzer's result is cached on its own."""
+
+    async def test_cached_results_reused(self, temp_dir, fake_client):
+        await AIAnalyzerRunner(temp_dir, _project_index()).run_full_analysis()
+        fake_client.reset()
+
+        insights = await AIAnalyzerRunner(
+            temp_dir, _project_index()
+        ).run_full_analysis()
+
+        assert fake_client.queries == []
+        assert all(t["cached"] for t in insights["analyzer_timings"].values())
+        assert insights["overall_score"] == 80
+
+    async def test_index_change_only_reruns_affected_analyzer(
+        self, temp_dir, fake_client
+    ):
+        await AIAnalyzerRunner(temp_dir, _project_index()).run_full_analysis()
+        fake_client.reset()
+
+        changed = _project_index(route="/api/orders")
+        insights = await AIAnalyzerRunner(temp_dir, changed).run_full_analysis()
+
+        assert len(fake_client.queries) == 1
+        assert "/api/orders" in fake_client.queries[0]
+        assert insights["analyzer_timings"]["code_relationships"]["cached"] is False
+        assert insights["analyzer_timings"]["security"]["cached"] is True
+
+    async def test_prompt_version_bump_reruns_analyzer(self, temp_dir, fake_client):
+        await AIAnalyzerRunner(temp_dir, _project_index()).run_full_analysis()
+        fake_client.reset()
+
+        with patch.object(SecurityAnalyzer, "PROMPT_VERSION", 2):
+            await AIAnalyzerRunner(temp_dir, _project_index()).run_full_analysis(
+                selected_analyzers=["security", "performance"]
+            )
+
+        assert len(fake_client.queries) == 1
+
+    async def test_skip_cache(self, temp_dir, fake_client):
+        await AIAnalyzerRunner(temp_dir, _project_index()).run_full_analysis()
+        fake_client.reset()
+
+        await AIAnalyzerRunner(temp_dir, _project_index()).run_full_analysis(
+            skip_cache=True
+        )
+
+        assert len(fake_client.queries) == len(AnalyzerType.all_analyzers())
+
+
+async def test_summary_prints_latency(temp_dir, fake_client, capsys):
+    runner = AIAnalyzerRunner(temp_dir, _project_index())
+    insights = await runner.run_full_analysis(selected_analyzers=["security"])
+
+    runner.print_summary(insights)
+
+    out = capsys.readouterr().out
+    assert "Analyzer Latency" in out
+    assert "Security" in out and "0.1s" in out
+
+
+def test_each_query_gets_its_own_settings_file(temp_dir):
+    # Bypass __init__, which needs the SDK and an auth token
+    client = object.__new__(ClaudeAnalysisClient)
+    client.project_dir = temp_dir
+
+    first = client._create_settings_file()
+    second = client._create_settings_file()
+
+    assert first != second
+    assert first.parent == second.parent == temp_dir
+    first.unlink()
+    assert json.loads(second.read_text())["sandbox"]["enabled"] is True
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Tests for CLI cold-start cost.
+
+The UI shells out to `run.py` for quick queries (listing specs, status,
+merge preview) many times. These tests run those commands in a fresh
+interpreter with `-X importtime` and check that they:
+- Do not import the agent SDK, agents, QA loop, memory or runner packages
+- Stay within an import-time budget
+"""
+
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = Path(__file__).parent.parent / "apps" / "backend"
+
+# Total import time allowed for a lightweight command (generous, so only a
+# real regression such as loading the agent SDK or merge system trips it)
+IMPORT_BUDGET_MS = 600
+
+# Packages that only building, QA runs, merging and the runners need
+HEAVY_MODULES = (
+    "claude_agent_sdk",
+    "agent",
+    "agents",
+    "core.client",
+    "core.simple_client",
+    "qa.loop",
+    "qa.reviewer",
+    "qa.fixer",
+    "spec.pipeline.orchestrator",
+    "graphiti_core",
+    "integrations.graphiti",
+    "linear_integration",
+    "runners",
+)
+
+_IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def _run_with_importtime(args: list[str]) -> tuple[subprocess.CompletedProcess, dict]:
+    """Run run.py in a fresh interpreter; return the result and module timings."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "run.py", *args],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    modules = {}
+    total_us = 0
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        modules[name] = int(cumulative_us)
+        total_us += int(self_us)
+    modules["<total>"] = total_us
+    return result, modules
+
+
+def _loaded(modules: dict, prefixes: tuple[str, ...]) -> list[str]:
+    return sorted(
+        name
+        for name in modules
+        if any(name == p or name.startswith(p + ".") for p in prefixes)
+    )
+
+
+@pytest.fixture
+def project(temp_git_repo: Path) -> Path:
+    """Project with one spec."""
+    spec_dir = temp_git_repo / ".auto-claude" / "specs" / "001-feature"
+    spec_dir.mkdir(parents=True)
+    (spec_dir / "spec.md").write_text("# Feature\n")
+    return temp_git_repo
+
+
+@pytest.mark.parametrize(
+    "args, also_forbidden",
+    [
+        (["--list"], ("merge",)),
+        (["--spec", "001", "--qa-status"], ("merge",)),
+        (["--spec", "001", "--review-status"], ("merge",)),
+        (["--spec", "001", "--merge-preview"], ()),
+    ],
+    ids=["list", "qa-status", "review-status", "merge-preview"],
+)
+def test_lightweight_command_imports(project: Path, args, also_forbidden):
+    result, modules = _run_with_importtime([*args, "--project-dir", str(project)])
+
+    assert result.returncode == 0, result.stderr[-2000:]
+    assert _loaded(modules, HEAVY_MODULES + also_forbidden) == []
+    total_ms = modules["<total>"] / 1000
+    assert total_ms < IMPORT_BUDGET_MS, (
+        f"{' '.join(args)} spent {total_ms:.0f}ms importing modules "
+        f"(budget {IMPORT_BUDGET_MS}ms)"
+    )
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Tests for the Subtask Context Packer
+====================================
+
+Tests prompts_pkg/context_packer.py and its use in load_subtask_context:
+- Term extraction from identifiers
+- Whole files when everything fits the budget
+- Ranking definitions by relevance within a budget
+- Outline/omission markers for the rest
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "apps" / "backend"))
+
+from prompts_pkg.context_packer import (
+    CONTEXT_TOKEN_BUDGET_ENV,
+    DEFAULT_CONTEXT_TOKEN_BUDGET,
+    estimate_tokens,
+    extract_terms,
+    get_context_token_budget,
+    pack_context,
+)
+from prompts_pkg.prompt_generator import load_subtask_context
+
+
+def _filler_function(name: str, lines: int = 30) -> str:
+    body = "\n".join(f"    value_{i} = compute_{name}_{i}()" for i in range(lines))
+    return f"def {name}():\n{body}\n    return value_0\n"
+
+
+@pytest.fixture
+def big_project(temp_dir):
+    """Project with a large module where one function matters."""
+    services = temp_dir / "services.py"
+    services.write_text(
+        "import os\nimport json\n\n\n"
+        + "\n\n".join(_filler_function(f"unrelated_{i}") for i in range(20))
+        + "\n\ndef send_invoice_email(invoice, recipient):\n"
+        + '    """Send the invoice email."""\n'
+        + "    body = render_invoice(invoice)\n"
+        + "    return mailer.send(recipient, body)\n"
+    )
+    (temp_dir / "pattern.py").write_text(
+        "class EmailTemplate:\n"
+        "    def render(self, context):\n"
+        "        return self.template.format(**context)\n"
+    )
+    (temp_dir / "notes.txt").write_text("misc\n" * 2000)
+    return temp_dir
+
+
+class TestExtractTerms:
+    """Tests for query term extraction."""
+
+    def test_splits_identifiers(self):
+        terms = extract_terms("Add getUserProfile and user_settings")
+        assert {"user", "profile", "settings", "getuserprofile"} <= terms
+
+    def test_drops_stopwords_and_short_words(self):
+        assert extract_terms("Add the new API to it") == {"api"}
+
+
+class TestPackContext:
+    """Tests for pack_context."""
+
+    def test_small_files_included_whole(self, temp_dir):
+        (temp_dir / "a.py").write_text("def a():\n    return 1\n")
+        packed = pack_context(temp_dir, ["a.py"], [], "anything", token_budget=1000)
+        assert packed["files_to_modify"]["a.py"] == "def a():\n    return 1\n"
+
+    def test_relevant_definition_kept_within_budget(self, big_project):
+        packed = pack_context(
+            big_project,
+            ["services.py"],
+            [],
+            "Send invoice email to the customer",
+            token_budget=600,
+        )
+        content = packed["files_to_modify"]["services.py"]
+
+        assert "return mailer.send(recipient, body)" in content
+        assert "import json" in content  # Header of a file to modify
+        # Unrelated functions appear only as signatures (if at all)
+        assert "value_5 = compute_unrelated_3_5()" not in content
+        assert "omitted" in content
+        assert estimate_tokens(content) <= 700
+
+    def test_header_kept_when_definitions_fill_budget(self, big_project):
+        # Every filler function matches, and together they exceed the budget
+        packed = pack_context(
+            big_project,
+            ["services.py"],
+            [],
+            "compute unrelated value",
+            token_budget=350,
+        )
+        content = packed["files_to_modify"]["services.py"]
+        assert content.startswith("import os\nimport json")
+
+    def test_invalid_budget_env_falls_back(self, monkeypatch):
+        monkeypatch.setenv(CONTEXT_TOKEN_BUDGET_ENV, "8k")
+        assert get_context_token_budget() == DEFAULT_CONTEXT_TOKEN_BUDGET
+        monkeypatch.setenv(CONTEXT_TOKEN_BUDGET_ENV, "500")
+        assert get_context_token_budget() == 500
+
+    def test_outline_fills_remaining_budget(self, big_project):
+        packed = pack_context(
+            big_project, ["services.py"], [], "send invoice", token_budget=600
+        )
+        content = packed["files_to_modify"]["services.py"]
+        assert "def unrelated_0():" in content
+
+    def test_irrelevant_unstructured_pattern_omitted(self, big_project):
+        packed = pack_context(
+            big_project,
+            ["services.py"],
+            ["notes.txt"],
+            "send invoice email",
+            token_budget=800,
+        )
+        assert packed["patterns"]["notes.txt"].startswith("... (2001 lines omitted")
+
+    def test_method_keeps_class_line(self, big_project):
+        packed = pack_context(
+            big_project,
+            ["services.py"],
+            ["pattern.py"],
+            "render email template",
+            token_budget=400,
+        )
+        content = packed["patterns"]["pattern.py"]
+        assert content.startswith("class EmailTemplate:")
+        assert "def render(self, context):" in content
+
+    def test_missing_files_skipped(self, temp_dir):
+        packed = pack_context(temp_dir, ["missing.py"], [], "x", token_budget=10)
+        assert packed == {"files_to_modify": {}, "patterns": {}}
+
+
+class TestLoadSubtaskContext:
+    """Tests for the packer's integration into load_subtask_context."""
+
+    def test_uses_packer(self, big_project, temp_dir):
+        subtask = {
+            "id": "invoice-email",
+            "description": "Send invoice email",
+            "files_to_modify": ["services.py"],
+            "patterns_from": ["pattern.py"],
+        }
+        context = load_subtask_context(temp_dir, big_project, subtask, token_budget=600)
+
+        assert "mailer.send" in context["files_to_modify"]["services.py"]
+        assert "pattern.py" in context["patterns"]
+
+    def test_zero_budget_uses_line_truncation(self, big_project, temp_dir):
+        subtask = {"files_to_modify": ["services.py"]}
+        context = load_subtask_context(
+            temp_dir, big_project, subtask, max_file_lines=10, token_budget=0
+        )
+
+        content = context["files_to_modify"]["services.py"]
+        assert "(truncated," in content
+        assert "mailer.send" not in content
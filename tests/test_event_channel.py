@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Tests for the Out-of-Band Event Channel
+=======================================
+
+Tests the core/event_channel.py module including:
+- Length-prefixed frame encoding/decoding
+- Coalescing of high-frequency events
+- Routing of emit_marker/emit_phase through an inherited fd
+- Stdout fallback when no channel is configured or the channel breaks
+"""
+
+import json
+import os
+import sys
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "apps" / "backend"))
+
+from core import event_channel
+from core.event_channel import (
+    EVENT_FD_ENV,
+    EventChannel,
+    decode_frames,
+    encode_frame,
+    format_stdout_marker,
+    reset_event_channel,
+    send_event,
+)
+
+
+def _read_available(fd: int) -> bytes:
+    """Read everything currently buffered in a pipe."""
+    os.set_blocking(fd, False)
+    chunks = []
+    while True:
+        try:
+            chunk = os.read(fd, 65536)
+        except BlockingIOError:
+            break
+        if not chunk:
+            break
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+@pytest.fixture
+def pipe_channel(monkeypatch):
+    """Configure the process-wide channel on a pipe; yields the read end."""
+    read_fd, write_fd = os.pipe()
+    monkeypatch.setenv(EVENT_FD_ENV, str(write_fd))
+    monkeypatch.setenv("AUTO_CLAUDE_EVENT_COALESCE_MS", "0")
+    reset_event_channel()
+    yield read_fd
+    reset_event_channel()
+    os.close(read_fd)
+
+
+@pytest.fixture(autouse=True)
+def _no_channel_leak(monkeypatch):
+    """Make sure no test inherits a channel from the environment."""
+    monkeypatch.delenv(EVENT_FD_ENV, raising=False)
+    monkeypatch.delenv("AUTO_CLAUDE_EVENT_SOCKET", raising=False)
+    reset_event_channel()
+    yield
+    reset_event_channel()
+
+
+class TestFraming:
+    """Tests for frame encoding and decoding."""
+
+    def test_round_trip(self):
+        """Encoded batches decode back to the same events."""
+        batch = [{"type": "EXEC_PHASE", "data": {"phase": "coding"}}]
+        batches, rest = decode_frames(encode_frame(batch) + encode_frame(batch))
+
+        assert batches == [batch, batch]
+        assert rest == b""
+
+    def test_incomplete_frame_is_kept(self):
+        """A partial trailing frame is returned as remaining bytes."""
+        frame = encode_frame([{"type": "X", "data": {}}])
+        batches, rest = decode_frames(frame + frame[:5])
+
+        assert len(batches) == 1
+        assert rest == frame[:5]
+
+    def test_unicode_payload(self):
+        """Non-ASCII content survives framing."""
+        batch = [{"type": "TASK_LOG_TEXT", "data": {"content": "日本語 🎉"}}]
+        batches, _ = decode_frames(encode_frame(batch))
+        assert batches[0][0]["data"]["content"] == "日本語 🎉"
+
+
+class TestCoalescing:
+    """Tests for EventChannel batching."""
+
+    def test_events_within_window_share_a_frame(self):
+        """Many events sent quickly are written as one frame."""
+        frames = []
+        channel = EventChannel(frames.append, coalesce_ms=10_000)
+
+        for i in range(50):
+            assert channel.send("TASK_LOG_TEXT", {"i": i})
+        assert frames == []  # Still inside the window
+
+        channel.flush()
+
+        assert len(frames) == 1
+        batches, _ = decode_frames(frames[0])
+        assert [e["data"]["i"] for e in batches[0]] == list(range(50))
+
+    def test_background_flush_after_window(self):
+        """The flusher thread writes pending events after the window."""
+        import threading
+
+        written = threading.Event()
+        frames = []
+
+        def write(frame):
+            frames.append(frame)
+            written.set()
+
+        channel = EventChannel(write, coalesce_ms=5)
+        channel.send("TASK_LOG_TOOL_START", {"name": "Read"})
+
+        assert written.wait(timeout=2)
+        channel.close()
+        assert decode_frames(frames[0])[0][0][0]["type"] == "TASK_LOG_TOOL_START"
+
+    def test_full_batch_flushes_immediately(self):
+        """Hitting the batch limit writes without waiting for the window."""
+        frames = []
+        channel = EventChannel(frames.append, coalesce_ms=10_000)
+
+        for i in range(event_channel.MAX_BATCH_EVENTS):
+            channel.send("TASK_LOG_TEXT", {"i": i})
+
+        assert len(frames) == 1
+
+    def test_broken_channel_falls_back_to_stdout(self):
+        """A write failure replays the batch as stdout markers."""
+
+        def broken(frame):
+            raise BrokenPipeError("reader went away")
+
+        channel = EventChannel(broken, coalesce_ms=0)
+
+        with patch("sys.stdout", new_callable=StringIO) as stdout:
+            channel.send("EXEC_PHASE", {"phase": "coding", "message": ""})
+
+        assert channel.closed
+        assert stdout.getvalue().startswith("__EXEC_PHASE__:")
+        # Later events are refused so callers print directly
+        assert channel.send("EXEC_PHASE", {"phase": "qa_review"}) is False
+
+    def test_failed_write_prints_each_marker_once(self, monkeypatch):
+        """Events in a failing batch are not printed again by the emitters."""
+        from core.phase_event import ExecutionPhase, emit_phase
+        from task_logger.streaming import emit_marker
+
+        def broken(frame):
+            raise BrokenPipeError("reader went away")
+
+        channel = EventChannel(broken, coalesce_ms=0)
+        monkeypatch.setattr(event_channel, "get_event_channel", lambda: channel)
+
+        with patch("sys.stdout", new_callable=StringIO) as stdout:
+            emit_phase(ExecutionPhase.CODING, "Starting")
+            emit_marker("tool_start", {"name": "Read"})
+
+        lines = stdout.getvalue().splitlines()
+        assert sum(line.startswith("__EXEC_PHASE__:") for line in lines) == 1
+        assert sum(line.startswith("__TASK_LOG_TOOL_START__:") for line in lines) == 1
+
+    def test_coalesced_batch_replayed_once_after_failure(self):
+        """A background write failure replays every queued event exactly once."""
+
+        def broken(frame):
+            raise BrokenPipeError("reader went away")
+
+        channel = EventChannel(broken, coalesce_ms=20)
+
+        with patch("sys.stdout", new_callable=StringIO) as stdout:
+            for i in range(3):
+                assert channel.send("TASK_LOG_TEXT", {"i": i}) is True
+            channel._thread.join(timeout=2)
+
+        lines = stdout.getvalue().splitlines()
+        assert sorted(lines) == [
+            format_stdout_marker("TASK_LOG_TEXT", {"i": i}) for i in range(3)
+        ]
+
+
+class TestEmitterRouting:
+    """Tests for emit_marker/emit_phase using the channel."""
+
+    def test_no_channel_means_stdout(self):
+        """Without env configuration, send_event declines."""
+        assert send_event("EXEC_PHASE", {"phase": "coding"}) is False
+
+    def test_emit_phase_uses_channel(self, pipe_channel):
+        """Phase events go to the channel and not to stdout."""
+        from core.phase_event import ExecutionPhase, emit_phase
+
+        with patch("sys.stdout", new_callable=StringIO) as stdout:
+            emit_phase(ExecutionPhase.CODING, "Starting", progress=10)
+
+        assert stdout.getvalue() == ""
+        batches, _ = decode_frames(_read_available(pipe_channel))
+        event = batches[0][0]
+        assert event["type"] == "EXEC_PHASE"
+        assert event["data"] == {
+            "phase": "coding",
+            "message": "Starting",
+            "progress": 10,
+        }
+
+    def test_emit_marker_uses_channel(self, pipe_channel):
+        """Task log markers go to the channel with their TASK_LOG_ type."""
+        from task_logger.streaming import emit_marker
+
+        with patch("sys.stdout", new_callable=StringIO) as stdout:
+            emit_marker("tool_start", {"name": "Read"})
+
+        assert stdout.getvalue() == ""
+        batches, _ = decode_frames(_read_available(pipe_channel))
+        assert batches[0][0] == {
+            "type": "TASK_LOG_TOOL_START",
+            "data": {"name": "Read"},
+        }
+
+    def test_emit_marker_stdout_fallback_format(self):
+        """The stdout fallback is unchanged."""
+        from task_logger.streaming import emit_marker
+
+        with patch("sys.stdout", new_callable=StringIO) as stdout:
+            emit_marker("tool_start", {"name": "Read"})
+
+        line = stdout.getvalue().strip()
+        assert line.startswith("__TASK_LOG_TOOL_START__:")
+        assert json.loads(line.split(":", 1)[1]) == {"name": "Read"}
@@ -0,0 +1,259 @@
+"""
+Tests for GitHub issue batch clustering
+=======================================
+
+Covers union-find clustering of the similarity matrix (checked against the
+previous agglomerative algorithm), the MinHash issue index, and adding new
+issues to existing batches without re-clustering.
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add the backend runners/github directory to path
+_backend_dir = Path(__file__).parent.parent / "apps" / "backend"
+_github_dir = _backend_dir / "runners" / "github"
+if str(_github_dir) not in sys.path:
+    sys.path.insert(0, str(_github_dir))
+
+from batch_issues import BatchStatus, IssueBatcher
+from issue_clustering import IssueSimilarityIndex, UnionFind, cluster_issues
+from state_store import close_state_stores
+
+
+def _agglomerative(issue_numbers, similarity_matrix, threshold, max_batch_size):
+    """The previous O(n^3) clustering, kept as a reference."""
+    clusters = [{n} for n in issue_numbers]
+
+    def cluster_similarity(c1, c2):
+        scores = [
+            similarity_matrix[(a, b)]
+            for a in c1
+            for b in c2
+            if (a, b) in similarity_matrix
+        ]
+        return sum(scores) / len(scores) if scores else 0.0
+
+    while len(clusters) > 1:
+        best_score, best_pair = 0.0, (-1, -1)
+        for i in range(len(clusters)):
+            for j in range(i + 1, len(clusters)):
+                score = cluster_similarity(clusters[i], clusters[j])
+                if score > best_score:
+                    best_score, best_pair = score, (i, j)
+        if best_score < threshold:
+            break
+        i, j = best_pair
+        merged = clusters[i] | clusters[j]
+        if len(merged) > max_batch_size:
+            break
+        clusters = [c for k, c in enumerate(clusters) if k not in (i, j)]
+        clusters.append(merged)
+    return clusters
+
+
+def _agent_matrix(groups):
+    """Similarity matrix in the shape _build_similarity_matrix produces."""
+    matrix = {}
+    for group in groups:
+        for i, a in enumerate(group):
+            for b in group[i + 1 :]:
+                matrix[(a, b)] = matrix[(b, a)] = 0.85
+    return matrix
+
+
+def _random_groups(rng, n, max_size):
+    numbers = list(range(1, n + 1))
+    rng.shuffle(numbers)
+    groups = []
+    while numbers:
+        size = rng.randint(1, max_size)
+        groups.append(numbers[:size])
+        numbers = numbers[size:]
+    return groups
+
+
+def _as_sets(clusters):
+    return sorted(sorted(c) for c in clusters)
+
+
+@pytest.fixture
+def batcher(tmp_path):
+    github_dir = tmp_path / ".auto-claude" / "github"
+    github_dir.mkdir(parents=True)
+    yield IssueBatcher(
+        github_dir=github_dir,
+        repo="owner/repo",
+        max_batch_size=3,
+        validate_batches=False,
+    )
+    close_state_stores()
+
+
+def _issue(number, title, body="", labels=()):
+    return {
+        "number": number,
+        "title": title,
+        "body": body,
+        "labels": [{"name": name} for name in labels],
+    }
+
+
+class TestClusterIssues:
+    """Union-find clustering matches the previous batches."""
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_agglomerative_on_agent_matrices(self, seed):
+        rng = random.Random(seed)
+        groups = _random_groups(rng, 60, 5)
+        matrix = _agent_matrix(groups)
+        numbers = list(range(1, 61))
+
+        clusters = cluster_issues(numbers, matrix, 0.70, 5)
+
+        assert _as_sets(clusters) == _as_sets(_agglomerative(numbers, matrix, 0.70, 5))
+        assert _as_sets(clusters) == _as_sets(groups)
+
+    def test_threshold_and_max_size(self):
+        matrix = {(1, 2): 0.9, (2, 3): 0.8, (3, 4): 0.75, (4, 5): 0.5}
+
+        clusters = cluster_issues([1, 2, 3, 4, 5], matrix, 0.70, 3)
+
+        # Strongest edges first; 3-4 would exceed the size cap
+        assert clusters == [[1, 2, 3], [4], [5]]
+
+    def test_ignores_issues_outside_the_input(self):
+        assert cluster_issues([1, 2], {(1, 99): 0.9, (2, 1): 0.9}, 0.7, 5) == [[1, 2]]
+
+    def test_union_find_sizes(self):
+        uf = UnionFind(range(4))
+        assert uf.union(0, 1) and uf.union(2, 3)
+        assert not uf.union(1, 2, max_size=3)
+        assert uf.union(1, 2, max_size=4)
+        assert uf.size(3) == 4 and uf.find(0) == uf.find(3)
+
+    @pytest.mark.slow
+    def test_benchmark_large_backlog(self):
+        rng = random.Random(1)
+        groups = _random_groups(rng, 300, 5)
+        matrix = _agent_matrix(groups)
+        numbers = list(range(1, 301))
+
+        start = time.perf_counter()
+        reference = _agglomerative(numbers, matrix, 0.70, 5)
+        agglomerative_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        clusters = cluster_issues(numbers, matrix, 0.70, 5)
+        union_find_seconds = time.perf_counter() - start
+
+        assert _as_sets(clusters) == _as_sets(reference)
+        assert union_find_seconds < agglomerative_seconds
+        print(
+            f"\n300 issues: agglomerative {agglomerative_seconds * 1000:.0f}ms, "
+            f"union-find {union_find_seconds * 1000:.1f}ms"
+        )
+
+
+def test_similarity_index_nearest():
+    index = IssueSimilarityIndex()
+    index.add(1, "Login fails with OAuth token expired", "OAuth login token refresh")
+    index.add(2, "Dark mode colors wrong in settings page", "")
+    index.add(3, "Crash on startup", "")
+
+    nearest = index.nearest("OAuth login fails: token expired", "refresh token")
+
+    assert [number for number, _ in nearest] == [1]
+    assert nearest[0][1] >= 0.5
+
+    index.remove(1)
+    assert index.nearest("OAuth login fails: token expired", "refresh token") == []
+    assert len(index) == 2
+
+
+class TestAddIssue:
+    """New issues join an existing batch without re-clustering."""
+
+    async def _seed_batch(self, batcher, monkeypatch):
+        async def fake_matrix(issues):
+            return _agent_matrix([[10, 11], [20]]), {}
+
+        monkeypatch.setattr(batcher, "_build_similarity_matrix", fake_matrix)
+        return await batcher.create_batches(
+            [
+                _issue(10, "OAuth login token expired", "Login fails after refresh"),
+                _issue(11, "OAuth token refresh fails", "Login token expired error"),
+                _issue(20, "Settings page dark mode colors", "Colors are wrong"),
+            ]
+        )
+
+    async def test_joins_most_similar_batch(self, batcher, monkeypatch):
+        batches = await self._seed_batch(batcher, monkeypatch)
+        assert len(batches) == 2
+
+        async def no_reclustering(issues):
+            raise AssertionError("add_issue must not re-cluster")
+
+        monkeypatch.setattr(batcher, "_build_similarity_matrix", no_reclustering)
+
+        batch = await batcher.add_issue(
+            _issue(12, "OAuth login token expired again", "refresh fails", ["bug"])
+        )
+
+        assert batch is not None
+        assert sorted(batch.get_issue_numbers()) == [10, 11, 12]
+        assert batcher.get_batch_for_issue(12).batch_id == batch.batch_id
+        assert batcher.is_issue_in_batch(12)
+
+    async def test_new_issues_join_batches_before_clustering(
+        self, batcher, monkeypatch
+    ):
+        await self._seed_batch(batcher, monkeypatch)
+        clustered = []
+
+        async def fake_matrix(issues):
+            clustered.extend(i["number"] for i in issues)
+            return {}, {}
+
+        monkeypatch.setattr(batcher, "_build_similarity_matrix", fake_matrix)
+        new_issues = [
+            _issue(12, "OAuth login token expired again", "refresh fails"),
+            _issue(30, "Upgrade build dependencies"),
+        ]
+
+        grown = await batcher.add_issues(new_issues, exclude_issue_numbers={30})
+        await batcher.create_batches(new_issues)
+
+        assert [sorted(b.get_issue_numbers()) for b in grown] == [[10, 11, 12]]
+        assert clustered == [30]
+
+    async def test_unrelated_issue_is_left_alone(self, batcher, monkeypatch):
+        await self._seed_batch(batcher, monkeypatch)
+
+        assert await batcher.add_issue(_issue(30, "Upgrade build dependencies")) is None
+        assert not batcher.is_issue_in_batch(30)
+
+    async def test_full_or_started_batches_are_skipped(self, batcher, monkeypatch):
+        await self._seed_batch(batcher, monkeypatch)
+        first = await batcher.add_issue(_issue(12, "OAuth login token expired again"))
+        assert len(first.issues) == 3
+
+        # The batch is at max_batch_size
+        assert await batcher.add_issue(_issue(13, "OAuth login token expired")) is None
+
+        other = batcher.get_batch_for_issue(20)
+        other.update_status(BatchStatus.BUILDING)
+        await other.save(batcher.github_dir)
+        fresh = IssueBatcher(
+            github_dir=batcher.github_dir,
+            repo="owner/repo",
+            max_batch_size=3,
+            validate_batches=False,
+        )
+        assert (
+            await fresh.add_issue(_issue(21, "Settings page dark mode colors")) is None
+        )
@@ -0,0 +1,308 @@
+"""
+Tests for chunked PR review
+===========================
+
+Covers partitioning changed files into token-bounded chunks along module
+boundaries, concurrent chunk review with streamed, de-duplicated findings,
+and a synthetic 5,000-file PR benchmark.
+"""
+
+import asyncio
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+# Add the backend runners/github directory to path
+_backend_dir = Path(__file__).parent.parent / "apps" / "backend"
+_github_dir = _backend_dir / "runners" / "github"
+if str(_github_dir) not in sys.path:
+    sys.path.insert(0, str(_github_dir))
+
+from chunked_review import (
+    ChunkedReview,
+    FindingMerger,
+    file_tokens,
+    module_of,
+    needs_chunked_review,
+    partition_files,
+)
+from context_gatherer import ChangedFile, PRContext
+from models import PRReviewFinding, ReviewCategory, ReviewSeverity
+
+
+def _file(path: str, patch_chars: int = 400) -> ChangedFile:
+    return ChangedFile(
+        path=path,
+        status="modified",
+        additions=10,
+        deletions=2,
+        content="",
+        base_content="",
+        patch="+" * patch_chars,
+    )
+
+
+def _finding(
+    file: str, line: int = 1, title: str = "Unchecked input"
+) -> PRReviewFinding:
+    return PRReviewFinding(
+        id=f"{file}:{line}",
+        severity=ReviewSeverity.MEDIUM,
+        category=ReviewCategory.QUALITY,
+        title=title,
+        description="",
+        file=file,
+        line=line,
+    )
+
+
+def _synthetic_pr(files: int, per_module: int = 25) -> list[ChangedFile]:
+    return [
+        _file(f"src/pkg{i // per_module:03d}/module_{i % per_module:02d}.py", 800)
+        for i in range(files)
+    ]
+
+
+class TestPartitionFiles:
+    """Tests for partition_files()."""
+
+    def test_every_file_in_exactly_one_chunk(self):
+        files = _synthetic_pr(300)
+
+        chunks = list(partition_files(files, max_tokens=3000, max_files=20))
+
+        paths = [f.path for chunk in chunks for f in chunk.files]
+        assert sorted(paths) == sorted(f.path for f in files)
+        assert [c.index for c in chunks] == list(range(len(chunks)))
+        assert all(c.tokens <= 3000 and len(c.files) <= 20 for c in chunks)
+
+    def test_modules_are_not_split_when_they_fit(self):
+        files = [_file(f"{d}/f{i}.py") for d in ("api", "db", "ui") for i in range(4)]
+
+        chunks = list(partition_files(files, max_tokens=1000))
+
+        assert [c.modules for c in chunks] == [["api", "db"], ["ui"]]
+
+    def test_oversized_module_is_split_between_files(self):
+        files = [_file(f"big/f{i}.py") for i in range(10)] + [_file("small/a.py")]
+
+        chunks = list(partition_files(files, max_tokens=500))
+
+        big_chunks = [c for c in chunks if c.modules == ["big"]]
+        assert [len(c.files) for c in big_chunks] == [4, 4, 2]
+        assert chunks[-1].modules == ["small"]
+
+    def test_huge_file_gets_its_own_chunk(self):
+        files = [_file("a/small.py"), _file("a/zz_huge.py", 100_000)]
+
+        chunks = list(partition_files(files, max_tokens=1000))
+
+        assert [[f.path for f in c.files] for c in chunks] == [
+            ["a/small.py"],
+            ["a/zz_huge.py"],
+        ]
+        assert chunks[1].tokens == file_tokens(files[1])
+
+    def test_needs_chunked_review(self):
+        small = [_file(f"m/f{i}.py") for i in range(3)]
+        many = [_file(f"m/f{i}.py") for i in range(60)]
+        big = [_file(f"m/f{i}.py", 20_000) for i in range(3)]
+
+        assert not needs_chunked_review(small, diff="+" * 1200)
+        assert not needs_chunked_review(small, diff_truncated=True)
+        assert needs_chunked_review(many, diff_truncated=True)
+        assert needs_chunked_review(big, diff_truncated=True)
+        # A full diff a single pass would cut at 50,000 characters
+        assert needs_chunked_review(big, diff="+" * 60_000)
+        assert not needs_chunked_review([_file("m/a.py", 0)], diff="+" * 60_000)
+
+    def test_module_of(self):
+        assert module_of("apps/backend/core/client.py") == "apps/backend/core"
+        assert module_of("README.md") == "."
+
+
+class TestChunkedReview:
+    """Tests for ChunkedReview."""
+
+    async def test_findings_are_merged_and_deduplicated(self):
+        files = [_file(f"m{i}/a.py") for i in range(6)]
+
+        async def review_chunk(chunk):
+            # Every chunk also reports the same repo-wide finding
+            return [_finding(f.path) for f in chunk.files] + [
+                _finding("setup.py", title="Missing  LICENSE")
+            ]
+
+        review = ChunkedReview(files, review_chunk, max_tokens=250, concurrency=2)
+        findings = await review.run()
+
+        assert len(findings) == 7
+        assert review.stats.chunks == 3
+        assert review.stats.duplicates == 2
+        assert review.stats.time_to_first_finding is not None
+        assert review.stats.to_dict()["strategy"] == "chunked"
+
+    async def test_concurrency_is_bounded(self):
+        files = _synthetic_pr(200, per_module=5)
+        active = peak = 0
+
+        async def review_chunk(chunk):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.001)
+            active -= 1
+            return []
+
+        review = ChunkedReview(files, review_chunk, max_tokens=1100, concurrency=3)
+        await review.run()
+
+        assert peak == 3
+        assert review.stats.chunks == 40
+
+    async def test_failed_chunk_does_not_stop_review(self):
+        files = [_file(f"m{i}/a.py") for i in range(4)]
+
+        async def review_chunk(chunk):
+            if chunk.index == 1:
+                raise RuntimeError("session crashed")
+            return [_finding(chunk.files[0].path)]
+
+        review = ChunkedReview(files, review_chunk, max_tokens=150)
+        findings = await review.run()
+
+        assert len(findings) == 3
+        assert review.stats.chunks_failed == 1
+        assert "session crashed" in review.stats.errors[0]
+
+    async def test_stopping_early_cancels_pending_chunks(self):
+        files = [_file(f"m{i}/a.py") for i in range(20)]
+        reviewed = []
+
+        async def review_chunk(chunk):
+            reviewed.append(chunk.index)
+            await asyncio.sleep(0.01)
+            return [_finding(chunk.files[0].path)]
+
+        review = ChunkedReview(files, review_chunk, max_tokens=150, concurrency=2)
+        stream = review.stream()
+        first = await stream.__anext__()
+        await stream.aclose()
+
+        assert first.file.startswith("m")
+        assert len(reviewed) < 20
+
+    def test_merger_normalizes_titles(self):
+        merger = FindingMerger()
+
+        assert merger.add(_finding("a.py", 3, "SQL injection"))
+        assert not merger.add(_finding("a.py", 3, "sql   Injection "))
+        assert merger.add(_finding("a.py", 4, "SQL injection"))
+        assert merger.duplicates == 1
+
+
+def _context(files: list[ChangedFile], diff: str = "", **overrides) -> PRContext:
+    return PRContext(
+        pr_number=1,
+        title="Large change",
+        description="",
+        author="dev",
+        base_branch="main",
+        head_branch="feature",
+        state="open",
+        changed_files=files,
+        diff=diff,
+        repo_structure="",
+        related_files=[],
+        **overrides,
+    )
+
+
+class TestEngineRouting:
+    """Which PRs PRReviewEngine reviews in chunks."""
+
+    @pytest.fixture
+    def engine(self, tmp_path):
+        # The runners package imports python-dotenv on import
+        pytest.importorskip("dotenv")
+        for path in (_backend_dir, _backend_dir / "runners"):
+            if str(path) not in sys.path:
+                sys.path.append(str(path))
+        from runners.github.models import GitHubRunnerConfig
+        from runners.github.services.pr_review_engine import PRReviewEngine
+
+        config = GitHubRunnerConfig(token="t", repo="o/r")
+        return PRReviewEngine(tmp_path, tmp_path, config)
+
+    def test_orchestrator_keeps_medium_prs(self, engine):
+        big = [_file(f"m/f{i}.py", 20_000) for i in range(3)]
+
+        engine.config.use_parallel_orchestrator = True
+        assert not engine.needs_chunked_review(_context(big, "+" * 60_000))
+        assert engine.needs_chunked_review(_context(big, diff_truncated=True))
+
+        engine.config.use_parallel_orchestrator = False
+        assert engine.needs_chunked_review(_context(big, "+" * 60_000))
+
+    async def test_chunked_mode_keeps_structural_and_triage(self, engine):
+        engine.config.use_parallel_orchestrator = False
+        context = _context(
+            [_file(f"m/f{i}.py") for i in range(60)],
+            diff_truncated=True,
+            ai_bot_comments=[object()],
+        )
+
+        async def chunked(ctx):
+            return [_finding("m/f1.py")], {"strategy": "chunked"}
+
+        async def side_pass(ctx):
+            return "result"
+
+        engine.run_chunked_review = chunked
+        engine._run_structural_pass = side_pass
+        engine._run_ai_triage_pass = side_pass
+        engine.parser.parse_structural_issues = lambda text: ["structural"]
+        engine.parser.parse_ai_comment_triages = lambda text: ["triage"]
+
+        findings, structural, triages, summary = await engine.run_multi_pass_review(
+            context
+        )
+
+        assert len(findings) == 1
+        assert structural == ["structural"]
+        assert triages == ["triage"]
+        assert summary["strategy"] == "chunked"
+
+
+@pytest.mark.slow
+async def test_synthetic_5000_file_pr_benchmark():
+    """Time to first finding and peak memory on a 5,000-file PR."""
+    files = _synthetic_pr(5000)
+
+    async def review_chunk(chunk):
+        await asyncio.sleep(0.002)
+        return [_finding(f.path) for f in chunk.files[:2]]
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    review = ChunkedReview(files, review_chunk, concurrency=4)
+    count = 0
+    async for _ in review.stream():
+        count += 1
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    stats = review.stats
+    print(
+        f"\n5000 files: {stats.chunks} chunks, {count} findings, "
+        f"first finding {stats.time_to_first_finding * 1000:.1f}ms, "
+        f"total {elapsed:.2f}s, peak {peak / 1024:.0f} KiB"
+    )
+    assert stats.chunks >= 5000 // 50
+    assert stats.time_to_first_finding < elapsed / 4
+    # Chunks hold references to the files; nothing is copied per chunk
+    assert peak < 5 * 1024 * 1024
@@ -0,0 +1,309 @@
+"""
+Tests for the GitHub runner state store
+=======================================
+
+Covers the SQLite store, the one-shot JSON migration, the runner state
+classes persisting through it, and a multi-process stress benchmark.
+"""
+
+import asyncio
+import json
+import multiprocessing
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add the backend runners/github directory to path
+_backend_dir = Path(__file__).parent.parent / "apps" / "backend"
+_github_dir = _backend_dir / "runners" / "github"
+if str(_github_dir) not in sys.path:
+    sys.path.insert(0, str(_github_dir))
+
+from bot_detection import BotDetectionState, BotDetector
+from cleanup import DataCleaner
+from file_lock import locked_json_read, locked_json_update, locked_json_write
+from models import AutoFixState, AutoFixStatus
+from state_store import (
+    NS_AUTOFIX_QUEUE,
+    NS_BATCH_INDEX,
+    NS_BOT_DETECTION,
+    NS_PR_REVIEWS,
+    NS_TRUST,
+    StateStore,
+    close_state_stores,
+    get_state_store,
+    migrate_json_state,
+)
+from trust import TrustLevel, TrustManager
+
+
+@pytest.fixture
+def state_dir(tmp_path):
+    state_dir = tmp_path / "github"
+    state_dir.mkdir()
+    yield state_dir
+    close_state_stores()
+
+
+class TestStateStore:
+    """Tests for StateStore operations."""
+
+    def test_put_get_items_delete(self, state_dir):
+        store = StateStore(state_dir / "state.db")
+        store.put("ns", "a", {"x": 1})
+        store.put_many("ns", {"b": [1, 2], 3: "three"})
+
+        assert store.get("ns", "a") == {"x": 1}
+        assert store.get("ns", "missing", default=0) == 0
+        assert store.items("ns") == {"3": "three", "a": {"x": 1}, "b": [1, 2]}
+
+        store.delete("ns", "a")
+        store.delete_many("ns", ["b"])
+        assert store.items("ns") == {"3": "three"}
+        assert store.count("other") == 0
+
+    def test_update_read_modify_write(self, state_dir):
+        store = StateStore(state_dir / "state.db")
+        store.update("ns", "n", lambda v: (v or 0) + 1)
+        assert store.update("ns", "n", lambda v: v + 1) == 2
+        # Returning None deletes the key
+        store.update("ns", "n", lambda v: None)
+        assert store.get("ns", "n") is None
+
+    def test_failed_transaction_rolls_back(self, state_dir):
+        store = StateStore(state_dir / "state.db")
+        store.put("ns", "a", 1)
+
+        with pytest.raises(RuntimeError):
+            with store.transaction() as conn:
+                store.put("ns", "a", 2, conn=conn)
+                raise RuntimeError("boom")
+
+        assert store.get("ns", "a") == 1
+
+    def test_wal_mode_and_owner_only_file(self, state_dir):
+        store = StateStore(state_dir / "state.db")
+        mode = store._connection().execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+        assert (state_dir / "state.db").stat().st_mode & 0o077 == 0
+
+    def test_closed_store_reopens(self, state_dir):
+        store = StateStore(state_dir / "state.db")
+        store.put("ns", "a", 1)
+        store.close()
+        assert store.get("ns", "a") == 1
+
+
+class TestJsonMigration:
+    """Tests for migrate_json_state."""
+
+    def _write_legacy_files(self, state_dir: Path) -> None:
+        (state_dir / "bot_detection_state.json").write_text(
+            json.dumps(
+                {
+                    "reviewed_commits": {"42": ["abc"]},
+                    "last_review_times": {"42": "2025-01-01T10:00:00"},
+                }
+            )
+        )
+        (state_dir / "trust").mkdir(exist_ok=True)
+        (state_dir / "trust" / "owner_repo.json").write_text(
+            json.dumps({"repo": "owner/repo", "current_level": 2})
+        )
+        (state_dir / "batches").mkdir(exist_ok=True)
+        (state_dir / "batches" / "index.json").write_text(
+            json.dumps({"issue_to_batch": {"7": "batch-1"}})
+        )
+        (state_dir / "issues").mkdir(exist_ok=True)
+        (state_dir / "issues" / "index.json").write_text(
+            json.dumps({"auto_fix_queue": [{"issue_number": 9, "status": "pending"}]})
+        )
+
+    def test_imports_legacy_files_once(self, state_dir):
+        self._write_legacy_files(state_dir)
+
+        store = get_state_store(state_dir)
+
+        assert store.get(NS_BOT_DETECTION, "42")["reviewed_commits"] == ["abc"]
+        assert store.get(NS_TRUST, "owner/repo")["current_level"] == 2
+        assert store.get(NS_BATCH_INDEX, "7") == "batch-1"
+        assert store.get(NS_AUTOFIX_QUEUE, "9")["status"] == "pending"
+        assert (state_dir / "bot_detection_state.json.migrated").exists()
+        assert not (state_dir / "trust" / "owner_repo.json").exists()
+
+        # Files reappearing later are not imported again
+        self._write_legacy_files(state_dir)
+        assert migrate_json_state(store, state_dir) == 0
+
+    def test_existing_rows_win(self, state_dir):
+        store = StateStore(state_dir / "state.db")
+        store.put(NS_BATCH_INDEX, "7", "batch-new")
+        self._write_legacy_files(state_dir)
+
+        migrate_json_state(store, state_dir)
+
+        assert store.get(NS_BATCH_INDEX, "7") == "batch-new"
+
+    def test_legacy_state_visible_through_runner_classes(self, state_dir):
+        self._write_legacy_files(state_dir)
+
+        assert BotDetectionState.load(state_dir).reviewed_commits == {"42": ["abc"]}
+        trust = TrustManager(state_dir).get_state("owner/repo")
+        assert trust.current_level == TrustLevel(2)
+
+
+class TestRunnerStatePersistence:
+    """Runner state classes persisting through the store."""
+
+    def test_concurrent_detectors_do_not_lose_reviews(self, state_dir):
+        first = BotDetector(state_dir=state_dir, review_own_prs=True)
+        second = BotDetector(state_dir=state_dir, review_own_prs=True)
+
+        first.mark_reviewed(1, "aaa111")
+        second.mark_reviewed(1, "bbb222")
+        second.mark_reviewed(2, "ccc333")
+        first.clear_pr_state(3)
+
+        loaded = BotDetectionState.load(state_dir)
+        assert loaded.reviewed_commits == {"1": ["aaa111", "bbb222"], "2": ["ccc333"]}
+
+    def test_trust_state_round_trip(self, state_dir):
+        manager = TrustManager(state_dir)
+        manager.record_action("owner/repo", "review", correct=True)
+
+        other = TrustManager(state_dir)
+        assert other.get_state("owner/repo").metrics.total_actions == 1
+        assert [s.repo for s in other.get_all_states()] == ["owner/repo"]
+
+    async def test_autofix_queue_entry(self, state_dir):
+        state = AutoFixState(
+            issue_number=5,
+            issue_url="https://github.com/o/r/issues/5",
+            repo="o/r",
+            status=AutoFixStatus.PENDING,
+        )
+        await state.save(state_dir)
+
+        entry = get_state_store(state_dir).get(NS_AUTOFIX_QUEUE, 5)
+        assert entry["status"] == "pending"
+        # The desktop app reads the per-issue document directly
+        assert (state_dir / "issues" / "autofix_5.json").exists()
+
+    async def test_cleanup_prunes_rows_without_documents(self, state_dir):
+        for issue in (5, 6):
+            await AutoFixState(
+                issue_number=issue,
+                issue_url=f"https://github.com/o/r/issues/{issue}",
+                repo="o/r",
+                status=AutoFixStatus.PENDING,
+            ).save(state_dir)
+        store = get_state_store(state_dir)
+        store.put(NS_BATCH_INDEX, "7", "gone")
+        (state_dir / "issues" / "autofix_6.json").unlink()
+        cleaner = DataCleaner(state_dir)
+
+        preview = await cleaner.run_cleanup(dry_run=True)
+        assert preview.pruned_index_entries == 2
+        assert store.count(NS_AUTOFIX_QUEUE) == 2
+
+        result = await cleaner.run_cleanup()
+        assert result.pruned_index_entries == 2
+        assert list(store.items(NS_AUTOFIX_QUEUE)) == ["5"]
+        assert store.count(NS_BATCH_INDEX) == 0
+
+    async def test_purge_deletes_store_rows(self, state_dir):
+        store = get_state_store(state_dir)
+        TrustManager(state_dir).record_action("o/r", "review", correct=True)
+        store.put(NS_AUTOFIX_QUEUE, 5, {"issue_number": 5, "repo": "o/r"})
+        store.put(NS_AUTOFIX_QUEUE, 6, {"issue_number": 6, "repo": "o/other"})
+        store.put(NS_PR_REVIEWS, 7, {"pr_number": 7, "repo": "o/r"})
+        store.put(NS_PR_REVIEWS, 8, {"pr_number": 8, "repo": "o/r"})
+        cleaner = DataCleaner(state_dir)
+
+        result = await cleaner.purge_pr(8, repo="o/r")
+        assert result.deleted_count == 1
+        assert list(store.items(NS_PR_REVIEWS)) == ["7"]
+
+        result = await cleaner.purge_repo("o/r")
+        assert result.deleted_count == 3
+        assert store.get(NS_TRUST, "o/r") is None
+        assert store.count(NS_PR_REVIEWS) == 0
+        assert list(store.items(NS_AUTOFIX_QUEUE)) == ["6"]
+
+
+# =============================================================================
+# STRESS BENCHMARK
+# =============================================================================
+
+WORKERS = 4
+UPDATES_PER_WORKER = 100
+
+
+def _store_worker(state_dir: str, worker: int) -> None:
+    store = get_state_store(state_dir)
+    for i in range(UPDATES_PER_WORKER):
+        store.update("counters", "shared", lambda v: (v or 0) + 1)
+        store.put("reviews", f"{worker}-{i}", {"worker": worker, "i": i})
+
+
+def _json_worker(state_dir: str, worker: int) -> None:
+    index_file = Path(state_dir) / "index.json"
+
+    def add(data, i):
+        data = data or {"shared": 0, "reviews": {}}
+        data["shared"] += 1
+        data["reviews"][f"{worker}-{i}"] = {"worker": worker, "i": i}
+        return data
+
+    async def run():
+        for i in range(UPDATES_PER_WORKER):
+            await locked_json_update(index_file, lambda d, i=i: add(d, i), timeout=30.0)
+
+    asyncio.run(run())
+
+
+def _run_workers(target, state_dir: Path) -> float:
+    ctx = multiprocessing.get_context("fork")
+    processes = [
+        ctx.Process(target=target, args=(str(state_dir), w)) for w in range(WORKERS)
+    ]
+    start = time.perf_counter()
+    for p in processes:
+        p.start()
+    for p in processes:
+        p.join(timeout=120)
+        assert p.exitcode == 0
+    return time.perf_counter() - start
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(sys.platform == "win32", reason="uses fork")
+def test_stress_concurrent_writers(tmp_path):
+    """
+    Concurrent processes updating shared state lose no writes.
+
+    The locked-JSON baseline is only measured: FileLock unlinks its lock file
+    on release, so processes can end up holding locks on different inodes
+    and lose updates.
+    """
+    store_dir = tmp_path / "store"
+    json_dir = tmp_path / "json"
+    json_dir.mkdir()
+    asyncio.run(locked_json_write(json_dir / "index.json", None))
+
+    store_seconds = _run_workers(_store_worker, store_dir)
+    json_seconds = _run_workers(_json_worker, json_dir)
+
+    total = WORKERS * UPDATES_PER_WORKER
+    store = StateStore(store_dir / "state.db")
+    assert store.get("counters", "shared") == total
+    assert store.count("reviews") == total
+    json_kept = asyncio.run(locked_json_read(json_dir / "index.json"))["shared"]
+
+    print(
+        f"\n{WORKERS} processes x {UPDATES_PER_WORKER} read-modify-writes: "
+        f"state store {total / store_seconds:.0f} ops/s (kept {total}/{total}), "
+        f"locked JSON {total / json_seconds:.0f} ops/s (kept {json_kept}/{total})"
+    )
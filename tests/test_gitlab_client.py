@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Tests for the GitLab API client.
+
+Runs the client against a local stub HTTP server and covers:
+- Keep-alive connection reuse
+- ETag revalidation (If-None-Match / 304)
+- Non-blocking rate-limit backoff
+- Concurrent MR context fetch
+"""
+
+import asyncio
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "apps" / "backend"))
+sys.path.insert(
+    0, str(Path(__file__).parent.parent / "apps" / "backend" / "runners" / "gitlab")
+)
+
+from glab_client import GitLabClient, GitLabConfig, GitLabConnectionPool
+
+MR_PATH = "/api/v4/projects/group%2Fproject/merge_requests/7"
+
+
+class StubGitLab(ThreadingHTTPServer):
+    """GitLab API stub recording requests and TCP connections."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.connections = 0
+        self.requests: list[tuple[str, dict]] = []
+        self.rate_limited: set[str] = set()
+        self.redirects: dict[str, str] = {}
+        self.delay = 0.0
+        self.routes = {
+            MR_PATH: {"title": "Add feature", "sha": "abc123"},
+            f"{MR_PATH}/changes": {
+                "changes": [{"new_path": "a.py", "old_path": "a.py", "diff": "+x\n"}]
+            },
+            f"{MR_PATH}/commits": [{"id": "abc123"}],
+            "/api/v4/user": {"username": "bot"},
+        }
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status: int, body: bytes = b"", headers: dict | None = None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.do_GET()
+
+    def do_GET(self):
+        server = self.server
+        server.requests.append((self.path, dict(self.headers)))
+        # Requests sent through a proxy carry the absolute URL
+        path = self.path
+        if path.startswith("http://"):
+            path = "/" + path.split("/", 3)[3]
+        if server.delay:
+            time.sleep(server.delay)
+
+        if path in server.rate_limited:
+            server.rate_limited.discard(path)
+            self._send(429, b"slow down", {"Retry-After": "1"})
+            return
+
+        if path in server.redirects:
+            self._send(301, headers={"Location": server.redirects[path]})
+            return
+
+        if path not in server.routes:
+            self._send(404, b'{"message": "404 Not Found"}')
+            return
+
+        body = json.dumps(server.routes[path]).encode()
+        etag = f'"{hash(body)}"'
+        if self.headers.get("If-None-Match") == etag:
+            self._send(304, headers={"ETag": etag})
+            return
+        self._send(200, body, {"ETag": etag, "Content-Type": "application/json"})
+
+
+@pytest.fixture
+def server():
+    stub = StubGitLab()
+    thread = threading.Thread(target=stub.serve_forever, daemon=True)
+    thread.start()
+    yield stub
+    stub.shutdown()
+    stub.server_close()
+
+
+@pytest.fixture
+def client(server, temp_dir):
+    host, port = server.server_address
+    gitlab = GitLabClient(
+        temp_dir,
+        GitLabConfig(
+            token="secret",
+            project="group/project",
+            instance_url=f"http://{host}:{port}",
+        ),
+        default_timeout=5.0,
+    )
+    yield gitlab
+    gitlab.close()
+
+
+class TestTransport:
+    """Pooled connections and conditional requests."""
+
+    async def test_connections_are_reused(self, client, server):
+        for _ in range(5):
+            assert (await client.get_current_user())["username"] == "bot"
+
+        assert server.connections == 1
+        assert client.pool.connections_opened == 1
+
+    async def test_etag_revalidation(self, client, server):
+        first = await client.get_mr(7)
+        second = await client.get_mr(7)
+
+        assert first == second == {"title": "Add feature", "sha": "abc123"}
+        assert "If-None-Match" not in server.requests[0][1]
+        assert server.requests[1][1]["If-None-Match"]
+
+    async def test_changed_resource_is_refetched(self, client, server):
+        await client.get_mr(7)
+        server.routes[MR_PATH] = {"title": "Renamed", "sha": "def456"}
+
+        assert (await client.get_mr(7))["title"] == "Renamed"
+
+    async def test_etag_cache_is_bounded(self, client, server):
+        client.etag_cache_size = 2
+        await client.get_mr(7)
+        await client.get_current_user()
+        await client.get_mr(7)  # Now the most recently used entry
+        await client.get_mr_changes(7)
+
+        assert list(client._etag_cache) == [MR_PATH, f"{MR_PATH}/changes"]
+
+    async def test_context_manager_closes_idle_connections(self, client):
+        async with client:
+            await client.get_current_user()
+            assert client.pool._idle
+
+        assert client.pool._idle == []
+
+    async def test_get_follows_redirects(self, client, server):
+        host, port = server.server_address
+        server.redirects["/api/v4/user"] = "/api/v4/users/bot"
+        server.redirects["/api/v4/users/bot"] = f"http://{host}:{port}/api/v4/me"
+        server.routes["/api/v4/me"] = {"username": "bot"}
+
+        assert (await client.get_current_user())["username"] == "bot"
+        assert [path for path, _ in server.requests][-1] == "/api/v4/me"
+
+    async def test_post_is_not_redirected(self, client, server):
+        server.redirects[f"{MR_PATH}/notes"] = "/elsewhere"
+
+        with pytest.raises(Exception, match="GitLab API error 301"):
+            await client._fetch(
+                "/projects/group%2Fproject/merge_requests/7/notes",
+                method="POST",
+                data={"body": "hi"},
+            )
+
+    async def test_http_proxy_from_environment(self, server, temp_dir, monkeypatch):
+        host, port = server.server_address
+        monkeypatch.setenv("http_proxy", f"http://user:pw@{host}:{port}")
+        monkeypatch.delenv("no_proxy", raising=False)
+        monkeypatch.delenv("NO_PROXY", raising=False)
+        config = GitLabConfig(
+            token="secret", project="group/project", instance_url="http://gitlab.test"
+        )
+
+        async with GitLabClient(temp_dir, config, default_timeout=5.0) as gitlab:
+            assert (await gitlab.get_current_user())["username"] == "bot"
+
+        path, headers = server.requests[0]
+        assert path == "http://gitlab.test/api/v4/user"
+        assert headers["Proxy-Authorization"].startswith("Basic ")
+
+    def test_https_proxy_tunnels(self, monkeypatch):
+        monkeypatch.setenv("https_proxy", "http://proxy.test:3128")
+        monkeypatch.setenv("no_proxy", "internal.test")
+        monkeypatch.delenv("NO_PROXY", raising=False)
+
+        conn = GitLabConnectionPool("https://gitlab.test")._new_connection(5.0)
+        assert (conn.host, conn.port) == ("proxy.test", 3128)
+        assert conn._tunnel_host == "gitlab.test"
+        assert GitLabConnectionPool("https://internal.test").proxy is None
+
+    async def test_http_error_raises(self, client):
+        with pytest.raises(Exception, match="GitLab API error 404"):
+            await client.get_mr(8)
+
+    async def test_token_header_sent(self, client, server):
+        await client.get_current_user()
+        assert server.requests[0][1]["PRIVATE-TOKEN"] == "secret"
+
+
+async def test_rate_limit_backoff_does_not_block_loop(client, server):
+    server.rate_limited.add("/api/v4/user")
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.05)
+            ticks += 1
+
+    task = asyncio.create_task(ticker())
+    try:
+        user = await client.get_current_user()
+    finally:
+        task.cancel()
+
+    assert user["username"] == "bot"
+    assert len(server.requests) == 2
+    # The loop kept running throughout the 1s Retry-After wait
+    assert ticks >= 10
+
+
+async def test_mr_bundle_fetched_concurrently(client, server):
+    server.delay = 0.3
+
+    start = time.perf_counter()
+    mr, changes, commits = await client.get_mr_bundle(7)
+    elapsed = time.perf_counter() - start
+
+    assert mr["title"] == "Add feature"
+    assert changes["changes"][0]["new_path"] == "a.py"
+    assert commits == [{"id": "abc123"}]
+    assert elapsed < 0.3 * 2
+
+
+async def test_orchestrator_gathers_mr_context(client, server, temp_dir):
+    # The runners package imports python-dotenv on import
+    pytest.importorskip("dotenv")
+    from runners.gitlab.models import GitLabRunnerConfig
+    from runners.gitlab.orchestrator import GitLabOrchestrator
+
+    orchestrator = GitLabOrchestrator(
+        temp_dir,
+        GitLabRunnerConfig(
+            token="secret",
+            project="group/project",
+            instance_url=client.config.instance_url,
+        ),
+    )
+    orchestrator.client = client
+
+    context = await orchestrator._gather_mr_context(7)
+
+    assert context.title == "Add feature"
+    assert context.head_sha == "abc123"
+    assert context.commits == [{"id": "abc123"}]
+    assert context.total_additions == 1
+
+    async with orchestrator:
+        assert client.pool._idle
+    assert client.pool._idle == []
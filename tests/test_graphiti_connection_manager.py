@@ -0,0 +1,206 @@
+"""Tests for the process-wide Graphiti connection manager."""
+
+import asyncio
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "apps" / "backend"))
+
+from graphiti_config import GraphitiConfig
+from integrations.graphiti.queries_pkg import connection_manager
+from integrations.graphiti.queries_pkg.connection_manager import (
+    GraphitiConnectionManager,
+    get_connection_key,
+)
+from integrations.graphiti.queries_pkg.graphiti import GraphitiMemory
+
+
+class FakeClient:
+    """Stand-in for GraphitiClient that counts initializations."""
+
+    instances: list["FakeClient"] = []
+
+    def __init__(self, config):
+        self.config = config
+        self.initialize_calls = 0
+        self.closed = False
+        self._initialized = False
+        self.graphiti = MagicMock()
+        self.graphiti.driver.execute_query = AsyncMock()
+        FakeClient.instances.append(self)
+
+    @property
+    def is_initialized(self):
+        return self._initialized
+
+    async def initialize(self, state=None):
+        self.initialize_calls += 1
+        self._initialized = True
+        return True
+
+    async def close(self):
+        self.closed = True
+        self.closed_on = asyncio.get_running_loop()
+        self._initialized = False
+
+
+@pytest.fixture
+def fake_client():
+    FakeClient.instances = []
+    with patch.object(connection_manager, "GraphitiClient", FakeClient):
+        yield FakeClient
+
+
+@pytest.fixture
+def config(temp_dir):
+    return GraphitiConfig(enabled=True, db_path=str(temp_dir / "graphs"))
+
+
+class TestConnectionKey:
+    """Tests for pooling keys."""
+
+    def test_same_config_same_key(self, config):
+        other = GraphitiConfig(enabled=True, db_path=config.db_path)
+        assert get_connection_key(config) == get_connection_key(other)
+
+    def test_provider_change_changes_key(self, config):
+        other = GraphitiConfig(
+            enabled=True, db_path=config.db_path, embedder_provider="voyage"
+        )
+        assert get_connection_key(config) != get_connection_key(other)
+
+    def test_database_change_changes_key(self, config):
+        other = GraphitiConfig(enabled=True, db_path=config.db_path, database="other")
+        assert get_connection_key(config) != get_connection_key(other)
+
+
+class TestConnectionManager:
+    """Tests for GraphitiConnectionManager."""
+
+    async def test_client_reused_across_acquires(self, fake_client, config):
+        manager = GraphitiConnectionManager()
+
+        first = await manager.acquire(config)
+        second = await manager.acquire(config)
+
+        assert first is second
+        assert len(fake_client.instances) == 1
+        assert first.initialize_calls == 1
+        assert manager.get_stats()["reused"] == 1
+
+    async def test_concurrent_acquires_initialize_once(self, fake_client, config):
+        manager = GraphitiConnectionManager()
+
+        clients = await asyncio.gather(*(manager.acquire(config) for _ in range(5)))
+
+        assert len({id(c) for c in clients}) == 1
+        assert len(fake_client.instances) == 1
+
+    async def test_failed_health_check_reconnects(self, fake_client, config):
+        manager = GraphitiConnectionManager(health_check_interval=0)
+        first = await manager.acquire(config)
+        first.graphiti.driver.execute_query.side_effect = RuntimeError("db gone")
+
+        second = await manager.acquire(config)
+
+        assert second is not first
+        assert first.closed
+        assert manager.get_stats()["health_failures"] == 1
+
+    async def test_failed_initialize_not_pooled(self, fake_client, config):
+        manager = GraphitiConnectionManager()
+        with patch.object(FakeClient, "initialize", AsyncMock(return_value=False)):
+            assert await manager.acquire(config) is None
+        assert manager.get_stats()["open"] == 0
+
+    async def test_close_all(self, fake_client, config):
+        manager = GraphitiConnectionManager()
+        client = await manager.acquire(config)
+
+        await manager.close_all()
+
+        assert client.closed
+        assert manager.get_stats()["open"] == 0
+
+    def test_new_event_loop_replaces_client(self, fake_client, config):
+        manager = GraphitiConnectionManager()
+
+        first = asyncio.run(manager.acquire(config))
+        second = asyncio.run(manager.acquire(config))
+
+        assert first is not second
+        assert first.closed
+
+    def test_client_closed_when_its_loop_shuts_down(self, fake_client, config):
+        manager = GraphitiConnectionManager()
+
+        async def use():
+            return await manager.acquire(config), asyncio.get_running_loop()
+
+        client, loop = asyncio.run(use())
+
+        assert client.closed
+        assert client.closed_on is loop
+        assert manager.get_stats()["open"] == 0
+
+    def test_shutdown_closes_clients_on_their_loop(self, fake_client, config):
+        manager = GraphitiConnectionManager()
+        loop = asyncio.new_event_loop()
+        try:
+            client = loop.run_until_complete(manager.acquire(config))
+
+            manager.shutdown()
+
+            assert client.closed
+            assert client.closed_on is loop
+        finally:
+            loop.close()
+
+
+class TestGraphitiMemorySharing:
+    """Tests for GraphitiMemory using the shared client."""
+
+    @pytest.fixture
+    def manager(self, fake_client):
+        manager = GraphitiConnectionManager()
+        with patch(
+            "integrations.graphiti.queries_pkg.graphiti.get_connection_manager",
+            return_value=manager,
+        ):
+            yield manager
+
+    def _memory(self, temp_dir, config, spec, **kwargs):
+        spec_dir = temp_dir / "specs" / spec
+        spec_dir.mkdir(parents=True, exist_ok=True)
+        with patch.object(GraphitiConfig, "from_env", return_value=config):
+            memory = GraphitiMemory(spec_dir, temp_dir, **kwargs)
+        memory._available = True
+        return memory
+
+    async def test_memories_share_one_client(self, manager, temp_dir, config):
+        first = self._memory(temp_dir, config, "001-a")
+        second = self._memory(temp_dir, config, "002-b")
+
+        assert await first.initialize()
+        await first.close()
+        assert await second.initialize()
+
+        assert len(FakeClient.instances) == 1
+        assert not FakeClient.instances[0].closed
+        assert second._queries.group_id == "002-b"
+        # The second spec records that the shared client is initialized
+        assert second.state.initialized
+
+    async def test_private_client_is_closed(self, manager, temp_dir, config):
+        with patch(
+            "integrations.graphiti.queries_pkg.graphiti.GraphitiClient", FakeClient
+        ):
+            memory = self._memory(temp_dir, config, "001-a", shared_client=False)
+            assert await memory.initialize()
+            await memory.close()
+
+        assert FakeClient.instances[0].closed
+        assert manager.get_stats()["open"] == 0
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared ideation context snapshot and per-type result cache.
+
+Covers:
+- Snapshot hashing and per-type cache keys
+- PhaseExecutor only regenerating ideation types whose inputs changed
+- The process-wide agent concurrency limiter
+"""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "apps" / "backend"))
+
+from core.agent_limiter import MAX_PARALLEL_AGENTS_ENV, agent_slot
+from ideation.context_snapshot import IdeationContextSnapshot
+from ideation.generator import IdeationGenerator
+from ideation.phase_executor import PhaseExecutor
+from ideation.prioritizer import IdeaPrioritizer
+
+TYPES = ["code_improvements", "security_hardening"]
+
+
+def _context(**overrides) -> dict:
+    context = {
+        "existing_features": ["login"],
+        "tech_stack": ["python", "react"],
+        "target_audience": "developers",
+        "planned_features": ["search", "export"],
+    }
+    context.update(overrides)
+    return context
+
+
+class FakeAnalyzer:
+    include_roadmap = True
+    include_kanban = True
+
+    def __init__(self, context: dict):
+        self.context = context
+
+    def gather_context(self) -> dict:
+        return self.context
+
+
+class FakeGenerator(IdeationGenerator):
+    """Writes a valid output file instead of running an agent."""
+
+    def __init__(self, output_dir: Path):
+        super().__init__(output_dir, output_dir)
+        self.runs: list[str] = []
+        self.contexts: dict[str, str] = {}
+
+    async def run_agent(self, prompt_file: str, additional_context: str = ""):
+        ideation_type = next(
+            t for t in TYPES if f"{t}_ideas.json" in additional_context
+        )
+        self.runs.append(ideation_type)
+        self.contexts[ideation_type] = additional_context
+        (self.output_dir / f"{ideation_type}_ideas.json").write_text(
+            json.dumps({ideation_type: [{"id": "1", "title": "Idea"}]})
+        )
+        return True, ""
+
+
+async def _run(
+    output_dir: Path, context: dict, hints=None, refresh=False, generator=None
+):
+    """Run the context and ideation phases; return the types that ran."""
+    (output_dir / "graph_hints.json").write_text(
+        json.dumps({"hints_by_type": hints or {}})
+    )
+    generator = generator or FakeGenerator(output_dir)
+    executor = PhaseExecutor(
+        output_dir=output_dir,
+        generator=generator,
+        analyzer=FakeAnalyzer(context),
+        prioritizer=IdeaPrioritizer(output_dir),
+        formatter=None,
+        enabled_types=TYPES,
+        max_ideas_per_type=5,
+        refresh=refresh,
+        append=False,
+    )
+    await executor.execute_context()
+    executor.build_snapshot()
+    results = await asyncio.gather(*(executor.execute_ideation_type(t) for t in TYPES))
+    assert all(r.success for r in results)
+    return sorted(generator.runs)
+
+
+@pytest.fixture
+def output_dir(temp_dir):
+    (temp_dir / "project_index.json").write_text('{"services": {}}')
+    return temp_dir
+
+
+class TestSnapshot:
+    """Tests for IdeationContextSnapshot."""
+
+    def test_hash_independent_of_list_order(self, output_dir):
+        index = output_dir / "project_index.json"
+        first = IdeationContextSnapshot.build(_context(), {}, index)
+        second = IdeationContextSnapshot.build(
+            _context(planned_features=["export", "search"]), {}, index
+        )
+        assert first.content_hash == second.content_hash
+        assert first == second
+
+    def test_project_index_changes_hash(self, output_dir):
+        index = output_dir / "project_index.json"
+        before = IdeationContextSnapshot.build(_context(), {}, index)
+        index.write_text('{"services": {"api": {}}}')
+        after = IdeationContextSnapshot.build(_context(), {}, index)
+        assert before.content_hash != after.content_hash
+
+    def test_type_key_only_depends_on_own_hints(self, output_dir):
+        index = output_dir / "project_index.json"
+        base = IdeationContextSnapshot.build(_context(), {}, index)
+        hinted = IdeationContextSnapshot.build(
+            _context(), {"security_hardening": [{"hint": "x"}]}, index
+        )
+        assert base.type_key("code_improvements") == hinted.type_key(
+            "code_improvements"
+        )
+        assert base.type_key("security_hardening") != hinted.type_key(
+            "security_hardening"
+        )
+
+    async def test_prompts_carry_snapshot_content(self, output_dir):
+        generator = FakeGenerator(output_dir)
+        await _run(
+            output_dir,
+            _context(),
+            hints={"security_hardening": [{"hint": "rotate keys"}]},
+            generator=generator,
+        )
+
+        for prompt in generator.contexts.values():
+            assert "**Tech Stack**: python, react" in prompt
+            assert "**Target Audience**: developers" in prompt
+            assert "- export\n- search" in prompt
+        assert "rotate keys" in generator.contexts["security_hardening"]
+        assert "rotate keys" not in generator.contexts["code_improvements"]
+
+    def test_snapshot_is_immutable(self, output_dir):
+        snapshot = IdeationContextSnapshot.build(
+            _context(), {}, output_dir / "project_index.json"
+        )
+        with pytest.raises(AttributeError):
+            snapshot.target_audience = "everyone"
+
+
+class TestResultCache:
+    """PhaseExecutor reuses outputs whose inputs are unchanged."""
+
+    async def test_unchanged_inputs_skip_all_types(self, output_dir):
+        assert await _run(output_dir, _context()) == TYPES
+        assert await _run(output_dir, _context()) == []
+
+    async def test_changed_hints_rerun_only_that_type(self, output_dir):
+        await _run(output_dir, _context())
+        ran = await _run(
+            output_dir, _context(), hints={"security_hardening": [{"hint": "x"}]}
+        )
+        assert ran == ["security_hardening"]
+
+        context_file = json.loads((output_dir / "ideation_context.json").read_text())
+        assert context_file["graph_hints"] == {"security_hardening": [{"hint": "x"}]}
+
+    async def test_changed_shared_context_reruns_all(self, output_dir):
+        await _run(output_dir, _context())
+        assert await _run(output_dir, _context(target_audience="teams")) == TYPES
+
+    async def test_refresh_forces_all(self, output_dir):
+        await _run(output_dir, _context())
+        assert await _run(output_dir, _context(), refresh=True) == TYPES
+
+    async def test_outputs_without_cache_entry_are_kept(self, output_dir):
+        await _run(output_dir, _context())
+        (output_dir / "ideation_cache.json").unlink()
+
+        assert await _run(output_dir, _context()) == []
+        # The keys are recorded, so later input changes are detected
+        assert await _run(output_dir, _context(tech_stack=["go"])) == TYPES
+
+
+async def test_agent_slot_limits_concurrency(monkeypatch):
+    monkeypatch.setenv(MAX_PARALLEL_AGENTS_ENV, "2")
+    active = peak = 0
+
+    async def session():
+        nonlocal active, peak
+        async with agent_slot():
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    await asyncio.gather(*(session() for _ in range(8)))
+    assert peak == 2
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Tests for project index freshness tracking.
+
+Covers:
+- Manifest discovery including nested monorepo packages
+- should_refresh_project_index() with and without a freshness record
+- The inotify watcher invalidating core.client's project cache
+"""
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "apps" / "backend"))
+
+from prompts_pkg.index_freshness import (
+    FRESHNESS_FILE,
+    discover_manifests,
+    is_index_stale,
+    is_marked_stale,
+    record_index_manifests,
+    stop_index_watchers,
+    watch_project_index,
+)
+from prompts_pkg.project_context import should_refresh_project_index
+
+
+def _touch(path: Path, content: str = "{}") -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+    return path
+
+
+def _bump_mtime(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def monorepo(temp_dir):
+    """Project with an indexed nested monorepo layout."""
+    _touch(temp_dir / "package.json")
+    _touch(temp_dir / "apps" / "web" / "package.json")
+    _touch(temp_dir / "apps" / "web" / "packages" / "ui" / "package.json")
+    _touch(temp_dir / "apps" / "api" / "pyproject.toml", "")
+    _touch(temp_dir / "node_modules" / "dep" / "package.json")
+    index_file = _touch(temp_dir / ".auto-claude" / "project_index.json")
+    record_index_manifests(temp_dir, index_file)
+    yield temp_dir
+    stop_index_watchers()
+
+
+def _wait_for(condition, timeout: float = 3.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+class TestManifestDiscovery:
+    """Tests for discover_manifests()."""
+
+    def test_finds_nested_packages_and_skips_dependencies(self, monorepo):
+        manifests, package_dirs = discover_manifests(monorepo)
+        relative = {p.relative_to(monorepo).as_posix() for p in manifests}
+
+        assert "apps/web/packages/ui/package.json" in relative
+        assert "apps/api/pyproject.toml" in relative
+        assert not any(r.startswith("node_modules") for r in relative)
+        assert monorepo / "apps" / "web" / "packages" in package_dirs
+
+    def test_record_written_next_to_index(self, monorepo):
+        record = json.loads((monorepo / ".auto-claude" / FRESHNESS_FILE).read_text())
+
+        assert "apps/web/packages/ui/package.json" in record["paths"]
+        assert record["paths"]["go.mod"] is None  # absent root manifest
+
+
+class TestShouldRefresh:
+    """Tests for should_refresh_project_index() with freshness records."""
+
+    def test_fresh_index(self, monorepo):
+        assert should_refresh_project_index(monorepo) is False
+
+    def test_nested_manifest_change(self, monorepo):
+        _bump_mtime(monorepo / "apps" / "web" / "packages" / "ui" / "package.json")
+        assert should_refresh_project_index(monorepo) is True
+
+    def test_new_nested_package(self, monorepo):
+        new_package = monorepo / "apps" / "web" / "packages" / "forms"
+        new_package.mkdir()
+        _bump_mtime(new_package.parent)
+        assert should_refresh_project_index(monorepo) is True
+
+    def test_new_first_level_package(self, monorepo):
+        _touch(monorepo / "worker" / "package.json")
+        _bump_mtime(monorepo)
+        assert is_index_stale(monorepo) is True
+        assert should_refresh_project_index(monorepo) is True
+
+    def test_new_root_manifest(self, monorepo):
+        _touch(monorepo / "go.mod", "module x")
+        assert should_refresh_project_index(monorepo) is True
+
+    def test_record_ignored_when_index_rewritten_elsewhere(self, monorepo):
+        _bump_mtime(monorepo / ".auto-claude" / "project_index.json")
+        assert is_index_stale(monorepo) is None
+        # Falls back to comparing root manifests against the index mtime
+        assert should_refresh_project_index(monorepo) is False
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify")
+class TestIndexWatcher:
+    """Tests for the inotify watcher."""
+
+    def test_manifest_change_marks_stale_and_notifies(self, monorepo):
+        changes = []
+        watcher = watch_project_index(monorepo, lambda: changes.append(1))
+        if watcher is None:
+            pytest.skip("inotify unavailable")
+
+        _touch(monorepo / "apps" / "web" / "packages" / "ui" / "package.json", "{1}")
+
+        assert _wait_for(lambda: changes)
+        assert is_marked_stale(monorepo)
+        assert should_refresh_project_index(monorepo) is True
+
+        # Regenerating the index clears the stale flag
+        index_file = _touch(monorepo / ".auto-claude" / "project_index.json", "{2}")
+        record_index_manifests(monorepo, index_file)
+        assert _wait_for(lambda: not is_marked_stale(monorepo))
+
+    def test_new_first_level_package_marks_stale(self, monorepo):
+        changes = []
+        watcher = watch_project_index(monorepo, lambda: changes.append(1))
+        if watcher is None:
+            pytest.skip("inotify unavailable")
+        assert watcher.tracking
+
+        # Hidden directories such as .worktrees are not packages
+        (monorepo / ".worktrees").mkdir()
+        time.sleep(0.1)
+        assert not is_marked_stale(monorepo)
+
+        (monorepo / "worker").mkdir()
+        assert _wait_for(lambda: is_marked_stale(monorepo))
+
+    def test_client_cache_invalidated_on_index_rewrite(self, monorepo, monkeypatch):
+        from core import client
+
+        monkeypatch.setenv(client.WATCH_PROJECT_INDEX_ENV, "1")
+        client.invalidate_project_cache()
+
+        client._get_cached_project_data(monorepo)
+        if str(monorepo.resolve()) not in client._PROJECT_INDEX_CACHE:
+            pytest.skip("cache not populated")
+        if not client._watch_project_index(monorepo):
+            pytest.skip("inotify unavailable")
+
+        _touch(monorepo / ".auto-claude" / "project_index.json", '{"services": {}}')
+
+        assert _wait_for(
+            lambda: str(monorepo.resolve()) not in client._PROJECT_INDEX_CACHE
+        )
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Tests for the Linear sync queue.
+
+Covers:
+- Coalescing status transitions and batching comments into one agent call
+- Background flushing that never blocks the caller
+- Persistence of pending updates across runs
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "apps" / "backend"))
+
+from integrations.linear import updater
+from integrations.linear.updater import (
+    STATUS_IN_PROGRESS,
+    STATUS_IN_REVIEW,
+    LinearTaskState,
+)
+
+
+class FakeLinearAgent:
+    """Records prompts instead of running a Linear mini-agent."""
+
+    def __init__(self, delay: float = 0.0, response: str | None = "Done"):
+        self.prompts: list[str] = []
+        self.delay = delay
+        self.response = response
+        self.on_call = None
+
+    async def __call__(self, prompt: str) -> str | None:
+        self.prompts.append(prompt)
+        if self.on_call:
+            self.on_call()
+        await asyncio.sleep(self.delay)
+        return self.response
+
+
+@pytest.fixture
+def spec_dir(temp_dir, monkeypatch):
+    monkeypatch.setenv("LINEAR_API_KEY", "test-key")
+    # Long interval so only explicit flushes run unless a test shortens it
+    monkeypatch.setenv(updater.FLUSH_INTERVAL_ENV, "3600")
+    monkeypatch.setattr(updater, "_sync_queues", {})
+    LinearTaskState(task_id="VAL-1", team_id="team-1").save(temp_dir)
+    return temp_dir
+
+
+@pytest.fixture
+def agent(monkeypatch):
+    fake = FakeLinearAgent()
+    monkeypatch.setattr(updater, "_run_linear_agent", fake)
+    return fake
+
+
+class TestCoalescing:
+    """Queued updates are merged into a single agent call."""
+
+    async def test_statuses_coalesce_and_comments_batch(self, spec_dir, agent):
+        await updater.update_linear_status(spec_dir, STATUS_IN_PROGRESS)
+        await updater.linear_subtask_completed(spec_dir, "1.1", 1, 3)
+        await updater.linear_subtask_completed(spec_dir, "1.2", 2, 3)
+        await updater.update_linear_status(spec_dir, STATUS_IN_REVIEW)
+
+        assert agent.prompts == []
+        assert await updater.flush_linear_updates(spec_dir) is True
+
+        assert len(agent.prompts) == 1
+        prompt = agent.prompts[0]
+        assert f'"{STATUS_IN_REVIEW}"' in prompt
+        assert f'"{STATUS_IN_PROGRESS}"' not in prompt
+        assert "Completed 1.1" in prompt and "Completed 1.2" in prompt
+        assert prompt.count("create_comment") == 1
+
+        state = LinearTaskState.load(spec_dir)
+        assert state.status == STATUS_IN_REVIEW
+        assert not state.has_pending
+
+    async def test_status_back_to_current_is_dropped(self, spec_dir, agent):
+        await updater.update_linear_status(spec_dir, STATUS_IN_PROGRESS)
+        await updater.update_linear_status(spec_dir, LinearTaskState().status)
+
+        assert await updater.flush_linear_updates(spec_dir) is True
+        assert agent.prompts == []
+
+
+class TestBackgroundFlush:
+    """Flushes run in the background and keep unsent updates queued."""
+
+    async def test_phase_boundary_does_not_block(self, spec_dir, agent):
+        agent.delay = 0.5
+
+        start = time.perf_counter()
+        assert await updater.linear_task_started(spec_dir) is True
+        assert time.perf_counter() - start < 0.2
+
+        await updater.get_linear_sync_queue(spec_dir)._task
+        assert len(agent.prompts) == 1
+        assert LinearTaskState.load(spec_dir).status == STATUS_IN_PROGRESS
+
+    async def test_timer_flush(self, spec_dir, agent, monkeypatch):
+        monkeypatch.setenv(updater.FLUSH_INTERVAL_ENV, "0.05")
+
+        await updater.linear_subtask_failed(spec_dir, "1.1", 1, "boom")
+        await updater.linear_subtask_failed(spec_dir, "1.1", 2, "boom")
+        await asyncio.sleep(0.2)
+
+        assert len(agent.prompts) == 1
+        assert not LinearTaskState.load(spec_dir).has_pending
+
+    async def test_failed_flush_keeps_updates(self, spec_dir, agent):
+        agent.response = None
+        await updater.linear_qa_rejected(spec_dir, 3, 1)
+
+        assert await updater.flush_linear_updates(spec_dir) is False
+        assert LinearTaskState.load(spec_dir).pending_comments == [
+            "QA iteration 1: Found 3 issues - applying fixes"
+        ]
+
+    async def test_updates_queued_during_flush_are_kept(self, spec_dir, agent):
+        queue = updater.get_linear_sync_queue(spec_dir)
+        queue.enqueue_comment("first")
+        agent.on_call = lambda: queue.enqueue_comment("second")
+
+        assert await queue.flush() is False
+        assert LinearTaskState.load(spec_dir).pending_comments == ["second"]
+
+    async def test_updates_queued_during_background_flush_are_sent(
+        self, spec_dir, agent, monkeypatch
+    ):
+        monkeypatch.setenv(updater.FLUSH_INTERVAL_ENV, "0.05")
+        agent.delay = 0.3
+
+        await updater.add_linear_comment(spec_dir, "one")
+        await asyncio.sleep(0.15)  # The first flush is waiting on the agent
+        await updater.add_linear_comment(spec_dir, "two")
+        await asyncio.sleep(0.8)
+
+        assert len(agent.prompts) == 2
+        assert "one" in agent.prompts[0] and "two" in agent.prompts[1]
+        assert not LinearTaskState.load(spec_dir).has_pending
+
+
+async def test_pending_updates_survive_restart(spec_dir, agent, monkeypatch):
+    await updater.linear_task_stuck(spec_dir, "2.1", 3)
+
+    # A new process starts with an empty queue registry
+    monkeypatch.setattr(updater, "_sync_queues", {})
+    state = LinearTaskState.load(spec_dir)
+    assert state.has_pending
+
+    assert await updater.linear_qa_approved(spec_dir) is True
+    assert len(agent.prompts) == 1
+    assert "STUCK" in agent.prompts[0] and "QA approved" in agent.prompts[0]
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Tests for FileTimelineTracker
+=============================
+
+Tests main-branch commit ingestion for the intent-aware timeline system.
+
+Covers:
+- Batched blob reads via git cat-file --batch
+- Single and multi-commit ingestion
+- Fast-forward range ingestion
+- Coalesced persistence (one index flush per batch)
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add auto-claude directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "Apps" / "backend"))
+
+from merge.file_timeline import FileTimelineTracker, TimelineGitHelper
+
+
+def _commit(repo: Path, message: str) -> str:
+    """Stage everything, commit, and return the new HEAD hash."""
+    subprocess.run(["git", "add", "."], cwd=repo, capture_output=True, check=True)
+    subprocess.run(
+        ["git", "commit", "-m", message], cwd=repo, capture_output=True, check=True
+    )
+    return subprocess.run(
+        ["git", "rev-parse", "HEAD"],
+        cwd=repo,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.strip()
+
+
+@pytest.fixture
+def tracked_repo(temp_project: Path) -> tuple[Path, FileTimelineTracker]:
+    """A project with src/App.tsx and src/utils.py registered for a task."""
+    tracker = FileTimelineTracker(temp_project)
+    tracker.on_task_start(
+        task_id="task-001",
+        files_to_modify=["src/App.tsx", "src/utils.py"],
+        task_intent="Add auth",
+    )
+    return temp_project, tracker
+
+
+class TestBatchedBlobReads:
+    """Tests for TimelineGitHelper.get_file_contents_at_commits."""
+
+    def test_reads_many_files_in_one_call(self, temp_project):
+        """Existing and missing blobs are resolved in a single batch."""
+        git = TimelineGitHelper(temp_project)
+        head = git.get_current_main_commit()
+
+        contents = git.get_file_contents_at_commits(
+            [
+                (head, "src/App.tsx"),
+                (head, "src/utils.py"),
+                (head, "does/not/exist.py"),
+            ]
+        )
+
+        assert "function App" in contents[(head, "src/App.tsx")]
+        assert (
+            contents[(head, "src/utils.py")]
+            == (temp_project / "src" / "utils.py").read_text()
+        )
+        assert contents[(head, "does/not/exist.py")] is None
+
+    def test_matches_single_file_reads(self, temp_project):
+        """Batched content is identical to per-file git show output."""
+        git = TimelineGitHelper(temp_project)
+        head = git.get_current_main_commit()
+
+        batched = git.get_file_contents_at_commits([(head, "src/App.tsx")])
+
+        assert batched[(head, "src/App.tsx")] == git.get_file_content_at_commit(
+            "src/App.tsx", head
+        )
+
+    def test_paths_with_spaces(self, temp_project):
+        """Missing names with spaces don't break parsing of later objects."""
+        (temp_project / "my notes.txt").write_text("hello\n")
+        git = TimelineGitHelper(temp_project)
+        head = _commit(temp_project, "Add notes")
+
+        contents = git.get_file_contents_at_commits(
+            [
+                (head, "new file.py"),
+                (head, "my notes.txt"),
+                (head, "src/utils.py"),
+            ]
+        )
+
+        assert contents[(head, "new file.py")] is None
+        assert contents[(head, "my notes.txt")] == "hello\n"
+        assert contents[(head, "src/utils.py")] is not None
+
+    def test_task_start_with_new_spaced_file(self, temp_project):
+        """Registering a not-yet-existing file with a space in its name works."""
+        tracker = FileTimelineTracker(temp_project)
+
+        tracker.on_task_start(
+            task_id="task-001",
+            files_to_modify=["new file.py"],
+            task_intent="Add a file",
+        )
+
+        assert tracker.get_timeline("new file.py") is not None
+
+    def test_empty_request(self, temp_project):
+        """No requests means no git process and an empty result."""
+        git = TimelineGitHelper(temp_project)
+        assert git.get_file_contents_at_commits([]) == {}
+
+
+class TestMainBranchIngestion:
+    """Tests for on_main_branch_commit(s) and range ingestion."""
+
+    def test_single_commit_records_event(self, tracked_repo):
+        """The single-commit hook path still records a human event."""
+        repo, tracker = tracked_repo
+        (repo / "src" / "utils.py").write_text("def changed():\n    pass\n")
+        commit = _commit(repo, "Change utils")
+
+        tracker.on_main_branch_commit(commit)
+
+        timeline = tracker.get_timeline("src/utils.py")
+        assert len(timeline.main_branch_history) == 1
+        event = timeline.main_branch_history[0]
+        assert event.commit_hash == commit
+        assert event.commit_message == "Change utils"
+        assert event.source == "human"
+        assert "def changed" in event.content
+
+    def test_untracked_files_are_ignored(self, tracked_repo):
+        """Commits touching only untracked files record nothing."""
+        repo, tracker = tracked_repo
+        (repo / "other.txt").write_text("unrelated\n")
+        commit = _commit(repo, "Unrelated change")
+
+        assert tracker.on_main_branch_commits([commit]) == 0
+        assert tracker.get_timeline("src/App.tsx").main_branch_history == []
+
+    def test_commit_info_fetched_once_per_commit(self, tracked_repo):
+        """Metadata is looked up once per commit, not once per file."""
+        repo, tracker = tracked_repo
+        (repo / "src" / "utils.py").write_text("x = 1\n")
+        (repo / "src" / "App.tsx").write_text("export const App = () => null;\n")
+        commit = _commit(repo, "Touch both files")
+
+        with patch.object(
+            tracker.git, "get_commit_info", wraps=tracker.git.get_commit_info
+        ) as info:
+            updated = tracker.on_main_branch_commits([commit])
+
+        assert updated == 2
+        assert info.call_count == 1
+
+    def test_multiple_commits_flush_index_once(self, tracked_repo):
+        """Several commits are persisted with a single index write."""
+        repo, tracker = tracked_repo
+        commits = []
+        for i in range(3):
+            (repo / "src" / "utils.py").write_text(f"VALUE = {i}\n")
+            commits.append(_commit(repo, f"Update {i}"))
+
+        with patch.object(
+            tracker.persistence,
+            "update_index",
+            wraps=tracker.persistence.update_index,
+        ) as update_index:
+            recorded = tracker.on_main_branch_commits(commits)
+
+        assert update_index.call_count == 1
+        # One event per commit, although only one file changed
+        assert recorded == 3
+        history = tracker.get_timeline("src/utils.py").main_branch_history
+        assert [e.commit_hash for e in history] == commits
+        assert history[-1].content == "VALUE = 2\n"
+
+    def test_range_ingestion(self, tracked_repo):
+        """A fast-forward range is ingested oldest-first."""
+        repo, tracker = tracked_repo
+        start = tracker.git.get_current_main_commit()
+        (repo / "src" / "utils.py").write_text("a = 1\n")
+        first = _commit(repo, "First")
+        (repo / "src" / "utils.py").write_text("a = 2\n")
+        second = _commit(repo, "Second")
+
+        tracker.on_main_branch_range(start, second)
+
+        history = tracker.get_timeline("src/utils.py").main_branch_history
+        assert [e.commit_hash for e in history] == [first, second]
+
+    def test_batched_events_survive_reload(self, tracked_repo):
+        """Coalesced writes are still readable by a fresh tracker."""
+        repo, tracker = tracked_repo
+        (repo / "src" / "utils.py").write_text("persisted = True\n")
+        commit = _commit(repo, "Persist me")
+        tracker.on_main_branch_commits([commit])
+
+        reloaded = FileTimelineTracker(repo)
+
+        history = reloaded.get_timeline("src/utils.py").main_branch_history
+        assert [e.commit_hash for e in history] == [commit]
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Tests for Semantic Analyzer Parse Caching
+=========================================
+
+Tests the parser pooling and incremental parsing support used by
+SemanticAnalyzer.
+
+Covers:
+- Single-range edit computation for incremental re-parsing
+- Byte offset to line number mapping
+- The process-wide tree cache (LRU)
+- A hot-file benchmark (requires tree-sitter)
+"""
+
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from merge.semantic_analysis.parse_cache import (
+    LineIndex,
+    ParsedSource,
+    TreeCache,
+    compute_edit,
+    content_key,
+)
+
+
+def _apply(old: bytes, new: bytes) -> bytes:
+    """Rebuild new from old and the computed edit."""
+    edit = compute_edit(old, new)
+    return (
+        old[: edit.start_byte]
+        + new[edit.start_byte : edit.new_end_byte]
+        + old[edit.old_end_byte :]
+    )
+
+
+class TestComputeEdit:
+    """compute_edit describes the changed byte range."""
+
+    def test_identical_contents(self):
+        assert compute_edit(b"same", b"same") is None
+
+    def test_insertion_in_middle(self):
+        old = b"def a():\n    pass\n"
+        new = b"def a():\n    x = 1\n    pass\n"
+
+        edit = compute_edit(old, new)
+
+        assert edit.start_byte == len(b"def a():\n    ")
+        assert edit.old_end_byte == edit.start_byte
+        assert edit.new_end_byte == edit.start_byte + len(b"x = 1\n    ")
+        assert edit.start_point == (1, 4)
+        assert edit.old_end_point == (1, 4)
+        assert edit.new_end_point == (2, 4)
+
+    def test_deletion_and_append(self):
+        assert _apply(b"abcdef", b"abef") == b"abef"
+        assert _apply(b"abc", b"abcxyz") == b"abcxyz"
+        assert _apply(b"xyzabc", b"abc") == b"abc"
+
+    def test_repeated_content_does_not_overlap(self):
+        old = b"aaaa"
+        new = b"aaaaaa"
+
+        edit = compute_edit(old, new)
+
+        assert edit.start_byte <= edit.old_end_byte
+        assert _apply(old, new) == new
+
+    def test_random_edits_across_chunks(self):
+        rng = random.Random(7)
+        base = bytes(rng.choice(b"abc\n") for _ in range(20000))
+        for _ in range(50):
+            start = rng.randrange(len(base))
+            end = min(len(base), start + rng.randrange(200))
+            new = (
+                base[:start]
+                + bytes(rng.choice(b"xy\n") for _ in range(50))
+                + base[end:]
+            )
+            assert _apply(base, new) == new
+
+
+def test_line_index_matches_naive_count():
+    data = "first\nsecond\n\nünïcode line\nlast".encode()
+    lines = LineIndex(data)
+
+    for pos in range(len(data) + 1):
+        assert lines.line_of(pos) == data[:pos].count(b"\n") + 1
+
+
+def test_tree_cache_evicts_least_recently_used():
+    cache = TreeCache(max_entries=2)
+    entries = {
+        name: ParsedSource(source=name, data=name.encode(), tree=None)
+        for name in ("a", "b", "c")
+    }
+    keys = {name: content_key(".py", name.encode()) for name in entries}
+
+    cache.put(keys["a"], entries["a"])
+    cache.put(keys["b"], entries["b"])
+    assert cache.get(keys["a"]) is entries["a"]
+    cache.put(keys["c"], entries["c"])
+
+    assert cache.get(keys["b"]) is None
+    assert cache.get(keys["a"]) is entries["a"]
+    assert len(cache) == 2
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def _hot_file(functions: int) -> str:
+    return "".join(
+        f"def func_{i}(value):\n    result = value * {i}\n    return result\n\n"
+        for i in range(functions)
+    )
+
+
+@pytest.mark.slow
+def test_benchmark_hot_file_many_tasks():
+    """Many tasks each modifying one function of the same large file."""
+    pytest.importorskip("tree_sitter")
+    pytest.importorskip("tree_sitter_python")
+    import tree_sitter_python
+    from merge import semantic_analyzer as sa_module
+    from merge.semantic_analyzer import SemanticAnalyzer
+    from tree_sitter import Language, Parser
+
+    baseline = _hot_file(2000)
+    tasks = [
+        baseline.replace(f"result = value * {i}\n", f"result = value * {i} + 1\n", 1)
+        for i in range(0, 2000, 20)
+    ]
+
+    # Previous behavior: new parsers per analyzer, full parses of both sides
+    start = time.perf_counter()
+    for after in tasks:
+        parser = Parser()
+        parser.language = Language(tree_sitter_python.language())
+        parser.parse(baseline.encode())
+        parser.parse(after.encode())
+    cold_seconds = time.perf_counter() - start
+
+    sa_module._TREE_CACHE.clear()
+
+    def analyze(after: str):
+        return SemanticAnalyzer().analyze_diff("hot.py", baseline, after)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(analyze, tasks))
+    pooled_seconds = time.perf_counter() - start
+
+    assert all(r.functions_modified for r in results)
+    assert sa_module._TREE_CACHE.hits >= len(tasks) - 4
+    print(
+        f"\n{len(tasks)} tasks on a {len(baseline) // 1024}KB file: "
+        f"cold parse {len(tasks) / cold_seconds:.0f} tasks/s, "
+        f"pooled analysis {len(tasks) / pooled_seconds:.0f} tasks/s"
+    )
@@ -233,3 +233,48 @@ class TestEdgeCases:
         # Should complete without issues
         assert analysis is not None
         assert len(analysis.changes) > 0
+
+
+class TestExtractElements:
+    """Tests for structural element extraction (used by the context packer)."""
+
+    def test_python_definitions(self, semantic_analyzer):
+        """Functions, classes and methods are found with line ranges."""
+        elements = semantic_analyzer.extract_elements("test.py", SAMPLE_PYTHON_MODULE)
+
+        assert elements["function:hello"].start_line == 5
+        assert elements["function:hello"].end_line == 7
+        assert elements["class:Greeter"].end_line == 17
+        method = elements["function:Greeter.greet"]
+        assert method.parent == "Greeter"
+        assert "return" in method.content
+
+    def test_typescript_definitions(self, semantic_analyzer):
+        """Functions, arrow functions and classes are found in TS/TSX."""
+        code = """import React from 'react';
+
+export function loadUser(id: string) {
+  return fetch(`/users/${id}`);
+}
+
+const formatName = (user: User) => {
+  return user.name;
+};
+
+export class UserStore {
+  save(user: User): void {
+    this.users.push(user);
+  }
+}
+"""
+        elements = semantic_analyzer.extract_elements("store.ts", code)
+
+        assert elements["function:loadUser"].start_line == 3
+        assert elements["function:loadUser"].end_line == 5
+        assert "function:formatName" in elements
+        assert elements["class:UserStore"].end_line == 15
+        assert elements["function:UserStore.save"].parent == "UserStore"
+
+    def test_unsupported_extension(self, semantic_analyzer):
+        """Unknown file types yield no elements."""
+        assert semantic_analyzer.extract_elements("notes.txt", "def x(): pass") == {}
@@ -15,6 +15,7 @@ Tests the project_analyzer.py module functionality including:
 import json
 import pytest
 from pathlib import Path
+from unittest.mock import patch
 
 from project_analyzer import (
     ProjectAnalyzer,
@@ -496,6 +497,68 @@ class TestSecurityProfileGeneration:
         assert profile2.created_at != created1
 
 
+class TestProjectHash:
+    """Tests for the pruned, cached project hash."""
+
+    def test_hash_stable_without_changes(self, temp_dir: Path):
+        """Repeated calls on an unchanged tree return the same hash."""
+        (temp_dir / "main.py").write_text("print('hi')\n")
+        analyzer = ProjectAnalyzer(temp_dir)
+
+        assert analyzer.compute_project_hash() == analyzer.compute_project_hash()
+
+    def test_hash_ignores_node_modules(self, temp_dir: Path):
+        """Files under pruned directories don't affect the hash."""
+        (temp_dir / "main.py").write_text("print('hi')\n")
+        before = ProjectAnalyzer(temp_dir).compute_project_hash()
+
+        deps = temp_dir / "node_modules" / "pkg"
+        deps.mkdir(parents=True)
+        (deps / "index.js").write_text("module.exports = {};\n")
+        (deps / "Pkg.csproj").write_text("<Project />\n")
+
+        assert ProjectAnalyzer(temp_dir).compute_project_hash() == before
+
+    def test_new_source_file_changes_hash(self, temp_dir: Path):
+        """Adding a source file in a nested dir invalidates the cached scan."""
+        nested = temp_dir / "src" / "pkg"
+        nested.mkdir(parents=True)
+        (nested / "a.py").write_text("a = 1\n")
+        before = ProjectAnalyzer(temp_dir).compute_project_hash()
+
+        (nested / "b.py").write_text("b = 2\n")
+
+        assert ProjectAnalyzer(temp_dir).compute_project_hash() != before
+
+    def test_nested_dotnet_project_detected(self, temp_dir: Path):
+        """A .csproj deep in the tree counts as a manifest."""
+        project = temp_dir / "src" / "App"
+        project.mkdir(parents=True)
+        (project / "App.csproj").write_text("<Project />\n")
+        before = ProjectAnalyzer(temp_dir).compute_project_hash()
+
+        # Source files don't matter once a manifest exists
+        (temp_dir / "extra.cs").write_text("class X {}\n")
+        assert ProjectAnalyzer(temp_dir).compute_project_hash() == before
+
+        # Editing the manifest does
+        (project / "App.csproj").write_text("<Project Sdk='x' />\n")
+        assert ProjectAnalyzer(temp_dir).compute_project_hash() != before
+
+    def test_scan_reused_between_calls(self, temp_dir: Path):
+        """An unchanged tree is not walked again."""
+        from project import tree_scanner
+
+        (temp_dir / "main.py").write_text("print('hi')\n")
+        tree_scanner.clear_tree_scan_cache()
+        ProjectAnalyzer(temp_dir).compute_project_hash()
+
+        with patch.object(tree_scanner, "_walk") as walk:
+            ProjectAnalyzer(temp_dir).compute_project_hash()
+
+        walk.assert_not_called()
+
+
 class TestCommandAllowlistChecking:
     """Tests for command allowlist checking."""
 
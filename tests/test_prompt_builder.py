@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Tests for cache-friendly prompt assembly.
+
+Covers:
+- Stable blocks rendered before volatile blocks
+- Byte-stable prefixes across subtasks, retries and sessions of a spec
+- Prefix log and the estimated cache-hit report
+"""
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "apps" / "backend"))
+
+from prompts_pkg import (
+    PromptBuilder,
+    build_coding_prompt_blocks,
+    build_qa_reviewer_prompt_blocks,
+    build_subtask_prompt_blocks,
+    format_prompt_cache_report,
+    generate_subtask_prompt,
+    get_prompt_cache_report,
+)
+from prompts_pkg.prompt_builder import CACHE_TTL_SECONDS, PROMPT_PREFIX_LOG
+
+
+def _subtask(subtask_id: str, description: str) -> dict:
+    return {
+        "id": subtask_id,
+        "description": description,
+        "files_to_modify": ["app.py"],
+        "verification": {"type": "command", "command": "pytest"},
+    }
+
+
+def _write_log(spec_dir: Path, entries: list[dict]) -> None:
+    log_file = spec_dir / "memory" / PROMPT_PREFIX_LOG
+    log_file.parent.mkdir(parents=True, exist_ok=True)
+    log_file.write_text("".join(json.dumps(e) + "\n" for e in entries))
+
+
+class TestPromptBuilder:
+    """Tests for PromptBuilder ordering and hashing."""
+
+    def test_stable_blocks_come_first(self):
+        builder = PromptBuilder("coding")
+        builder.add_volatile("subtask", "B")
+        builder.add_stable("instructions", "A")
+        builder.add_volatile("memory", "C")
+
+        assert builder.build() == "ABC"
+        assert builder.prefix == "A"
+
+    def test_empty_blocks_skipped(self):
+        builder = PromptBuilder("coding").add_stable("a", "").add_volatile("b", "")
+        assert builder.blocks == []
+
+    def test_prefix_hash_ignores_volatile_blocks(self):
+        first = PromptBuilder("coding").add_stable("a", "A").add_volatile("b", "1")
+        second = PromptBuilder("coding").add_stable("a", "A").add_volatile("b", "2")
+        assert first.prefix_hash() == second.prefix_hash()
+
+
+class TestPrefixStability:
+    """Prefixes of real prompts stay byte-identical within a spec."""
+
+    def test_subtask_prompts_share_prefix(self, temp_dir):
+        spec_dir = temp_dir / "specs" / "001-test"
+        spec_dir.mkdir(parents=True)
+
+        first = build_subtask_prompt_blocks(
+            spec_dir, temp_dir, _subtask("1.1", "Add model"), {"name": "Backend"}
+        )
+        retry = build_subtask_prompt_blocks(
+            spec_dir,
+            temp_dir,
+            _subtask("1.2", "Add endpoint"),
+            {"name": "API"},
+            attempt_count=2,
+            recovery_hints=["Tried X"],
+        )
+
+        assert first.prefix == retry.prefix
+        assert "1.1" not in first.prefix
+        assert "Add endpoint" in retry.suffix
+        assert 'git commit -m "auto-claude: 1.2 - Add endpoint"' in retry.suffix
+
+    def test_generate_subtask_prompt_matches_builder(self, temp_dir):
+        spec_dir = temp_dir / "specs" / "001-test"
+        spec_dir.mkdir(parents=True)
+        args = (spec_dir, temp_dir, _subtask("1.1", "Add model"), {"name": "B"})
+
+        assert (
+            generate_subtask_prompt(*args) == build_subtask_prompt_blocks(*args).build()
+        )
+
+    def test_coding_prompt_volatile_context_after_prefix(self, temp_dir):
+        spec_dir = temp_dir / "spec"
+        spec_dir.mkdir()
+        before = build_coding_prompt_blocks(spec_dir)
+
+        (spec_dir / "HUMAN_INPUT.md").write_text("Use the new API")
+        after = build_coding_prompt_blocks(spec_dir)
+
+        assert before.prefix == after.prefix
+        assert after.build().endswith(after.suffix)
+        assert "Use the new API" in after.suffix
+
+    def test_qa_reviewer_prompt_is_fully_cacheable(self, temp_dir):
+        spec_dir = temp_dir / "spec"
+        spec_dir.mkdir()
+        builder = build_qa_reviewer_prompt_blocks(spec_dir, temp_dir)
+
+        assert builder.suffix == ""
+        assert builder.prefix_hash() == (
+            build_qa_reviewer_prompt_blocks(spec_dir, temp_dir).prefix_hash()
+        )
+
+
+class TestPromptCacheReport:
+    """Tests for the prefix log and the cache-hit report."""
+
+    def test_record_appends_to_log(self, temp_dir):
+        builder = PromptBuilder("coding").add_stable("a", "A" * 400)
+        builder.add_volatile("b", "B" * 100)
+
+        builder.record(temp_dir, session=3)
+        builder.record(temp_dir, session=4)
+
+        lines = (temp_dir / "memory" / PROMPT_PREFIX_LOG).read_text().splitlines()
+        entry = json.loads(lines[0])
+        assert len(lines) == 2
+        assert entry["session"] == 3
+        assert entry["prefix_tokens"] == 100
+        assert entry["total_tokens"] == 125
+
+    def test_hits_require_same_prefix_within_ttl(self, temp_dir):
+        entry = {"phase": "coding", "prefix_tokens": 80, "total_tokens": 100}
+        _write_log(
+            temp_dir,
+            [
+                {**entry, "prefix_hash": "a", "timestamp": 0},
+                {**entry, "prefix_hash": "a", "timestamp": 60},  # hit
+                {**entry, "prefix_hash": "b", "timestamp": 120},  # new prefix
+                {**entry, "prefix_hash": "a", "timestamp": 60 + CACHE_TTL_SECONDS + 1},
+                {**entry, "phase": "qa_review", "prefix_hash": "q", "timestamp": 0},
+            ],
+        )
+
+        report = get_prompt_cache_report(temp_dir)
+
+        assert report["coding"]["sessions"] == 4
+        assert report["coding"]["cache_hits"] == 1
+        assert report["coding"]["distinct_prefixes"] == 2
+        assert report["coding"]["estimated_hit_ratio"] == 0.2
+        assert report["qa_review"]["cache_hits"] == 0
+
+    def test_format_report(self, temp_dir):
+        assert "No prompts" in format_prompt_cache_report({})
+
+        PromptBuilder("coding").add_stable("a", "A" * 40).record(temp_dir)
+        text = format_prompt_cache_report(get_prompt_cache_report(temp_dir))
+        assert "coding" in text
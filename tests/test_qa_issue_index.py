@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Tests for the QA issue fingerprint index
+========================================
+
+Tests the MinHash/LSH index in qa/issue_index.py and its use by
+qa/report.py:
+- Candidate lookup and persistence of IssueIndex
+- has_recurring_issues() agreeing with an exhaustive comparison
+- The index stored in qa_issue_index.json next to the plan
+- A benchmark against the exhaustive comparison
+"""
+
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add tests directory to path for helper imports
+sys.path.insert(0, str(Path(__file__).parent))
+
+# Setup mocks before importing auto-claude modules
+from qa_report_helpers import cleanup_qa_report_mocks, setup_qa_report_mocks
+
+# Setup mocks
+setup_qa_report_mocks()
+
+# Import report functions after mocking
+from qa.issue_index import IssueIndex
+from qa.report import (
+    ISSUE_INDEX_FILE,
+    ISSUE_SIMILARITY_THRESHOLD,
+    MIN_INDEXED_ISSUES,
+    _issue_similarity,
+    _normalize_issue_key,
+    get_issue_index,
+    has_recurring_issues,
+    record_iteration,
+)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def cleanup_mocked_modules():
+    """Restore original modules after all tests in this module complete."""
+    yield
+    cleanup_qa_report_mocks()
+
+
+def _generated_history(iterations: int, issues_per_iteration: int, seed: int = 7):
+    """QA history where a few issues recur with small variations."""
+    rng = random.Random(seed)
+    subjects = ["user", "token", "session", "cart", "order", "invoice", "profile"]
+    problems = [
+        "missing null check for",
+        "unhandled exception when saving",
+        "type error in serializer of",
+        "test fails for",
+        "race condition updating",
+    ]
+    history = []
+    for i in range(iterations):
+        issues = []
+        for _ in range(issues_per_iteration):
+            subject = rng.choice(subjects)
+            issues.append(
+                {
+                    "title": f"{rng.choice(problems)} {subject} {rng.randrange(40)}",
+                    "file": f"src/{subject}.py",
+                    "line": rng.randrange(1, 30),
+                }
+            )
+        history.append({"iteration": i + 1, "status": "rejected", "issues": issues})
+    return history
+
+
+def _exhaustive_counts(current, history):
+    """Occurrence counts by comparing against every historical issue."""
+    historical = [issue for record in history for issue in record["issues"]]
+    return [
+        1
+        + sum(
+            1
+            for other in historical
+            if _issue_similarity(issue, other) >= ISSUE_SIMILARITY_THRESHOLD
+        )
+        for issue in current
+    ]
+
+
+class TestIssueIndex:
+    """Tests for IssueIndex."""
+
+    def test_candidates_include_near_duplicates(self):
+        index = IssueIndex.from_keys(
+            [
+                "type error in function foo|utils.py|10",
+                "type error in function foo|utils.py|10",
+                "database connection failed|db.py|",
+            ]
+        )
+
+        candidates = dict(index.candidates("type error in function foo|utils.py|12"))
+
+        assert candidates["type error in function foo|utils.py|10"] == 2
+        assert len(index) == 2
+        assert index.total == 3
+
+    def test_round_trip(self):
+        index = IssueIndex.from_keys(["a|b|1", "c|d|2", "a|b|1"])
+
+        loaded = IssueIndex.from_dict(json.loads(json.dumps(index.to_dict())))
+
+        assert loaded.total == 3
+        assert loaded.candidates("a|b|1") == index.candidates("a|b|1")
+
+    def test_rejects_other_parameters(self):
+        data = IssueIndex.from_keys(["a|b|1"]).to_dict()
+        data["band_rows"] = 4
+
+        assert IssueIndex.from_dict(data) is None
+        assert IssueIndex.from_dict(None) is None
+
+
+class TestIndexedRecurrence:
+    """has_recurring_issues() through the index."""
+
+    def test_matches_exhaustive_comparison(self):
+        history = _generated_history(iterations=30, issues_per_iteration=8)
+        current = history[-1]["issues"] + _generated_history(3, 5, seed=99)[0]["issues"]
+
+        counts = _exhaustive_counts(current, history)
+        _, recurring = has_recurring_issues(current, history, threshold=1)
+
+        assert [r["occurrence_count"] for r in recurring] == counts
+
+    def test_reworded_title_at_same_location(self):
+        current = [{"title": "Null check missing for user", "file": "a.py", "line": 3}]
+        history = [
+            {
+                "issues": [
+                    {"title": "Missing null check for user", "file": "a.py", "line": 3}
+                ]
+            },
+            {
+                "issues": [
+                    {"title": "Null check for user missing", "file": "a.py", "line": 3}
+                ]
+            },
+        ]
+
+        has_recurring, recurring = has_recurring_issues(current, history)
+
+        assert has_recurring is True
+        assert recurring[0]["occurrence_count"] == 3
+
+    def test_same_location_keys_are_candidates(self):
+        # Same words at the same location, but no MinHash band in common
+        stored = "a b c d e f g h|app.py|3"
+        query = "c h e d b g a f|app.py|3"
+        index = IssueIndex.from_keys([stored, "a b c d e f g h|other.py|3"])
+
+        assert (stored, 1) in index.candidates(query)
+        assert [key for key, _ in index.candidates(query)].count(stored) == 1
+
+    def test_keys_without_location_are_not_bucketed_together(self):
+        stored = [f"unrelated problem number {i}||" for i in range(50)]
+        index = IssueIndex.from_keys(stored)
+
+        candidates = [key for key, _ in index.candidates("missing docstring||")]
+        assert len(candidates) < 10
+
+    def test_small_and_indexed_histories_agree(self):
+        history = _generated_history(iterations=40, issues_per_iteration=10)
+        current = history[-1]["issues"]
+        small = history[:3]
+        keys = {_normalize_issue_key(i) for r in history for i in r["issues"]}
+        assert len(keys) >= MIN_INDEXED_ISSUES
+
+        for past in (small, history):
+            _, recurring = has_recurring_issues(current, past, threshold=1)
+            assert [r["occurrence_count"] for r in recurring] == (
+                _exhaustive_counts(current, past)
+            )
+
+    def test_reworded_title_elsewhere_is_distinct(self):
+        current = [{"title": "Null check missing for user", "file": "a.py"}]
+        history = [
+            {"issues": [{"title": "Missing null check for user", "file": "b.py"}]}
+        ]
+
+        assert has_recurring_issues(current, history, threshold=2) == (False, [])
+
+
+class TestStoredIndex:
+    """The index persisted in qa_issue_index.json."""
+
+    def test_record_iteration_updates_index(self, temp_dir):
+        issue = {"title": "Same error", "file": "app.py"}
+        for iteration in range(1, 4):
+            record_iteration(temp_dir, iteration, "rejected", [issue])
+
+        plan = json.loads((temp_dir / "implementation_plan.json").read_text())
+        assert "qa_issue_index" not in plan
+        stored = json.loads((temp_dir / ISSUE_INDEX_FILE).read_text())["entries"]
+        assert stored[_normalize_issue_key(issue)]["count"] == 3
+
+        index = get_issue_index(temp_dir)
+        history = plan["qa_iteration_history"]
+        assert (
+            has_recurring_issues([issue], history, index=index)[1][0][
+                "occurrence_count"
+            ]
+            == 4
+        )
+
+    def test_stale_index_rebuilt(self, temp_dir):
+        record_iteration(temp_dir, 1, "rejected", [{"title": "A"}])
+        plan_file = temp_dir / "implementation_plan.json"
+        plan = json.loads(plan_file.read_text())
+        plan["qa_iteration_history"].append({"issues": [{"title": "B"}]})
+        plan_file.write_text(json.dumps(plan))
+
+        assert get_issue_index(temp_dir).total == 2
+
+    def test_index_moved_out_of_plan(self, temp_dir):
+        plan_file = temp_dir / "implementation_plan.json"
+        plan_file.write_text(json.dumps({"qa_issue_index": {"entries": {}}}))
+
+        record_iteration(temp_dir, 1, "rejected", [{"title": "A"}])
+
+        assert "qa_issue_index" not in json.loads(plan_file.read_text())
+        assert get_issue_index(temp_dir).total == 1
+
+
+@pytest.mark.slow
+def test_benchmark_against_exhaustive_comparison():
+    history = _generated_history(iterations=60, issues_per_iteration=10)
+    current = history[-1]["issues"]
+
+    start = time.perf_counter()
+    expected = _exhaustive_counts(current, history)
+    exhaustive_s = time.perf_counter() - start
+
+    index = IssueIndex.from_keys(
+        _normalize_issue_key(issue) for record in history for issue in record["issues"]
+    )
+    start = time.perf_counter()
+    _, recurring = has_recurring_issues(current, history, threshold=1, index=index)
+    indexed_s = time.perf_counter() - start
+
+    assert [r["occurrence_count"] for r in recurring] == expected
+    print(
+        f"\n{len(current)} issues vs {len(history) * 10} historical: exhaustive "
+        f"{exhaustive_s * 1000:.0f}ms, indexed {indexed_s * 1000:.0f}ms"
+    )
@@ -7,7 +7,13 @@ from pathlib import Path
 # Ensure local apps/backend is in path
 sys.path.insert(0, str(Path(__file__).parents[1] / "apps" / "backend"))
 
-from security.profile import get_security_profile, reset_profile_cache
+from security.profile import (
+    discover_worktree_dirs,
+    get_profile_cache_stats,
+    get_security_profile,
+    reset_profile_cache,
+    warm_profile_cache,
+)
 from project.models import SecurityProfile
 from project.analyzer import ProjectAnalyzer
 
@@ -114,3 +120,86 @@ def test_cache_invalidation_on_file_deletion(mock_project_dir, mock_profile_path
     # 4. Call again - should handle deletion gracefully and fallback to fresh analysis
     profile2 = get_security_profile(mock_project_dir)
     assert "unique_cmd_A" not in profile2.get_all_allowed_commands() 
+
+def _make_projects(tmp_path, count):
+    projects = []
+    for i in range(count):
+        project_dir = tmp_path / f"project-{i}"
+        project_dir.mkdir()
+        (project_dir / ".auto-claude-security.json").write_text(
+            create_valid_profile_json([f"cmd_{i}"], get_dir_hash(project_dir))
+        )
+        projects.append(project_dir)
+    return projects
+
+def test_multiple_projects_cached_independently(tmp_path):
+    reset_profile_cache()
+    project_a, project_b = _make_projects(tmp_path, 2)
+
+    # Alternate between projects - each one is analyzed/loaded once
+    for _ in range(3):
+        assert "cmd_0" in get_security_profile(project_a).get_all_allowed_commands()
+        assert "cmd_1" in get_security_profile(project_b).get_all_allowed_commands()
+
+    stats = get_profile_cache_stats()
+    assert stats["misses"] == 2
+    assert stats["hits"] == 4
+    assert stats["size"] == 2
+
+def test_lru_evicts_least_recently_used(tmp_path, monkeypatch):
+    from security import profile as profile_module
+
+    reset_profile_cache()
+    monkeypatch.setattr(profile_module, "MAX_CACHED_PROFILES", 2)
+    project_a, project_b, project_c = _make_projects(tmp_path, 3)
+
+    get_security_profile(project_a)
+    get_security_profile(project_b)
+    get_security_profile(project_a)  # a is now most recently used
+    get_security_profile(project_c)  # evicts b
+
+    stats = get_profile_cache_stats()
+    assert stats["evictions"] == 1
+    assert stats["size"] == 2
+
+    get_security_profile(project_a)
+    assert get_profile_cache_stats()["misses"] == 3  # a still cached
+    get_security_profile(project_b)
+    assert get_profile_cache_stats()["misses"] == 4  # b was evicted
+    # Per-key locks go with their evicted entries
+    assert set(profile_module._key_locks) == set(profile_module._profile_cache)
+
+def test_invalid_cache_size_env_falls_back(monkeypatch):
+    from security import profile as profile_module
+
+    monkeypatch.setenv(profile_module.PROFILE_CACHE_SIZE_ENV, "lots")
+    assert (
+        profile_module._get_max_cached_profiles()
+        == profile_module.DEFAULT_MAX_CACHED_PROFILES
+    )
+    monkeypatch.setenv(profile_module.PROFILE_CACHE_SIZE_ENV, "8")
+    assert profile_module._get_max_cached_profiles() == 8
+
+def test_warm_profile_cache_prefills_entries(tmp_path):
+    reset_profile_cache()
+    projects = _make_projects(tmp_path, 3)
+
+    warmed = warm_profile_cache(projects + [projects[0]], max_workers=3)
+
+    assert warmed == 3
+    assert get_profile_cache_stats()["misses"] == 3
+    for i, project_dir in enumerate(projects):
+        assert f"cmd_{i}" in get_security_profile(project_dir).get_all_allowed_commands()
+    assert get_profile_cache_stats()["hits"] == 3
+
+def test_discover_worktree_dirs(tmp_path):
+    (tmp_path / ".worktrees" / "001-a").mkdir(parents=True)
+    (tmp_path / ".worktrees" / "002-b").mkdir(parents=True)
+
+    dirs = discover_worktree_dirs(tmp_path)
+
+    assert dirs == [
+        tmp_path.resolve(),
+        tmp_path.resolve() / ".worktrees" / "001-a",
+        tmp_path.resolve() / ".worktrees" / "002-b",
+    ]
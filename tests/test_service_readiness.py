@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Tests for the service readiness module.
+
+Tests cover:
+- Concurrent readiness waiting with a shared deadline
+- TCP, HTTP and log-line probes
+- Per-service time-to-ready in orchestration results
+"""
+
+import socket
+import sys
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "apps" / "backend"))
+
+from services.orchestrator import ServiceConfig, ServiceOrchestrator
+from services.readiness import (
+    Backoff,
+    ServiceCheck,
+    http_probe,
+    tcp_probe,
+    wait_for_services,
+)
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+@pytest.fixture
+def http_server():
+    """HTTP server whose response status can be changed by the test."""
+
+    class Handler(BaseHTTPRequestHandler):
+        status = 200
+
+        def do_GET(self):
+            self.send_response(Handler.status)
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server, Handler
+    server.shutdown()
+    server.server_close()
+
+
+def _ready_after(seconds: float):
+    ready_at = time.monotonic() + seconds
+    return lambda: time.monotonic() >= ready_at
+
+
+# =============================================================================
+# WAITING
+# =============================================================================
+
+
+class TestWaitForServices:
+    """Tests for concurrent readiness waiting."""
+
+    def test_services_are_probed_concurrently(self):
+        checks = [ServiceCheck(f"svc-{i}", _ready_after(0.5)) for i in range(4)]
+
+        start = time.monotonic()
+        report = wait_for_services(checks, timeout=10)
+        elapsed = time.monotonic() - start
+
+        assert report.all_ready
+        assert set(report.ready) == {"svc-0", "svc-1", "svc-2", "svc-3"}
+        assert all(0.5 <= seconds < 1.0 for seconds in report.ready.values())
+        # Serial polling with a fixed 2s sleep would take several seconds
+        assert elapsed < 1.5
+
+    def test_deadline_reports_slow_service(self):
+        report = wait_for_services(
+            [
+                ServiceCheck("fast", lambda: True),
+                ServiceCheck("never", lambda: False),
+            ],
+            timeout=0.3,
+        )
+
+        assert not report.all_ready
+        assert "fast" in report.ready
+        assert report.not_ready["never"].startswith("not ready after")
+        assert report.summary()[-1].startswith("never: not ready")
+
+    def test_exited_service_fails_fast(self):
+        start = time.monotonic()
+        report = wait_for_services(
+            [ServiceCheck("crashed", lambda: False, alive=lambda: False)], timeout=10
+        )
+
+        assert report.not_ready == {"crashed": "exited before becoming ready"}
+        assert time.monotonic() - start < 1
+
+    def test_wake_event_skips_backoff_delay(self):
+        event = threading.Event()
+        threading.Timer(0.2, event.set).start()
+
+        report = wait_for_services(
+            [ServiceCheck("logged", event.is_set, wake=event)],
+            timeout=10,
+            backoff=Backoff(initial=5, maximum=5),
+        )
+
+        assert report.ready["logged"] < 1
+
+    def test_backoff_grows_to_maximum(self):
+        delays = Backoff(initial=0.1, factor=2, maximum=0.5).delays()
+
+        assert [next(delays) for _ in range(5)] == [0.1, 0.2, 0.4, 0.5, 0.5]
+
+
+# =============================================================================
+# PROBES
+# =============================================================================
+
+
+class TestProbes:
+    """Tests for TCP and HTTP probes."""
+
+    def test_tcp_probe(self):
+        port = _free_port()
+        probe = tcp_probe("127.0.0.1", port)
+        assert probe() is False
+
+        with socket.socket() as listener:
+            listener.bind(("127.0.0.1", port))
+            listener.listen()
+            assert probe() is True
+
+    def test_http_probe_status(self, http_server):
+        server, handler = http_server
+        probe = http_probe(f"http://127.0.0.1:{server.server_port}/health")
+
+        assert probe() is True
+        handler.status = 404
+        assert probe() is True
+        handler.status = 503
+        assert probe() is False
+
+    def test_http_probe_on_non_http_port(self):
+        with socket.socket() as listener:
+            listener.bind(("127.0.0.1", 0))
+            listener.listen()
+
+            def reply_garbage():
+                conn, _ = listener.accept()
+                conn.recv(1024)
+                conn.sendall(b"\x00not http\r\n")
+                conn.close()
+
+            threading.Thread(target=reply_garbage, daemon=True).start()
+            port = listener.getsockname()[1]
+
+            assert http_probe(f"http://127.0.0.1:{port}/health")() is True
+
+        assert http_probe(f"http://127.0.0.1:{_free_port()}/health")() is False
+
+    def test_http_probe_ignores_proxy_env(self, http_server, monkeypatch):
+        server, _ = http_server
+        monkeypatch.setenv("HTTP_PROXY", f"http://127.0.0.1:{_free_port()}")
+        monkeypatch.setenv("http_proxy", f"http://127.0.0.1:{_free_port()}")
+        monkeypatch.delenv("NO_PROXY", raising=False)
+        monkeypatch.delenv("no_proxy", raising=False)
+        # urlopen() caches an opener built from the environment on first use
+        monkeypatch.setattr(urllib.request, "_opener", None)
+
+        assert http_probe(f"http://127.0.0.1:{server.server_port}/health")() is True
+
+
+# =============================================================================
+# ORCHESTRATOR
+# =============================================================================
+
+
+class TestOrchestratorReadiness:
+    """Tests for readiness in ServiceOrchestrator."""
+
+    def _orchestrator(self, temp_dir, *services):
+        orchestrator = ServiceOrchestrator(temp_dir)
+        orchestrator._services = list(services)
+        return orchestrator
+
+    def test_log_line_readiness(self, temp_dir):
+        script = "import time; print('booting', flush=True); time.sleep(0.3); print('Listening on 8000', flush=True); time.sleep(30)"
+        orchestrator = self._orchestrator(
+            temp_dir,
+            ServiceConfig(
+                name="worker",
+                type="local",
+                startup_command=f'{sys.executable} -c "{script}"',
+                ready_log_pattern=r"Listening on \d+",
+            ),
+        )
+        try:
+            result = orchestrator.start_services(timeout=10)
+        finally:
+            orchestrator.stop_services()
+
+        assert result.success
+        assert 0.2 < result.time_to_ready["worker"] < 5
+
+    def test_local_service_exit_is_reported(self, temp_dir):
+        orchestrator = self._orchestrator(
+            temp_dir,
+            ServiceConfig(
+                name="broken",
+                type="local",
+                startup_command=f'{sys.executable} -c "raise SystemExit(1)"',
+                port=_free_port(),
+            ),
+        )
+        try:
+            result = orchestrator.start_services(timeout=10)
+        finally:
+            orchestrator.stop_services()
+
+        assert not result.success
+        assert "broken (exited before becoming ready)" in result.errors[0]
+
+    def test_compose_port_without_http_uses_tcp_check(self, temp_dir):
+        with socket.socket() as listener:
+            # Accepts connections but never answers
+            listener.bind(("127.0.0.1", 0))
+            listener.listen()
+            port = listener.getsockname()[1]
+            (temp_dir / "docker-compose.yml").write_text(
+                f"services:\n  db:\n    image: redis\n    ports: ['{port}:6379']\n"
+            )
+            orchestrator = ServiceOrchestrator(temp_dir)
+            (service,) = orchestrator.get_services()
+
+            start = time.perf_counter()
+            assert orchestrator._readiness_check(service).probe() is True
+            assert time.perf_counter() - start < 1.0
+
+        assert service.health_check_url == f"http://localhost:{port}/health"
+        assert service.health_check_derived
+
+    def test_compose_ready_log_label(self, temp_dir):
+        (temp_dir / "docker-compose.yml").write_text(
+            "services:\n"
+            "  api:\n"
+            "    image: app\n"
+            "    ports: ['8000:8000']\n"
+            "    labels:\n"
+            "      auto-claude.ready-log: 'Uvicorn running'\n"
+            "  db:\n"
+            "    image: postgres\n"
+            "    labels: ['auto-claude.ready-log=ready to accept']\n"
+        )
+
+        services = {s.name: s for s in ServiceOrchestrator(temp_dir).get_services()}
+
+        assert services["api"].ready_log_pattern == "Uvicorn running"
+        assert services["db"].ready_log_pattern == "ready to accept"
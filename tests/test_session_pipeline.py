@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Tests for the buffered session event pipeline.
+
+Covers:
+- Text coalescing per time window and flushing before tool events
+- Response text accumulation
+- A replay benchmark of a 10k-message stream through run_agent_session
+"""
+
+import importlib
+import sys
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "apps" / "backend"))
+
+from agents.session_pipeline import SessionEventPipeline
+from task_logger import LogPhase
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+# Stream message types, named like the SDK classes run_agent_session dispatches on
+class AssistantMessage:
+    def __init__(self, content):
+        self.content = content
+
+
+class UserMessage:
+    def __init__(self, content):
+        self.content = content
+
+
+class TextBlock:
+    def __init__(self, text):
+        self.text = text
+
+
+class ToolUseBlock:
+    def __init__(self, name, input):
+        self.name = name
+        self.input = input
+
+
+class ToolResultBlock:
+    def __init__(self, content, is_error=False):
+        self.content = content
+        self.is_error = is_error
+
+
+def recorded_stream(messages: int = 10_000, tool_every: int = 200) -> list:
+    """A session stream: mostly small text chunks with periodic tool calls."""
+    stream = []
+    while len(stream) < messages:
+        n = len(stream)
+        if n % tool_every == tool_every - 2:
+            stream.append(
+                AssistantMessage([ToolUseBlock("Read", {"file_path": f"src/m{n}.py"})])
+            )
+            stream.append(UserMessage([ToolResultBlock(f"contents of m{n}.py")]))
+        else:
+            stream.append(AssistantMessage([TextBlock(f"token {n} ")]))
+    return stream[:messages]
+
+
+def fake_client(stream: list) -> MagicMock:
+    async def receive_response():
+        for msg in stream:
+            yield msg
+
+    client = MagicMock()
+    client.query = MagicMock(side_effect=lambda _: _done())
+    client.receive_response = receive_response
+    return client
+
+
+async def _done():
+    return None
+
+
+class TestSessionEventPipeline:
+    """Unit tests for SessionEventPipeline."""
+
+    def test_coalesces_text_within_window(self):
+        logger = MagicMock()
+        clock = FakeClock()
+        pipeline = SessionEventPipeline(
+            logger, LogPhase.CODING, coalesce_window=1.0, clock=clock
+        )
+
+        pipeline.add_text("Hello ")
+        clock.now = 0.5
+        pipeline.add_text("world")
+        assert logger.log.call_count == 0
+
+        clock.now = 1.2
+        pipeline.add_text("!")  # Window elapsed - flush including this block
+        assert logger.log.call_count == 1
+        assert logger.log.call_args.args[0] == "Hello world!"
+
+    def test_flush_and_close_write_pending_text(self):
+        logger = MagicMock()
+        pipeline = SessionEventPipeline(logger, LogPhase.CODING, coalesce_window=10)
+
+        pipeline.add_text("before tool")
+        pipeline.flush()
+        pipeline.add_text("after tool")
+        pipeline.close()
+
+        logged = [c.args[0] for c in logger.log.call_args_list]
+        assert logged == ["before tool", "after tool"]
+        assert pipeline.response_text == "before toolafter tool"
+
+    def test_blank_text_not_logged(self):
+        logger = MagicMock()
+        pipeline = SessionEventPipeline(logger, LogPhase.CODING, coalesce_window=10)
+        pipeline.add_text("\n  ")
+        pipeline.close()
+        assert logger.log.call_count == 0
+        assert pipeline.response_text == "\n  "
+
+    def test_zero_window_logs_every_block(self):
+        logger = MagicMock()
+        pipeline = SessionEventPipeline(logger, LogPhase.CODING, coalesce_window=0)
+        for text in ("a", "b", "c"):
+            pipeline.add_text(text)
+        assert logger.log.call_count == 3
+
+    def test_window_from_env(self, monkeypatch):
+        monkeypatch.setenv("AUTO_CLAUDE_LOG_COALESCE_MS", "250")
+        pipeline = SessionEventPipeline(None, LogPhase.CODING)
+        assert pipeline.coalesce_window == 0.25
+
+    def test_without_logger(self):
+        pipeline = SessionEventPipeline(None, LogPhase.CODING)
+        pipeline.add_text("x")
+        pipeline.close()
+        assert pipeline.response_text == "x"
+
+
+@pytest.fixture
+def session_module():
+    """
+    agents.session bound to the real task logger and progress modules.
+
+    Other test modules install MagicMock versions of these at import time,
+    so reload the session modules once conftest has restored the real ones.
+    """
+    import agents.session
+    import agents.session_pipeline
+
+    importlib.reload(agents.session_pipeline)
+    return importlib.reload(agents.session)
+
+
+class TestRunAgentSessionReplay:
+    """Replays recorded streams through run_agent_session."""
+
+    async def _replay(self, spec_dir: Path, stream: list, window_ms: str, monkeypatch):
+        from agents.session import run_agent_session
+        from task_logger import LogPhase, TaskLogger
+        from task_logger.storage import LogStorage
+
+        monkeypatch.setenv("AUTO_CLAUDE_LOG_COALESCE_MS", window_ms)
+        logger = TaskLogger(spec_dir, emit_markers=False)
+        saves = 0
+        original_save = LogStorage.save
+
+        def counting_save(storage):
+            nonlocal saves
+            saves += 1
+            original_save(storage)
+
+        with (
+            patch("agents.session.get_task_logger", return_value=logger),
+            patch.object(LogStorage, "save", counting_save),
+            patch("builtins.print"),
+        ):
+            start = time.perf_counter()
+            status, response = await run_agent_session(
+                fake_client(stream), "prompt", spec_dir, phase=LogPhase.CODING
+            )
+            elapsed = time.perf_counter() - start
+        return status, response, saves, elapsed, logger
+
+    async def test_log_order_preserved(self, session_module, temp_dir, monkeypatch):
+        stream = recorded_stream(messages=12, tool_every=6)
+        _, response, _, _, logger = await self._replay(
+            temp_dir, stream, "60000", monkeypatch
+        )
+
+        entries = logger.get_logs()["phases"]["coding"]["entries"]
+        types = [e["type"] for e in entries]
+        assert types == [
+            "text",
+            "tool_start",
+            "tool_end",
+            "text",
+            "tool_start",
+            "tool_end",
+        ]
+        assert entries[0]["content"] == "token 0 token 1 token 2 token 3 "
+        assert response.startswith("token 0 token 1")
+
+    @pytest.mark.slow
+    async def test_replay_benchmark_10k_messages(
+        self, session_module, temp_dir, monkeypatch
+    ):
+        stream = recorded_stream()
+        # Per-block logging rewrites the whole log per entry (quadratic), so
+        # the legacy path is only measured on a prefix of the stream
+        prefix = stream[:300]
+
+        legacy_dir = temp_dir / "legacy"
+        buffered_dir = temp_dir / "buffered"
+        legacy_dir.mkdir()
+        buffered_dir.mkdir()
+
+        _, _, legacy_saves, legacy_s, _ = await self._replay(
+            legacy_dir, prefix, "0", monkeypatch
+        )
+        status, text, saves, seconds, _ = await self._replay(
+            buffered_dir, stream, "500", monkeypatch
+        )
+
+        expected = "".join(
+            block.text
+            for msg in stream
+            if isinstance(msg, AssistantMessage)
+            for block in msg.content
+            if isinstance(block, TextBlock)
+        )
+        assert status == "continue"
+        assert text == expected
+        assert saves < 200
+        assert legacy_saves > 0.9 * len(prefix)
+        print(
+            f"\nPer-block logging: {len(prefix)} messages in {legacy_s:.2f}s "
+            f"({legacy_saves} log writes). Buffered: {len(stream)} messages in "
+            f"{seconds:.2f}s ({saves} log writes)"
+        )
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Tests for the spec validator.
+
+Tests cover:
+- Validators sharing one parsed snapshot of the spec directory
+- Concurrent validate_all() results
+- Skipping re-validation while the spec directory is unchanged
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "apps" / "backend"))
+
+from spec.validate_pkg import SpecSnapshot, SpecValidator
+from spec.validate_pkg import snapshot as snapshot_module
+from spec.validate_pkg import spec_validator as spec_validator_module
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    snapshot_module.clear_snapshot_cache()
+    spec_validator_module.clear_validation_cache()
+    yield
+    snapshot_module.clear_snapshot_cache()
+    spec_validator_module.clear_validation_cache()
+
+
+@pytest.fixture
+def spec_dir(temp_dir: Path) -> Path:
+    """A spec directory that passes every checkpoint."""
+    spec = temp_dir / "specs" / "001-feature"
+    spec.mkdir(parents=True)
+    (spec / "project_index.json").write_text(json.dumps({"project_type": "single"}))
+    (spec / "context.json").write_text(
+        json.dumps(
+            {
+                "task_description": "Add a feature",
+                "files_to_modify": ["app.py"],
+                "files_to_reference": ["lib.py"],
+                "scoped_services": ["backend"],
+            }
+        )
+    )
+    sections = ["Overview", "Workflow Type", "Task Scope", "Success Criteria"]
+    (spec / "spec.md").write_text(
+        "\n\n".join(f"## {s}\n\n{'Details. ' * 20}" for s in sections)
+    )
+    (spec / "implementation_plan.json").write_text(
+        json.dumps(
+            {
+                "feature": "Feature",
+                "workflow_type": "feature",
+                "phases": [
+                    {
+                        "id": "phase-1",
+                        "name": "Build",
+                        "subtasks": [
+                            {"id": "1.1", "description": "Do it", "status": "pending"}
+                        ],
+                    }
+                ],
+            }
+        )
+    )
+    return spec
+
+
+def _touch(path: Path, content: str) -> None:
+    """Rewrite a file and make sure its mtime moves forward."""
+    stat = path.stat()
+    path.write_text(content)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def _count_loads(monkeypatch) -> dict[str, int]:
+    counts = {"json": 0, "text": 0}
+    load_json, read_text = snapshot_module._load_json, snapshot_module._read_text
+
+    def counting_json(path):
+        counts["json"] += 1
+        return load_json(path)
+
+    def counting_text(path):
+        counts["text"] += 1
+        return read_text(path)
+
+    monkeypatch.setattr(snapshot_module, "_load_json", counting_json)
+    monkeypatch.setattr(snapshot_module, "_read_text", counting_text)
+    return counts
+
+
+class TestValidateAll:
+    """Tests for SpecValidator.validate_all()."""
+
+    def test_all_checkpoints_in_order(self, spec_dir: Path):
+        results = SpecValidator(spec_dir).validate_all()
+
+        assert [r.checkpoint for r in results] == ["prereqs", "context", "spec", "plan"]
+        assert all(r.valid for r in results), [str(r) for r in results]
+
+    def test_reports_errors(self, spec_dir: Path):
+        (spec_dir / "context.json").write_text("{not json")
+        (spec_dir / "spec.md").unlink()
+
+        results = {r.checkpoint: r for r in SpecValidator(spec_dir).validate_all()}
+
+        assert "invalid JSON" in results["context"].errors[0]
+        assert results["spec"].errors == ["spec.md not found"]
+        assert results["plan"].valid
+
+    def test_unchanged_spec_dir_skips_validation(self, spec_dir: Path, monkeypatch):
+        first = SpecValidator(spec_dir).validate_all()
+        snapshot_module.clear_snapshot_cache()
+        counts = _count_loads(monkeypatch)
+
+        second = SpecValidator(spec_dir).validate_all()
+
+        assert counts == {"json": 0, "text": 0}
+        assert [str(r) for r in second] == [str(r) for r in first]
+        assert second[0] is not first[0]
+
+    def test_change_triggers_revalidation(self, spec_dir: Path):
+        validator = SpecValidator(spec_dir)
+        assert all(r.valid for r in validator.validate_all())
+
+        _touch(spec_dir / "implementation_plan.json", json.dumps({"feature": "x"}))
+
+        plan = validator.validate_all()[3]
+        assert not plan.valid
+        assert "Missing required field: workflow_type" in plan.errors
+
+    def test_failed_run_is_not_remembered(self, spec_dir: Path, monkeypatch):
+        (spec_dir / "spec.md").unlink()
+        SpecValidator(spec_dir).validate_all()
+        counts = _count_loads(monkeypatch)
+        snapshot_module.clear_snapshot_cache()
+
+        SpecValidator(spec_dir).validate_all()
+
+        assert counts["json"] == 2
+
+
+class TestSpecSnapshot:
+    """Tests for the shared snapshot."""
+
+    def test_files_parsed_once_until_modified(self, spec_dir: Path, monkeypatch):
+        counts = _count_loads(monkeypatch)
+        validator = SpecValidator(spec_dir)
+
+        for _ in range(3):
+            validator.validate_context()
+            validator.validate_implementation_plan()
+            validator.validate_spec_document()
+        assert counts == {"json": 2, "text": 1}
+
+        _touch(spec_dir / "spec.md", "## Overview\n")
+        assert not validator.validate_spec_document().valid
+        assert counts["text"] == 2
+
+    def test_invalid_json_error_is_cached(self, spec_dir: Path):
+        (spec_dir / "context.json").write_text("[1,")
+        snapshot = SpecSnapshot(spec_dir)
+
+        for _ in range(2):
+            with pytest.raises(json.JSONDecodeError):
+                snapshot.load_json("context.json")
+
+    def test_fingerprint_tracks_spec_dir(self, spec_dir: Path):
+        snapshot = SpecSnapshot(spec_dir)
+        before = snapshot.fingerprint()
+
+        assert snapshot.fingerprint() == before
+        (spec_dir / "notes.txt").write_text("new file")
+        assert snapshot.fingerprint() != before
+        assert SpecSnapshot(spec_dir / "missing").fingerprint() == (None,)
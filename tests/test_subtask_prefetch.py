@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Tests for speculative subtask prefetch in the coder loop.
+
+Covers:
+- Next-subtask prediction on an in-memory plan
+- Plan hashing that ignores progress fields
+- Bundle reuse and invalidation (wrong prediction, plan edits, file edits)
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "apps" / "backend"))
+
+from agents.prefetch import SubtaskPrefetcher, compute_plan_hash
+from core.progress import find_next_subtask, get_next_subtask
+from recovery import RecoveryManager
+
+
+def _plan():
+    return {
+        "feature": "Prefetch test",
+        "phases": [
+            {
+                "id": "phase-1",
+                "name": "Backend",
+                "subtasks": [
+                    {
+                        "id": "1.1",
+                        "description": "Add model",
+                        "status": "pending",
+                        "files_to_modify": ["app.py"],
+                    },
+                    {
+                        "id": "1.2",
+                        "description": "Add endpoint",
+                        "status": "pending",
+                        "files_to_modify": ["app.py"],
+                        "patterns_from": ["pattern.py"],
+                    },
+                ],
+            },
+            {
+                "id": "phase-2",
+                "name": "Frontend",
+                "depends_on": ["phase-1"],
+                "subtasks": [
+                    {"id": "2.1", "description": "Add view", "status": "pending"}
+                ],
+            },
+        ],
+    }
+
+
+@pytest.fixture
+def build_env(temp_dir):
+    """Spec dir with a plan plus a project dir with the referenced files."""
+    spec_dir = temp_dir / "spec"
+    project_dir = temp_dir / "project"
+    spec_dir.mkdir()
+    project_dir.mkdir()
+    (project_dir / "app.py").write_text("app = 1\n")
+    (project_dir / "pattern.py").write_text("# the pattern\n")
+    write_plan(spec_dir, _plan())
+    return spec_dir, project_dir
+
+
+def write_plan(spec_dir: Path, plan: dict) -> None:
+    (spec_dir / "implementation_plan.json").write_text(json.dumps(plan))
+
+
+def set_status(spec_dir: Path, subtask_id: str, status: str) -> None:
+    plan = json.loads((spec_dir / "implementation_plan.json").read_text())
+    for phase in plan["phases"]:
+        for subtask in phase["subtasks"]:
+            if subtask["id"] == subtask_id:
+                subtask["status"] = status
+                subtask["completed_at"] = "2024-01-01T00:00:00"
+    plan["updated_at"] = "2024-01-01T00:00:00"
+    write_plan(spec_dir, plan)
+
+
+@pytest.fixture
+def prefetcher(build_env):
+    spec_dir, project_dir = build_env
+    with patch(
+        "agents.prefetch.get_graphiti_context", AsyncMock(return_value="MEMORY")
+    ):
+        yield SubtaskPrefetcher(
+            spec_dir, project_dir, RecoveryManager(spec_dir, project_dir)
+        )
+
+
+class TestFindNextSubtask:
+    """Tests for find_next_subtask prediction."""
+
+    def test_matches_get_next_subtask(self, build_env):
+        spec_dir, _ = build_env
+        assert find_next_subtask(_plan()) == get_next_subtask(spec_dir)
+
+    def test_assume_completed_skips_current(self):
+        assert find_next_subtask(_plan(), assume_completed=["1.1"])["id"] == "1.2"
+
+    def test_assume_completed_unlocks_dependent_phase(self):
+        nxt = find_next_subtask(_plan(), assume_completed=["1.1", "1.2"])
+        assert nxt["id"] == "2.1"
+        assert nxt["phase_name"] == "Frontend"
+
+
+class TestPlanHash:
+    """Tests for compute_plan_hash."""
+
+    def test_progress_fields_ignored(self):
+        plan = _plan()
+        done = _plan()
+        done["phases"][0]["subtasks"][0]["status"] = "completed"
+        done["phases"][0]["subtasks"][0]["completed_at"] = "2024-01-01"
+        done["updated_at"] = "2024-01-01"
+        assert compute_plan_hash(plan) == compute_plan_hash(done)
+
+    def test_structural_edit_changes_hash(self):
+        edited = _plan()
+        edited["phases"][0]["subtasks"][1]["description"] = "Something else"
+        assert compute_plan_hash(_plan()) != compute_plan_hash(edited)
+
+
+class TestSubtaskPrefetcher:
+    """Tests for SubtaskPrefetcher reuse and invalidation."""
+
+    async def test_prefetched_bundle_used_when_prediction_holds(
+        self, prefetcher, build_env
+    ):
+        spec_dir, _ = build_env
+        prefetcher.schedule("1.1")
+        set_status(spec_dir, "1.1", "completed")  # The session finishes 1.1
+        prefetcher.prefetch_memory()
+
+        bundle = await prefetcher.take(get_next_subtask(spec_dir), 0)
+
+        assert bundle is not None
+        assert bundle.subtask_id == "1.2"
+        assert "Add endpoint" in bundle.prompt
+        assert "the pattern" in bundle.prompt
+        assert await bundle.graphiti_task == "MEMORY"
+        assert prefetcher.stats == {"hits": 1, "misses": 0}
+
+    async def test_discarded_when_current_subtask_fails(self, prefetcher, build_env):
+        spec_dir, _ = build_env
+        prefetcher.schedule("1.1")
+        # 1.1 is still pending, so the loop retries it instead of 1.2
+        assert await prefetcher.take(get_next_subtask(spec_dir), 1) is None
+        assert prefetcher.stats["misses"] == 1
+
+    async def test_discarded_when_plan_changes(self, prefetcher, build_env):
+        spec_dir, _ = build_env
+        prefetcher.schedule("1.1")
+        await prefetcher._task
+
+        plan = _plan()
+        plan["phases"][0]["subtasks"][0]["status"] = "completed"
+        plan["phases"][0]["subtasks"].append(
+            {"id": "1.3", "description": "New work", "status": "pending"}
+        )
+        write_plan(spec_dir, plan)
+
+        assert await prefetcher.take(get_next_subtask(spec_dir), 0) is None
+
+    async def test_discarded_when_context_file_modified(self, prefetcher, build_env):
+        spec_dir, project_dir = build_env
+        prefetcher.schedule("1.1")
+        await prefetcher._task
+
+        # The session edits a file the next subtask's context includes
+        app = project_dir / "app.py"
+        app.write_text("app = 2  # changed by session\n")
+        os.utime(app, ns=(0, app.stat().st_mtime_ns + 1_000_000))
+        set_status(spec_dir, "1.1", "completed")
+
+        assert await prefetcher.take(get_next_subtask(spec_dir), 0) is None
+
+    async def test_disabled_by_env(self, prefetcher, build_env, monkeypatch):
+        spec_dir, _ = build_env
+        monkeypatch.setenv("AUTO_CLAUDE_PREFETCH", "false")
+        prefetcher.schedule("1.1")
+        set_status(spec_dir, "1.1", "completed")
+
+        assert await prefetcher.take(get_next_subtask(spec_dir), 0) is None
+
+    async def test_nothing_after_last_subtask(self, prefetcher, build_env):
+        spec_dir, _ = build_env
+        set_status(spec_dir, "1.1", "completed")
+        set_status(spec_dir, "1.2", "completed")
+        prefetcher.schedule("2.1")
+
+        assert await prefetcher.take({"id": "2.1"}, 0) is None
@@ -380,3 +380,126 @@ class TestPerSpecWorktreeName:
 
         assert ".worktrees" in str(working_dir)
         assert working_dir.parent.name == ".worktrees"
+
+
+class TestMergePreflight:
+    """Tests for batched git conflict preflight (core.workspace.preflight)."""
+
+    @staticmethod
+    def _git(repo: Path, *args: str) -> None:
+        subprocess.run(["git", *args], cwd=repo, capture_output=True, check=True)
+
+    @pytest.fixture
+    def preflight_repo(self, temp_git_repo: Path) -> Path:
+        """Repo with one conflicting and one clean spec branch."""
+        (temp_git_repo / "shared.txt").write_text("base\n")
+        self._git(temp_git_repo, "add", ".")
+        self._git(temp_git_repo, "commit", "-m", "Add shared file")
+
+        self._git(temp_git_repo, "checkout", "-b", "auto-claude/001-conflict")
+        (temp_git_repo / "shared.txt").write_text("from spec\n")
+        self._git(temp_git_repo, "commit", "-am", "Spec edit")
+
+        self._git(temp_git_repo, "checkout", "main")
+        self._git(temp_git_repo, "checkout", "-b", "auto-claude/002-clean")
+        (temp_git_repo / "new_file.txt").write_text("new\n")
+        self._git(temp_git_repo, "add", ".")
+        self._git(temp_git_repo, "commit", "-m", "Add new file")
+
+        self._git(temp_git_repo, "checkout", "main")
+        (temp_git_repo / "shared.txt").write_text("from main\n")
+        self._git(temp_git_repo, "commit", "-am", "Main edit")
+        return temp_git_repo
+
+    def test_batch_detects_conflicts_per_spec(self, preflight_repo):
+        """Each spec gets its own conflict result from one batched pass."""
+        from core.workspace.preflight import check_git_conflicts_batch
+
+        results = check_git_conflicts_batch(
+            preflight_repo, ["001-conflict", "002-clean"]
+        )
+
+        conflict = results["001-conflict"]
+        assert conflict["has_conflicts"] is True
+        assert conflict["conflicting_files"] == ["shared.txt"]
+        assert conflict["base_branch"] == "main"
+        assert conflict["spec_branch"] == "auto-claude/001-conflict"
+        assert conflict["commits_behind"] == 1
+        assert conflict["needs_rebase"] is True
+
+        clean = results["002-clean"]
+        assert clean["has_conflicts"] is False
+        assert clean["conflicting_files"] == []
+
+    def test_defaults_to_all_spec_branches(self, preflight_repo):
+        """Omitting spec names checks every auto-claude/* branch."""
+        from core.workspace.preflight import check_git_conflicts_batch
+
+        results = check_git_conflicts_batch(preflight_repo)
+
+        assert set(results) == {"001-conflict", "002-clean"}
+
+    def test_missing_branch_returns_default(self, preflight_repo):
+        """Unknown specs return the clean default instead of failing the batch."""
+        from core.workspace.preflight import check_git_conflicts_batch
+
+        results = check_git_conflicts_batch(
+            preflight_repo, ["001-conflict", "999-missing"]
+        )
+
+        assert results["999-missing"]["has_conflicts"] is False
+        assert results["001-conflict"]["has_conflicts"] is True
+
+    def test_results_cached_by_commit_pair(self, preflight_repo):
+        """A second check for unchanged SHAs doesn't re-run merge-tree."""
+        from core.workspace import preflight
+
+        first = preflight.check_git_conflicts_batch(preflight_repo, ["001-conflict"])
+
+        with patch.object(preflight, "_merge_tree_batch") as merge_tree:
+            merge_tree.return_value = []
+            second = preflight.check_git_conflicts_batch(
+                preflight_repo, ["001-conflict"]
+            )
+
+        merge_tree.assert_called_once_with(preflight_repo, [])
+        assert second == first
+
+    def test_new_spec_commit_invalidates_cache(self, preflight_repo):
+        """Moving the spec branch produces a fresh result."""
+        from core.workspace.preflight import check_git_conflicts_batch
+
+        assert check_git_conflicts_batch(preflight_repo, ["001-conflict"])[
+            "001-conflict"
+        ]["has_conflicts"]
+
+        # Resolve the conflict on the spec branch by matching main
+        self._git(preflight_repo, "checkout", "auto-claude/001-conflict")
+        (preflight_repo / "shared.txt").write_text("from main\n")
+        self._git(preflight_repo, "commit", "-am", "Match main")
+        self._git(preflight_repo, "checkout", "main")
+
+        result = check_git_conflicts_batch(preflight_repo, ["001-conflict"])
+        assert result["001-conflict"]["has_conflicts"] is False
+
+    def test_per_spec_fallback_matches_batch(self, preflight_repo):
+        """The per-pair fallback agrees with the --stdin batch."""
+        from core.workspace import preflight
+
+        batched = preflight.check_git_conflicts_batch(
+            preflight_repo, ["001-conflict", "002-clean"], use_cache=False
+        )
+        stdin_result = subprocess.CompletedProcess(args=[], returncode=129)
+        real_run_git = preflight._run_git
+
+        def no_stdin(project_dir, args, stdin=None):
+            if "--stdin" in args:
+                return stdin_result
+            return real_run_git(project_dir, args, stdin)
+
+        with patch.object(preflight, "_run_git", side_effect=no_stdin):
+            fallback = preflight.check_git_conflicts_batch(
+                preflight_repo, ["001-conflict", "002-clean"], use_cache=False
+            )
+
+        assert fallback == batched
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Tests for the Worktree Pool
+===========================
+
+Tests pooled worktree reuse in WorktreeManager including:
+- Acquiring pre-checked-out worktrees for new specs
+- Recycling removed worktrees back into the pool
+- Pool-aware cleanup and stale-directory pruning
+- Optional sparse checkout from the implementation plan
+"""
+
+import json
+import subprocess
+from pathlib import Path
+
+import pytest
+from core.worktree_pool import (
+    POOL_SIZE_ENV,
+    RECLAIM_POLICY_ENV,
+    sparse_paths_from_plan,
+)
+from worktree import WorktreeManager
+
+
+def _git(repo: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=repo, capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+@pytest.fixture
+def pooled_manager(temp_git_repo: Path, monkeypatch) -> WorktreeManager:
+    """Manager with a two-slot pool, already filled."""
+    monkeypatch.setenv(POOL_SIZE_ENV, "2")
+    (temp_git_repo / "src").mkdir()
+    (temp_git_repo / "src" / "app.py").write_text("print('hi')\n")
+    (temp_git_repo / "docs").mkdir()
+    (temp_git_repo / "docs" / "guide.md").write_text("# Guide\n")
+    _git(temp_git_repo, "add", ".")
+    _git(temp_git_repo, "commit", "-m", "Add sources")
+
+    manager = WorktreeManager(temp_git_repo)
+    manager.setup()
+    assert manager.pool.fill() == 2
+    yield manager
+    manager.pool.wait()
+
+
+class TestPoolAcquire:
+    """New spec worktrees come from the pool."""
+
+    def test_create_uses_pooled_worktree(self, pooled_manager: WorktreeManager):
+        info = pooled_manager.create_worktree("spec-1")
+        pooled_manager.pool.wait()
+
+        assert info.path == pooled_manager.get_worktree_path("spec-1")
+        assert _git(info.path, "rev-parse", "--abbrev-ref", "HEAD") == (
+            "auto-claude/spec-1"
+        )
+        assert (info.path / "src" / "app.py").exists()
+
+        stats = pooled_manager.get_pool_stats()
+        assert stats.hits == 1 and stats.misses == 0
+        assert stats.hit_rate == 1.0
+        # Refilled in the background after the slot was taken
+        assert stats.idle == 2
+
+    def test_empty_pool_falls_back_to_cold_create(
+        self, pooled_manager: WorktreeManager
+    ):
+        pooled_manager.pool.drain()
+        pooled_manager.pool.size = 0
+
+        info = pooled_manager.create_worktree("spec-1")
+
+        assert _git(info.path, "rev-parse", "--abbrev-ref", "HEAD") == (
+            "auto-claude/spec-1"
+        )
+
+    def test_pool_miss_recorded(self, temp_git_repo: Path, monkeypatch):
+        monkeypatch.setenv(POOL_SIZE_ENV, "1")
+        manager = WorktreeManager(temp_git_repo)
+        manager.setup()
+
+        manager.create_worktree("spec-1")
+        manager.pool.wait()
+
+        stats = manager.get_pool_stats()
+        assert (stats.hits, stats.misses, stats.idle) == (0, 1, 1)
+
+    def test_pool_not_listed_as_spec_worktree(self, pooled_manager: WorktreeManager):
+        pooled_manager.create_worktree("spec-1")
+        pooled_manager.pool.wait()
+
+        names = [wt.spec_name for wt in pooled_manager.list_all_worktrees()]
+        assert names == ["spec-1"]
+
+
+class TestPoolReclaim:
+    """Removed worktrees are reset and returned to the pool."""
+
+    def test_removed_worktree_is_recycled(self, pooled_manager: WorktreeManager):
+        info = pooled_manager.create_worktree("spec-1")
+        pooled_manager.pool.wait()
+        # Leave room in the pool for the removed worktree
+        pooled_manager.pool.size = 3
+        (info.path / "src" / "app.py").write_text("changed\n")
+        (info.path / "scratch.txt").write_text("untracked\n")
+
+        pooled_manager.remove_worktree("spec-1", delete_branch=True)
+
+        assert not info.path.exists()
+        slots = pooled_manager.pool.idle_slots()
+        assert len(slots) == 3
+        assert not any((s / "scratch.txt").exists() for s in slots)
+        assert all((s / "src" / "app.py").read_text() == "print('hi')\n" for s in slots)
+        assert pooled_manager.get_pool_stats().reclaimed == 1
+        assert "auto-claude/spec-1" not in pooled_manager.list_all_spec_branches()
+
+    def test_recycled_worktree_drops_ignored_files(
+        self, pooled_manager: WorktreeManager
+    ):
+        repo = pooled_manager.project_dir
+        (repo / ".gitignore").write_text(".env\nbuild/\n")
+        _git(repo, "add", ".gitignore")
+        _git(repo, "commit", "-m", "Ignore secrets")
+        pooled_manager.pool.drain()
+        pooled_manager.pool.fill()
+
+        info = pooled_manager.create_worktree("spec-1")
+        pooled_manager.pool.wait()
+        pooled_manager.pool.size = 3
+        (info.path / ".env").write_text("SECRET=1\n")
+        (info.path / "build").mkdir()
+        (info.path / "build" / "out.js").write_text("bundle\n")
+
+        pooled_manager.remove_worktree("spec-1", delete_branch=True)
+        for slot in pooled_manager.pool.idle_slots():
+            assert _git(slot, "status", "--porcelain", "--ignored") == ""
+
+        info = pooled_manager.create_worktree("spec-2")
+        assert not (info.path / ".env").exists()
+        assert not (info.path / "build").exists()
+
+    def test_full_pool_removes_worktree(self, pooled_manager: WorktreeManager):
+        info = pooled_manager.create_worktree("spec-1")
+        pooled_manager.pool.wait()
+
+        pooled_manager.remove_worktree("spec-1")
+
+        assert not info.path.exists()
+        assert len(pooled_manager.pool.idle_slots()) == 2
+        assert pooled_manager.get_pool_stats().reclaimed == 0
+
+    def test_discard_policy(self, temp_git_repo: Path, monkeypatch):
+        monkeypatch.setenv(POOL_SIZE_ENV, "2")
+        monkeypatch.setenv(RECLAIM_POLICY_ENV, "discard")
+        manager = WorktreeManager(temp_git_repo)
+        manager.setup()
+        manager.create_worktree("spec-1")
+        manager.pool.wait()
+        manager.pool.size = 3
+
+        manager.remove_worktree("spec-1")
+
+        assert manager.get_pool_stats().reclaim_policy == "discard"
+        assert len(manager.pool.idle_slots()) == 2
+
+
+class TestPoolCleanup:
+    """cleanup_all and stale pruning know about the pool."""
+
+    def test_cleanup_all_drains_pool(self, pooled_manager: WorktreeManager):
+        pooled_manager.create_worktree("spec-1")
+        pooled_manager.pool.wait()
+
+        pooled_manager.cleanup_all()
+
+        assert pooled_manager.list_all_worktrees() == []
+        assert pooled_manager.pool.idle_slots() == []
+        assert not pooled_manager.pool.pool_dir.exists()
+
+    def test_stale_cleanup_keeps_pool(self, pooled_manager: WorktreeManager):
+        stale_slot = pooled_manager.pool.pool_dir / "slot-9"
+        stale_slot.mkdir()
+
+        pooled_manager.cleanup_stale_worktrees()
+
+        assert len(pooled_manager.pool.idle_slots()) == 2
+        assert not stale_slot.exists()
+
+
+class TestSparseCheckout:
+    """Optional sparse checkout driven by the plan."""
+
+    def test_sparse_paths_from_plan(self, temp_dir: Path):
+        plan = {
+            "phases": [
+                {
+                    "subtasks": [
+                        {"files_to_modify": ["src/app.py", "README.md"]},
+                        {"files_to_create": ["src/api/routes.py"]},
+                    ]
+                }
+            ]
+        }
+        (temp_dir / "implementation_plan.json").write_text(json.dumps(plan))
+
+        assert sparse_paths_from_plan(temp_dir) == ["src", "src/api"]
+        assert sparse_paths_from_plan(temp_dir / "missing") == []
+
+    def test_sparse_pooled_worktree(self, pooled_manager: WorktreeManager):
+        info = pooled_manager.create_worktree("spec-1", sparse_paths=["src"])
+        pooled_manager.pool.wait()
+
+        assert (info.path / "src" / "app.py").exists()
+        assert (info.path / "README.md").exists()
+        assert not (info.path / "docs").exists()
+        # Sparse checkout is per-worktree; the main checkout is unaffected
+        main_config = subprocess.run(
+            ["git", "config", "--get", "core.sparseCheckout"],
+            cwd=pooled_manager.project_dir,
+            capture_output=True,
+            text=True,
+        )
+        assert main_config.stdout.strip() != "true"
+
+    def test_failed_sparse_checkout_falls_back_to_cold_create(
+        self, pooled_manager: WorktreeManager, monkeypatch
+    ):
+        monkeypatch.setattr(
+            pooled_manager.pool, "_finish_checkout", lambda path, sparse: False
+        )
+
+        info = pooled_manager.create_worktree("spec-1", sparse_paths=["src"])
+        pooled_manager.pool.wait()
+
+        assert _git(info.path, "rev-parse", "--abbrev-ref", "HEAD") == (
+            "auto-claude/spec-1"
+        )
+        assert pooled_manager.get_pool_stats().misses == 1
+
+    def test_recycled_worktree_is_full_checkout(self, pooled_manager: WorktreeManager):
+        pooled_manager.create_worktree("spec-1", sparse_paths=["src"])
+        pooled_manager.pool.wait()
+        pooled_manager.pool.size = 3
+
+        pooled_manager.remove_worktree("spec-1", delete_branch=True)
+
+        assert all(
+            (s / "docs" / "guide.md").exists() for s in pooled_manager.pool.idle_slots()
+        )